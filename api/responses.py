@@ -0,0 +1,87 @@
+"""
+빠른 JSON 응답
+큰 자막 배열을 pydantic 모델로 감싸 다시 검증/직렬화하지 않고 바로 JSON 바이트로 만듭니다.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List
+import json
+import math
+
+from fastapi.responses import JSONResponse
+
+from utils.transcript import Transcript
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _replace_non_finite(value: Any) -> Any:
+    """NaN과 무한대 float를 None으로 바꾼 값을 반환합니다 (orjson과 같은 결과)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Mapping):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
+
+
+def json_dumps(content: Any) -> bytes:
+    """
+    JSON 바이트로 직렬화합니다 (orjson이 있으면 orjson 사용).
+
+    NaN과 무한대 float는 orjson처럼 null로 직렬화하므로, orjson 설치 여부와 관계없이
+    같은 응답을 만듭니다.
+
+    Args:
+        content: JSON으로 변환할 값 (dict, list, str, 숫자, None)
+
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    try:
+        text = json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+    except ValueError:
+        # NaN/무한대가 있을 때만 값을 복사하여 null로 바꿈
+        text = json.dumps(
+            _replace_non_finite(content), ensure_ascii=False, allow_nan=False, separators=(',', ':')
+        )
+    return text.encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """jsonable_encoder를 거치지 않고 json_dumps로 본문을 만드는 JSON 응답"""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+def transcript_entries(transcript: Iterable[Mapping]) -> List[Dict]:
+    """
+    자막을 TranscriptEntry 스키마와 같은 형태의 딕셔너리 리스트로 변환합니다.
+
+    키 순서(start, duration, text, timestamp), float 변환, 스키마에 없는 키 제외까지
+    TranscriptEntry(**entry).model_dump()와 같은 결과를 모델 생성 없이 만듭니다.
+
+    Args:
+        transcript: Transcript 또는 자막 딕셔너리 iterable
+
+    Returns:
+        자막 딕셔너리 리스트
+    """
+    if isinstance(transcript, Transcript):
+        return transcript.to_list()
+    return [
+        {
+            'start': float(entry['start']),
+            'duration': float(entry['duration']),
+            'text': entry['text'],
+            'timestamp': entry.get('timestamp'),
+        }
+        for entry in transcript
+    ]
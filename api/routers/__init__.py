@@ -6,9 +6,11 @@ FastAPI 엔드포인트를 제공합니다.
 from .video import router as video_router
 from .playlist import router as playlist_router
 from .ai import router as ai_router
+from .jobs import router as jobs_router
 
 __all__ = [
     "video_router",
     "playlist_router",
     "ai_router",
+    "jobs_router",
 ]
@@ -17,6 +17,7 @@ from api.schemas.ai import (
     AIEnhancementRequest,
     AIEnhancementResponse
 )
+from core.executor import run_blocking
 from utils.dependencies import AIServiceDep, SettingsDep
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,7 @@ async def generate_summary(
     - **text**: 요약할 텍스트 (필수)
     - **max_points**: 최대 요약 포인트 수 (1-10, 기본값: 5)
     - **language**: 요약 언어 코드 (기본값: ko)
+    - **bypass_cache**: 캐시된 응답을 사용하지 않고 새로 생성 (기본값: false)
     """
     if not ai_service.is_available():
         raise HTTPException(
@@ -49,10 +51,14 @@ async def generate_summary(
     try:
         logger.info(f"Generating summary for text ({len(request.text)} chars)")
 
-        summary = ai_service.generate_summary_from_text(
+        # 블로킹 Gemini 호출은 전역 실행기에서 실행하여 이벤트 루프를 차단하지 않음
+        summary = await run_blocking(
+            None,
+            ai_service.generate_summary_from_text,
             text=request.text,
             max_points=request.max_points,
-            language=request.language
+            language=request.language,
+            use_cache=not request.bypass_cache
         )
 
         if not summary:
@@ -87,6 +93,7 @@ async def translate_text(
     - **text**: 번역할 텍스트 (필수)
     - **target_language**: 대상 언어 코드 (필수)
     - **source_language**: 원본 언어 코드 (선택, 자동 감지)
+    - **bypass_cache**: 캐시된 응답을 사용하지 않고 새로 생성 (기본값: false)
     """
     if not ai_service.is_available():
         raise HTTPException(
@@ -100,10 +107,13 @@ async def translate_text(
             f"to {request.target_language}"
         )
 
-        translated = ai_service.translate_text(
+        translated = await run_blocking(
+            None,
+            ai_service.translate_text,
             text=request.text,
             target_language=request.target_language,
-            source_language=request.source_language
+            source_language=request.source_language,
+            use_cache=not request.bypass_cache
         )
 
         if not translated:
@@ -139,6 +149,7 @@ async def extract_topics(
     - **text**: 분석할 텍스트 (필수)
     - **num_topics**: 추출할 주제 수 (1-20, 기본값: 5)
     - **language**: 주제 언어 코드 (기본값: ko)
+    - **bypass_cache**: 캐시된 응답을 사용하지 않고 새로 생성 (기본값: false)
     """
     if not ai_service.is_available():
         raise HTTPException(
@@ -151,10 +162,13 @@ async def extract_topics(
             f"Extracting topics from text ({len(request.text)} chars)"
         )
 
-        topics = ai_service.extract_topics_from_text(
+        topics = await run_blocking(
+            None,
+            ai_service.extract_topics_from_text,
             text=request.text,
             num_topics=request.num_topics,
-            language=request.language
+            language=request.language,
+            use_cache=not request.bypass_cache
         )
 
         if not topics:
@@ -189,6 +203,7 @@ async def enhance_text(
     - **enable_summary**: 요약 활성화
     - **enable_translation**: 번역 활성화
     - **enable_topics**: 주제 추출 활성화
+    - **bypass_cache**: 캐시된 응답을 사용하지 않고 새로 생성
     """
     if not ai_service.is_available():
         raise HTTPException(
@@ -205,7 +220,7 @@ async def enhance_text(
         transcript = [{'text': request.text, 'start': 0, 'duration': 0}]
 
         # AI 기능 적용
-        result = ai_service.enhance_transcript(
+        result = await ai_service.enhance_transcript_async(
             transcript=transcript,
             enable_summary=request.enable_summary,
             summary_max_points=request.summary_max_points,
@@ -213,7 +228,8 @@ async def enhance_text(
             target_language=request.target_language,
             enable_topics=request.enable_topics,
             num_topics=request.num_topics,
-            language=request.language
+            language=request.language,
+            use_cache=not request.bypass_cache
         )
 
         processing_time = time.time() - start_time
@@ -240,9 +256,16 @@ async def check_ai_health(
 ):
     """
     AI 서비스의 상태를 확인합니다.
+
+    LLM 응답 캐시가 활성화되어 있으면 적중률 등 캐시 통계(response_cache)를,
+    호출 제한기가 활성화되어 있으면 현재 한도와 대기열 길이(rate_limits)를,
+    AI 서비스가 활성화되어 있으면 동시 요청 병합 통계(coalescing)를 포함합니다.
     """
     return JSONResponse(content={
         "available": ai_service.is_available(),
         "model": settings.gemini_model_name,
-        "api_key_configured": bool(settings.gemini_api_key)
+        "api_key_configured": bool(settings.gemini_api_key),
+        "response_cache": ai_service.get_cache_stats(),
+        "rate_limits": ai_service.get_rate_limit_stats(),
+        "coalescing": ai_service.get_coalescing_stats()
     })
@@ -0,0 +1,151 @@
+"""
+작업 큐 관련 API 라우터
+오래 걸리는 플레이리스트 스크래핑을 백그라운드 작업으로 제출하고 진행 상황과 결과를 조회합니다.
+"""
+
+from typing import Dict
+from fastapi import APIRouter, HTTPException
+import logging
+
+from api.schemas.jobs import (
+    PlaylistJobRequest,
+    JobSubmitResponse,
+    JobStatusResponse,
+    JobResultResponse,
+    JobVideoResult
+)
+from api.schemas.video import VideoScrapeResponse, TranscriptEntry
+from core.executor import run_blocking
+from core.job_queue import JobNotFoundError, TERMINAL_STATUSES
+from utils.dependencies import JobQueueDep, YouTubeServiceDep
+from utils.metadata import normalize_metadata, validate_metadata
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    responses={404: {"description": "Job not found"}},
+)
+
+
+def _to_scrape_response(result: Dict) -> VideoScrapeResponse:
+    """저장된 비디오 처리 결과를 VideoScrapeResponse로 변환합니다."""
+    metadata = normalize_metadata(result['metadata'], video_id=result.get('video_id', ''))
+    translated_transcript = result.get('translated_transcript')
+    return VideoScrapeResponse(
+        metadata=validate_metadata(metadata),
+        transcript=[TranscriptEntry(**entry) for entry in result['transcript']],
+        transcript_language=result.get('transcript_language'),
+        summary=result.get('summary'),
+        translation=result.get('translation'),
+        translated_transcript=(
+            [TranscriptEntry(**entry) for entry in translated_transcript]
+            if translated_transcript else None
+        ),
+        key_topics=result.get('key_topics'),
+        output_file=result.get('output_file'),
+        partial=bool(result.get('errors')),
+        errors=result.get('errors') or {}
+    )
+
+
+@router.post("/playlist", response_model=JobSubmitResponse, status_code=202)
+async def submit_playlist_job(
+    request: PlaylistJobRequest,
+    job_queue: JobQueueDep,
+    youtube_service: YouTubeServiceDep
+):
+    """
+    플레이리스트 스크래핑 작업을 제출합니다.
+
+    작업은 백그라운드 워커에서 실행되며, 반환된 `job_id`로 진행 상황(`GET /jobs/{job_id}`)과
+    결과(`GET /jobs/{job_id}/result`)를 조회하거나 취소(`POST /jobs/{job_id}/cancel`)할 수 있습니다.
+    서버가 재시작되면 완료된 비디오를 제외한 나머지부터 이어서 실행합니다.
+
+    - **playlist_url**: YouTube 플레이리스트 URL (필수)
+    - **max_videos**: 처리할 최대 비디오 수
+    - 그 외 옵션은 `/video/scrape`와 같으며 모든 비디오에 적용됩니다 (output_format 기본값은 None)
+    """
+    if not youtube_service.is_playlist_url(request.playlist_url):
+        raise HTTPException(status_code=400, detail="Provided URL is not a playlist URL")
+
+    try:
+        job_id = await run_blocking(None, job_queue.submit, request.model_dump())
+    except Exception as e:
+        logger.error(f"Failed to submit job: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to submit job: {str(e)}")
+
+    return JobSubmitResponse(job_id=job_id, status="queued")
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(job_id: str, job_queue: JobQueueDep):
+    """
+    작업 상태와 비디오별 진행 상황을 반환합니다.
+
+    - **job_id**: 작업 ID
+    """
+    try:
+        job = await run_blocking(None, job_queue.status, job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    return JobStatusResponse(
+        job_id=job['job_id'],
+        status=job['status'],
+        playlist_url=job['params']['playlist_url'],
+        error=job['error'],
+        created_at=job['created_at'],
+        updated_at=job['updated_at'],
+        progress=job['progress'],
+        videos=job['videos']
+    )
+
+
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+async def get_job_result(job_id: str, job_queue: JobQueueDep):
+    """
+    작업의 비디오별 처리 결과를 반환합니다.
+
+    작업이 끝나지 않았으면 지금까지 완료된 비디오의 결과만 포함합니다 (`finished: false`).
+
+    - **job_id**: 작업 ID
+    """
+    try:
+        job = await run_blocking(None, job_queue.results, job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    videos = []
+    for video in job['videos']:
+        result = video.pop('result')
+        videos.append(JobVideoResult(
+            **video,
+            result=_to_scrape_response(result) if result else None
+        ))
+
+    return JobResultResponse(
+        job_id=job['job_id'],
+        status=job['status'],
+        playlist_url=job['params']['playlist_url'],
+        finished=job['status'] in TERMINAL_STATUSES,
+        videos=videos
+    )
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(job_id: str, job_queue: JobQueueDep):
+    """
+    작업을 취소합니다. 처리 중인 비디오는 끝까지 처리하고 남은 비디오는 건너뜁니다.
+
+    - **job_id**: 작업 ID
+    """
+    try:
+        cancelled = await run_blocking(None, job_queue.cancel, job_id)
+    except JobNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    if not cancelled:
+        raise HTTPException(status_code=409, detail=f"Job already finished: {job_id}")
+    return {"job_id": job_id, "status": "cancelled"}
@@ -37,7 +37,7 @@ async def get_playlist_info(
             raise ValueError("Provided URL is not a playlist URL")
 
         # 플레이리스트 정보 가져오기
-        playlist_info_raw = youtube_service.get_playlist_info(request.playlist_url)
+        playlist_info_raw = await youtube_service.get_playlist_info_async(request.playlist_url)
         if not playlist_info_raw:
             raise ValueError("Failed to get playlist info")
 
@@ -54,9 +54,9 @@ async def get_playlist_info(
             'description': playlist_info_raw.get('description')
         }
 
-        # 비디오 목록 가져오기
-        videos = youtube_service.get_playlist_videos(
-            playlist_url=request.playlist_url,
+        # 비디오 목록은 위에서 추출한 재생목록 정보에서 생성 (재추출하지 않음)
+        videos = youtube_service.playlist_videos(
+            playlist_info_raw,
             max_videos=request.max_videos
         )
 
@@ -135,26 +135,40 @@ async def check_playlist_url(
 async def get_playlist_videos(
     youtube_service: YouTubeServiceDep,
     playlist_url: str = Query(..., description="YouTube 플레이리스트 URL"),
-    max_videos: int = Query(None, ge=1, description="최대 비디오 수")
+    max_videos: int = Query(None, ge=1, description="최대 비디오 수 (페이지 크기)"),
+    offset: int = Query(0, ge=0, description="건너뛸 비디오 수 (이전 응답의 next_offset)")
 ):
     """
     플레이리스트의 비디오 목록만 가져옵니다.
 
+    재생목록은 필요한 페이지까지만 조회하므로, 큰 채널도 max_videos와 offset으로
+    나누어 가져올 수 있습니다. 다음 페이지가 있으면 next_offset을 반환합니다.
+
     - **playlist_url**: YouTube 플레이리스트 URL
     - **max_videos**: 최대 비디오 수 (선택)
+    - **offset**: 건너뛸 비디오 수 (선택, 기본값 0)
     """
     try:
         if not youtube_service.is_playlist_url(playlist_url):
             raise ValueError("Provided URL is not a playlist URL")
 
-        videos = youtube_service.get_playlist_videos(
+        # 다음 페이지 존재 여부를 알기 위해 한 개 더 조회
+        videos = await youtube_service.get_playlist_videos_async(
             playlist_url=playlist_url,
-            max_videos=max_videos
+            max_videos=max_videos + 1 if max_videos else None,
+            offset=offset
         )
 
+        next_offset = None
+        if max_videos and len(videos) > max_videos:
+            videos = videos[:max_videos]
+            next_offset = offset + max_videos
+
         return JSONResponse(content={
             "videos": videos,
-            "count": len(videos)
+            "count": len(videos),
+            "offset": offset,
+            "next_offset": next_offset
         })
 
     except ValueError as e:
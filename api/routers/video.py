@@ -2,25 +2,37 @@
 비디오 관련 API 라우터
 """
 
-from typing import List
+from typing import List, Dict, AsyncIterator
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+import asyncio
+import itertools
+import json
 import logging
+import os
+from urllib.parse import quote
 
 from api.schemas.video import (
     VideoRequest,
     VideoResponse,
     VideoScrapeRequest,
     VideoScrapeResponse,
+    VideoBatchRequest,
+    VideoBatchItem,
     VideoMetadata,
     TranscriptEntry
 )
+from api.responses import FastJSONResponse, transcript_entries
+from core import YouTubeService, AIService, FormatterService
 from utils.dependencies import (
     YouTubeServiceDep,
     AIServiceDep,
     FormatterServiceDep
 )
 from utils.metadata import normalize_metadata, validate_metadata
+from core.executor import run_blocking
+from utils.config import settings
+from utils.transcript import transcript_to_list
 
 logger = logging.getLogger(__name__)
 
@@ -45,23 +57,29 @@ async def get_video_info(
     """
     try:
         # 비디오 정보 가져오기
-        result = youtube_service.get_video_info(
+        result = await youtube_service.get_video_info_async(
             video_url=request.video_url,
             languages=request.languages,
             prefer_manual=request.prefer_manual
         )
 
-        # 응답 생성
+        # 응답 생성: 메타데이터만 모델로 검증하고, 자막 배열은 항목별 모델 생성과
+        # response_model 재검증 없이 바로 직렬화
         metadata_dict = normalize_metadata(
             result['metadata'],
             video_id=result.get('video_id', '')
         )
 
-        return VideoResponse(
+        errors = result.get('errors') or {}
+        content = VideoResponse.model_construct(
             metadata=validate_metadata(metadata_dict),
-            transcript=[TranscriptEntry(**entry) for entry in result['transcript']],
-            transcript_language=request.languages[0] if request.languages else None
-        )
+            transcript=[],
+            transcript_language=request.languages[0] if request.languages else None,
+            partial=bool(errors),
+            errors=errors
+        ).model_dump(mode='json')
+        content['transcript'] = transcript_entries(result['transcript'])
+        return FastJSONResponse(content=content)
 
     except ValueError as e:
         logger.error(f"Invalid request: {e}")
@@ -71,6 +89,127 @@ async def get_video_info(
         raise HTTPException(status_code=500, detail=f"Failed to get video info: {str(e)}")
 
 
+async def _scrape_video(
+    request: VideoScrapeRequest,
+    youtube_service: YouTubeService,
+    ai_service: AIService,
+    formatter_service: FormatterService
+) -> VideoScrapeResponse:
+    """
+    비디오 하나를 스크래핑하고 요청된 AI 기능과 파일 저장을 적용합니다.
+
+    Args:
+        request: 스크래핑 요청
+        youtube_service: YouTube 서비스
+        ai_service: AI 서비스
+        formatter_service: Formatter 서비스
+
+    Returns:
+        VideoScrapeResponse
+
+    Raises:
+        ValueError: 유효하지 않은 URL 등 잘못된 요청인 경우
+    """
+    # 1. 비디오 정보 가져오기
+    logger.info(f"Scraping video: {request.video_url}")
+    video_info = await youtube_service.get_video_info_async(
+        video_url=request.video_url,
+        languages=request.languages,
+        prefer_manual=request.prefer_manual
+    )
+
+    metadata = video_info['metadata']
+    transcript = video_info['transcript']
+
+    # 2. AI 기능 적용 (요약, 번역, 주제 추출을 동시에 실행)
+    summary = None
+    translation = None
+    translated_transcript = None
+    topics = None
+
+    # AI 서비스 사용 가능 여부 확인
+    ai_available = ai_service.is_available()
+    ai_requested = request.enable_summary or request.enable_translation or request.enable_topics
+    if not ai_available and ai_requested:
+        logger.warning(
+            "AI features were requested but AI service is not available. "
+            "Please check your Gemini API key configuration."
+        )
+
+    # languages 안전 처리
+    default_language = 'ko'
+    if request.languages and len(request.languages) > 0:
+        default_language = request.languages[0]
+
+    if ai_available and ai_requested:
+        logger.info("Applying AI features...")
+        try:
+            enhanced = await ai_service.enhance_transcript_async(
+                transcript=transcript,
+                enable_summary=request.enable_summary,
+                summary_max_points=request.summary_max_points,
+                enable_translation=request.enable_translation,
+                target_language=request.target_language,
+                enable_topics=request.enable_topics,
+                num_topics=request.num_topics,
+                language=default_language,
+                use_cache=not request.bypass_cache
+            )
+            summary = enhanced['summary']
+            translation = enhanced['translation']
+            translated_transcript = enhanced.get('translated_transcript')
+            topics = enhanced['topics']
+        except Exception as e:
+            logger.error(f"Failed to apply AI features: {e}")
+
+    # 3. 파일로 저장 (선택적)
+    output_file = None
+    if request.output_format:
+        try:
+            output_file = await run_blocking(
+                None,
+                formatter_service.save_to_file,
+                metadata=metadata,
+                transcript=transcript,
+                output_file=formatter_service.build_output_path(
+                    metadata, video_info.get('video_id', '')
+                ),
+                format_choice=request.output_format,
+                summary=summary,
+                # 항목별 번역이 있으면 자막과 함께 출력하므로 결합 텍스트는 생략
+                translation=None if translated_transcript else translation,
+                key_topics=topics,
+                translated_transcript=translated_transcript
+            )
+            logger.info(f"Saved to file: {output_file}")
+        except Exception as e:
+            logger.error(f"Failed to save file: {e}")
+            # 파일 저장 실패해도 응답은 계속 진행
+            output_file = None
+
+    # 4. 응답 생성
+    metadata_dict = normalize_metadata(
+        video_info['metadata'],
+        video_id=video_info.get('video_id', '')
+    )
+
+    return VideoScrapeResponse(
+        metadata=validate_metadata(metadata_dict),
+        transcript=[TranscriptEntry(**entry) for entry in transcript],
+        transcript_language=default_language,
+        summary=summary,
+        translation=translation,
+        translated_transcript=(
+            [TranscriptEntry(**entry) for entry in translated_transcript]
+            if translated_transcript else None
+        ),
+        key_topics=topics,
+        output_file=output_file,
+        partial=bool(video_info.get('errors')),
+        errors=video_info.get('errors') or {}
+    )
+
+
 @router.post("/scrape", response_model=VideoScrapeResponse)
 async def scrape_video(
     request: VideoScrapeRequest,
@@ -87,126 +226,143 @@ async def scrape_video(
     - **enable_translation**: 번역 활성화 여부
     - **enable_topics**: 주제 추출 활성화 여부
     - **output_format**: 출력 형식 (txt, json, xml, markdown)
+    - **bypass_cache**: 캐시된 AI 응답을 사용하지 않고 새로 생성
     """
     try:
-        # 1. 비디오 정보 가져오기
-        logger.info(f"Scraping video: {request.video_url}")
-        video_info = youtube_service.get_video_info(
-            video_url=request.video_url,
-            languages=request.languages,
-            prefer_manual=request.prefer_manual
-        )
+        return await _scrape_video(request, youtube_service, ai_service, formatter_service)
 
-        metadata = video_info['metadata']
-        transcript = video_info['transcript']
-
-        # 2. AI 기능 적용
-        summary = None
-        translation = None
-        topics = None
-
-        # AI 서비스 사용 가능 여부 확인
-        ai_available = ai_service.is_available()
-        if not ai_available and (request.enable_summary or request.enable_translation or request.enable_topics):
-            logger.warning(
-                "AI features were requested but AI service is not available. "
-                "Please check your Gemini API key configuration."
-            )
+    except ValueError as e:
+        logger.error(f"Invalid request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to scrape video: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to scrape video: {str(e)}")
 
-        # languages 안전 처리
-        default_language = 'ko'
-        if request.languages and len(request.languages) > 0:
-            default_language = request.languages[0]
 
-        if request.enable_summary and ai_available:
-            logger.info("Generating summary...")
-            try:
-                summary = ai_service.generate_summary(
-                    transcript=transcript,
-                    max_points=request.summary_max_points,
-                    language=default_language
-                )
-            except Exception as e:
-                logger.error(f"Failed to generate summary: {e}")
-                summary = None
+def _encode_event(event: str, data: Dict, stream_format: str) -> str:
+    """
+    스트림 이벤트 하나를 NDJSON 줄 또는 SSE 메시지로 인코딩합니다.
 
-        if request.enable_translation and request.target_language and ai_available:
-            logger.info(f"Translating to {request.target_language}...")
-            try:
-                translation = ai_service.translate_transcript(
-                    transcript=transcript,
-                    target_language=request.target_language
-                )
-            except Exception as e:
-                logger.error(f"Failed to translate: {e}")
-                translation = None
+    Args:
+        event: 이벤트 이름 (result, done)
+        data: 이벤트 데이터
+        stream_format: 스트림 형식 (ndjson, sse)
 
-        if request.enable_topics and ai_available:
-            logger.info("Extracting topics...")
-            try:
-                topics = ai_service.extract_topics(
-                    transcript=transcript,
-                    num_topics=request.num_topics,
-                    language=default_language
-                )
-            except Exception as e:
-                logger.error(f"Failed to extract topics: {e}")
-                topics = None
+    Returns:
+        인코딩된 문자열
+    """
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return json.dumps({"event": event, **data}, ensure_ascii=False) + "\n"
+
+
+async def _stream_batch(
+    request: VideoBatchRequest,
+    concurrency: int,
+    youtube_service: YouTubeService,
+    ai_service: AIService,
+    formatter_service: FormatterService
+) -> AsyncIterator[str]:
+    """
+    비디오들을 동시에 스크래핑하면서 완료되는 순서대로 결과를 생성합니다.
+
+    클라이언트 연결이 끊겨 스트림이 닫히면 남은 작업을 취소합니다.
+
+    Args:
+        request: 일괄 스크래핑 요청
+        concurrency: 동시에 처리할 비디오 수
+        youtube_service: YouTube 서비스
+        ai_service: AI 서비스
+        formatter_service: Formatter 서비스
 
-        # 3. 파일로 저장 (선택적)
-        output_file = None
-        if request.output_format:
+    Yields:
+        비디오별 result 이벤트와 마지막 done 이벤트
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    options = request.model_dump(exclude={'video_urls', 'max_concurrency', 'stream_format'})
+
+    async def scrape(index: int, video_url: str) -> VideoBatchItem:
+        async with semaphore:
             try:
-                # 안전한 파일명 생성
-                video_title = metadata.get('title', 'video')
-                if not video_title or video_title.strip() == '':
-                    video_title = 'video'
-                
-                import re
-                safe_title = re.sub(r'[<>:"/\\|?*]', '_', video_title)
-                safe_title = safe_title.strip()[:100]
-                
-                video_id = video_info.get('video_id', '')
-                if video_id:
-                    safe_title = f"{safe_title}_{video_id}"
-                
-                output_file = formatter_service.save_to_file(
-                    metadata=metadata,
-                    transcript=transcript,
-                    output_file=f"output/{safe_title}",
-                    format_choice=request.output_format,
-                    summary=summary,
-                    translation=translation,
-                    key_topics=topics
+                result = await _scrape_video(
+                    VideoScrapeRequest(video_url=video_url, **options),
+                    youtube_service,
+                    ai_service,
+                    formatter_service
+                )
+                return VideoBatchItem(index=index, video_url=video_url, status="ok", result=result)
+            except ValueError as e:
+                logger.error(f"Invalid batch item {video_url}: {e}")
+                return VideoBatchItem(
+                    index=index, video_url=video_url, status="error",
+                    error=str(e), status_code=400
                 )
-                logger.info(f"Saved to file: {output_file}")
             except Exception as e:
-                logger.error(f"Failed to save file: {e}")
-                # 파일 저장 실패해도 응답은 계속 진행
-                output_file = None
+                logger.error(f"Failed to scrape batch item {video_url}: {e}", exc_info=True)
+                return VideoBatchItem(
+                    index=index, video_url=video_url, status="error",
+                    error=f"Failed to scrape video: {str(e)}", status_code=500
+                )
 
-        # 4. 응답 생성
-        metadata_dict = normalize_metadata(
-            video_info['metadata'],
-            video_id=video_info.get('video_id', '')
+    tasks = [
+        asyncio.create_task(scrape(index, video_url))
+        for index, video_url in enumerate(request.video_urls)
+    ]
+    succeeded = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            item = await next_done
+            if item.status == "ok":
+                succeeded += 1
+            yield _encode_event("result", item.model_dump(mode="json"), request.stream_format)
+
+        yield _encode_event(
+            "done",
+            {"total": len(tasks), "succeeded": succeeded, "failed": len(tasks) - succeeded},
+            request.stream_format
         )
+    finally:
+        for task in tasks:
+            task.cancel()
 
-        return VideoScrapeResponse(
-            metadata=validate_metadata(metadata_dict),
-            transcript=[TranscriptEntry(**entry) for entry in transcript],
-            transcript_language=default_language,
-            summary=summary,
-            translation=translation,
-            key_topics=topics,
-            output_file=output_file
+
+@router.post("/batch")
+async def scrape_video_batch(
+    request: VideoBatchRequest,
+    youtube_service: YouTubeServiceDep,
+    ai_service: AIServiceDep,
+    formatter_service: FormatterServiceDep
+):
+    """
+    여러 YouTube 비디오를 동시에 스크래핑하고 완료되는 순서대로 결과를 스트리밍합니다.
+
+    각 비디오 결과는 준비되는 즉시 `result` 이벤트로 전송되며(요청 순서는 `index`로 확인),
+    모든 비디오가 끝나면 성공/실패 수를 담은 `done` 이벤트를 전송합니다.
+    한 비디오의 실패는 다른 비디오에 영향을 주지 않습니다.
+
+    - **video_urls**: YouTube 비디오 URL 목록 (최대 BATCH_MAX_VIDEOS개)
+    - **max_concurrency**: 동시에 처리할 비디오 수 (서버 상한 BATCH_MAX_CONCURRENCY)
+    - **stream_format**: ndjson (application/x-ndjson) 또는 sse (text/event-stream)
+    - 그 외 옵션은 `/video/scrape`와 같으며 모든 비디오에 적용됩니다 (output_format 기본값은 None)
+    """
+    if len(request.video_urls) > settings.batch_max_videos:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many videos: {len(request.video_urls)} (max {settings.batch_max_videos})"
         )
 
-    except ValueError as e:
-        logger.error(f"Invalid request: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Failed to scrape video: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Failed to scrape video: {str(e)}")
+    concurrency = max(1, min(
+        request.max_concurrency or settings.batch_max_concurrency,
+        settings.batch_max_concurrency
+    ))
+    logger.info(f"Scraping batch of {len(request.video_urls)} videos (concurrency {concurrency})")
+
+    media_type = "text/event-stream" if request.stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        _stream_batch(request, concurrency, youtube_service, ai_service, formatter_service),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get("/metadata")
@@ -224,7 +380,7 @@ async def get_video_metadata(
         if not video_id:
             raise ValueError(f"Invalid YouTube URL: {video_url}")
 
-        metadata = youtube_service.get_video_metadata(video_id)
+        metadata = await youtube_service.get_video_metadata_async(video_id)
 
         return JSONResponse(content=metadata)
 
@@ -255,13 +411,13 @@ async def get_video_transcript(
         if not video_id:
             raise ValueError(f"Invalid YouTube URL: {video_url}")
 
-        transcript = youtube_service.get_transcript(
+        transcript = await youtube_service.get_transcript_async(
             video_id=video_id,
             languages=languages,
             prefer_manual=prefer_manual
         )
 
-        return JSONResponse(content=transcript)
+        return FastJSONResponse(content=transcript_to_list(transcript))
 
     except ValueError as e:
         logger.error(f"Invalid request: {e}")
@@ -269,3 +425,81 @@ async def get_video_transcript(
     except Exception as e:
         logger.error(f"Failed to get transcript: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get transcript: {str(e)}")
+
+
+@router.get("/export")
+async def export_video_transcript(
+    youtube_service: YouTubeServiceDep,
+    formatter_service: FormatterServiceDep,
+    video_url: str = Query(..., description="YouTube 비디오 URL"),
+    output_format: str = Query(default="txt", description="출력 형식 (txt, json, xml, markdown)"),
+    languages: List[str] = Query(default=["ko", "en"], description="자막 언어 우선순위"),
+    prefer_manual: bool = Query(default=True, description="수동 생성 자막 선호 여부")
+):
+    """
+    비디오 자막을 지정한 형식의 파일로 스트리밍합니다.
+
+    문서 전체를 메모리에 만들지 않고 자막 항목 단위로 응답 본문에 씁니다.
+
+    - **video_url**: YouTube 비디오 URL
+    - **output_format**: 출력 형식 (txt, json, xml, markdown)
+    - **languages**: 자막 언어 우선순위 목록
+    - **prefer_manual**: 수동 생성 자막 선호 여부
+    """
+    try:
+        formatter = formatter_service.get_formatter(output_format)
+
+        video_info = await youtube_service.get_video_info_async(
+            video_url=video_url,
+            languages=languages,
+            prefer_manual=prefer_manual
+        )
+
+        metadata = video_info['metadata']
+        body = formatter_service.iter_format(
+            metadata,
+            video_info['transcript'],
+            format_choice=output_format
+        )
+        # 헤더를 먼저 만들어 메타데이터 오류는 응답을 보내기 전에 드러나게 함
+        header = next(body)
+
+    except ValueError as e:
+        logger.error(f"Invalid request: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to export transcript: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to export transcript: {str(e)}")
+
+    filename = os.path.basename(
+        formatter_service.build_output_path(metadata, video_info.get('video_id', ''))
+    )
+    headers = {
+        "Content-Disposition": (
+            f"attachment; filename*=UTF-8''{quote(filename)}.{formatter.file_extension}"
+        )
+    }
+    errors = video_info.get('errors')
+    if errors:
+        # 본문은 파일 형식이므로 부분 결과 여부는 헤더로 알림 (ASCII JSON)
+        headers["X-Partial-Errors"] = json.dumps(errors)
+    return StreamingResponse(
+        itertools.chain([header], body),
+        media_type=formatter.media_type,
+        headers=headers
+    )
+
+
+@router.get("/health")
+async def check_video_health(youtube_service: YouTubeServiceDep):
+    """
+    YouTube 서비스의 캐시와 동시 요청 병합 상태를 확인합니다.
+
+    자막/메타데이터/재생목록 캐시와 추출기 풀 통계(cache),
+    메타데이터/자막/재생목록별 동시 요청 병합 통계(coalescing: 실행 수,
+    합류한 대기자 수, 최대 대기자 수 등)를 포함합니다.
+    """
+    return JSONResponse(content={
+        "cache": youtube_service.cache_stats(),
+        "coalescing": youtube_service.coalescing_stats()
+    })
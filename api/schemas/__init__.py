@@ -8,8 +8,11 @@ from .video import (
     VideoMetadata,
     TranscriptEntry,
     VideoResponse,
+    VideoScrapeOptions,
     VideoScrapeRequest,
-    VideoScrapeResponse
+    VideoScrapeResponse,
+    VideoBatchRequest,
+    VideoBatchItem
 )
 from .playlist import (
     PlaylistRequest,
@@ -17,6 +20,15 @@ from .playlist import (
     PlaylistVideoInfo,
     PlaylistResponse
 )
+from .jobs import (
+    PlaylistJobRequest,
+    JobSubmitResponse,
+    JobProgress,
+    JobVideoStatus,
+    JobStatusResponse,
+    JobVideoResult,
+    JobResultResponse
+)
 from .ai import (
     SummaryRequest,
     SummaryResponse,
@@ -34,13 +46,24 @@ __all__ = [
     "VideoMetadata",
     "TranscriptEntry",
     "VideoResponse",
+    "VideoScrapeOptions",
     "VideoScrapeRequest",
     "VideoScrapeResponse",
+    "VideoBatchRequest",
+    "VideoBatchItem",
     # Playlist schemas
     "PlaylistRequest",
     "PlaylistInfo",
     "PlaylistVideoInfo",
     "PlaylistResponse",
+    # Job schemas
+    "PlaylistJobRequest",
+    "JobSubmitResponse",
+    "JobProgress",
+    "JobVideoStatus",
+    "JobStatusResponse",
+    "JobVideoResult",
+    "JobResultResponse",
     # AI schemas
     "SummaryRequest",
     "SummaryResponse",
@@ -29,6 +29,10 @@ class SummaryRequest(BaseModel):
         default="ko",
         description="요약 언어 코드"
     )
+    bypass_cache: bool = Field(
+        default=False,
+        description="캐시된 AI 응답을 사용하지 않고 새로 생성"
+    )
 
 
 class SummaryResponse(BaseModel):
@@ -68,6 +72,10 @@ class TranslationRequest(BaseModel):
         None,
         description="원본 언어 코드 (자동 감지: None)"
     )
+    bypass_cache: bool = Field(
+        default=False,
+        description="캐시된 AI 응답을 사용하지 않고 새로 생성"
+    )
 
 
 class TranslationResponse(BaseModel):
@@ -114,6 +122,10 @@ class TopicExtractionRequest(BaseModel):
         default="ko",
         description="주제 언어 코드"
     )
+    bypass_cache: bool = Field(
+        default=False,
+        description="캐시된 AI 응답을 사용하지 않고 새로 생성"
+    )
 
 
 class TopicExtractionResponse(BaseModel):
@@ -158,6 +170,7 @@ class AIEnhancementRequest(BaseModel):
     enable_topics: bool = Field(default=False, description="주제 추출 활성화")
     num_topics: int = Field(default=5, ge=1, le=20, description="추출할 주제 수")
     language: str = Field(default="ko", description="기본 언어 코드")
+    bypass_cache: bool = Field(default=False, description="캐시된 AI 응답을 사용하지 않고 새로 생성")
 
 
 class AIEnhancementResponse(BaseModel):
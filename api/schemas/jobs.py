@@ -0,0 +1,85 @@
+"""
+작업 큐 관련 Pydantic 스키마
+"""
+
+from typing import Optional, List
+from pydantic import BaseModel, Field, ConfigDict
+
+from .video import VideoScrapeOptions, VideoScrapeResponse
+
+
+class PlaylistJobRequest(VideoScrapeOptions):
+    """플레이리스트 스크래핑 작업 제출 요청 스키마"""
+    playlist_url: str = Field(..., description="YouTube 플레이리스트 URL")
+    max_videos: Optional[int] = Field(
+        None,
+        ge=1,
+        description="처리할 최대 비디오 수 (제한 없음: None)"
+    )
+    output_format: Optional[str] = Field(
+        default=None,
+        description="출력 형식 (txt, json, xml, markdown, 기본값 None은 파일로 저장하지 않음)"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "playlist_url": "https://www.youtube.com/playlist?list=PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf",
+                "max_videos": 50,
+                "languages": ["ko", "en"],
+                "enable_summary": True,
+                "output_format": "json"
+            }
+        }
+    )
+
+
+class JobSubmitResponse(BaseModel):
+    """작업 제출 응답 스키마"""
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태")
+
+
+class JobProgress(BaseModel):
+    """작업 진행 상황 (상태별 비디오 수)"""
+    total: int = 0
+    pending: int = 0
+    running: int = 0
+    done: int = 0
+    failed: int = 0
+
+
+class JobVideoStatus(BaseModel):
+    """작업 내 비디오별 상태"""
+    position: int = Field(..., description="플레이리스트 내 위치 (0-based)")
+    video_id: Optional[str] = None
+    url: str
+    title: Optional[str] = None
+    status: str = Field(..., description="pending, running, done, failed")
+    error: Optional[str] = None
+
+
+class JobStatusResponse(BaseModel):
+    """작업 상태 응답 스키마"""
+    job_id: str
+    status: str = Field(..., description="queued, running, completed, failed, cancelled")
+    playlist_url: str
+    error: Optional[str] = None
+    created_at: float = Field(..., description="제출 시각 (Unix time)")
+    updated_at: float = Field(..., description="마지막 진행 시각 (Unix time)")
+    progress: JobProgress
+    videos: List[JobVideoStatus]
+
+
+class JobVideoResult(JobVideoStatus):
+    """작업 내 비디오별 처리 결과"""
+    result: Optional[VideoScrapeResponse] = None
+
+
+class JobResultResponse(BaseModel):
+    """작업 결과 응답 스키마 (완료된 비디오의 결과 포함)"""
+    job_id: str
+    status: str
+    playlist_url: str
+    finished: bool = Field(..., description="작업이 끝났는지 여부 (끝나지 않았으면 부분 결과)")
+    videos: List[JobVideoResult]
@@ -2,7 +2,7 @@
 비디오 관련 Pydantic 스키마
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Literal
 from pydantic import BaseModel, Field, ConfigDict
 
 
@@ -105,11 +105,18 @@ class VideoResponse(BaseModel):
     metadata: VideoMetadata
     transcript: List[TranscriptEntry]
     transcript_language: Optional[str] = Field(None, description="자막 언어 코드")
+    partial: bool = Field(
+        False,
+        description="메타데이터나 자막을 가져오지 못해 기본값(Unknown Title 또는 빈 자막)으로 채운 결과인지 여부"
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict,
+        description="가져오지 못한 항목별 사유 (metadata, transcript 키, 시간 초과 포함)"
+    )
 
 
-class VideoScrapeRequest(BaseModel):
-    """비디오 스크래핑 요청 스키마 (AI 기능 포함)"""
-    video_url: str = Field(..., description="YouTube 비디오 URL")
+class VideoScrapeOptions(BaseModel):
+    """비디오 스크래핑 옵션 (단일/일괄 스크래핑 요청 공통)"""
     languages: List[str] = Field(
         default=["ko", "en"],
         description="자막 언어 우선순위 목록"
@@ -146,10 +153,19 @@ class VideoScrapeRequest(BaseModel):
         le=20,
         description="추출할 주제 수 (1-20)"
     )
-    output_format: str = Field(
+    output_format: Optional[str] = Field(
         default="json",
-        description="출력 형식 (txt, json, xml, markdown)"
+        description="출력 형식 (txt, json, xml, markdown, None이면 파일로 저장하지 않음)"
     )
+    bypass_cache: bool = Field(
+        default=False,
+        description="캐시된 AI 응답을 사용하지 않고 새로 생성"
+    )
+
+
+class VideoScrapeRequest(VideoScrapeOptions):
+    """비디오 스크래핑 요청 스키마 (AI 기능 포함)"""
+    video_url: str = Field(..., description="YouTube 비디오 URL")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -176,8 +192,17 @@ class VideoScrapeResponse(BaseModel):
     transcript_language: Optional[str] = None
     summary: Optional[str] = None
     translation: Optional[str] = None
+    translated_transcript: Optional[List[TranscriptEntry]] = None
     key_topics: Optional[List[str]] = None
     output_file: Optional[str] = None
+    partial: bool = Field(
+        False,
+        description="메타데이터나 자막을 가져오지 못해 기본값(Unknown Title 또는 빈 자막)으로 채운 결과인지 여부"
+    )
+    errors: Dict[str, str] = Field(
+        default_factory=dict,
+        description="가져오지 못한 항목별 사유 (metadata, transcript 키, 시간 초과 포함)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -203,3 +228,50 @@ class VideoScrapeResponse(BaseModel):
             }
         }
     )
+
+
+class VideoBatchRequest(VideoScrapeOptions):
+    """비디오 일괄 스크래핑 요청 스키마"""
+    video_urls: List[str] = Field(
+        ...,
+        min_length=1,
+        description="YouTube 비디오 URL 목록"
+    )
+    max_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="동시에 처리할 비디오 수 (서버 상한 BATCH_MAX_CONCURRENCY를 넘지 않음)"
+    )
+    stream_format: Literal["ndjson", "sse"] = Field(
+        default="ndjson",
+        description="결과 스트림 형식 (ndjson: 줄 단위 JSON, sse: Server-Sent Events)"
+    )
+    output_format: Optional[str] = Field(
+        default=None,
+        description="출력 형식 (txt, json, xml, markdown, 기본값 None은 파일로 저장하지 않음)"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "video_urls": [
+                    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    "https://www.youtube.com/watch?v=9bZkp7q19f0"
+                ],
+                "languages": ["ko", "en"],
+                "enable_summary": True,
+                "summary_max_points": 5,
+                "stream_format": "ndjson"
+            }
+        }
+    )
+
+
+class VideoBatchItem(BaseModel):
+    """일괄 스크래핑 결과 스트림의 비디오별 항목"""
+    index: int = Field(..., description="요청 목록에서의 위치 (0부터 시작)")
+    video_url: str
+    status: Literal["ok", "error"]
+    result: Optional[VideoScrapeResponse] = None
+    error: Optional[str] = None
+    status_code: Optional[int] = Field(None, description="실패 시 단일 요청이었다면 반환했을 HTTP 상태 코드")
@@ -5,20 +5,18 @@ YouTube 비디오 스크래핑 및 AI 기능을 제공하는 RESTful API
 에이전트 프레임워크가 사용할 수 있는 보편적인 도구 API를 제공합니다.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
-import uvicorn
 
-from api.routers import video_router, playlist_router, ai_router
+from api.routers import video_router, playlist_router, ai_router, jobs_router
+from core.executor import run_blocking, shutdown_blocking_executor
+from core.extractor_pool import shutdown_extractor_pool
 from utils import settings
-from tools import (
-    VideoScraperTool,
-    SummarizerTool,
-    TranslatorTool,
-    TopicExtractorTool
-)
+from utils.dependencies import init_services, close_services
 
 # 로깅 설정
 logging.basicConfig(
@@ -27,6 +25,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 수명 관리
+
+    시작 시 공유 서비스를 생성하고 워밍업하며, 종료 시 서비스 연결,
+    추출기 풀, 작업 스레드 풀을 정리합니다.
+    """
+    logger.info(f"Starting {settings.api_title} v{settings.api_version}")
+    logger.info(f"API documentation available at: /docs")
+    logger.info(f"Tool schemas available at: /tools/schemas")
+    await run_blocking(None, init_services, warm_up=settings.service_warm_up, start_jobs=True)
+
+    try:
+        yield
+    finally:
+        logger.info(f"Shutting down {settings.api_title}")
+        close_services()
+        shutdown_extractor_pool()
+        shutdown_blocking_executor(wait=False)
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title=settings.api_title,
@@ -35,6 +56,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -50,6 +72,7 @@ app.add_middleware(
 app.include_router(video_router)
 app.include_router(playlist_router)
 app.include_router(ai_router)
+app.include_router(jobs_router)
 
 
 @app.get("/")
@@ -70,14 +93,23 @@ async def root():
             "video": {
                 "info": "/video/info",
                 "scrape": "/video/scrape",
+                "batch": "/video/batch",
                 "metadata": "/video/metadata",
-                "transcript": "/video/transcript"
+                "transcript": "/video/transcript",
+                "export": "/video/export",
+                "health": "/video/health"
             },
             "playlist": {
                 "info": "/playlist/info",
                 "check": "/playlist/check",
                 "videos": "/playlist/videos"
             },
+            "jobs": {
+                "submit_playlist": "/jobs/playlist",
+                "status": "/jobs/{job_id}",
+                "result": "/jobs/{job_id}/result",
+                "cancel": "/jobs/{job_id}/cancel"
+            },
             "ai": {
                 "summary": "/ai/summary",
                 "translate": "/ai/translate",
@@ -114,6 +146,14 @@ async def get_tool_schemas():
     OpenAI function calling 형식의 도구 스키마를 제공합니다.
     Claude, GPT, LangChain 등 다양한 에이전트 프레임워크에서 사용 가능합니다.
     """
+    # 도구 클래스는 스키마 요청 시에만 필요하므로 앱 시작 시 import하지 않음
+    from tools import (
+        VideoScraperTool,
+        SummarizerTool,
+        TranslatorTool,
+        TopicExtractorTool
+    )
+
     schemas = [
         VideoScraperTool.get_tool_schema(),
         SummarizerTool.get_tool_schema(),
@@ -146,24 +186,6 @@ async def get_tool_schemas():
     })
 
 
-@app.on_event("startup")
-async def startup_event():
-    """
-    애플리케이션 시작 이벤트
-    """
-    logger.info(f"Starting {settings.api_title} v{settings.api_version}")
-    logger.info(f"API documentation available at: /docs")
-    logger.info(f"Tool schemas available at: /tools/schemas")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    애플리케이션 종료 이벤트
-    """
-    logger.info(f"Shutting down {settings.api_title}")
-
-
 def start_server(
     host: str = None,
     port: int = None,
@@ -177,6 +199,8 @@ def start_server(
         port: 포트 번호 (기본값: settings.api_port)
         reload: 자동 리로드 활성화 (개발 모드)
     """
+    import uvicorn
+
     uvicorn.run(
         "api_main:app",
         host=host or settings.api_host,
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+yt-dlp 추출기 풀 벤치마크
+호출마다 YoutubeDL을 생성/해제하는 방식과 ExtractorPool 재사용 방식의
+호출당 오버헤드를 비교합니다.
+
+사용법:
+  # 초기화 오버헤드만 측정 (네트워크 불필요)
+  python benchmarks/bench_extractor_pool.py
+
+  # 실제 메타데이터 추출까지 포함하여 측정
+  python benchmarks/bench_extractor_pool.py --url https://www.youtube.com/watch?v=VIDEO_ID
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import yt_dlp
+
+from core.extractor_pool import ExtractorPool
+from youtube_api import METADATA_YDL_OPTS, get_video_metadata
+
+
+def measure(label: str, func, iterations: int) -> float:
+    """
+    함수를 반복 실행하고 호출당 평균 시간을 출력합니다.
+
+    Returns:
+        호출당 평균 시간 (ms)
+    """
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    mean = statistics.mean(timings)
+    print(
+        f"{label:<28} mean={mean:8.2f} ms  "
+        f"median={statistics.median(timings):8.2f} ms  "
+        f"max={max(timings):8.2f} ms"
+    )
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ExtractorPool 호출당 오버헤드 벤치마크')
+    parser.add_argument('--iterations', type=int, default=30, help='반복 횟수 (기본값: 30)')
+    parser.add_argument('--url', help='실제로 메타데이터를 추출할 비디오 URL (선택)')
+    args = parser.parse_args()
+
+    pool = ExtractorPool(size=1)
+
+    if args.url:
+        def per_call():
+            get_video_metadata(args.url)
+
+        def pooled():
+            with pool.acquire(METADATA_YDL_OPTS) as ydl:
+                get_video_metadata(args.url, ydl=ydl)
+    else:
+        def per_call():
+            with yt_dlp.YoutubeDL(METADATA_YDL_OPTS):
+                pass
+
+        def pooled():
+            with pool.acquire(METADATA_YDL_OPTS):
+                pass
+
+    print(f"Iterations: {args.iterations}" + (f", URL: {args.url}" if args.url else ""))
+    before = measure("per-call YoutubeDL", per_call, args.iterations)
+    after = measure("pooled YoutubeDL", pooled, args.iterations)
+    print(f"\nOverhead saved per call: {before - after:.2f} ms ({before / max(after, 1e-6):.1f}x)")
+
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
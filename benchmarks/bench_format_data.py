@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+format_data 벤치마크
+임시 파일에 저장한 뒤 다시 읽는 기존 방식과 메모리 버퍼에 바로 출력하는
+FormatterService.format_data의 호출당 시간과 파일 시스템 호출 수를 비교합니다.
+
+사용법:
+  # 10시간 분량(약 2초 간격 18,000개 항목) 자막으로 측정
+  python benchmarks/bench_format_data.py
+
+  # 항목 수와 형식 지정
+  python benchmarks/bench_format_data.py --entries 50000 --formats json xml
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.formatter_service import FormatterService
+
+# 파일 시스템 호출로 집계할 감사(audit) 이벤트
+FILE_EVENTS = {'open', 'os.remove', 'os.unlink', 'tempfile.mkstemp'}
+_counting = False
+_file_events = 0
+
+
+def _audit_hook(event: str, args) -> None:
+    global _file_events
+    if _counting and event in FILE_EVENTS:
+        _file_events += 1
+
+
+def format_via_tempfile(service: FormatterService, metadata, transcript, format_choice) -> str:
+    """기존 format_data 구현: 임시 파일에 저장 → 읽기 → 삭제"""
+    formatter = service.get_formatter(format_choice)
+    with tempfile.NamedTemporaryFile(
+        mode='w',
+        suffix=f'.{formatter.file_extension}',
+        delete=False
+    ) as tmp_file:
+        tmp_path = tmp_file.name
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            formatter.save(metadata=metadata, transcript=transcript, output_file=tmp_path)
+        with open(tmp_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def make_sample(entries: int):
+    """벤치마크용 메타데이터와 자막을 생성합니다."""
+    metadata = {
+        'video_id': 'bench',
+        'title': 'Benchmark Video',
+        'channel': 'Benchmark Channel',
+        'upload_date': '20240101',
+        'duration': entries * 2,
+        'view_count': 1000,
+        'description': 'Benchmark description',
+    }
+    transcript = [
+        {'start': i * 2.0, 'duration': 2.0, 'text': f'caption line number {i} with some words'}
+        for i in range(entries)
+    ]
+    return metadata, transcript
+
+
+def measure(label: str, func, iterations: int) -> float:
+    """
+    함수를 반복 실행하고 호출당 평균 시간과 파일 시스템 호출 수를 출력합니다.
+
+    Returns:
+        호출당 평균 시간 (ms)
+    """
+    global _counting, _file_events
+    timings = []
+    _file_events = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        _counting = True
+        func()
+        _counting = False
+        timings.append((time.perf_counter() - start) * 1000)
+
+    mean = statistics.mean(timings)
+    print(
+        f"{label:<24} mean={mean:9.2f} ms  "
+        f"median={statistics.median(timings):9.2f} ms  "
+        f"file ops/call={_file_events / iterations:5.1f}"
+    )
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description='format_data 임시 파일 제거 벤치마크')
+    parser.add_argument('--entries', type=int, default=18000, help='자막 항목 수 (기본값: 18000)')
+    parser.add_argument('--iterations', type=int, default=10, help='반복 횟수 (기본값: 10)')
+    parser.add_argument(
+        '--formats', nargs='+', default=['txt', 'json', 'xml', 'markdown'],
+        help='측정할 형식 (기본값: txt json xml markdown)'
+    )
+    args = parser.parse_args()
+
+    sys.addaudithook(_audit_hook)
+    service = FormatterService()
+    metadata, transcript = make_sample(args.entries)
+
+    print(f"Entries: {args.entries}, iterations: {args.iterations}")
+    for format_choice in args.formats:
+        print(f"\n[{format_choice}]")
+        before = measure(
+            "tempfile round trip",
+            lambda: format_via_tempfile(service, metadata, transcript, format_choice),
+            args.iterations
+        )
+        after = measure(
+            "in-memory format_data",
+            lambda: service.format_data(metadata, transcript, format_choice=format_choice),
+            args.iterations
+        )
+        print(f"Saved per call: {before - after:.2f} ms ({before / max(after, 1e-6):.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+시작(import) 시간 벤치마크
+`python -X importtime`으로 CLI(main)와 API(api_main) 모듈의 import 시간을 측정하고,
+예산을 넘거나 무거운 의존성(yt-dlp, youtube-transcript-api, google-genai, httpx)이
+시작 시점에 로드되면 0이 아닌 종료 코드로 실패합니다 (CI 회귀 검사용).
+
+API의 import 시간은 대부분 FastAPI 자체가 차지하고 머신에 따라 크게 달라지므로
+(300-450ms), API 예산은 프레임워크(FastAPI, pydantic-settings)를 먼저 import한 뒤
+측정한 애플리케이션 코드의 import 시간에 적용합니다. 프레임워크 시간은 참고용으로 출력합니다.
+
+사용법:
+  python benchmarks/bench_import_time.py
+  python benchmarks/bench_import_time.py --runs 7 --cli-budget 80 --api-budget 200
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 처음 사용할 때까지 로드하지 않아야 하는 무거운 의존성
+DEFERRED_MODULES = ('yt_dlp', 'youtube_transcript_api', 'google.genai', 'httpx')
+
+# 예산에서 제외하고 먼저 import하는 프레임워크 모듈
+FRAMEWORK_MODULES = {
+    'main': (),
+    'api_main': ('fastapi', 'pydantic_settings'),
+}
+
+# 대상 모듈별 기본 예산 (ms, 프레임워크 제외)
+# 측정값: main 약 20-30ms, api_main 애플리케이션 코드 약 80-130ms (FastAPI 약 300-450ms 별도)
+DEFAULT_BUDGETS = {
+    'main': 100.0,
+    'api_main': 300.0,
+}
+
+
+def import_profile(module: str, framework: Tuple[str, ...] = ()) -> Tuple[float, float, List[str]]:
+    """
+    새 인터프리터에서 모듈을 import하고 -X importtime 출력을 파싱합니다.
+
+    Args:
+        module: import할 모듈 이름
+        framework: 모듈보다 먼저 import하여 모듈의 시간에서 제외할 모듈 이름들
+
+    Returns:
+        (모듈의 누적 import 시간(ms), 프레임워크 모듈의 누적 import 시간(ms),
+        로드된 모듈 이름 목록)
+    """
+    code = ''.join(f'import {name}; ' for name in framework) + f'import {module}'
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    cumulative = None
+    framework_time = 0.0
+    loaded = []
+    for line in result.stderr.splitlines():
+        # 형식: "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # 헤더 줄
+        name = parts[2].strip()
+        loaded.append(name)
+        if name == module:
+            cumulative = int(parts[1]) / 1000
+        elif name in framework:
+            framework_time += int(parts[1]) / 1000
+
+    if cumulative is None:
+        raise RuntimeError(f"{module} import 시간을 찾을 수 없습니다")
+    return cumulative, framework_time, loaded
+
+
+def check_module(module: str, budget: float, runs: int) -> bool:
+    """
+    모듈의 import 시간(중앙값)과 지연 로드 대상 모듈을 검사하고 결과를 출력합니다.
+
+    Args:
+        module: 검사할 모듈 이름
+        budget: 허용 import 시간 (ms, 프레임워크 모듈 제외)
+        runs: 측정 횟수
+
+    Returns:
+        예산 이내이고 무거운 의존성을 로드하지 않았으면 True
+    """
+    framework = FRAMEWORK_MODULES.get(module, ())
+    timings = []
+    framework_timings = []
+    loaded = []
+    for _ in range(runs):
+        elapsed, framework_time, loaded = import_profile(module, framework)
+        timings.append(elapsed)
+        framework_timings.append(framework_time)
+
+    median = statistics.median(timings)
+    eager = [deferred for deferred in DEFERRED_MODULES if deferred in loaded]
+
+    ok = median <= budget and not eager
+    line = (
+        f"{'OK  ' if ok else 'FAIL'} import {module:<10} "
+        f"median={median:8.1f} ms  min={min(timings):8.1f} ms  budget={budget:8.1f} ms"
+    )
+    if framework:
+        line += f"  (+ {', '.join(framework)}: median={statistics.median(framework_timings):.1f} ms)"
+    print(line)
+    if eager:
+        print(f"     시작 시점에 로드된 무거운 의존성: {', '.join(eager)}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI/API 시작 시간 예산 검사')
+    parser.add_argument('--runs', type=int, default=5, help='모듈별 측정 횟수 (기본값: 5)')
+    parser.add_argument(
+        '--cli-budget', type=float, default=DEFAULT_BUDGETS['main'],
+        help=f"import main 예산 (ms, 기본값: {DEFAULT_BUDGETS['main']:.0f})"
+    )
+    parser.add_argument(
+        '--api-budget', type=float, default=DEFAULT_BUDGETS['api_main'],
+        help=f"import api_main 예산 (ms, FastAPI/pydantic-settings 제외, 기본값: {DEFAULT_BUDGETS['api_main']:.0f})"
+    )
+    args = parser.parse_args()
+
+    budgets: Dict[str, float] = {'main': args.cli_budget, 'api_main': args.api_budget}
+    results = [check_module(module, budget, args.runs) for module, budget in budgets.items()]
+
+    if not all(results):
+        print("\n시작 시간 예산을 초과했습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
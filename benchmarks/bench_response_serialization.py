@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+/video/info 응답 직렬화 벤치마크
+자막 항목마다 TranscriptEntry 모델을 만들고 response_model로 다시 검증/직렬화하던
+기존 방식과, 자막 배열을 바로 JSON 바이트로 만드는 현재 방식의 요청당 시간을 비교합니다.
+
+사용법:
+  python benchmarks/bench_response_serialization.py
+  python benchmarks/bench_response_serialization.py --entries 20000 --iterations 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.responses
+from api_main import app
+from api.schemas.video import VideoRequest, VideoResponse, TranscriptEntry
+from utils.dependencies import get_youtube_service
+from utils.metadata import normalize_metadata, validate_metadata
+from utils.transcript import Transcript
+
+
+class StubYouTubeService:
+    """네트워크 없이 고정된 비디오 정보를 반환하는 서비스"""
+
+    def __init__(self, entries: int):
+        self.result = {
+            'video_id': 'bench',
+            'metadata': {
+                'video_id': 'bench',
+                'title': 'Benchmark Video',
+                'channel': 'Benchmark Channel',
+                'upload_date': '20240101',
+                'duration': entries * 2,
+                'view_count': 1000,
+            },
+            'transcript': Transcript(
+                {'start': i * 2.0, 'duration': 2.0, 'text': f'caption line number {i} with some words'}
+                for i in range(entries)
+            ),
+        }
+
+    async def get_video_info_async(self, video_url, languages=None, prefer_manual=True):
+        return self.result
+
+
+def legacy_app(service: StubYouTubeService) -> FastAPI:
+    """기존 /video/info 구현 (항목별 모델 생성 + response_model 직렬화)"""
+    legacy = FastAPI()
+
+    @legacy.post("/video/info", response_model=VideoResponse)
+    async def get_video_info(request: VideoRequest):
+        result = await service.get_video_info_async(request.video_url)
+        metadata_dict = normalize_metadata(result['metadata'], video_id=result['video_id'])
+        return VideoResponse(
+            metadata=validate_metadata(metadata_dict),
+            transcript=[TranscriptEntry(**entry) for entry in result['transcript']],
+            transcript_language=request.languages[0] if request.languages else None
+        )
+
+    return legacy
+
+
+def measure(label: str, client: TestClient, iterations: int) -> float:
+    """
+    /video/info 요청을 반복하고 요청당 평균 시간을 출력합니다.
+
+    Returns:
+        요청당 평균 시간 (ms)
+    """
+    body = {"video_url": "https://www.youtube.com/watch?v=bench"}
+    client.post("/video/info", json=body)  # 워밍업
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.post("/video/info", json=body)
+        timings.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+
+    mean = statistics.mean(timings)
+    print(
+        f"{label:<28} mean={mean:8.2f} ms  "
+        f"median={statistics.median(timings):8.2f} ms  "
+        f"body={len(response.content) / 1024:7.1f} KiB"
+    )
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/video/info 응답 직렬화 벤치마크')
+    parser.add_argument('--entries', type=int, default=5000, help='자막 항목 수 (기본값: 5000)')
+    parser.add_argument('--iterations', type=int, default=20, help='반복 횟수 (기본값: 20)')
+    args = parser.parse_args()
+
+    service = StubYouTubeService(args.entries)
+    app.dependency_overrides[get_youtube_service] = lambda: service
+
+    print(
+        f"Entries: {args.entries}, iterations: {args.iterations}, "
+        f"orjson: {'yes' if api.responses.orjson is not None else 'no (json fallback)'}"
+    )
+    before = measure("response_model + models", TestClient(legacy_app(service)), args.iterations)
+    after = measure("fast path", TestClient(app), args.iterations)
+    print(f"\nSaved per request: {before - after:.2f} ms ({before / max(after, 1e-6):.1f}x)")
+
+    app.dependency_overrides = {}
+
+
+if __name__ == "__main__":
+    main()
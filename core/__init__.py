@@ -3,9 +3,22 @@ Core 서비스 레이어 패키지
 비즈니스 로직을 캡슐화하고 재사용 가능한 서비스를 제공합니다.
 """
 
-from .youtube_service import YouTubeService
-from .ai_service import AIService
-from .formatter_service import FormatterService
+# 서비스 모듈은 처음 접근할 때 로드합니다. 예를 들어 core.youtube_service만
+# 사용하는 CLI가 AIService(gemini_api, httpx)까지 불러오지 않도록 합니다.
+_SERVICE_MODULES = {
+    "YouTubeService": "youtube_service",
+    "AIService": "ai_service",
+    "FormatterService": "formatter_service",
+}
+
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        import importlib
+        module = importlib.import_module(f".{_SERVICE_MODULES[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "YouTubeService",
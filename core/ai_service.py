@@ -3,19 +3,20 @@ AI 서비스
 Gemini API를 사용한 AI 기능을 제공하는 서비스 레이어
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, List, Dict
 import logging
 import time
 import os
 
 from gemini_api import GeminiClient, is_gemini_available, GeminiAPIError
+from core.executor import run_blocking
 from utils.config import settings
+from utils.lazy_import import lazy_module
 
-# google-genai 패키지 import 확인
-try:
-    from google import genai
-except ImportError:
-    genai = None
+# google-genai 패키지 설치 확인 (실제 로드는 첫 클라이언트 생성 시)
+genai = lazy_module('google.genai')
 
 logger = logging.getLogger(__name__)
 
@@ -99,11 +100,58 @@ class AIService:
         """
         return self.available and self.client is not None
 
+    def warm_up(self) -> None:
+        """
+        Gemini 연결을 미리 준비합니다 (AI 서비스 비활성화 시 아무 작업도 하지 않음).
+        """
+        if self.is_available():
+            self.client.warm_up()
+
+    def close(self) -> None:
+        """Gemini 클라이언트의 HTTP 연결을 닫습니다."""
+        if self.client is not None:
+            self.client.close()
+
+    def get_cache_stats(self) -> Optional[Dict]:
+        """
+        LLM 응답 캐시 통계를 반환합니다.
+
+        Returns:
+            캐시 통계 딕셔너리 또는 None (AI 서비스 또는 캐시 비활성화 시)
+        """
+        if not self.is_available() or self.client.response_cache is None:
+            return None
+        return self.client.response_cache.stats()
+
+    def get_coalescing_stats(self) -> Optional[Dict]:
+        """
+        동시에 들어온 같은 Gemini 요청의 병합(single-flight) 통계를 반환합니다.
+
+        Returns:
+            실행 수, 합류한 대기자 수, 최대 대기자 수 등을 포함한 딕셔너리
+            또는 None (AI 서비스 비활성화 시)
+        """
+        if not self.is_available():
+            return None
+        return self.client.request_flight.stats()
+
+    def get_rate_limit_stats(self) -> Optional[Dict]:
+        """
+        Gemini 호출의 현재 요청 한도와 대기열 상태를 반환합니다.
+
+        Returns:
+            rate_limiter, concurrency 통계를 포함한 딕셔너리 또는 None (AI 서비스 비활성화 시)
+        """
+        if not self.is_available():
+            return None
+        return self.client.limiter_stats()
+
     def generate_summary(
         self,
         transcript: List[Dict],
         max_points: int = 5,
-        language: str = 'ko'
+        language: str = 'ko',
+        use_cache: bool = True
     ) -> Optional[str]:
         """
         자막에서 요약을 생성합니다.
@@ -112,6 +160,7 @@ class AIService:
             transcript: 자막 데이터 리스트
             max_points: 최대 요약 포인트 수
             language: 요약 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             생성된 요약 문자열 또는 None
@@ -124,7 +173,8 @@ class AIService:
             summary = self.client.generate_summary(
                 transcript=transcript,
                 max_points=max_points,
-                language=language
+                language=language,
+                use_cache=use_cache
             )
             logger.info("Successfully generated summary")
             return summary
@@ -136,7 +186,8 @@ class AIService:
         self,
         text: str,
         max_points: int = 5,
-        language: str = 'ko'
+        language: str = 'ko',
+        use_cache: bool = True
     ) -> Optional[str]:
         """
         텍스트에서 요약을 생성합니다.
@@ -145,6 +196,7 @@ class AIService:
             text: 요약할 텍스트
             max_points: 최대 요약 포인트 수
             language: 요약 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             생성된 요약 문자열 또는 None
@@ -155,13 +207,14 @@ class AIService:
 
         # 텍스트를 자막 형식으로 변환
         transcript = [{'text': text, 'start': 0, 'duration': 0}]
-        return self.generate_summary(transcript, max_points, language)
+        return self.generate_summary(transcript, max_points, language, use_cache)
 
     def translate_text(
         self,
         text: str,
         target_language: str,
-        source_language: Optional[str] = None
+        source_language: Optional[str] = None,
+        use_cache: bool = True
     ) -> Optional[str]:
         """
         텍스트를 번역합니다.
@@ -170,6 +223,7 @@ class AIService:
             text: 번역할 텍스트
             target_language: 대상 언어 코드
             source_language: 원본 언어 코드 (None이면 자동 감지)
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             번역된 텍스트 또는 None
@@ -182,7 +236,8 @@ class AIService:
             translated = self.client.translate_text(
                 text=text,
                 target_language=target_language,
-                source_language=source_language
+                source_language=source_language,
+                use_cache=use_cache
             )
             logger.info(f"Successfully translated text to {target_language}")
             return translated
@@ -194,7 +249,8 @@ class AIService:
         self,
         transcript: List[Dict],
         target_language: str,
-        source_language: Optional[str] = None
+        source_language: Optional[str] = None,
+        use_cache: bool = True
     ) -> Optional[str]:
         """
         자막 전체를 번역합니다.
@@ -203,6 +259,7 @@ class AIService:
             transcript: 자막 데이터 리스트
             target_language: 대상 언어 코드
             source_language: 원본 언어 코드
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             번역된 텍스트 또는 None
@@ -215,7 +272,8 @@ class AIService:
             translated = self.client.translate_transcript(
                 transcript=transcript,
                 target_language=target_language,
-                source_language=source_language
+                source_language=source_language,
+                use_cache=use_cache
             )
             logger.info(f"Successfully translated transcript to {target_language}")
             return translated
@@ -223,11 +281,48 @@ class AIService:
             logger.error(f"Failed to translate transcript: {e}")
             return None
 
+    def translate_transcript_entries(
+        self,
+        transcript: List[Dict],
+        target_language: str,
+        source_language: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Optional[List[Dict]]:
+        """
+        자막을 항목별로 번역합니다 (타임스탬프 유지).
+
+        Args:
+            transcript: 자막 데이터 리스트
+            target_language: 대상 언어 코드
+            source_language: 원본 언어 코드
+            use_cache: False면 캐시된 응답을 사용하지 않음
+
+        Returns:
+            원본과 같은 순서와 타임스탬프를 가진 번역 자막 리스트 또는 None
+        """
+        if not self.is_available():
+            logger.warning("AI service not available for transcript translation")
+            return None
+
+        try:
+            translated = self.client.translate_transcript_entries(
+                transcript=transcript,
+                target_language=target_language,
+                source_language=source_language,
+                use_cache=use_cache
+            )
+            logger.info(f"Successfully translated transcript entries to {target_language}")
+            return translated
+        except GeminiAPIError as e:
+            logger.error(f"Failed to translate transcript: {e}")
+            return None
+
     def extract_topics(
         self,
         transcript: List[Dict],
         num_topics: int = 5,
-        language: str = 'ko'
+        language: str = 'ko',
+        use_cache: bool = True
     ) -> Optional[List[str]]:
         """
         자막에서 핵심 주제를 추출합니다.
@@ -236,6 +331,7 @@ class AIService:
             transcript: 자막 데이터 리스트
             num_topics: 추출할 주제 수
             language: 주제 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             주제 리스트 또는 None
@@ -248,7 +344,8 @@ class AIService:
             topics = self.client.extract_key_topics(
                 transcript=transcript,
                 num_topics=num_topics,
-                language=language
+                language=language,
+                use_cache=use_cache
             )
             logger.info(f"Successfully extracted {len(topics) if topics else 0} topics")
             return topics
@@ -260,7 +357,8 @@ class AIService:
         self,
         text: str,
         num_topics: int = 5,
-        language: str = 'ko'
+        language: str = 'ko',
+        use_cache: bool = True
     ) -> Optional[List[str]]:
         """
         텍스트에서 핵심 주제를 추출합니다.
@@ -269,6 +367,7 @@ class AIService:
             text: 분석할 텍스트
             num_topics: 추출할 주제 수
             language: 주제 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             주제 리스트 또는 None
@@ -279,7 +378,7 @@ class AIService:
 
         # 텍스트를 자막 형식으로 변환
         transcript = [{'text': text, 'start': 0, 'duration': 0}]
-        return self.extract_topics(transcript, num_topics, language)
+        return self.extract_topics(transcript, num_topics, language, use_cache)
 
     def enhance_transcript(
         self,
@@ -290,11 +389,17 @@ class AIService:
         target_language: Optional[str] = None,
         enable_topics: bool = False,
         num_topics: int = 5,
-        language: str = 'ko'
+        language: str = 'ko',
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = True
     ) -> Dict:
         """
         자막을 AI로 향상시킵니다 (요약, 번역, 주제 추출).
 
+        요청된 작업들은 서로 독립적이므로 최대 max_concurrency개까지 동시에 실행합니다.
+        실제 API 호출 속도는 모델별 속도 제한기가 조절합니다.
+        한 작업이 실패해도 나머지 결과는 그대로 반환합니다.
+
         Args:
             transcript: 자막 데이터 리스트
             enable_summary: 요약 활성화
@@ -304,13 +409,17 @@ class AIService:
             enable_topics: 주제 추출 활성화
             num_topics: 추출할 주제 수
             language: 기본 언어
+            max_concurrency: 동시에 실행할 최대 작업 수 (None이면 ai_max_concurrency 설정 사용)
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
-            향상된 데이터를 포함한 딕셔너리
+            향상된 데이터를 포함한 딕셔너리. 번역 결과는 항목별 번역 자막
+            (translated_transcript)과 이를 결합한 텍스트(translation)로 제공됩니다.
         """
         result = {
             'summary': None,
             'translation': None,
+            'translated_transcript': None,
             'topics': None,
             'processing_time': 0.0
         }
@@ -321,30 +430,93 @@ class AIService:
 
         start_time = time.time()
 
+        tasks = {}
         # 요약 생성
         if enable_summary:
-            result['summary'] = self.generate_summary(
+            tasks['summary'] = partial(
+                self.generate_summary,
                 transcript=transcript,
                 max_points=summary_max_points,
-                language=language
+                language=language,
+                use_cache=use_cache
             )
 
         # 번역
         if enable_translation and target_language:
-            result['translation'] = self.translate_transcript(
+            tasks['translated_transcript'] = partial(
+                self.translate_transcript_entries,
                 transcript=transcript,
-                target_language=target_language
+                target_language=target_language,
+                use_cache=use_cache
             )
 
         # 주제 추출
         if enable_topics:
-            result['topics'] = self.extract_topics(
+            tasks['topics'] = partial(
+                self.extract_topics,
                 transcript=transcript,
                 num_topics=num_topics,
-                language=language
+                language=language,
+                use_cache=use_cache
+            )
+
+        if tasks:
+            if max_concurrency is None:
+                max_concurrency = settings.ai_max_concurrency
+            workers = max(1, min(max_concurrency, len(tasks)))
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-enhance") as executor:
+                futures = {name: executor.submit(task) for name, task in tasks.items()}
+                for name, future in futures.items():
+                    try:
+                        result[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to generate {name}: {e}")
+
+        if result['translated_transcript']:
+            result['translation'] = " ".join(
+                entry['text'].strip()
+                for entry in result['translated_transcript']
+                if entry.get('text', '').strip()
             )
 
         result['processing_time'] = time.time() - start_time
         logger.info(f"Enhancement completed in {result['processing_time']:.2f}s")
 
         return result
+
+    async def enhance_transcript_async(
+        self,
+        transcript: List[Dict],
+        enable_summary: bool = False,
+        summary_max_points: int = 5,
+        enable_translation: bool = False,
+        target_language: Optional[str] = None,
+        enable_topics: bool = False,
+        num_topics: int = 5,
+        language: str = 'ko',
+        max_concurrency: Optional[int] = None,
+        use_cache: bool = True
+    ) -> Dict:
+        """
+        enhance_transcript의 비동기 버전입니다.
+
+        블로킹 API 호출을 전역 실행기에서 실행하여 이벤트 루프를 차단하지 않습니다.
+
+        Returns:
+            향상된 데이터를 포함한 딕셔너리
+        """
+        return await run_blocking(
+            None,
+            self.enhance_transcript,
+            transcript,
+            enable_summary=enable_summary,
+            summary_max_points=summary_max_points,
+            enable_translation=enable_translation,
+            target_language=target_language,
+            enable_topics=enable_topics,
+            num_topics=num_topics,
+            language=language,
+            max_concurrency=max_concurrency,
+            use_cache=use_cache
+        )
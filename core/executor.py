@@ -0,0 +1,100 @@
+"""
+블로킹 작업 실행기
+yt-dlp, youtube-transcript-api 같은 동기 라이브러리 호출을
+이벤트 루프 밖의 제한된 스레드 풀에서 실행합니다.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Callable, Any, Dict
+import asyncio
+import logging
+import threading
+
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executor_lock = threading.Lock()
+
+
+def _get_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    with _executor_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=name
+            )
+            _executors[name] = executor
+        return executor
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """
+    프로세스 전역 블로킹 작업 실행기를 반환합니다.
+
+    스레드 수는 blocking_executor_workers 설정으로 제한되며,
+    이를 넘는 요청은 실행기 큐에서 대기합니다.
+
+    Returns:
+        ThreadPoolExecutor 인스턴스
+    """
+    return _get_executor("blocking", settings.blocking_executor_workers)
+
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """
+    한 요청 안의 독립적인 네트워크 호출을 병렬로 실행할 실행기를 반환합니다.
+
+    블로킹 작업 실행기의 스레드가 이 실행기의 작업을 기다리므로,
+    두 실행기를 분리하여 서로를 기다리며 멈추는 상황을 방지합니다.
+
+    Returns:
+        ThreadPoolExecutor 인스턴스
+    """
+    return _get_executor("fetch", settings.fetch_executor_workers)
+
+
+def shutdown_blocking_executor(wait: bool = True) -> None:
+    """
+    프로세스 전역 실행기를 모두 종료합니다.
+
+    Args:
+        wait: 실행 중인 작업이 끝날 때까지 대기할지 여부
+    """
+    with _executor_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+    if executors:
+        logger.info("Blocking executors shut down")
+
+
+async def run_blocking(
+    executor: Optional[Executor],
+    func: Callable[..., Any],
+    *args,
+    **kwargs
+) -> Any:
+    """
+    동기 함수를 실행기에서 실행하고 결과를 기다립니다.
+
+    Args:
+        executor: 사용할 실행기 (None이면 프로세스 전역 실행기)
+        func: 실행할 동기 함수
+        *args: 함수 위치 인자
+        **kwargs: 함수 키워드 인자
+
+    Returns:
+        함수 반환값
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor or get_blocking_executor(),
+        partial(func, *args, **kwargs)
+    )
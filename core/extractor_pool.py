@@ -0,0 +1,239 @@
+"""
+yt-dlp 추출기 풀
+YoutubeDL 인스턴스를 재사용하여 호출마다 발생하는 초기화 비용을 줄입니다.
+"""
+
+from contextlib import contextmanager
+from typing import Optional, Dict, Iterator, Callable, Any
+import json
+import logging
+import queue
+import threading
+
+from utils.config import settings
+from utils.lazy_import import lazy_module
+
+# yt-dlp는 첫 인스턴스 생성 시 로드 (시작 시간 단축)
+yt_dlp = lazy_module('yt_dlp')
+
+logger = logging.getLogger(__name__)
+
+# 풀 종료 시 인스턴스를 기다리는 스레드를 깨우는 표식
+_CLOSED = object()
+
+
+class ExtractorPool:
+    """
+    스레드 안전한 YoutubeDL 인스턴스 풀
+
+    YoutubeDL 옵션 조합별로 유휴 인스턴스를 보관합니다.
+    인스턴스는 추출기 초기화 결과와 HTTP 연결을 유지한 채 재사용되며,
+    한 번에 하나의 스레드만 같은 인스턴스를 사용합니다.
+    옵션별 인스턴스 수가 size에 도달하면 반환될 때까지 대기합니다.
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        factory: Optional[Callable[[Dict], Any]] = None
+    ):
+        """
+        풀 초기화
+
+        Args:
+            size: 옵션 조합별 최대 인스턴스 수
+            factory: 옵션 딕셔너리를 받아 YoutubeDL 인스턴스를 생성하는 함수
+                (None이면 yt_dlp.YoutubeDL)
+        """
+        if size < 1:
+            raise ValueError("Extractor pool size must be at least 1")
+
+        self.size = size
+        self.factory = factory if factory is not None else yt_dlp.YoutubeDL
+
+        self.created = 0
+        self.reused = 0
+
+        self._lock = threading.Lock()
+        self._idle: Dict[str, "queue.LifoQueue"] = {}
+        self._counts: Dict[str, int] = {}
+        self._closed = False
+
+    @staticmethod
+    def _options_key(options: Dict) -> str:
+        return json.dumps(options, sort_keys=True, default=str)
+
+    @contextmanager
+    def acquire(self, options: Dict) -> Iterator[Any]:
+        """
+        지정된 옵션의 YoutubeDL 인스턴스를 빌려옵니다.
+
+        Args:
+            options: YoutubeDL 옵션 딕셔너리
+
+        Yields:
+            YoutubeDL 인스턴스 (블록이 끝나면 풀로 반환)
+        """
+        key = self._options_key(options)
+        ydl = self._checkout(key, options)
+        try:
+            yield ydl
+        finally:
+            self._checkin(key, ydl)
+
+    def _checkout(self, key: str, options: Dict) -> Any:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Extractor pool is closed")
+            idle = self._idle.setdefault(key, queue.LifoQueue())
+            try:
+                ydl = idle.get_nowait()
+                self.reused += 1
+                return ydl
+            except queue.Empty:
+                pass
+
+            create = self._counts.get(key, 0) < self.size
+            if create:
+                self._counts[key] = self._counts.get(key, 0) + 1
+                self.created += 1
+
+        if create:
+            try:
+                return self.factory(dict(options))
+            except Exception:
+                with self._lock:
+                    self._counts[key] -= 1
+                raise
+
+        # 모든 인스턴스가 사용 중이면 반환되거나 풀이 종료될 때까지 대기
+        ydl = idle.get()
+        if ydl is _CLOSED:
+            # 다음 대기 스레드도 깨어나도록 표식을 되돌려 놓음
+            idle.put(_CLOSED)
+            raise RuntimeError("Extractor pool is closed")
+        with self._lock:
+            self.reused += 1
+        return ydl
+
+    def warm_up(self, options: Dict, count: int = 1) -> int:
+        """
+        지정된 옵션의 인스턴스가 count개가 되도록 미리 생성하여 유휴 목록에 넣습니다.
+
+        Args:
+            options: YoutubeDL 옵션 딕셔너리
+            count: 준비할 인스턴스 수 (size를 넘지 않음)
+
+        Returns:
+            새로 생성한 인스턴스 수
+        """
+        key = self._options_key(options)
+        created = 0
+        for _ in range(count):
+            with self._lock:
+                if self._closed or self._counts.get(key, 0) >= min(count, self.size):
+                    break
+                idle = self._idle.setdefault(key, queue.LifoQueue())
+                self._counts[key] = self._counts.get(key, 0) + 1
+                self.created += 1
+
+            try:
+                ydl = self.factory(dict(options))
+            except Exception:
+                with self._lock:
+                    self._counts[key] -= 1
+                    self.created -= 1
+                raise
+            idle.put(ydl)
+            created += 1
+        return created
+
+    def _checkin(self, key: str, ydl: Any) -> None:
+        with self._lock:
+            closed = self._closed
+            if closed:
+                self._counts[key] -= 1
+            else:
+                # 종료와 경합하지 않도록 잠금 안에서 반환 (제한 없는 큐이므로 대기하지 않음)
+                self._idle[key].put(ydl)
+        if closed:
+            # 종료 후 반환된 인스턴스는 풀에 넣지 않고 닫음
+            self._close_instance(ydl)
+
+    @staticmethod
+    def _close_instance(ydl: Any) -> None:
+        try:
+            ydl.close()
+        except Exception as e:
+            logger.debug(f"Failed to close YoutubeDL instance: {e}")
+
+    def close(self) -> None:
+        """
+        유휴 인스턴스를 모두 닫고 풀을 종료합니다.
+
+        인스턴스를 기다리던 스레드는 깨어나 RuntimeError를 받고,
+        사용 중이던 인스턴스는 반환될 때 닫힙니다.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            idle_instances = []
+            for key, idle in self._idle.items():
+                while True:
+                    try:
+                        idle_instances.append(idle.get_nowait())
+                        self._counts[key] -= 1
+                    except queue.Empty:
+                        break
+                idle.put(_CLOSED)
+
+        for ydl in idle_instances:
+            self._close_instance(ydl)
+
+    def stats(self) -> Dict:
+        """
+        풀 통계를 반환합니다.
+
+        Returns:
+            size, created, reused, idle 수를 포함한 딕셔너리
+        """
+        with self._lock:
+            return {
+                'size': self.size,
+                'created': self.created,
+                'reused': self.reused,
+                'idle': 0 if self._closed else sum(idle.qsize() for idle in self._idle.values()),
+            }
+
+
+_pool: Optional[ExtractorPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_extractor_pool() -> Optional[ExtractorPool]:
+    """
+    프로세스 전역 추출기 풀을 반환합니다.
+
+    Returns:
+        ExtractorPool 인스턴스 또는 None (extractor_pool_size가 0이면 비활성화)
+    """
+    global _pool
+    if settings.extractor_pool_size < 1:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExtractorPool(size=settings.extractor_pool_size)
+        return _pool
+
+
+def shutdown_extractor_pool() -> None:
+    """프로세스 전역 추출기 풀의 유휴 인스턴스를 모두 닫고 풀을 초기화합니다."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool is not None:
+        pool.close()
+        logger.info("Extractor pool shut down")
@@ -3,9 +3,10 @@
 다양한 출력 형식을 지원하는 서비스 레이어
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator
 import logging
 import os
+import re
 
 from formatters import get_formatter, get_available_formatters, Formatter
 
@@ -60,6 +61,28 @@ class FormatterService:
         logger.info(f"Using formatter: {formatter.format_name}")
         return formatter
 
+    @staticmethod
+    def build_output_path(metadata: Dict, video_id: str = '', directory: str = 'output') -> str:
+        """
+        비디오 제목과 ID로 안전한 출력 파일 경로(확장자 제외)를 만듭니다.
+
+        Args:
+            metadata: 비디오 메타데이터
+            video_id: 비디오 ID (있으면 파일명 뒤에 붙여 중복 방지)
+            directory: 출력 디렉토리
+
+        Returns:
+            출력 파일 경로 (확장자 없이)
+        """
+        video_title = metadata.get('title') or 'video'
+        if not video_title.strip():
+            video_title = 'video'
+
+        safe_title = re.sub(r'[<>:"/\\|?*]', '_', video_title).strip()[:100]
+        if video_id:
+            safe_title = f"{safe_title}_{video_id}"
+        return os.path.join(directory, safe_title)
+
     def save_to_file(
         self,
         metadata: Dict,
@@ -68,7 +91,8 @@ class FormatterService:
         format_choice: str = 'json',
         summary: Optional[str] = None,
         translation: Optional[str] = None,
-        key_topics: Optional[List[str]] = None
+        key_topics: Optional[List[str]] = None,
+        translated_transcript: Optional[List[Dict]] = None
     ) -> str:
         """
         데이터를 지정된 형식으로 파일에 저장합니다.
@@ -81,6 +105,7 @@ class FormatterService:
             summary: AI 생성 요약 (선택사항)
             translation: 번역된 텍스트 (선택사항)
             key_topics: 핵심 주제 리스트 (선택사항)
+            translated_transcript: 항목별 번역 자막 (선택사항)
 
         Returns:
             저장된 파일 경로
@@ -106,7 +131,8 @@ class FormatterService:
                 output_file=output_file,
                 summary=summary,
                 translation=translation,
-                key_topics=key_topics
+                key_topics=key_topics,
+                translated_transcript=translated_transcript
             )
             logger.info(f"Successfully saved to {output_file}")
             return output_file
@@ -114,6 +140,41 @@ class FormatterService:
             logger.error(f"Failed to save file {output_file}: {e}")
             raise
 
+    def iter_format(
+        self,
+        metadata: Dict,
+        transcript: Iterable[Dict],
+        format_choice: str = 'json',
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None,
+        translated_transcript: Optional[List[Dict]] = None
+    ) -> Iterator[str]:
+        """
+        데이터를 지정된 형식의 문자열 조각으로 차례로 생성합니다.
+
+        자막 항목 단위로 출력하므로 HTTP 응답 본문으로 바로 스트리밍할 수 있습니다.
+
+        Args:
+            metadata: 비디오 메타데이터
+            transcript: 자막 데이터 (번역이 없으면 제너레이터도 가능)
+            format_choice: 형식 선택
+            summary: AI 생성 요약 (선택사항)
+            translation: 번역된 텍스트 (선택사항)
+            key_topics: 핵심 주제 리스트 (선택사항)
+            translated_transcript: 항목별 번역 자막 (선택사항)
+
+        Returns:
+            출력 문자열 조각 iterator
+        """
+        return self.get_formatter(format_choice).iter_document(
+            metadata, transcript,
+            summary=summary,
+            translation=translation,
+            key_topics=key_topics,
+            translated_transcript=translated_transcript
+        )
+
     def format_data(
         self,
         metadata: Dict,
@@ -121,10 +182,11 @@ class FormatterService:
         format_choice: str = 'json',
         summary: Optional[str] = None,
         translation: Optional[str] = None,
-        key_topics: Optional[List[str]] = None
+        key_topics: Optional[List[str]] = None,
+        translated_transcript: Optional[List[Dict]] = None
     ) -> str:
         """
-        데이터를 지정된 형식의 문자열로 변환합니다 (파일 저장 없이).
+        데이터를 지정된 형식의 문자열로 변환합니다 (임시 파일 없이 메모리 버퍼에 출력).
 
         Args:
             metadata: 비디오 메타데이터
@@ -133,39 +195,15 @@ class FormatterService:
             summary: AI 생성 요약 (선택사항)
             translation: 번역된 텍스트 (선택사항)
             key_topics: 핵심 주제 리스트 (선택사항)
+            translated_transcript: 항목별 번역 자막 (선택사항)
 
         Returns:
             포맷팅된 문자열
         """
-        import tempfile
-        import os
-
-        # 임시 파일 생성
-        formatter = self.get_formatter(format_choice)
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix=f'.{formatter.file_extension}',
-            delete=False
-        ) as tmp_file:
-            tmp_path = tmp_file.name
-
-        try:
-            # 임시 파일에 저장
-            formatter.save(
-                metadata=metadata,
-                transcript=transcript,
-                output_file=tmp_path,
-                summary=summary,
-                translation=translation,
-                key_topics=key_topics
-            )
-
-            # 파일 내용 읽기
-            with open(tmp_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            return content
-        finally:
-            # 임시 파일 삭제
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        return self.get_formatter(format_choice).render(
+            metadata, transcript,
+            summary=summary,
+            translation=translation,
+            key_topics=key_topics,
+            translated_transcript=translated_transcript
+        )
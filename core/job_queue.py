@@ -0,0 +1,687 @@
+"""
+플레이리스트 스크래핑 작업 큐
+오래 걸리는 플레이리스트 스크래핑을 HTTP 요청과 분리하여 백그라운드 워커에서 실행합니다.
+
+작업과 비디오별 진행 상황은 SQLite에 저장되므로 서버가 재시작되어도
+완료된 비디오를 다시 처리하지 않고 남은 비디오부터 이어서 실행합니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, List, Dict, Any
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+
+from core.youtube_service import YouTubeService
+from core.ai_service import AIService
+from core.formatter_service import FormatterService
+from utils.config import settings
+from utils.transcript import transcript_to_list
+
+logger = logging.getLogger(__name__)
+
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+TERMINAL_STATUSES = (COMPLETED, FAILED, CANCELLED)
+
+# 비디오 상태
+PENDING = 'pending'
+DONE = 'done'
+
+
+class JobNotFoundError(KeyError):
+    """존재하지 않는 작업 ID"""
+    pass
+
+
+class JobStore:
+    """
+    SQLite 기반 작업 저장소
+
+    jobs 테이블에 작업 파라미터와 상태를, job_videos 테이블에 비디오별 상태와 결과를
+    저장합니다. 여러 스레드에서 하나의 인스턴스를 공유해도 안전합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        저장소 초기화
+
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (':memory:' 가능)
+        """
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            if path != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    videos_listed INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_videos (
+                    job_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    video_id TEXT,
+                    url TEXT NOT NULL,
+                    title TEXT,
+                    status TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, position)
+                )
+                """
+            )
+
+    @classmethod
+    def from_settings(cls) -> "JobStore":
+        """
+        애플리케이션 설정으로 작업 저장소를 생성합니다.
+
+        Returns:
+            JobStore 인스턴스
+        """
+        return cls(os.path.join(settings.cache_dir, 'jobs.db'))
+
+    def create_job(self, job_id: str, params: Dict) -> None:
+        """
+        대기 상태의 새 작업을 저장합니다.
+
+        Args:
+            job_id: 작업 ID
+            params: 작업 파라미터 (JSON 직렬화 가능)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, params, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, json.dumps(params, ensure_ascii=False), QUEUED, now, now)
+            )
+
+    def set_status(self, job_id: str, status: str, error: Optional[str] = None) -> bool:
+        """
+        끝나지 않은 작업의 상태를 변경합니다.
+
+        상태 확인과 변경을 하나의 UPDATE로 처리하므로, 워커가 작업을 읽은 뒤
+        들어온 취소를 덮어쓰지 않습니다.
+
+        Args:
+            job_id: 작업 ID
+            status: 새 상태
+            error: 실패 사유 (선택)
+
+        Returns:
+            변경했으면 True, 이미 끝난(완료, 실패, 취소) 작업이면 False
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET status = ?, error = ?, updated_at = ? "
+                f"WHERE job_id = ? AND status NOT IN ({', '.join('?' * len(TERMINAL_STATUSES))})",
+                (status, error, time.time(), job_id, *TERMINAL_STATUSES)
+            )
+            return cursor.rowcount > 0
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        끝나지 않은 작업을 취소 상태로 변경합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            취소했으면 True, 이미 끝난 작업이면 False
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET status = ?, updated_at = ? "
+                f"WHERE job_id = ? AND status NOT IN ({', '.join('?' * len(TERMINAL_STATUSES))})",
+                (CANCELLED, time.time(), job_id, *TERMINAL_STATUSES)
+            )
+            return cursor.rowcount > 0
+
+    def add_videos(self, job_id: str, videos: List[Dict]) -> None:
+        """
+        작업에 처리할 비디오 목록을 저장합니다.
+
+        Args:
+            job_id: 작업 ID
+            videos: 플레이리스트 비디오 목록 (id, url, title)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO job_videos "
+                "(job_id, position, video_id, url, title, status, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (job_id, position, video.get('id'), video.get('url', ''),
+                     video.get('title'), PENDING, now)
+                    for position, video in enumerate(videos)
+                ]
+            )
+            self._conn.execute(
+                "UPDATE jobs SET videos_listed = 1, updated_at = ? WHERE job_id = ?",
+                (now, job_id)
+            )
+
+    def update_video(
+        self,
+        job_id: str,
+        position: int,
+        status: str,
+        result: Optional[Dict] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        비디오 하나의 상태와 결과를 저장합니다.
+
+        Args:
+            job_id: 작업 ID
+            position: 플레이리스트 내 위치 (0부터 시작)
+            status: 새 상태
+            result: 처리 결과 (선택)
+            error: 실패 사유 (선택)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE job_videos SET status = ?, result = ?, error = ?, updated_at = ? "
+                "WHERE job_id = ? AND position = ?",
+                (
+                    status,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error, now, job_id, position
+                )
+            )
+            self._conn.execute(
+                "UPDATE jobs SET updated_at = ? WHERE job_id = ?", (now, job_id)
+            )
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        작업 정보를 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            job_id, params, status, error, videos_listed, created_at, updated_at을
+            포함한 딕셔너리 또는 None (없는 작업)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['videos_listed'] = bool(job['videos_listed'])
+        return job
+
+    def get_videos(self, job_id: str, include_results: bool = False) -> List[Dict]:
+        """
+        작업의 비디오 목록을 위치 순서대로 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+            include_results: 처리 결과 포함 여부
+
+        Returns:
+            position, video_id, url, title, status, error (및 result)를 포함한 딕셔너리 리스트
+        """
+        columns = "position, video_id, url, title, status, error"
+        if include_results:
+            columns += ", result"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM job_videos WHERE job_id = ? ORDER BY position",
+                (job_id,)
+            ).fetchall()
+
+        videos = [dict(row) for row in rows]
+        if include_results:
+            for video in videos:
+                video['result'] = json.loads(video['result']) if video['result'] else None
+        return videos
+
+    def count_videos(self, job_id: str) -> Dict[str, int]:
+        """
+        상태별 비디오 수를 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            {상태: 비디오 수} 딕셔너리
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM job_videos WHERE job_id = ? GROUP BY status",
+                (job_id,)
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def unfinished_jobs(self) -> List[str]:
+        """
+        재시작 후 이어서 실행할 작업 ID를 생성 순서대로 반환합니다.
+
+        실행 도중 중단된 비디오와 실패한 비디오는 다시 대기 상태로 되돌려
+        재시작 후 다시 처리합니다.
+
+        Returns:
+            대기 또는 실행 중 상태의 작업 ID 리스트
+        """
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT job_id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (QUEUED, RUNNING)
+            ).fetchall()
+            job_ids = [row[0] for row in rows]
+            self._conn.executemany(
+                "UPDATE job_videos SET status = ?, error = NULL "
+                "WHERE job_id = ? AND status IN (?, ?)",
+                [(PENDING, job_id, RUNNING, FAILED) for job_id in job_ids]
+            )
+        return job_ids
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """
+    플레이리스트 스크래핑 작업 큐
+
+    제출된 작업은 workers개의 워커 스레드가 순서대로 가져가 실행합니다.
+    워커는 플레이리스트 비디오 목록을 저장한 뒤 대기 중인 비디오를 최대
+    video_concurrency개씩 동시에 처리하며, 비디오마다 결과를 저장하므로
+    진행 상황을 조회할 수 있고 재시작 후에도 남은 비디오만 처리합니다.
+
+    한 번의 실행에서 실패한 비디오는 다시 시도하지 않고 failed로 남깁니다. 하나 이상의
+    비디오가 처리되면 작업은 완료(completed)되고 실패한 비디오 수는 progress['failed']로
+    확인할 수 있으며, 모든 비디오가 실패하면 작업도 실패합니다. 끝나지 않은 작업을 재시작 후
+    이어서 실행할 때는 실패한 비디오도 다시 처리합니다. 비디오 목록을 가져오지 못하거나
+    목록이 비어 있으면 작업은 실패합니다.
+
+    작업 상태는 끝나지 않은 작업에만 변경하므로(JobStore.set_status), 실행 중에 들어온
+    취소는 이후의 상태 변경으로 덮어써지지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        youtube_service: YouTubeService,
+        ai_service: AIService,
+        formatter_service: FormatterService,
+        workers: int = 2,
+        video_concurrency: int = 4
+    ):
+        """
+        작업 큐 초기화
+
+        Args:
+            store: 작업 저장소
+            youtube_service: YouTube 서비스
+            ai_service: AI 서비스
+            formatter_service: Formatter 서비스
+            workers: 동시에 실행할 작업 수
+            video_concurrency: 작업당 동시에 처리할 비디오 수
+        """
+        self.store = store
+        self.youtube_service = youtube_service
+        self.ai_service = ai_service
+        self.formatter_service = formatter_service
+        self.workers = max(1, workers)
+        self.video_concurrency = max(1, video_concurrency)
+
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    @classmethod
+    def from_settings(
+        cls,
+        youtube_service: YouTubeService,
+        ai_service: AIService,
+        formatter_service: FormatterService
+    ) -> "JobQueue":
+        """
+        애플리케이션 설정으로 작업 큐를 생성합니다.
+
+        Args:
+            youtube_service: YouTube 서비스
+            ai_service: AI 서비스
+            formatter_service: Formatter 서비스
+
+        Returns:
+            JobQueue 인스턴스
+        """
+        return cls(
+            JobStore.from_settings(),
+            youtube_service,
+            ai_service,
+            formatter_service,
+            workers=settings.job_workers,
+            video_concurrency=settings.job_video_concurrency
+        )
+
+    def start(self) -> int:
+        """
+        워커 스레드를 시작하고 끝나지 않은 작업을 다시 대기열에 넣습니다.
+
+        이미 시작된 경우 아무 작업도 하지 않습니다.
+
+        Returns:
+            이어서 실행할 작업 수
+        """
+        with self._lock:
+            if self._threads:
+                return 0
+
+            resumed = self.store.unfinished_jobs()
+            for job_id in resumed:
+                self._queue.put(job_id)
+            if resumed:
+                logger.info(f"Resuming {len(resumed)} unfinished jobs")
+
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"job-worker-{index}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+            return len(resumed)
+
+    def submit(self, params: Dict) -> str:
+        """
+        플레이리스트 스크래핑 작업을 제출합니다.
+
+        Args:
+            params: 작업 파라미터 (playlist_url, max_videos와 스크래핑 옵션)
+
+        Returns:
+            작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        self.store.create_job(job_id, params)
+        self.start()
+        self._queue.put(job_id)
+        logger.info(f"Submitted job {job_id}: {params.get('playlist_url')}")
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        작업을 취소합니다. 처리 중인 비디오는 끝까지 처리하고 남은 비디오는 건너뜁니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            취소했으면 True, 이미 끝난 작업이면 False
+
+        Raises:
+            JobNotFoundError: 존재하지 않는 작업인 경우
+        """
+        if self.store.get_job(job_id) is None:
+            raise JobNotFoundError(job_id)
+        cancelled = self.store.cancel(job_id)
+        if cancelled:
+            logger.info(f"Cancelled job {job_id}")
+        return cancelled
+
+    def status(self, job_id: str) -> Dict:
+        """
+        작업 상태와 비디오별 진행 상황을 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 정보, progress(상태별 비디오 수), videos(비디오별 상태)를 포함한 딕셔너리
+
+        Raises:
+            JobNotFoundError: 존재하지 않는 작업인 경우
+        """
+        job = self.store.get_job(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+
+        counts = self.store.count_videos(job_id)
+        job['progress'] = {
+            'total': sum(counts.values()),
+            'pending': counts.get(PENDING, 0),
+            'running': counts.get(RUNNING, 0),
+            'done': counts.get(DONE, 0),
+            'failed': counts.get(FAILED, 0),
+        }
+        job['videos'] = self.store.get_videos(job_id)
+        return job
+
+    def results(self, job_id: str) -> Dict:
+        """
+        작업 정보와 비디오별 처리 결과를 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 정보와 결과를 포함한 videos 리스트
+
+        Raises:
+            JobNotFoundError: 존재하지 않는 작업인 경우
+        """
+        job = self.store.get_job(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        job['videos'] = self.store.get_videos(job_id, include_results=True)
+        return job
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        워커를 멈추고 저장소를 닫습니다.
+
+        처리 중이던 비디오는 대기 상태로 남아 다음 시작 시 다시 처리됩니다.
+
+        Args:
+            timeout: 워커별 최대 대기 시간 (초)
+        """
+        self._stopping.set()
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout)
+        if any(thread.is_alive() for thread in threads):
+            logger.warning("Job workers did not stop in time; leaving database open")
+            return
+        self.store.close()
+
+    def _worker(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            if job_id is None or self._stopping.is_set():
+                return
+            try:
+                self._run_job(job_id)
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+                self.store.set_status(job_id, FAILED, error=str(e))
+
+    def _is_cancelled(self, job_id: str) -> bool:
+        job = self.store.get_job(job_id)
+        return job is None or job['status'] == CANCELLED
+
+    def _run_job(self, job_id: str) -> None:
+        """작업 하나를 실행합니다 (워커 스레드에서 호출)."""
+        job = self.store.get_job(job_id)
+        if job is None or job['status'] in TERMINAL_STATUSES:
+            return
+
+        # 읽은 뒤 취소되었으면 상태가 바뀌지 않으므로 실행하지 않음
+        if not self.store.set_status(job_id, RUNNING):
+            return
+        params = job['params']
+
+        if not job['videos_listed']:
+            # 목록 조회 예외는 워커가 작업 실패로 기록
+            videos = self.youtube_service.get_playlist_videos(
+                params['playlist_url'],
+                max_videos=params.get('max_videos')
+            )
+            if not videos:
+                # 빈 목록을 저장하면 0개 비디오로 완료된 것처럼 보이므로 실패로 기록
+                logger.error(f"Job {job_id} failed: no videos listed for {params['playlist_url']}")
+                self.store.set_status(
+                    job_id, FAILED, error="Playlist has no videos or could not be listed"
+                )
+                return
+            self.store.add_videos(job_id, videos)
+
+        pending = [
+            video for video in self.store.get_videos(job_id)
+            if video['status'] == PENDING
+        ]
+        with ThreadPoolExecutor(
+            max_workers=self.video_concurrency,
+            thread_name_prefix=f"job-{job_id[:8]}"
+        ) as executor:
+            wait([
+                executor.submit(self._run_video, job_id, params, video)
+                for video in pending
+            ])
+
+        # 종료 중이면 상태를 그대로 두어 다음 시작 시 이어서 실행
+        if self._stopping.is_set() or self._is_cancelled(job_id):
+            return
+
+        counts = self.store.count_videos(job_id)
+        if counts.get(FAILED) and not counts.get(DONE):
+            if self.store.set_status(job_id, FAILED, error=f"All {counts[FAILED]} videos failed"):
+                logger.error(f"Job {job_id} failed: all {counts[FAILED]} videos failed")
+            return
+        if self.store.set_status(job_id, COMPLETED):
+            logger.info(f"Job {job_id} completed ({counts.get(FAILED, 0)} videos failed)")
+
+    def _run_video(self, job_id: str, params: Dict, video: Dict) -> None:
+        """비디오 하나를 처리하고 결과를 저장합니다."""
+        if self._stopping.is_set() or self._is_cancelled(job_id):
+            return
+
+        position = video['position']
+        self.store.update_video(job_id, position, RUNNING)
+        try:
+            result = self._scrape_video(params, video['url'])
+            self.store.update_video(job_id, position, DONE, result=result)
+        except Exception as e:
+            logger.error(f"Job {job_id} video {video['url']} failed: {e}")
+            self.store.update_video(job_id, position, FAILED, error=str(e))
+
+    def _scrape_video(self, params: Dict, video_url: str) -> Dict[str, Any]:
+        """
+        비디오 하나를 스크래핑하고 요청된 AI 기능과 파일 저장을 적용합니다.
+
+        Args:
+            params: 작업 파라미터
+            video_url: 비디오 URL
+
+        Returns:
+            video_id, metadata, transcript, summary, translation,
+            translated_transcript, key_topics, output_file, errors(메타데이터/자막 중
+            가져오지 못한 항목별 사유)를 포함한 딕셔너리
+        """
+        languages = params.get('languages') or ['ko', 'en']
+        video_info = self.youtube_service.get_video_info(
+            video_url,
+            languages=languages,
+            prefer_manual=params.get('prefer_manual', True)
+        )
+        metadata = video_info['metadata']
+        transcript = video_info['transcript']
+
+        enhanced: Dict[str, Any] = {}
+        ai_requested = (
+            params.get('enable_summary')
+            or params.get('enable_translation')
+            or params.get('enable_topics')
+        )
+        if ai_requested and self.ai_service.is_available():
+            enhanced = self.ai_service.enhance_transcript(
+                transcript=transcript,
+                enable_summary=params.get('enable_summary', False),
+                summary_max_points=params.get('summary_max_points', 5),
+                enable_translation=params.get('enable_translation', False),
+                target_language=params.get('target_language'),
+                enable_topics=params.get('enable_topics', False),
+                num_topics=params.get('num_topics', 5),
+                language=languages[0],
+                use_cache=not params.get('bypass_cache', False)
+            )
+
+        translated_transcript = enhanced.get('translated_transcript')
+        output_file = None
+        if params.get('output_format'):
+            try:
+                output_file = self.formatter_service.save_to_file(
+                    metadata=metadata,
+                    transcript=transcript,
+                    output_file=self.formatter_service.build_output_path(
+                        metadata, video_info.get('video_id', '')
+                    ),
+                    format_choice=params['output_format'],
+                    summary=enhanced.get('summary'),
+                    translation=None if translated_transcript else enhanced.get('translation'),
+                    key_topics=enhanced.get('topics'),
+                    translated_transcript=translated_transcript
+                )
+            except Exception as e:
+                logger.error(f"Failed to save file: {e}")
+
+        return {
+            'video_id': video_info.get('video_id', ''),
+            'metadata': metadata,
+            'transcript': transcript_to_list(transcript),
+            'transcript_language': languages[0],
+            'summary': enhanced.get('summary'),
+            'translation': enhanced.get('translation'),
+            'translated_transcript': transcript_to_list(translated_transcript),
+            'key_topics': enhanced.get('topics'),
+            'output_file': output_file,
+            'errors': video_info.get('errors') or {},
+        }
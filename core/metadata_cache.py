@@ -0,0 +1,156 @@
+"""
+메타데이터 캐시
+비디오 메타데이터를 변경 빈도에 따라 서로 다른 TTL로 보관합니다.
+"""
+
+from typing import Optional, Dict
+import logging
+import os
+import sqlite3
+import threading
+
+from utils.cache import MemoryCache, SQLiteCache, TieredCache
+from utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCache:
+    """
+    TTL 계층을 가진 비디오 메타데이터 캐시
+
+    메타데이터를 두 부분으로 나누어 저장합니다.
+
+    - 불변 필드 (제목, 채널, 길이, 업로드 날짜 등): 긴 TTL
+    - 변동 필드 (조회수, 좋아요 수): 짧은 TTL
+
+    두 부분이 모두 유효할 때만 캐시 적중으로 처리합니다.
+    변동 필드만 만료된 경우에도 불변 필드는 get_static()으로 조회할 수 있어,
+    메타데이터 재추출이 실패했을 때 기본값 대신 사용할 수 있습니다.
+    """
+
+    VOLATILE_FIELDS = ('view_count', 'like_count')
+
+    def __init__(
+        self,
+        store: TieredCache,
+        static_ttl: float,
+        volatile_ttl: float
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            store: 메모리 + 디스크 2단계 캐시
+            static_ttl: 불변 필드 만료 시간 (초)
+            volatile_ttl: 변동 필드 만료 시간 (초)
+        """
+        self.store = store
+        self.static_ttl = static_ttl
+        self.volatile_ttl = volatile_ttl
+
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> Optional["MetadataCache"]:
+        """
+        애플리케이션 설정으로 메타데이터 캐시를 생성합니다.
+
+        Returns:
+            MetadataCache 인스턴스 또는 None (캐시 비활성화 시)
+        """
+        if not settings.cache_enabled:
+            return None
+
+        memory = MemoryCache(max_entries=settings.metadata_cache_memory_size)
+        try:
+            disk = SQLiteCache(
+                os.path.join(settings.cache_dir, 'metadata.db'),
+                max_bytes=settings.metadata_cache_max_mb * 1024 * 1024
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to open metadata disk cache, using memory only: {e}")
+            disk = None
+
+        return cls(
+            TieredCache(memory, disk),
+            static_ttl=settings.metadata_cache_static_ttl,
+            volatile_ttl=settings.metadata_cache_volatile_ttl
+        )
+
+    def get(self, video_id: str) -> Optional[Dict]:
+        """
+        유효한 전체 메타데이터를 반환합니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+
+        Returns:
+            메타데이터 딕셔너리 또는 None (불변/변동 필드 중 하나라도 만료된 경우)
+        """
+        static = self.store.get(f"metadata:static:{video_id}")
+        volatile = self.store.get(f"metadata:volatile:{video_id}") if static else None
+
+        with self._lock:
+            if static is None or volatile is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return {**static, **volatile}
+
+    def get_static(self, video_id: str) -> Optional[Dict]:
+        """
+        불변 필드만 반환합니다 (변동 필드 만료 여부와 무관).
+
+        Args:
+            video_id: YouTube 비디오 ID
+
+        Returns:
+            불변 필드 딕셔너리 또는 None
+        """
+        static = self.store.get(f"metadata:static:{video_id}")
+        if static is not None:
+            with self._lock:
+                self.partial_hits += 1
+            return dict(static)
+        return None
+
+    def put(self, video_id: str, metadata: Dict) -> None:
+        """
+        메타데이터를 불변/변동 필드로 나누어 저장합니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+            metadata: 메타데이터 딕셔너리
+        """
+        static = {k: v for k, v in metadata.items() if k not in self.VOLATILE_FIELDS}
+        volatile = {k: metadata.get(k) for k in self.VOLATILE_FIELDS}
+
+        self.store.set(f"metadata:static:{video_id}", static, ttl=self.static_ttl)
+        self.store.set(f"metadata:volatile:{video_id}", volatile, ttl=self.volatile_ttl)
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            hits, partial_hits, misses, hit_rate와 단계별 통계를 포함한 딕셔너리
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            result = {
+                'hits': self.hits,
+                'partial_hits': self.partial_hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+        result['tiers'] = self.store.stats()
+        return result
+
+    def close(self) -> None:
+        """캐시 저장소 연결을 닫습니다."""
+        self.store.close()
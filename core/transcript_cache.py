@@ -0,0 +1,222 @@
+"""
+자막 캐시
+네트워크 요청 없이 재사용할 수 있도록 추출된 자막을 디스크에 보관합니다.
+"""
+
+from typing import Optional, List, Dict, Sequence
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+
+from utils.cache import SQLiteCache
+from utils.config import settings
+from utils.transcript import Transcript
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache:
+    """
+    내용 주소 기반(content-addressed) 자막 캐시
+
+    자막 본문은 내용 해시로 한 번만 저장되고, 다음 두 종류의 키가 이를 가리킵니다.
+
+    - 트랙 키: video_id + 해석된 언어 + 수동/자동 여부
+    - 요청 키: video_id + 요청한 언어 우선순위 + prefer_manual
+
+    따라서 서로 다른 언어 우선순위 요청이 같은 트랙으로 해석되면
+    본문을 공유합니다. 자막이 없는 비디오는 요청 키에 짧은 TTL의
+    '자막 없음' 표시를 저장하여 반복 조회를 막습니다.
+    TTL과 크기 기반 LRU 제거는 SQLiteCache가 담당합니다.
+    """
+
+    def __init__(self, backend: SQLiteCache, negative_ttl: Optional[float] = 3600):
+        """
+        캐시 초기화
+
+        Args:
+            backend: 자막을 저장할 SQLite 캐시
+            negative_ttl: '자막 없음' 결과의 만료 시간 (초)
+        """
+        self.backend = backend
+        self.negative_ttl = negative_ttl
+
+    @classmethod
+    def from_settings(cls) -> Optional["TranscriptCache"]:
+        """
+        애플리케이션 설정으로 자막 캐시를 생성합니다.
+
+        Returns:
+            TranscriptCache 인스턴스 또는 None (캐시 비활성화 또는 생성 실패 시)
+        """
+        if not settings.cache_enabled:
+            return None
+
+        try:
+            backend = SQLiteCache(
+                os.path.join(settings.cache_dir, 'transcripts.db'),
+                default_ttl=settings.transcript_cache_ttl,
+                max_bytes=settings.transcript_cache_max_mb * 1024 * 1024
+            )
+            return cls(backend, negative_ttl=settings.transcript_negative_cache_ttl)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to open transcript cache: {e}")
+            return None
+
+    @staticmethod
+    def _request_key(video_id: str, languages: List[str], prefer_manual: bool) -> str:
+        return f"request:{video_id}|{','.join(languages)}|{int(prefer_manual)}"
+
+    @staticmethod
+    def _track_key(video_id: str, language: str, is_generated: bool) -> str:
+        kind = 'auto' if is_generated else 'manual'
+        return f"track:{video_id}|{language}|{kind}"
+
+    def _load_blob(
+        self,
+        content_hash: str,
+        language: Optional[str] = None,
+        is_generated: Optional[bool] = None
+    ) -> Optional[Transcript]:
+        """저장된 자막 본문을 Transcript로 복원합니다 (이전 형식인 항목 리스트도 지원)."""
+        blob = self.backend.get(f"blob:{content_hash}")
+        if blob is None:
+            return None
+        if isinstance(blob, dict):
+            return Transcript.from_columns(
+                blob['starts'], blob['durations'], blob['texts'],
+                language_code=language, is_generated=is_generated
+            )
+        return Transcript(blob, language_code=language, is_generated=is_generated)
+
+    def get(
+        self,
+        video_id: str,
+        languages: List[str],
+        prefer_manual: bool = True
+    ) -> Optional[Transcript]:
+        """
+        요청 조건에 해당하는 캐시된 자막을 반환합니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+            languages: 요청한 자막 언어 우선순위 목록
+            prefer_manual: 수동 생성 자막 선호 여부
+
+        Returns:
+            Transcript 또는 None (캐시 미스). 자막 없음이 캐시된 경우 missing이 True인 빈 Transcript
+        """
+        try:
+            ref = self.backend.get(self._request_key(video_id, languages, prefer_manual))
+            if ref is None:
+                return None
+            if ref.get('missing'):
+                return Transcript(missing=True)
+            return self._load_blob(
+                ref['hash'], language=ref.get('language'), is_generated=ref.get('is_generated')
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Transcript cache lookup failed for {video_id}: {e}")
+            return None
+
+    def get_track(
+        self,
+        video_id: str,
+        language: str,
+        is_generated: bool
+    ) -> Optional[Transcript]:
+        """
+        특정 자막 트랙의 캐시된 자막을 반환합니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+            language: 자막 언어 코드
+            is_generated: 자동 생성 자막 여부
+
+        Returns:
+            Transcript 또는 None (캐시 미스)
+        """
+        try:
+            content_hash = self.backend.get(self._track_key(video_id, language, is_generated))
+            if content_hash is None:
+                return None
+            return self._load_blob(content_hash, language=language, is_generated=is_generated)
+        except sqlite3.Error as e:
+            logger.warning(f"Transcript cache lookup failed for {video_id}: {e}")
+            return None
+
+    def put(
+        self,
+        video_id: str,
+        languages: List[str],
+        prefer_manual: bool,
+        transcript: Sequence[Dict],
+        language: Optional[str] = None,
+        is_generated: Optional[bool] = None
+    ) -> None:
+        """
+        자막을 캐시에 저장합니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+            languages: 요청한 자막 언어 우선순위 목록
+            prefer_manual: 수동 생성 자막 선호 여부
+            transcript: 저장할 자막 (Transcript 또는 자막 딕셔너리 리스트)
+            language: 실제로 선택된 자막 언어 코드 (알 수 없으면 None)
+            is_generated: 자동 생성 자막 여부 (알 수 없으면 None)
+        """
+        columns = Transcript(transcript).to_columns()
+        payload = json.dumps(columns, ensure_ascii=False, sort_keys=True)
+        content_hash = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+        try:
+            self.backend.set(f"blob:{content_hash}", columns)
+            if language and is_generated is not None:
+                self.backend.set(
+                    self._track_key(video_id, language, is_generated),
+                    content_hash
+                )
+            self.backend.set(
+                self._request_key(video_id, languages, prefer_manual),
+                {'hash': content_hash, 'language': language, 'is_generated': is_generated}
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to cache transcript for {video_id}: {e}")
+
+    def put_missing(
+        self,
+        video_id: str,
+        languages: List[str],
+        prefer_manual: bool
+    ) -> None:
+        """
+        비디오에 자막이 없다는 결과를 짧은 TTL로 저장합니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+            languages: 요청한 자막 언어 우선순위 목록
+            prefer_manual: 수동 생성 자막 선호 여부
+        """
+        try:
+            self.backend.set(
+                self._request_key(video_id, languages, prefer_manual),
+                {'hash': None, 'missing': True},
+                ttl=self.negative_ttl
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to cache missing transcript for {video_id}: {e}")
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            통계 딕셔너리
+        """
+        return self.backend.stats()
+
+    def close(self) -> None:
+        """캐시 저장소 연결을 닫습니다."""
+        self.backend.close()
@@ -3,6 +3,7 @@ YouTube 서비스
 YouTube 데이터 추출 및 처리를 위한 서비스 레이어
 """
 
+from concurrent.futures import Executor, Future, wait
 from typing import Optional, List, Dict
 import logging
 
@@ -10,9 +11,19 @@ from youtube_api import (
     extract_video_id,
     get_video_metadata,
     get_transcript_with_timestamps,
-    format_timestamp
+    is_placeholder_metadata,
+    placeholder_metadata,
+    METADATA_YDL_OPTS
 )
-from playlist_handler import PlaylistHandler, process_playlist_or_video
+from playlist_handler import PlaylistHandler, process_playlist_or_video, PLAYLIST_YDL_OPTS
+from core.executor import run_blocking, get_fetch_executor
+from core.extractor_pool import ExtractorPool, get_extractor_pool
+from core.transcript_cache import TranscriptCache
+from core.metadata_cache import MetadataCache
+from utils.cache import MemoryCache
+from utils.config import settings
+from utils.single_flight import SingleFlight
+from utils.transcript import Transcript
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +35,53 @@ class YouTubeService:
     비디오 및 플레이리스트 메타데이터, 자막 추출 기능을 제공합니다.
     """
 
-    def __init__(self):
-        """서비스 초기화"""
+    def __init__(
+        self,
+        transcript_cache: Optional[TranscriptCache] = None,
+        metadata_cache: Optional[MetadataCache] = None,
+        extractor_pool: Optional[ExtractorPool] = None,
+        executor: Optional[Executor] = None,
+        playlist_cache: Optional[MemoryCache] = None
+    ):
+        """
+        서비스 초기화
+
+        Args:
+            transcript_cache: 자막 캐시 (None이면 설정에 따라 생성)
+            metadata_cache: 메타데이터 캐시 (None이면 설정에 따라 생성)
+            extractor_pool: YoutubeDL 인스턴스 풀 (None이면 프로세스 전역 풀 사용)
+            executor: 비동기 메서드가 블로킹 작업을 실행할 실행기
+                (None이면 프로세스 전역 실행기 사용)
+            playlist_cache: 재생목록 추출 결과를 짧게 보관할 캐시
+                (None이면 설정에 따라 생성)
+        """
         self.playlist_handler = PlaylistHandler()
+        self.extractor_pool = extractor_pool or get_extractor_pool()
+        self.transcript_cache = transcript_cache or TranscriptCache.from_settings()
+        self.metadata_cache = metadata_cache or MetadataCache.from_settings()
+        self.executor = executor
+        self.playlist_cache = (
+            playlist_cache if playlist_cache is not None else self._playlist_cache_from_settings()
+        )
+        # 같은 비디오/재생목록을 동시에 요청하면 추출을 한 번만 실행
+        self._metadata_flight = SingleFlight()
+        self._transcript_flight = SingleFlight()
+        self._playlist_flight = SingleFlight()
+
+    @staticmethod
+    def _playlist_cache_from_settings() -> Optional[MemoryCache]:
+        """
+        애플리케이션 설정으로 재생목록 캐시를 생성합니다.
+
+        Returns:
+            MemoryCache 인스턴스 또는 None (캐시 비활성화 또는 TTL이 0인 경우)
+        """
+        if not settings.cache_enabled or settings.playlist_cache_ttl <= 0:
+            return None
+        return MemoryCache(
+            max_entries=settings.playlist_cache_size,
+            default_ttl=settings.playlist_cache_ttl
+        )
 
     def extract_video_id(self, url: str) -> Optional[str]:
         """
@@ -44,20 +99,45 @@ class YouTubeService:
         """
         비디오 메타데이터를 가져옵니다.
 
+        캐시에 없으면 추출하며, 같은 비디오를 동시에 요청한 호출들은 하나의 추출을
+        공유합니다.
+
         Args:
             video_id: YouTube 비디오 ID
 
         Returns:
             메타데이터 딕셔너리 (VideoMetadata 스키마와 일치)
         """
+        if self.metadata_cache is not None:
+            cached = self.metadata_cache.get(video_id)
+            if cached is not None:
+                logger.info(f"Metadata cache hit for video {video_id}")
+                return cached
+
+        metadata = self._metadata_flight.do(video_id, self._fetch_video_metadata, video_id)
+        # 병합된 호출자들이 같은 딕셔너리를 수정하지 않도록 복사본을 반환
+        return dict(metadata)
+
+    def _fetch_video_metadata(self, video_id: str) -> Dict:
+        """메타데이터를 추출하고 캐시에 저장합니다 (병합된 호출 중 하나만 실행)."""
         try:
             # video_id를 URL로 변환
             video_url = f"https://www.youtube.com/watch?v={video_id}"
-            metadata = get_video_metadata(video_url)
+            if self.extractor_pool is not None:
+                with self.extractor_pool.acquire(METADATA_YDL_OPTS) as ydl:
+                    metadata = get_video_metadata(video_url, ydl=ydl)
+            else:
+                metadata = get_video_metadata(video_url)
             
             # video_id가 없으면 추가
             if 'video_id' not in metadata or not metadata['video_id']:
                 metadata['video_id'] = video_id
+
+            if is_placeholder_metadata(metadata):
+                # 추출 실패 시 캐시된 불변 필드로 기본값을 대체
+                metadata = self._fallback_metadata(video_id)
+            elif self.metadata_cache is not None:
+                self.metadata_cache.put(video_id, metadata)
                 
             logger.info(f"Successfully retrieved metadata for video {video_id}")
             return metadata
@@ -65,22 +145,93 @@ class YouTubeService:
             logger.error(f"Failed to get metadata for video {video_id}: {e}")
             raise
 
+    def _fallback_metadata(self, video_id: str) -> Dict:
+        """
+        메타데이터를 가져오지 못했을 때 사용할 값을 반환합니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+
+        Returns:
+            기본값 메타데이터 (캐시된 불변 필드가 있으면 병합)
+        """
+        metadata = placeholder_metadata(video_id)
+        if self.metadata_cache is not None:
+            static = self.metadata_cache.get_static(video_id)
+            if static is not None:
+                metadata.update(static)
+        return metadata
+
+    def cache_stats(self) -> Dict:
+        """
+        서비스 캐시 및 추출기 풀 통계를 반환합니다.
+
+        Returns:
+            캐시별 통계 딕셔너리 (비활성화된 캐시는 None)
+        """
+        return {
+            'transcript': self.transcript_cache.stats() if self.transcript_cache else None,
+            'metadata': self.metadata_cache.stats() if self.metadata_cache else None,
+            'playlist': self.playlist_cache.stats() if self.playlist_cache is not None else None,
+            'extractor_pool': self.extractor_pool.stats() if self.extractor_pool else None,
+        }
+
+    def coalescing_stats(self) -> Dict:
+        """
+        동시 요청 병합(single-flight) 통계를 반환합니다.
+
+        Returns:
+            metadata, transcript, playlist별 SingleFlight 통계
+            (실행 수, 합류한 대기자 수, 최대 대기자 수 등)
+        """
+        return {
+            'metadata': self._metadata_flight.stats(),
+            'transcript': self._transcript_flight.stats(),
+            'playlist': self._playlist_flight.stats(),
+        }
+
+    def warm_up(self) -> None:
+        """
+        첫 요청의 지연을 줄이기 위해 메타데이터 추출기 인스턴스를 미리 생성합니다.
+
+        실패해도 예외를 던지지 않으며, 필요한 인스턴스는 첫 요청에서 생성됩니다.
+        """
+        if self.extractor_pool is None:
+            return
+        try:
+            self.extractor_pool.warm_up(METADATA_YDL_OPTS)
+        except Exception as e:
+            logger.warning(f"Extractor warm-up failed: {e}")
+
+    def close(self) -> None:
+        """자막 및 메타데이터 캐시 연결을 닫습니다."""
+        for cache in (self.transcript_cache, self.metadata_cache):
+            if cache is None:
+                continue
+            try:
+                cache.close()
+            except Exception as e:
+                logger.warning(f"Failed to close {type(cache).__name__}: {e}")
+
     def get_transcript(
         self,
         video_id: str,
         languages: List[str] = None,
         prefer_manual: bool = True
-    ) -> List[Dict]:
+    ) -> Transcript:
         """
         비디오 자막을 가져옵니다.
 
+        캐시에 없으면 조회하며, 같은 비디오와 언어 설정으로 동시에 요청한 호출들은
+        하나의 조회를 공유합니다.
+
         Args:
             video_id: YouTube 비디오 ID
             languages: 자막 언어 우선순위 목록
             prefer_manual: 수동 생성 자막 선호 여부
 
         Returns:
-            타임스탬프가 포함된 자막 리스트
+            열 기반 자막 (항목은 start, duration, text, timestamp 키를 가진 딕셔너리 뷰)
 
         Raises:
             Exception: 자막 추출 실패 시
@@ -88,6 +239,29 @@ class YouTubeService:
         if languages is None:
             languages = ["ko", "en"]
 
+        # 네트워크 요청 전에 캐시 확인
+        if self.transcript_cache is not None:
+            cached = self.transcript_cache.get(video_id, languages, prefer_manual)
+            if cached is not None:
+                logger.info(f"Transcript cache hit for video {video_id}")
+                return cached
+
+        # Transcript는 변경할 수 없으므로 병합된 호출자들이 그대로 공유
+        return self._transcript_flight.do(
+            (video_id, tuple(languages), prefer_manual),
+            self._fetch_transcript,
+            video_id,
+            languages,
+            prefer_manual
+        )
+
+    def _fetch_transcript(
+        self,
+        video_id: str,
+        languages: List[str],
+        prefer_manual: bool
+    ) -> Transcript:
+        """자막을 조회하고 캐시에 저장합니다 (병합된 호출 중 하나만 실행)."""
         try:
             transcript = get_transcript_with_timestamps(
                 video_id,
@@ -95,10 +269,12 @@ class YouTubeService:
                 prefer_manual=prefer_manual
             )
 
-            # 타임스탬프 포맷팅 추가
-            for entry in transcript:
-                if 'timestamp' not in entry or entry['timestamp'] is None:
-                    entry['timestamp'] = format_timestamp(entry['start'])
+            # 열 기반 자막으로 변환 (timestamp는 항목 뷰에서 start로 계산)
+            if not isinstance(transcript, Transcript):
+                transcript = Transcript(transcript)
+
+            if self.transcript_cache is not None:
+                self._cache_transcript(video_id, languages, prefer_manual, transcript)
 
             logger.info(f"Successfully retrieved transcript for video {video_id}")
             return transcript
@@ -106,45 +282,122 @@ class YouTubeService:
             logger.error(f"Failed to get transcript for video {video_id}: {e}")
             raise
 
+    def _cache_transcript(
+        self,
+        video_id: str,
+        languages: List[str],
+        prefer_manual: bool,
+        transcript: Transcript
+    ) -> None:
+        """
+        자막 조회 결과를 캐시에 저장합니다.
+
+        자막 없음이 확인된 결과는 짧은 TTL로 저장하고,
+        일시적 오류로 인한 빈 결과는 저장하지 않습니다.
+        """
+        if getattr(transcript, 'missing', False):
+            self.transcript_cache.put_missing(video_id, languages, prefer_manual)
+        elif transcript:
+            self.transcript_cache.put(
+                video_id,
+                languages,
+                prefer_manual,
+                transcript,
+                language=getattr(transcript, 'language_code', None),
+                is_generated=getattr(transcript, 'is_generated', None)
+            )
+
     def get_video_info(
         self,
         video_url: str,
         languages: List[str] = None,
-        prefer_manual: bool = True
+        prefer_manual: bool = True,
+        timeout: Optional[float] = None
     ) -> Dict:
         """
         비디오의 전체 정보를 가져옵니다 (메타데이터 + 자막).
 
+        메타데이터와 자막은 서로 독립적이므로 동시에 조회하며, 두 작업은 하나의
+        제한 시간을 공유합니다. 한쪽만 실패하거나 제한 시간을 넘기면 나머지 결과로
+        응답하고 실패 내용을 errors에 기록합니다 (메타데이터는 기본값, 자막은 빈 리스트).
+        추출기가 예외 없이 기본값 메타데이터나 빈 자막(자막 없음이 확인된 경우 제외)을
+        반환한 경우도 실패로 기록합니다.
+        제한 시간을 넘긴 작업은 백그라운드에서 계속 실행되어 캐시를 채웁니다.
+
         Args:
             video_url: YouTube 비디오 URL
             languages: 자막 언어 우선순위 목록
             prefer_manual: 수동 생성 자막 선호 여부
+            timeout: 두 조회의 공통 제한 시간 (초, None이면 video_info_timeout 설정 사용)
 
         Returns:
-            메타데이터와 자막을 포함한 딕셔너리
+            metadata, transcript, video_id, errors를 포함한 딕셔너리
+            (errors는 실패한 조회별 사유, 모두 성공하면 빈 딕셔너리)
 
         Raises:
             ValueError: 유효하지 않은 URL
-            Exception: 데이터 추출 실패 시
+            RuntimeError: 메타데이터와 자막을 모두 가져오지 못한 경우
         """
         if languages is None:
             languages = ["ko", "en"]
+        if timeout is None:
+            timeout = settings.video_info_timeout
 
         # 비디오 ID 추출
         video_id = self.extract_video_id(video_url)
         if not video_id:
             raise ValueError(f"Invalid YouTube URL: {video_url}")
 
-        # 메타데이터 및 자막 가져오기
-        metadata = self.get_video_metadata(video_id)
-        transcript = self.get_transcript(video_id, languages, prefer_manual)
+        # 메타데이터 및 자막 동시 조회
+        executor = get_fetch_executor()
+        metadata_future = executor.submit(self.get_video_metadata, video_id)
+        transcript_future = executor.submit(
+            self.get_transcript, video_id, languages, prefer_manual
+        )
+        wait([metadata_future, transcript_future], timeout=timeout)
+
+        errors: Dict[str, str] = {}
+        metadata = self._future_result(metadata_future, 'metadata', timeout, errors)
+        transcript = self._future_result(transcript_future, 'transcript', timeout, errors)
+
+        if metadata is None and transcript is None:
+            raise RuntimeError(
+                f"Failed to get video info for {video_id}: "
+                f"metadata: {errors['metadata']}; transcript: {errors['transcript']}"
+            )
+        # 추출기가 예외 대신 기본값을 반환한 실패도 호출자가 알 수 있도록 기록
+        if metadata is not None and is_placeholder_metadata(metadata):
+            errors['metadata'] = "Metadata extraction failed"
+        if transcript is not None and not transcript and not getattr(transcript, 'missing', False):
+            errors['transcript'] = "Transcript extraction failed"
+
+        if errors:
+            logger.warning(f"Returning partial video info for {video_id}: {errors}")
 
         return {
-            'metadata': metadata,
-            'transcript': transcript,
-            'video_id': video_id
+            'metadata': metadata if metadata is not None else self._fallback_metadata(video_id),
+            'transcript': transcript if transcript is not None else [],
+            'video_id': video_id,
+            'errors': errors
         }
 
+    @staticmethod
+    def _future_result(
+        future: Future,
+        name: str,
+        timeout: float,
+        errors: Dict[str, str]
+    ):
+        """완료된 작업의 결과를 반환하고, 실패하거나 시간 초과이면 errors에 기록합니다."""
+        if not future.done():
+            errors[name] = f"Timed out after {timeout:g}s"
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            errors[name] = str(e)
+            return None
+
     def is_playlist_url(self, url: str) -> bool:
         """
         URL이 플레이리스트 URL인지 확인합니다.
@@ -157,6 +410,60 @@ class YouTubeService:
         """
         return self.playlist_handler.is_playlist_url(url)
 
+    def _extract_playlist_info(self, playlist_url: str) -> Optional[Dict]:
+        """풀의 YoutubeDL 인스턴스로 재생목록 정보를 추출합니다."""
+        if self.extractor_pool is None:
+            return self.playlist_handler.get_playlist_info(playlist_url)
+
+        with self.extractor_pool.acquire(PLAYLIST_YDL_OPTS) as ydl:
+            return self.playlist_handler.get_playlist_info(playlist_url, ydl=ydl)
+
+    def _playlist_key(self, playlist_url: str) -> str:
+        """재생목록 캐시/병합 키 (같은 재생목록의 다른 URL 형식도 같은 키)"""
+        return f"playlist:{self.playlist_handler.extract_playlist_id(playlist_url) or playlist_url}"
+
+    def _cached_playlist(self, playlist_url: str) -> Optional[Dict]:
+        """캐시에 있는 재생목록 추출 결과를 반환합니다 (없으면 None)."""
+        if self.playlist_cache is None:
+            return None
+        return self.playlist_cache.get(self._playlist_key(playlist_url))
+
+    def _load_playlist(self, playlist_url: str) -> Optional[Dict]:
+        """재생목록을 추출하여 캐시에 저장합니다 (병합된 호출 중 하나만 실행)."""
+        # 앞선 추출이 끝나 캐시에 저장된 직후 들어온 호출은 재추출하지 않음
+        cached = self._cached_playlist(playlist_url)
+        if cached is not None:
+            return cached
+
+        info = self._extract_playlist_info(playlist_url)
+        if info and self.playlist_cache is not None:
+            self.playlist_cache.set(self._playlist_key(playlist_url), info)
+        return info
+
+    def get_playlist(self, playlist_url: str) -> Optional[Dict]:
+        """
+        재생목록 추출 결과(메타데이터와 전체 entries)를 가져옵니다.
+
+        같은 재생목록의 추출 결과는 playlist_cache에 짧게(PLAYLIST_CACHE_TTL) 보관되고,
+        동시에 들어온 같은 재생목록 요청은 하나의 추출을 공유합니다.
+        get_playlist_info, get_playlist_videos, playlist_videos가 이 결과를 재사용합니다.
+        반환값은 호출자 간에 공유되므로 수정하지 않아야 합니다.
+
+        Args:
+            playlist_url: YouTube 플레이리스트 URL
+
+        Returns:
+            재생목록 정보 딕셔너리 (PlaylistHandler.get_playlist_info 형식) 또는 None
+        """
+        cached = self._cached_playlist(playlist_url)
+        if cached is not None:
+            logger.info(f"Playlist cache hit for {playlist_url}")
+            return cached
+
+        return self._playlist_flight.do(
+            self._playlist_key(playlist_url), self._load_playlist, playlist_url
+        )
+
     def get_playlist_info(self, playlist_url: str) -> Optional[Dict]:
         """
         플레이리스트 정보를 가져옵니다.
@@ -168,24 +475,52 @@ class YouTubeService:
             플레이리스트 정보 딕셔너리 또는 None
         """
         try:
-            info = self.playlist_handler.get_playlist_info(playlist_url)
+            info = self.get_playlist(playlist_url)
             logger.info(f"Successfully retrieved playlist info for {playlist_url}")
             return info
         except Exception as e:
             logger.error(f"Failed to get playlist info: {e}")
             return None
 
+    def playlist_videos(
+        self,
+        playlist_info: Dict,
+        max_videos: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        이미 추출한 재생목록 정보에서 비디오 목록을 만듭니다 (네트워크 요청 없음).
+
+        Args:
+            playlist_info: get_playlist / get_playlist_info 결과
+            max_videos: 최대 비디오 수 제한
+            offset: 건너뛸 비디오 수
+
+        Returns:
+            비디오 정보 리스트
+        """
+        limit = max_videos if max_videos and max_videos > 0 else None
+        return list(self.playlist_handler.iter_entry_videos(
+            playlist_info.get('entries') or [], offset=offset, limit=limit
+        ))
+
     def get_playlist_videos(
         self,
         playlist_url: str,
-        max_videos: Optional[int] = None
+        max_videos: Optional[int] = None,
+        offset: int = 0
     ) -> List[Dict]:
         """
         플레이리스트의 비디오 목록을 가져옵니다.
 
+        캐시된 재생목록 추출 결과가 있으면 재사용하고, 없으면 재생목록 항목을 페이지
+        단위로 지연 조회하여 offset + max_videos개의 비디오를 얻으면 나머지 페이지는
+        요청하지 않습니다.
+
         Args:
             playlist_url: YouTube 플레이리스트 URL
             max_videos: 최대 비디오 수 제한
+            offset: 건너뛸 비디오 수 (페이지네이션용)
 
         Returns:
             비디오 정보 리스트
@@ -193,11 +528,20 @@ class YouTubeService:
         Raises:
             Exception: 플레이리스트 추출 실패 시
         """
+        limit = max_videos if max_videos and max_videos > 0 else None
         try:
-            videos = self.playlist_handler.get_video_urls_from_playlist(playlist_url)
-
-            if max_videos and max_videos > 0:
-                videos = videos[:max_videos]
+            cached = self._cached_playlist(playlist_url)
+            if cached is not None:
+                videos = self.playlist_videos(cached, max_videos=limit, offset=offset)
+            elif self.extractor_pool is None:
+                videos = list(self.playlist_handler.iter_playlist_videos(
+                    playlist_url, offset=offset, limit=limit
+                ))
+            else:
+                with self.extractor_pool.acquire(PLAYLIST_YDL_OPTS) as ydl:
+                    videos = list(self.playlist_handler.iter_playlist_videos(
+                        playlist_url, ydl=ydl, offset=offset, limit=limit
+                    ))
 
             logger.info(f"Retrieved {len(videos)} videos from playlist")
             return videos
@@ -216,9 +560,121 @@ class YouTubeService:
             타입, 비디오 목록, 플레이리스트 정보를 포함한 딕셔너리
         """
         try:
-            result = process_playlist_or_video(url)
+            # 재생목록이면 캐시/병합되는 단일 추출 결과를 재사용
+            playlist_info = self.get_playlist(url) if self.is_playlist_url(url) else None
+            result = process_playlist_or_video(url, playlist_info=playlist_info)
             logger.info(f"Processed URL type: {result['type']}")
             return result
         except Exception as e:
             logger.error(f"Failed to process URL {url}: {e}")
             raise
+
+    # ------------------------------------------------------------------
+    # 비동기 API
+    #
+    # FastAPI 라우터에서 사용합니다. 블로킹 추출 작업은 제한된 스레드 풀에서
+    # 실행되므로 이벤트 루프가 멈추지 않고 여러 요청을 동시에 처리할 수 있습니다.
+    # ------------------------------------------------------------------
+
+    async def get_video_metadata_async(self, video_id: str) -> Dict:
+        """
+        get_video_metadata의 비동기 버전입니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+
+        Returns:
+            메타데이터 딕셔너리
+        """
+        return await run_blocking(self.executor, self.get_video_metadata, video_id)
+
+    async def get_transcript_async(
+        self,
+        video_id: str,
+        languages: List[str] = None,
+        prefer_manual: bool = True
+    ) -> List[Dict]:
+        """
+        get_transcript의 비동기 버전입니다.
+
+        Args:
+            video_id: YouTube 비디오 ID
+            languages: 자막 언어 우선순위 목록
+            prefer_manual: 수동 생성 자막 선호 여부
+
+        Returns:
+            타임스탬프가 포함된 자막 리스트
+        """
+        return await run_blocking(
+            self.executor,
+            self.get_transcript,
+            video_id,
+            languages=languages,
+            prefer_manual=prefer_manual
+        )
+
+    async def get_video_info_async(
+        self,
+        video_url: str,
+        languages: List[str] = None,
+        prefer_manual: bool = True
+    ) -> Dict:
+        """
+        get_video_info의 비동기 버전입니다.
+
+        Args:
+            video_url: YouTube 비디오 URL
+            languages: 자막 언어 우선순위 목록
+            prefer_manual: 수동 생성 자막 선호 여부
+
+        Returns:
+            메타데이터와 자막을 포함한 딕셔너리
+
+        Raises:
+            ValueError: 유효하지 않은 URL
+        """
+        return await run_blocking(
+            self.executor,
+            self.get_video_info,
+            video_url,
+            languages=languages,
+            prefer_manual=prefer_manual
+        )
+
+    async def get_playlist_info_async(self, playlist_url: str) -> Optional[Dict]:
+        """
+        get_playlist_info의 비동기 버전입니다.
+
+        Args:
+            playlist_url: YouTube 플레이리스트 URL
+
+        Returns:
+            플레이리스트 정보 딕셔너리 또는 None
+        """
+        return await run_blocking(self.executor, self.get_playlist_info, playlist_url)
+
+    async def get_playlist_videos_async(
+        self,
+        playlist_url: str,
+        max_videos: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict]:
+        """
+        get_playlist_videos의 비동기 버전입니다.
+
+        Args:
+            playlist_url: YouTube 플레이리스트 URL
+            max_videos: 최대 비디오 수 제한
+            offset: 건너뛸 비디오 수 (페이지네이션용)
+
+        Returns:
+            비디오 정보 리스트
+        """
+        return await run_blocking(
+            self.executor,
+            self.get_playlist_videos,
+            playlist_url,
+            max_videos=max_videos,
+            offset=offset
+        )
+
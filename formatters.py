@@ -1,49 +1,335 @@
 """
 출력 포맷터 모듈
 전략 패턴(Strategy Pattern)을 사용하여 다양한 출력 형식을 지원합니다.
+
+모든 포맷터는 헤더 → 자막 항목 → 푸터 순서로 문자열 조각을 만들어 내므로,
+자막을 제너레이터로 넘기면 전체 자막이나 문서 트리를 메모리에 올리지 않고
+항목 단위로 파일이나 HTTP 응답에 바로 쓸 수 있습니다.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Iterable, Iterator, TextIO
+import io
 import json
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from youtube_api import format_timestamp
 
 
+def align_translation(
+    transcript: List[Dict],
+    translated_transcript: Optional[List[Dict]]
+) -> List[Optional[str]]:
+    """
+    항목별 번역을 원본 자막 순서에 맞춰 반환합니다.
+
+    Args:
+        transcript: 원본 자막 리스트
+        translated_transcript: 항목별 번역 자막 리스트 (원본과 같은 순서)
+
+    Returns:
+        원본 자막 항목마다 번역 텍스트 또는 None
+    """
+    if not translated_transcript:
+        return [None] * len(transcript)
+
+    translations = []
+    for i in range(len(transcript)):
+        text = translated_transcript[i].get('text', '') if i < len(translated_transcript) else ''
+        translations.append(text.strip() or None)
+    return translations
+
+
+def _generated_at() -> str:
+    """출력 생성 시각 문자열을 반환합니다."""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
 class Formatter(ABC):
     """
     출력 포맷터 추상 클래스
-    모든 포맷터는 이 클래스를 상속받아 save() 메서드를 구현해야 합니다.
+
+    모든 포맷터는 render_header(), render_transcript_start(), render_entry(),
+    render_footer()를 구현합니다. iter_render()가 이를 차례로 호출하여 문자열 조각을
+    만들고, write()와 save()는 그 조각을 스트림이나 파일에 바로 쓰며, render()는
+    임시 파일 없이 메모리 버퍼에 모아 문자열로 반환합니다.
+    자막 섹션 시작은 첫 항목을 받을 때 출력하므로, 자막이 비어 있는지는
+    render_footer()에 전달되는 항목 수로 판단합니다.
     """
 
     def __init__(self):
         """포맷터 초기화"""
         self.file_extension = ""
         self.format_name = ""
+        self.media_type = "text/plain; charset=utf-8"
+        self.file_label = ""
+
+    @abstractmethod
+    def render_header(
+        self,
+        metadata: Dict,
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None
+    ) -> str:
+        """
+        자막 앞부분 (비디오 정보, 설명, AI 결과)을 만듭니다.
+
+        Args:
+            metadata: 비디오 메타데이터
+            summary: AI 생성 요약 (선택사항)
+            translation: 번역된 텍스트 (선택사항)
+            key_topics: 핵심 주제 리스트 (선택사항)
+
+        Returns:
+            헤더 문자열
+        """
+        pass
+
+    @abstractmethod
+    def render_transcript_start(self, bilingual: bool = False) -> str:
+        """
+        자막 섹션 시작 부분을 만듭니다 (자막 항목이 하나 이상일 때만 호출).
+
+        Args:
+            bilingual: 원문과 번역을 함께 출력하는지 여부
+
+        Returns:
+            자막 섹션 시작 문자열
+        """
+        pass
+
+    @abstractmethod
+    def render_entry(
+        self,
+        entry: Dict,
+        translated: Optional[str] = None,
+        index: int = 0,
+        bilingual: bool = False
+    ) -> str:
+        """
+        자막 항목 하나를 만듭니다.
+
+        Args:
+            entry: 자막 항목 ({'start', 'duration', 'text'} 딕셔너리 또는 Transcript 항목 뷰)
+            translated: 항목 번역 텍스트 (선택사항)
+            index: 항목 순서 (0부터 시작)
+            bilingual: 원문과 번역을 함께 출력하는지 여부
+
+        Returns:
+            자막 항목 문자열
+        """
+        pass
 
     @abstractmethod
+    def render_footer(
+        self,
+        total_entries: int,
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None
+    ) -> str:
+        """
+        자막 섹션 끝과 메타데이터를 만듭니다.
+
+        Args:
+            total_entries: 출력한 자막 항목 수 (0이면 자막 없음)
+            summary: AI 생성 요약 (선택사항)
+            translation: 번역된 텍스트 (선택사항)
+            key_topics: 핵심 주제 리스트 (선택사항)
+
+        Returns:
+            푸터 문자열
+        """
+        pass
+
+    def iter_render(
+        self,
+        metadata: Dict,
+        transcript: Iterable[Dict],
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None,
+        translations: Optional[Iterable[Optional[str]]] = None,
+        bilingual: bool = False
+    ) -> Iterator[str]:
+        """
+        출력 문서를 문자열 조각 단위로 생성합니다.
+
+        자막은 한 항목씩 소비하므로 제너레이터를 넘기면 메모리 사용량이
+        자막 길이와 관계없이 일정합니다.
+
+        Args:
+            metadata: 비디오 메타데이터
+            transcript: 자막 항목 iterable (리스트 또는 제너레이터)
+            summary: AI 생성 요약 (선택사항)
+            translation: 번역된 텍스트 (선택사항)
+            key_topics: 핵심 주제 리스트 (선택사항)
+            translations: 자막과 같은 순서의 항목별 번역 iterable (선택사항,
+                짧으면 나머지 항목은 번역 없음)
+            bilingual: 원문과 번역을 함께 출력하는지 여부 (Markdown 표의 번역 열)
+
+        Yields:
+            출력 문자열 조각
+        """
+        yield self.render_header(
+            metadata, summary=summary, translation=translation, key_topics=key_topics
+        )
+
+        translation_iter = iter(translations) if translations is not None else None
+        count = 0
+        for entry in transcript:
+            translated = next(translation_iter, None) if translation_iter is not None else None
+            if count == 0:
+                yield self.render_transcript_start(bilingual)
+            yield self.render_entry(entry, translated, index=count, bilingual=bilingual)
+            count += 1
+
+        yield self.render_footer(
+            count, summary=summary, translation=translation, key_topics=key_topics
+        )
+
+    def write(
+        self,
+        stream: TextIO,
+        metadata: Dict,
+        transcript: Iterable[Dict],
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None,
+        translations: Optional[Iterable[Optional[str]]] = None,
+        bilingual: bool = False
+    ) -> None:
+        """
+        출력 문서를 텍스트 스트림에 항목 단위로 씁니다.
+
+        Args:
+            stream: 쓰기 가능한 텍스트 스트림
+            metadata: 비디오 메타데이터
+            transcript: 자막 항목 iterable (리스트 또는 제너레이터)
+            summary: AI 생성 요약 (선택사항)
+            translation: 번역된 텍스트 (선택사항)
+            key_topics: 핵심 주제 리스트 (선택사항)
+            translations: 자막과 같은 순서의 항목별 번역 iterable (선택사항)
+            bilingual: 원문과 번역을 함께 출력하는지 여부
+        """
+        for chunk in self.iter_render(
+            metadata, transcript,
+            summary=summary, translation=translation, key_topics=key_topics,
+            translations=translations, bilingual=bilingual
+        ):
+            stream.write(chunk)
+
+    def iter_document(
+        self,
+        metadata: Dict,
+        transcript: Iterable[Dict],
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None,
+        translated_transcript: Optional[List[Dict]] = None
+    ) -> Iterator[str]:
+        """
+        save()와 같은 인자로 출력 문서를 문자열 조각 단위로 생성합니다.
+
+        항목별 번역이 주어지면 자막 순서에 맞춰 정렬하고, 번역이 하나라도 있으면
+        원문과 번역을 함께 출력합니다.
+
+        Args:
+            metadata: 비디오 메타데이터
+            transcript: 자막 데이터 (Transcript, 리스트 또는 번역이 없으면 제너레이터)
+            summary: AI 생성 요약 (선택사항)
+            translation: 번역된 텍스트 (선택사항)
+            key_topics: 핵심 주제 리스트 (선택사항)
+            translated_transcript: 항목별 번역 자막 (선택사항, 자막과 같은 순서)
+
+        Returns:
+            출력 문자열 조각 iterator
+        """
+        translations = None
+        if translated_transcript:
+            if not isinstance(transcript, Sequence):
+                transcript = list(transcript)
+            translations = align_translation(transcript, translated_transcript)
+
+        return self.iter_render(
+            metadata, transcript,
+            summary=summary, translation=translation, key_topics=key_topics,
+            translations=translations, bilingual=any(translations or [])
+        )
+
+    def render(
+        self,
+        metadata: Dict,
+        transcript: Iterable[Dict],
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None,
+        translated_transcript: Optional[List[Dict]] = None
+    ) -> str:
+        """
+        출력 문서를 메모리 버퍼에 만들어 문자열로 반환합니다.
+
+        Args:
+            metadata: 비디오 메타데이터
+            transcript: 자막 데이터
+            summary: AI 생성 요약 (선택사항)
+            translation: 번역된 텍스트 (선택사항)
+            key_topics: 핵심 주제 리스트 (선택사항)
+            translated_transcript: 항목별 번역 자막 (선택사항)
+
+        Returns:
+            포맷팅된 문자열
+        """
+        buffer = io.StringIO()
+        for chunk in self.iter_document(
+            metadata, transcript,
+            summary=summary, translation=translation, key_topics=key_topics,
+            translated_transcript=translated_transcript
+        ):
+            buffer.write(chunk)
+        return buffer.getvalue()
+
     def save(
         self,
         metadata: Dict,
-        transcript: List[Dict],
+        transcript: Iterable[Dict],
         output_file: str,
         summary: Optional[str] = None,
         translation: Optional[str] = None,
-        key_topics: Optional[List[str]] = None
+        key_topics: Optional[List[str]] = None,
+        translated_transcript: Optional[List[Dict]] = None
     ) -> None:
         """
         데이터를 지정된 형식으로 저장합니다.
 
         Args:
             metadata: 비디오 메타데이터
-            transcript: 타임스탬프가 포함된 자막 데이터
+            transcript: 타임스탬프가 포함된 자막 데이터 (번역이 없으면 제너레이터도 가능)
             output_file: 출력 파일 경로
             summary: AI 생성 요약 (선택사항)
             translation: 번역된 텍스트 (선택사항)
             key_topics: 핵심 주제 리스트 (선택사항)
+            translated_transcript: 항목별 번역 자막 (선택사항, 자막과 같은 순서).
+                주어지면 자막을 원문과 번역을 함께 출력합니다.
+
+        Raises:
+            IOError: 파일 생성 실패
         """
-        pass
+        try:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                for chunk in self.iter_document(
+                    metadata, transcript,
+                    summary=summary, translation=translation, key_topics=key_topics,
+                    translated_transcript=translated_transcript
+                ):
+                    f.write(chunk)
+
+            print(f"\n✅ {self.file_label}파일이 성공적으로 생성되었습니다: {output_file}")
+
+        except Exception as e:
+            raise IOError(f"{self.file_label}파일 생성 오류: {e}")
 
     def get_extension(self) -> str:
         """파일 확장자를 반환합니다."""
@@ -62,226 +348,293 @@ class TxtFormatter(Formatter):
         self.file_extension = "txt"
         self.format_name = "텍스트"
 
-    def save(
+    def render_header(
         self,
         metadata: Dict,
-        transcript: List[Dict],
-        output_file: str,
         summary: Optional[str] = None,
         translation: Optional[str] = None,
         key_topics: Optional[List[str]] = None
-    ) -> None:
-        """텍스트 파일로 저장합니다."""
-        try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # 헤더
-                f.write("=" * 80 + "\n")
-                f.write("YouTube Video Transcript\n")
-                f.write("=" * 80 + "\n\n")
-
-                # 비디오 정보
-                f.write("📹 Video Information\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Title: {metadata['title']}\n")
-                f.write(f"Channel: {metadata['channel']}\n")
-                f.write(f"Upload Date: {metadata['upload_date']}\n")
-                f.write(f"Duration: {format_timestamp(metadata['duration'])}\n")
-                f.write(f"Views: {metadata['view_count']:,}\n")
-                f.write("\n")
-
-                # 설명
-                f.write("📝 Description\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"{metadata['description']}\n")
-                f.write("\n")
-
-                # AI 생성 요약 (있는 경우)
-                if summary:
-                    f.write("🤖 AI Summary\n")
-                    f.write("-" * 80 + "\n")
-                    f.write(f"{summary}\n")
-                    f.write("\n")
-
-                # 핵심 주제 (있는 경우)
-                if key_topics:
-                    f.write("🔑 Key Topics\n")
-                    f.write("-" * 80 + "\n")
-                    for topic in key_topics:
-                        f.write(f"• {topic}\n")
-                    f.write("\n")
-
-                # 번역 (있는 경우)
-                if translation:
-                    f.write("🌐 Translation\n")
-                    f.write("-" * 80 + "\n")
-                    f.write(f"{translation}\n")
-                    f.write("\n")
-
-                # 자막 (타임스탬프 포함)
-                if transcript:
-                    f.write("📜 Transcript with Timestamps\n")
-                    f.write("=" * 80 + "\n\n")
-
-                    for entry in transcript:
-                        timestamp = format_timestamp(entry['start'])
-                        text = entry['text'].strip()
-                        f.write(f"[{timestamp}] {text}\n")
-
-                    f.write("\n")
-                    f.write("=" * 80 + "\n")
-                    f.write(f"Total transcript entries: {len(transcript)}\n")
-                else:
-                    f.write("📜 Transcript\n")
-                    f.write("=" * 80 + "\n")
-                    f.write("No transcript available for this video.\n")
-
-                f.write(f"\nGenerated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-            print(f"\n✅ 파일이 성공적으로 생성되었습니다: {output_file}")
-
-        except Exception as e:
-            raise IOError(f"파일 생성 오류: {e}")
+    ) -> str:
+        """헤더, 비디오 정보, 설명, AI 결과를 만듭니다."""
+        # 헤더
+        parts = [
+            "=" * 80 + "\n",
+            "YouTube Video Transcript\n",
+            "=" * 80 + "\n\n",
+        ]
+
+        # 비디오 정보
+        parts += [
+            "📹 Video Information\n",
+            "-" * 80 + "\n",
+            f"Title: {metadata['title']}\n",
+            f"Channel: {metadata['channel']}\n",
+            f"Upload Date: {metadata['upload_date']}\n",
+            f"Duration: {format_timestamp(metadata['duration'])}\n",
+            f"Views: {metadata['view_count']:,}\n",
+            "\n",
+        ]
+
+        # 설명
+        parts += [
+            "📝 Description\n",
+            "-" * 80 + "\n",
+            f"{metadata['description']}\n",
+            "\n",
+        ]
+
+        # AI 생성 요약 (있는 경우)
+        if summary:
+            parts += ["🤖 AI Summary\n", "-" * 80 + "\n", f"{summary}\n", "\n"]
+
+        # 핵심 주제 (있는 경우)
+        if key_topics:
+            parts += ["🔑 Key Topics\n", "-" * 80 + "\n"]
+            parts += [f"• {topic}\n" for topic in key_topics]
+            parts.append("\n")
+
+        # 번역 (있는 경우)
+        if translation:
+            parts += ["🌐 Translation\n", "-" * 80 + "\n", f"{translation}\n", "\n"]
+
+        return "".join(parts)
+
+    def render_transcript_start(self, bilingual: bool = False) -> str:
+        """자막 섹션 제목을 만듭니다."""
+        return "📜 Transcript with Timestamps\n" + "=" * 80 + "\n\n"
+
+    def render_entry(
+        self,
+        entry: Dict,
+        translated: Optional[str] = None,
+        index: int = 0,
+        bilingual: bool = False
+    ) -> str:
+        """타임스탬프가 붙은 자막 한 줄 (번역은 아래 줄에 들여쓰기)을 만듭니다."""
+        timestamp = format_timestamp(entry['start'])
+        text = entry['text'].strip()
+        line = f"[{timestamp}] {text}\n"
+        if translated:
+            # 번역은 원문 아래에 들여쓰기하여 출력
+            line += f"{' ' * (len(timestamp) + 3)}{translated}\n"
+        return line
+
+    def render_footer(
+        self,
+        total_entries: int,
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None
+    ) -> str:
+        """자막 항목 수와 생성 시각을 만듭니다."""
+        if total_entries:
+            footer = "\n" + "=" * 80 + "\n" + f"Total transcript entries: {total_entries}\n"
+        else:
+            footer = (
+                "📜 Transcript\n" + "=" * 80 + "\n"
+                "No transcript available for this video.\n"
+            )
+        return footer + f"\nGenerated on: {_generated_at()}\n"
 
 
 class JsonFormatter(Formatter):
-    """JSON 파일 포맷터"""
+    """
+    JSON 파일 포맷터
+
+    json.dump(indent=2)와 같은 문서를 항목 단위로 직렬화합니다.
+    """
 
     def __init__(self):
         super().__init__()
         self.file_extension = "json"
         self.format_name = "JSON"
+        self.media_type = "application/json"
+        self.file_label = "JSON "
 
-    def save(
+    @staticmethod
+    def _member(key: str, value) -> str:
+        """최상위 객체의 '  "key": value' 멤버 문자열을 만듭니다."""
+        encoded = json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+        return f'  {json.dumps(key)}: {encoded}'
+
+    def render_header(
         self,
         metadata: Dict,
-        transcript: List[Dict],
-        output_file: str,
         summary: Optional[str] = None,
         translation: Optional[str] = None,
         key_topics: Optional[List[str]] = None
-    ) -> None:
-        """JSON 파일로 저장합니다."""
-        try:
-            # JSON 구조 생성
-            data = {
-                "video_info": {
-                    "video_id": metadata.get('video_id', ''),  # 추가
-                    "title": metadata['title'],
-                    "channel": metadata['channel'],
-                    "upload_date": metadata.get('upload_date'),
-                    "duration": metadata.get('duration', 0),
-                    "duration_formatted": format_timestamp(metadata.get('duration', 0)),
-                    "view_count": metadata.get('view_count', 0),
-                    "like_count": metadata.get('like_count'),  # 추가
-                    "thumbnail_url": metadata.get('thumbnail_url'),  # 추가
-                },
-                "description": metadata.get('description', ''),
-                "transcript": [
-                    {
-                        "timestamp": format_timestamp(entry['start']),
-                        "start_seconds": entry['start'],
-                        "duration": entry['duration'],
-                        "text": entry['text'].strip()
-                    }
-                    for entry in transcript
-                ],
-                "metadata": {
-                    "total_entries": len(transcript),
-                    "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-            }
-
-            # AI 기능 추가
-            if summary:
-                data["ai_summary"] = summary
-            if key_topics:
-                data["key_topics"] = key_topics
-            if translation:
-                data["translation"] = translation
-
-            # JSON 파일 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
-            print(f"\n✅ JSON 파일이 성공적으로 생성되었습니다: {output_file}")
-
-        except Exception as e:
-            raise IOError(f"JSON 파일 생성 오류: {e}")
+    ) -> str:
+        """video_info, description과 transcript 배열 시작을 만듭니다."""
+        video_info = {
+            "video_id": metadata.get('video_id', ''),  # 추가
+            "title": metadata['title'],
+            "channel": metadata['channel'],
+            "upload_date": metadata.get('upload_date'),
+            "duration": metadata.get('duration', 0),
+            "duration_formatted": format_timestamp(metadata.get('duration', 0)),
+            "view_count": metadata.get('view_count', 0),
+            "like_count": metadata.get('like_count'),  # 추가
+            "thumbnail_url": metadata.get('thumbnail_url'),  # 추가
+        }
+        return (
+            "{\n"
+            + self._member("video_info", video_info) + ",\n"
+            + self._member("description", metadata.get('description', '')) + ",\n"
+            + '  "transcript": ['
+        )
+
+    def render_transcript_start(self, bilingual: bool = False) -> str:
+        """transcript 배열은 헤더에서 시작하므로 빈 문자열을 반환합니다."""
+        return ""
+
+    def render_entry(
+        self,
+        entry: Dict,
+        translated: Optional[str] = None,
+        index: int = 0,
+        bilingual: bool = False
+    ) -> str:
+        """transcript 배열의 항목 하나를 만듭니다."""
+        item = {
+            "timestamp": format_timestamp(entry['start']),
+            "start_seconds": entry['start'],
+            "duration": entry['duration'],
+            "text": entry['text'].strip(),
+            **({"translation": translated} if translated else {})
+        }
+        encoded = json.dumps(item, ensure_ascii=False, indent=2).replace('\n', '\n    ')
+        return ("\n    " if index == 0 else ",\n    ") + encoded
+
+    def render_footer(
+        self,
+        total_entries: int,
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None
+    ) -> str:
+        """transcript 배열 끝, metadata와 AI 결과를 만듭니다."""
+        members = [
+            self._member("metadata", {
+                "total_entries": total_entries,
+                "generated_at": _generated_at()
+            })
+        ]
+
+        # AI 기능 추가
+        if summary:
+            members.append(self._member("ai_summary", summary))
+        if key_topics:
+            members.append(self._member("key_topics", key_topics))
+        if translation:
+            members.append(self._member("translation", translation))
+
+        closing = "\n  ]" if total_entries else "]"
+        return closing + ",\n" + ",\n".join(members) + "\n}"
 
 
 class XmlFormatter(Formatter):
-    """XML 파일 포맷터"""
+    """
+    XML 파일 포맷터
+
+    ET.indent(space="  ")로 정렬한 문서와 같은 출력을, 전체 트리 대신
+    최상위 요소와 자막 항목 단위의 작은 트리로 직렬화합니다.
+    """
 
     def __init__(self):
         super().__init__()
         self.file_extension = "xml"
         self.format_name = "XML"
+        self.media_type = "application/xml"
+        self.file_label = "XML "
 
-    def save(
+    @staticmethod
+    def _serialize(element: ET.Element, level: int) -> str:
+        """요소를 지정한 들여쓰기 수준에 맞춰 직렬화합니다 (앞 줄바꿈 포함)."""
+        ET.indent(element, space="  ", level=level)
+        return "\n" + "  " * level + ET.tostring(element, encoding='unicode')
+
+    def render_header(
         self,
         metadata: Dict,
-        transcript: List[Dict],
-        output_file: str,
         summary: Optional[str] = None,
         translation: Optional[str] = None,
         key_topics: Optional[List[str]] = None
-    ) -> None:
-        """XML 파일로 저장합니다."""
-        try:
-            # 루트 엘리먼트 생성
-            root = ET.Element('youtube_transcript')
-
-            # 비디오 정보
-            video_info = ET.SubElement(root, 'video_info')
-            ET.SubElement(video_info, 'title').text = metadata['title']
-            ET.SubElement(video_info, 'channel').text = metadata['channel']
-            ET.SubElement(video_info, 'upload_date').text = metadata['upload_date']
-            ET.SubElement(video_info, 'duration').text = str(metadata['duration'])
-            ET.SubElement(video_info, 'duration_formatted').text = format_timestamp(metadata['duration'])
-            ET.SubElement(video_info, 'view_count').text = str(metadata['view_count'])
-
-            # 설명
-            description = ET.SubElement(root, 'description')
-            description.text = metadata['description']
-
-            # AI 기능 (있는 경우)
-            if summary:
-                ai_summary = ET.SubElement(root, 'ai_summary')
-                ai_summary.text = summary
-
-            if key_topics:
-                topics_element = ET.SubElement(root, 'key_topics')
-                for topic in key_topics:
-                    topic_element = ET.SubElement(topics_element, 'topic')
-                    topic_element.text = topic
-
-            if translation:
-                translation_element = ET.SubElement(root, 'translation')
-                translation_element.text = translation
-
-            # 자막
-            transcript_element = ET.SubElement(root, 'transcript')
-            for entry in transcript:
-                entry_element = ET.SubElement(transcript_element, 'entry')
-                ET.SubElement(entry_element, 'timestamp').text = format_timestamp(entry['start'])
-                ET.SubElement(entry_element, 'start_seconds').text = str(entry['start'])
-                ET.SubElement(entry_element, 'duration').text = str(entry['duration'])
-                ET.SubElement(entry_element, 'text').text = entry['text'].strip()
-
-            # 메타데이터
-            metadata_element = ET.SubElement(root, 'metadata')
-            ET.SubElement(metadata_element, 'total_entries').text = str(len(transcript))
-            ET.SubElement(metadata_element, 'generated_at').text = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-            # XML 트리 생성 및 저장
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space="  ")  # Pretty print
-            tree.write(output_file, encoding='utf-8', xml_declaration=True)
-
-            print(f"\n✅ XML 파일이 성공적으로 생성되었습니다: {output_file}")
+    ) -> str:
+        """XML 선언, 루트 시작, 비디오 정보, 설명, AI 결과를 만듭니다."""
+        parts = ["<?xml version='1.0' encoding='utf-8'?>\n<youtube_transcript>"]
+
+        # 비디오 정보
+        video_info = ET.Element('video_info')
+        ET.SubElement(video_info, 'title').text = metadata['title']
+        ET.SubElement(video_info, 'channel').text = metadata['channel']
+        ET.SubElement(video_info, 'upload_date').text = metadata['upload_date']
+        ET.SubElement(video_info, 'duration').text = str(metadata['duration'])
+        ET.SubElement(video_info, 'duration_formatted').text = format_timestamp(metadata['duration'])
+        ET.SubElement(video_info, 'view_count').text = str(metadata['view_count'])
+        parts.append(self._serialize(video_info, 1))
+
+        # 설명
+        description = ET.Element('description')
+        description.text = metadata['description']
+        parts.append(self._serialize(description, 1))
+
+        # AI 기능 (있는 경우)
+        if summary:
+            ai_summary = ET.Element('ai_summary')
+            ai_summary.text = summary
+            parts.append(self._serialize(ai_summary, 1))
+
+        if key_topics:
+            topics_element = ET.Element('key_topics')
+            for topic in key_topics:
+                topic_element = ET.SubElement(topics_element, 'topic')
+                topic_element.text = topic
+            parts.append(self._serialize(topics_element, 1))
+
+        if translation:
+            translation_element = ET.Element('translation')
+            translation_element.text = translation
+            parts.append(self._serialize(translation_element, 1))
+
+        return "".join(parts)
+
+    def render_transcript_start(self, bilingual: bool = False) -> str:
+        """transcript 요소 시작 태그를 만듭니다."""
+        return "\n  <transcript>"
+
+    def render_entry(
+        self,
+        entry: Dict,
+        translated: Optional[str] = None,
+        index: int = 0,
+        bilingual: bool = False
+    ) -> str:
+        """entry 요소 하나를 만듭니다."""
+        entry_element = ET.Element('entry')
+        ET.SubElement(entry_element, 'timestamp').text = format_timestamp(entry['start'])
+        ET.SubElement(entry_element, 'start_seconds').text = str(entry['start'])
+        ET.SubElement(entry_element, 'duration').text = str(entry['duration'])
+        ET.SubElement(entry_element, 'text').text = entry['text'].strip()
+        if translated:
+            ET.SubElement(entry_element, 'translation').text = translated
+        return self._serialize(entry_element, 2)
+
+    def render_footer(
+        self,
+        total_entries: int,
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None
+    ) -> str:
+        """transcript 요소 끝, 메타데이터, 루트 끝 태그를 만듭니다."""
+        closing = "\n  </transcript>" if total_entries else "\n  <transcript />"
 
-        except Exception as e:
-            raise IOError(f"XML 파일 생성 오류: {e}")
+        # 메타데이터
+        metadata_element = ET.Element('metadata')
+        ET.SubElement(metadata_element, 'total_entries').text = str(total_entries)
+        ET.SubElement(metadata_element, 'generated_at').text = _generated_at()
+
+        return closing + self._serialize(metadata_element, 1) + "\n</youtube_transcript>"
 
 
 class MarkdownFormatter(Formatter):
@@ -291,75 +644,93 @@ class MarkdownFormatter(Formatter):
         super().__init__()
         self.file_extension = "md"
         self.format_name = "Markdown"
+        self.media_type = "text/markdown; charset=utf-8"
+        self.file_label = "Markdown "
 
-    def save(
+    def render_header(
         self,
         metadata: Dict,
-        transcript: List[Dict],
-        output_file: str,
         summary: Optional[str] = None,
         translation: Optional[str] = None,
         key_topics: Optional[List[str]] = None
-    ) -> None:
-        """Markdown 파일로 저장합니다."""
-        try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # 제목
-                f.write(f"# {metadata['title']}\n\n")
-
-                # 비디오 정보
-                f.write("## 📹 Video Information\n\n")
-                f.write(f"- **Title**: {metadata['title']}\n")
-                f.write(f"- **Channel**: {metadata['channel']}\n")
-                f.write(f"- **Upload Date**: {metadata['upload_date']}\n")
-                f.write(f"- **Duration**: {format_timestamp(metadata['duration'])}\n")
-                f.write(f"- **Views**: {metadata['view_count']:,}\n\n")
-
-                # 설명
-                f.write("## 📝 Description\n\n")
-                f.write(f"{metadata['description']}\n\n")
-
-                # AI 생성 요약 (있는 경우)
-                if summary:
-                    f.write("## 🤖 AI Summary\n\n")
-                    f.write(f"{summary}\n\n")
-
-                # 핵심 주제 (있는 경우)
-                if key_topics:
-                    f.write("## 🔑 Key Topics\n\n")
-                    for topic in key_topics:
-                        f.write(f"- {topic}\n")
-                    f.write("\n")
-
-                # 번역 (있는 경우)
-                if translation:
-                    f.write("## 🌐 Translation\n\n")
-                    f.write(f"{translation}\n\n")
-
-                # 자막
-                if transcript:
-                    f.write("## 📜 Transcript\n\n")
-                    f.write("| Timestamp | Text |\n")
-                    f.write("|-----------|------|\n")
-
-                    for entry in transcript:
-                        timestamp = format_timestamp(entry['start'])
-                        text = entry['text'].strip().replace('\n', ' ').replace('|', '\\|')
-                        f.write(f"| `{timestamp}` | {text} |\n")
-
-                    f.write(f"\n**Total transcript entries**: {len(transcript)}\n\n")
-                else:
-                    f.write("## 📜 Transcript\n\n")
-                    f.write("No transcript available for this video.\n\n")
-
-                # 메타데이터
-                f.write("---\n\n")
-                f.write(f"*Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n")
-
-            print(f"\n✅ Markdown 파일이 성공적으로 생성되었습니다: {output_file}")
-
-        except Exception as e:
-            raise IOError(f"Markdown 파일 생성 오류: {e}")
+    ) -> str:
+        """제목, 비디오 정보, 설명, AI 결과를 만듭니다."""
+        # 제목
+        parts = [f"# {metadata['title']}\n\n"]
+
+        # 비디오 정보
+        parts += [
+            "## 📹 Video Information\n\n",
+            f"- **Title**: {metadata['title']}\n",
+            f"- **Channel**: {metadata['channel']}\n",
+            f"- **Upload Date**: {metadata['upload_date']}\n",
+            f"- **Duration**: {format_timestamp(metadata['duration'])}\n",
+            f"- **Views**: {metadata['view_count']:,}\n\n",
+        ]
+
+        # 설명
+        parts += ["## 📝 Description\n\n", f"{metadata['description']}\n\n"]
+
+        # AI 생성 요약 (있는 경우)
+        if summary:
+            parts += ["## 🤖 AI Summary\n\n", f"{summary}\n\n"]
+
+        # 핵심 주제 (있는 경우)
+        if key_topics:
+            parts.append("## 🔑 Key Topics\n\n")
+            parts += [f"- {topic}\n" for topic in key_topics]
+            parts.append("\n")
+
+        # 번역 (있는 경우)
+        if translation:
+            parts += ["## 🌐 Translation\n\n", f"{translation}\n\n"]
+
+        return "".join(parts)
+
+    def render_transcript_start(self, bilingual: bool = False) -> str:
+        """자막 섹션 제목과 표 머리글을 만듭니다."""
+        if bilingual:
+            return (
+                "## 📜 Transcript\n\n"
+                "| Timestamp | Text | Translation |\n"
+                "|-----------|------|-------------|\n"
+            )
+        return (
+            "## 📜 Transcript\n\n"
+            "| Timestamp | Text |\n"
+            "|-----------|------|\n"
+        )
+
+    def render_entry(
+        self,
+        entry: Dict,
+        translated: Optional[str] = None,
+        index: int = 0,
+        bilingual: bool = False
+    ) -> str:
+        """자막 표의 행 하나를 만듭니다."""
+        timestamp = format_timestamp(entry['start'])
+        text = entry['text'].strip().replace('\n', ' ').replace('|', '\\|')
+        if bilingual:
+            translated = (translated or '').replace('\n', ' ').replace('|', '\\|')
+            return f"| `{timestamp}` | {text} | {translated} |\n"
+        return f"| `{timestamp}` | {text} |\n"
+
+    def render_footer(
+        self,
+        total_entries: int,
+        summary: Optional[str] = None,
+        translation: Optional[str] = None,
+        key_topics: Optional[List[str]] = None
+    ) -> str:
+        """자막 항목 수와 생성 시각을 만듭니다."""
+        if total_entries:
+            footer = f"\n**Total transcript entries**: {total_entries}\n\n"
+        else:
+            footer = "## 📜 Transcript\n\nNo transcript available for this video.\n\n"
+
+        # 메타데이터
+        return footer + "---\n\n" + f"*Generated on: {_generated_at()}*\n"
 
 
 # 포맷터 팩토리 함수
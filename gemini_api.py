@@ -5,16 +5,31 @@ Google Gemini API (google-genai 패키지)를 사용한 자막 요약 및 번역
 """
 
 import os
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
+import re
 import time
 import logging
 
-try:
-    from google import genai
-    from google.genai import types
-except ImportError:
-    genai = None
-    types = None
+from utils.lazy_import import lazy_module
+
+# google-genai와 httpx는 첫 클라이언트 생성 시 로드 (시작 시간 단축, 미설치 시 None)
+genai = lazy_module('google.genai')
+types = None
+httpx = lazy_module('httpx')
+
+from utils.chunking import chunk_transcript, estimate_tokens, format_time_range
+from utils.config import settings
+from utils.rate_limiter import (
+    RateLimiter,
+    AdaptiveConcurrencyLimiter,
+    backoff_delay,
+    get_rate_limiter,
+    get_concurrency_limiter,
+)
+from utils.response_cache import ResponseCache, get_response_cache
+from utils.single_flight import SingleFlight
+from utils.transcript import Transcript
 
 
 # 로깅 설정
@@ -22,6 +37,13 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _load_types() -> None:
+    """google.genai.types를 모듈 전역 types에 채웁니다 (이미 값이 있으면 유지)."""
+    global types
+    if types is None and genai is not None:
+        types = genai.types
+
+
 class GeminiAPIError(Exception):
     """Gemini API 관련 커스텀 예외"""
     pass
@@ -61,7 +83,10 @@ class GeminiClient:
         api_key: Optional[str] = None,
         model_name: str = 'gemini-2.5-flash',
         retry_count: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
     ):
         """
         Gemini API 클라이언트를 초기화합니다.
@@ -70,7 +95,10 @@ class GeminiClient:
             api_key: Gemini API 키 (None일 경우 환경변수에서 로드)
             model_name: 사용할 모델 이름
             retry_count: API 호출 실패 시 재시도 횟수
-            retry_delay: 재시도 간 대기 시간 (초)
+            retry_delay: 재시도 백오프 기본 대기 시간 (초)
+            rate_limiter: 요청/토큰 속도 제한기 (None이면 모델별 전역 제한기 사용)
+            response_cache: LLM 응답 캐시 (None이면 프로세스 전역 캐시 사용)
+            concurrency_limiter: 적응형 동시 실행 제한기 (None이면 모델별 전역 제한기 사용)
 
         Raises:
             GeminiAPIError: API 키가 없거나 SDK가 설치되지 않은 경우
@@ -80,6 +108,7 @@ class GeminiClient:
                 "google-genai 패키지가 설치되지 않았습니다. "
                 "'pip install google-genai'로 설치하세요."
             )
+        _load_types()
 
         # API 키 설정 (환경변수 우선순위: GEMINI_API_KEY > GOOGLE_API_KEY)
         self.api_key = api_key or os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
@@ -93,15 +122,78 @@ class GeminiClient:
         self.model_name = model_name
         self.retry_count = retry_count
         self.retry_delay = retry_delay
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            f"gemini:{model_name}",
+            settings.gemini_requests_per_minute,
+            burst=settings.gemini_burst,
+            tokens_per_minute=settings.gemini_tokens_per_minute
+        )
+        self.concurrency_limiter = concurrency_limiter or get_concurrency_limiter(
+            f"gemini:{model_name}",
+            settings.gemini_max_concurrency,
+            min_limit=settings.gemini_min_concurrency
+        )
+        self.response_cache = response_cache or get_response_cache()
+        # 같은 프롬프트와 생성 설정의 동시 요청은 API를 한 번만 호출
+        self.request_flight = SingleFlight()
 
         # 클라이언트 초기화 (google-genai 패키지 방식)
         try:
-            # API 키를 직접 전달하여 클라이언트 생성
-            self.client = genai.Client(api_key=self.api_key)
+            # 동시 호출 수만큼 연결을 유지하는 HTTP 연결 풀을 사용
+            http_options = self._http_options()
+            if http_options is not None:
+                self.client = genai.Client(api_key=self.api_key, http_options=http_options)
+            else:
+                self.client = genai.Client(api_key=self.api_key)
             logger.info(f"Gemini 클라이언트 초기화 완료 (모델: {self.model_name})")
         except Exception as e:
             raise GeminiAPIError(f"클라이언트 초기화 실패: {e}")
 
+    @staticmethod
+    def _http_options():
+        """
+        연결 풀 크기를 지정한 HTTP 옵션을 생성합니다.
+
+        Returns:
+            types.HttpOptions 인스턴스 또는 None (SDK가 연결 풀 설정을 지원하지 않는 경우)
+        """
+        if httpx is None or not hasattr(types, 'HttpOptions'):
+            return None
+
+        connections = max(1, settings.gemini_max_connections)
+        try:
+            return types.HttpOptions(client_args={
+                'limits': httpx.Limits(
+                    max_connections=connections,
+                    max_keepalive_connections=connections
+                )
+            })
+        except (TypeError, ValueError) as e:
+            logger.warning(f"HTTP 연결 풀 설정을 지원하지 않는 SDK 버전입니다: {e}")
+            return None
+
+    def warm_up(self) -> None:
+        """
+        모델 정보를 조회하여 HTTP 연결과 인증을 미리 준비합니다.
+
+        실패해도 예외를 던지지 않으며, 연결은 첫 요청에서 다시 시도됩니다.
+        """
+        try:
+            self.client.models.get(model=self.model_name)
+            logger.info(f"Gemini 클라이언트 워밍업 완료 (모델: {self.model_name})")
+        except Exception as e:
+            logger.warning(f"Gemini 클라이언트 워밍업 실패: {e}")
+
+    def close(self) -> None:
+        """HTTP 연결 풀을 닫습니다."""
+        close = getattr(self.client, 'close', None)
+        if not callable(close):
+            return
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Gemini 클라이언트 종료 실패: {e}")
+
     def _combine_transcript_text(self, transcript: List[Dict]) -> str:
         """
         자막 리스트를 하나의 텍스트로 결합합니다.
@@ -115,63 +207,185 @@ class GeminiClient:
         if not transcript:
             return ""
 
-        return " ".join([entry.get('text', '').strip() for entry in transcript if entry.get('text')])
+        if isinstance(transcript, Transcript):
+            texts = transcript.texts()
+        else:
+            texts = (entry.get('text') for entry in transcript)
+        return " ".join(text.strip() for text in texts if text)
+
+    def _make_api_call(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_output_tokens: Optional[int] = None,
+        use_cache: bool = True
+    ) -> Optional[str]:
+        """
+        API 호출을 수행합니다. 같은 모델, 프롬프트, 생성 설정의 응답이 캐시에 있으면
+        API를 호출하지 않고 캐시된 응답을 반환합니다. 캐시에 없는 같은 요청이 동시에
+        들어오면 API를 한 번만 호출하고 결과를 함께 사용합니다.
+
+        Args:
+            prompt: 전달할 프롬프트
+            temperature: 생성 온도 (0.0-1.0)
+            max_output_tokens: 최대 출력 토큰 수 (None이면 모델 기본값)
+            use_cache: False면 캐시를 조회하지 않고 항상 API를 호출 (결과는 캐시에 갱신,
+                동시 요청 병합도 하지 않음)
+
+        Returns:
+            생성된 텍스트 또는 None (실패 시)
+        """
+        key = ResponseCache.make_key(
+            self.model_name, prompt, temperature, max_output_tokens
+        )
+
+        if self.response_cache is None:
+            if not use_cache:
+                return self._generate_content(prompt, temperature, max_output_tokens)
+            return self.request_flight.do(
+                key, self._generate_content, prompt, temperature, max_output_tokens
+            )
+
+        if not use_cache:
+            self.response_cache.record_bypass()
+            return self._generate_and_cache(key, prompt, temperature, max_output_tokens)
+
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached
 
-    def _make_api_call(self, prompt: str, temperature: float = 0.7) -> Optional[str]:
+        return self.request_flight.do(
+            key, self._generate_and_cache, key, prompt, temperature, max_output_tokens
+        )
+
+    def _generate_and_cache(
+        self,
+        key: str,
+        prompt: str,
+        temperature: float,
+        max_output_tokens: Optional[int]
+    ) -> Optional[str]:
+        """API를 호출하고 성공한 응답을 캐시에 저장합니다."""
+        result = self._generate_content(prompt, temperature, max_output_tokens)
+        if result:
+            self.response_cache.set(key, result)
+        return result
+
+    def _generate_content(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_output_tokens: Optional[int] = None
+    ) -> Optional[str]:
         """
-        재시도 로직이 포함된 API 호출을 수행합니다.
+        재시도 로직이 포함된 API 호출을 수행합니다 (캐시 미사용).
+
+        같은 모델을 사용하는 모든 호출이 분당 요청/토큰 한도와 적응형 동시 실행 한도를
+        공유합니다. 토큰 한도를 먼저 확보한 뒤 동시 실행 슬롯을 얻으므로, 토큰 한도를
+        기다리는 호출은 슬롯을 점유하지 않습니다. 실패한 시도와 빈 응답은 지터가 적용된
+        지수 백오프 후 재시도하며, 한도 초과(429) 응답은 동시 실행 한도를 줄입니다.
 
         Args:
             prompt: 전달할 프롬프트
             temperature: 생성 온도 (0.0-1.0)
+            max_output_tokens: 최대 출력 토큰 수 (None이면 모델 기본값)
 
         Returns:
             생성된 텍스트 또는 None (실패 시)
         """
+        # 출력 토큰까지 포함한 예상 사용량으로 토큰 한도를 확보
+        request_tokens = estimate_tokens(prompt) + (max_output_tokens or 0)
+
         for attempt in range(self.retry_count):
+            # 토큰 한도를 기다리는 시간이 동시 실행 슬롯의 사용 시간에 포함되지 않도록 먼저 확보
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(tokens=request_tokens)
+            if self.concurrency_limiter is not None:
+                self.concurrency_limiter.acquire()
+
+            throttled = False
+            succeeded = False
+            delay = None
             try:
                 # google-genai 패키지의 새로운 API 방식
                 response = self.client.models.generate_content(
                     model=self.model_name,
                     contents=prompt,
                     config=types.GenerateContentConfig(
-                        temperature=temperature
+                        temperature=temperature,
+                        max_output_tokens=max_output_tokens
                     )
                 )
 
                 # 응답 검증
                 if not response or not hasattr(response, 'text') or not response.text:
                     logger.warning(f"빈 응답 수신 (시도 {attempt + 1}/{self.retry_count})")
-                    continue
-
-                return response.text.strip()
+                    if attempt < self.retry_count - 1:
+                        delay = backoff_delay(
+                            attempt, self.retry_delay, settings.gemini_backoff_max
+                        )
+                else:
+                    succeeded = True
+                    return response.text.strip()
 
             except Exception as e:
+                throttled = is_rate_limit_error(e)
                 logger.warning(
                     f"API 호출 실패 (시도 {attempt + 1}/{self.retry_count}): {e}"
                 )
 
                 if attempt < self.retry_count - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))  # 지수 백오프
+                    delay = backoff_delay(
+                        attempt, self.retry_delay, settings.gemini_backoff_max
+                    )
                 else:
                     logger.error(f"API 호출 최종 실패: {e}")
                     return None
 
+            finally:
+                if self.concurrency_limiter is not None:
+                    # 성공한 호출만 한도를 늘리고, 429가 아닌 실패는 한도를 유지
+                    self.concurrency_limiter.release(throttled=throttled, success=succeeded)
+
+            # 대기하는 동안에는 동시 실행 슬롯을 점유하지 않음
+            if delay:
+                time.sleep(delay)
+
         return None
 
+    def limiter_stats(self) -> Dict:
+        """
+        현재 요청 한도와 대기열 상태를 반환합니다.
+
+        Returns:
+            rate_limiter, concurrency 통계를 포함한 딕셔너리 (비활성화된 항목은 None)
+        """
+        return {
+            'rate_limiter': self.rate_limiter.stats() if self.rate_limiter is not None else None,
+            'concurrency': (
+                self.concurrency_limiter.stats()
+                if self.concurrency_limiter is not None else None
+            ),
+        }
+
     def generate_summary(
         self,
         transcript: List[Dict],
         max_points: int = 5,
-        language: str = 'ko'
+        language: str = 'ko',
+        use_cache: bool = True
     ) -> Optional[str]:
         """
         자막을 요약합니다.
 
+        자막이 구간 토큰 예산(summary_chunk_tokens)보다 길면 내용을 잘라내지 않고
+        map-reduce 방식으로 요약합니다 (_map_reduce_summary 참고).
+
         Args:
             transcript: 자막 데이터 리스트
             max_points: 최대 요약 포인트 수
             language: 요약 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             요약 텍스트 또는 None (실패 시)
@@ -187,15 +401,32 @@ class GeminiClient:
                 logger.warning("결합된 텍스트가 비어있습니다.")
                 return None
 
-            # 텍스트 길이 제한
-            max_chars = 30000
-            if len(text) > max_chars:
-                logger.info(f"텍스트가 너무 깁니다. {max_chars}자로 제한합니다.")
-                text = text[:max_chars] + "..."
+            logger.info(f"요약 생성 중... (언어: {language}, 포인트: {max_points})")
+            if estimate_tokens(text) <= settings.summary_chunk_tokens:
+                result = self._make_api_call(
+                    self._build_summary_prompt(text, max_points, language),
+                    temperature=0.3,
+                    max_output_tokens=settings.summary_max_output_tokens,
+                    use_cache=use_cache
+                )
+            else:
+                result = self._map_reduce_summary(transcript, max_points, language, use_cache)
 
-            # 언어별 프롬프트 생성
-            if language == 'ko':
-                prompt = f"""다음 YouTube 비디오 스크립트를 {max_points}개의 핵심 포인트로 요약해주세요.
+            if result:
+                logger.info("요약 생성 성공")
+            else:
+                logger.error("요약 생성 실패")
+
+            return result
+
+        except Exception as e:
+            logger.error(f"요약 생성 오류: {e}")
+            return None
+
+    def _build_summary_prompt(self, text: str, max_points: int, language: str) -> str:
+        """전체 스크립트 요약 프롬프트를 생성합니다."""
+        if language == 'ko':
+            return f"""다음 YouTube 비디오 스크립트를 {max_points}개의 핵심 포인트로 요약해주세요.
 각 포인트는 간결하고 명확하게 작성하며, 번호를 붙여주세요.
 
 스크립트:
@@ -207,8 +438,7 @@ class GeminiClient:
 ...
 
 요약:"""
-            else:
-                prompt = f"""Please summarize the following YouTube video script into {max_points} key points.
+        return f"""Please summarize the following YouTube video script into {max_points} key points.
 Each point should be concise and clear, numbered.
 
 Script:
@@ -221,25 +451,197 @@ Summary format:
 
 Summary:"""
 
-            logger.info(f"요약 생성 중... (언어: {language}, 포인트: {max_points})")
-            result = self._make_api_call(prompt, temperature=0.3)
+    def _build_section_prompt(self, text: str, label: str, language: str) -> str:
+        """구간 요약(map 단계) 프롬프트를 생성합니다."""
+        points = settings.summary_chunk_points
+        if language == 'ko':
+            return f"""다음은 YouTube 비디오 스크립트의 일부 구간({label})입니다.
+이 구간의 핵심 내용을 최대 {points}개의 짧은 글머리표로 정리해주세요.
 
-            if result:
-                logger.info("요약 생성 성공")
-            else:
-                logger.error("요약 생성 실패")
+스크립트:
+{text}
 
-            return result
+핵심 내용:"""
+        return f"""The following is one section ({label}) of a YouTube video script.
+List the key content of this section in at most {points} short bullet points.
 
-        except Exception as e:
-            logger.error(f"요약 생성 오류: {e}")
+Script:
+{text}
+
+Key content:"""
+
+    def _build_reduce_prompt(self, sections_text: str, max_points: int, language: str) -> str:
+        """구간 요약 통합(reduce 단계) 프롬프트를 생성합니다."""
+        if language == 'ko':
+            return f"""다음은 YouTube 비디오를 시간 구간별로 요약한 내용입니다.
+비디오 전체를 {max_points}개의 핵심 포인트로 요약해주세요.
+각 포인트는 간결하고 명확하게 작성하며, 번호를 붙여주세요.
+
+구간별 요약:
+{sections_text}
+
+요약 형식:
+1. [첫 번째 핵심 포인트]
+2. [두 번째 핵심 포인트]
+...
+
+요약:"""
+        return f"""The following are section-by-section summaries of a YouTube video.
+Summarize the whole video into {max_points} key points.
+Each point should be concise and clear, numbered.
+
+Section summaries:
+{sections_text}
+
+Summary format:
+1. [First key point]
+2. [Second key point]
+...
+
+Summary:"""
+
+    @staticmethod
+    def _join_sections(sections: List[Tuple[float, float, str]]) -> str:
+        return "\n\n".join(
+            f"[{format_time_range(start, end)}]\n{summary}" for start, end, summary in sections
+        )
+
+    def _map_reduce_summary(
+        self,
+        transcript: List[Dict],
+        max_points: int,
+        language: str,
+        use_cache: bool = True
+    ) -> Optional[str]:
+        """
+        긴 자막을 map-reduce 방식으로 요약합니다.
+
+        1. 자막 항목 경계에 맞춰 토큰 예산 이하의 구간으로 나눕니다.
+        2. 각 구간을 병렬로 요약합니다 (같은 구간의 요약은 응답 캐시에서 재사용).
+        3. 구간 요약을 합친 내용이 예산을 넘으면 인접한 요약끼리 묶어 다시 요약합니다.
+        4. 최종적으로 max_points개의 포인트로 통합합니다.
+
+        모든 단계의 출력 길이가 제한되므로 입력 길이와 무관하게 결과 크기가 제한됩니다.
+
+        Args:
+            transcript: 자막 데이터 리스트
+            max_points: 최대 요약 포인트 수
+            language: 요약 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
+
+        Returns:
+            요약 텍스트 또는 None (모든 구간 요약 실패 시)
+        """
+        budget = settings.summary_chunk_tokens
+        chunks = chunk_transcript(transcript, budget)
+        logger.info(f"긴 자막을 {len(chunks)}개 구간으로 나누어 요약합니다.")
+
+        sections = self._summarize_sections(
+            [(chunk.start, chunk.end, chunk.text) for chunk in chunks],
+            language,
+            use_cache
+        )
+
+        # 구간 요약이 예산 안에 들어올 때까지 인접 요약을 묶어 다시 요약
+        while len(sections) > 1 and estimate_tokens(self._join_sections(sections)) > budget:
+            groups = []
+            current: List[Tuple[float, float, str]] = []
+            for section in sections:
+                candidate = current + [section]
+                if current and estimate_tokens(self._join_sections(candidate)) > budget:
+                    groups.append(current)
+                    current = [section]
+                else:
+                    current = candidate
+            groups.append(current)
+
+            if len(groups) >= len(sections):
+                # 더 이상 줄일 수 없으면 현재 요약으로 통합
+                break
+
+            logger.info(f"구간 요약 {len(sections)}개를 {len(groups)}개로 통합합니다.")
+            sections = self._summarize_sections(
+                [(group[0][0], group[-1][1], self._join_sections(group)) for group in groups],
+                language,
+                use_cache
+            )
+
+        if not sections:
             return None
 
+        return self._make_api_call(
+            self._build_reduce_prompt(self._join_sections(sections), max_points, language),
+            temperature=0.3,
+            max_output_tokens=settings.summary_max_output_tokens,
+            use_cache=use_cache
+        )
+
+    def _summarize_sections(
+        self,
+        sections: List[Tuple[float, float, str]],
+        language: str,
+        use_cache: bool = True
+    ) -> List[Tuple[float, float, str]]:
+        """
+        구간들을 병렬로 요약합니다.
+
+        Args:
+            sections: (시작 시간, 종료 시간, 텍스트) 리스트
+            language: 요약 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
+
+        Returns:
+            (시작 시간, 종료 시간, 요약) 리스트 (실패한 구간은 제외, 순서 유지)
+        """
+        workers = max(1, min(settings.summary_max_parallel_chunks, len(sections)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summary") as executor:
+            summaries = list(executor.map(
+                lambda section: self._summarize_section(
+                    section[2], format_time_range(section[0], section[1]), language, use_cache
+                ),
+                sections
+            ))
+
+        results = []
+        for (start, end, _), summary in zip(sections, summaries):
+            if summary:
+                results.append((start, end, summary))
+            else:
+                logger.warning(f"구간 요약 실패: {format_time_range(start, end)}")
+        return results
+
+    def _summarize_section(
+        self,
+        text: str,
+        label: str,
+        language: str,
+        use_cache: bool = True
+    ) -> Optional[str]:
+        """
+        한 구간을 요약합니다.
+
+        Args:
+            text: 구간 텍스트
+            label: 구간 시간 범위
+            language: 요약 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
+
+        Returns:
+            구간 요약 또는 None (실패 시)
+        """
+        return self._make_api_call(
+            self._build_section_prompt(text, label, language),
+            temperature=0.3,
+            max_output_tokens=settings.summary_section_max_output_tokens,
+            use_cache=use_cache
+        )
+
     def translate_text(
         self,
         text: str,
         target_language: str = 'en',
-        source_language: Optional[str] = None
+        source_language: Optional[str] = None,
+        use_cache: bool = True
     ) -> Optional[str]:
         """
         텍스트를 번역합니다.
@@ -248,6 +650,7 @@ Summary:"""
             text: 번역할 텍스트
             target_language: 대상 언어 코드
             source_language: 소스 언어 코드 (None일 경우 자동 감지)
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             번역된 텍스트 또는 None (실패 시)
@@ -284,7 +687,7 @@ Summary:"""
 번역:"""
 
             logger.info(f"텍스트 번역 중... (대상 언어: {target_language})")
-            result = self._make_api_call(prompt, temperature=0.3)
+            result = self._make_api_call(prompt, temperature=0.3, use_cache=use_cache)
 
             if result:
                 logger.info("번역 완료")
@@ -300,30 +703,166 @@ Summary:"""
     def translate_transcript(
         self,
         transcript: List[Dict],
-        target_language: str = 'en'
+        target_language: str = 'en',
+        source_language: Optional[str] = None,
+        use_cache: bool = True
     ) -> Optional[str]:
         """
         전체 자막을 번역합니다.
 
+        항목별 번역(translate_transcript_entries) 결과를 하나의 텍스트로 결합하므로
+        자막 길이와 무관하게 전체 내용이 번역됩니다.
+
         Args:
             transcript: 자막 데이터 리스트
             target_language: 대상 언어 코드
+            source_language: 소스 언어 코드 (None일 경우 자동 감지)
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             번역된 전체 텍스트 또는 None (실패 시)
         """
+        translated = self.translate_transcript_entries(
+            transcript,
+            target_language=target_language,
+            source_language=source_language,
+            use_cache=use_cache
+        )
+        if not translated:
+            return None
+        return self._combine_transcript_text(translated)
+
+    def translate_transcript_entries(
+        self,
+        transcript: List[Dict],
+        target_language: str = 'en',
+        source_language: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Optional[Transcript]:
+        """
+        자막을 항목별로 번역합니다 (타임스탬프 유지).
+
+        자막 항목에 고정 ID(원본 인덱스)를 부여하고 토큰 예산(translation_batch_tokens)
+        이하의 배치로 묶어 병렬로 번역합니다. 응답에서 누락된 항목은 한 번 더 요청하고,
+        그래도 번역되지 않은 항목은 원문을 유지합니다.
+
+        Args:
+            transcript: 자막 데이터 리스트
+            target_language: 대상 언어 코드
+            source_language: 소스 언어 코드 (None일 경우 자동 감지)
+            use_cache: False면 캐시된 응답을 사용하지 않음
+
+        Returns:
+            원본과 같은 길이와 순서의 Transcript (start, duration은 원본과 동일하고
+            text만 번역됨) 또는 None (모든 배치 번역 실패 시)
+        """
         if not transcript:
             logger.warning("자막이 비어있어 번역할 수 없습니다.")
             return None
 
-        text = self._combine_transcript_text(transcript)
-        return self.translate_text(text, target_language)
+        indexed = [{**entry, 'id': i} for i, entry in enumerate(transcript)]
+        pending = [entry for entry in indexed if (entry.get('text') or '').strip()]
+        translations: Dict[int, str] = {}
+
+        logger.info(f"자막 항목 {len(pending)}개 번역 중... (대상 언어: {target_language})")
+        # 첫 시도 후 누락된 항목만 한 번 더 요청
+        for attempt in range(2):
+            if not pending:
+                break
+            batches = chunk_transcript(pending, settings.translation_batch_tokens)
+            workers = max(1, min(settings.translation_max_parallel_batches, len(batches)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as executor:
+                for batch_result in executor.map(
+                    lambda batch: self._translate_batch(
+                        batch.entries, target_language, source_language, use_cache
+                    ),
+                    batches
+                ):
+                    translations.update(batch_result)
+
+            pending = [entry for entry in pending if entry['id'] not in translations]
+            if pending:
+                logger.warning(f"번역 응답에서 {len(pending)}개 항목이 누락되었습니다.")
+
+        if not translations:
+            logger.error("번역 실패")
+            return None
+
+        logger.info(f"번역 완료 ({len(translations)}/{len(transcript)}개 항목)")
+        if not isinstance(transcript, Transcript):
+            transcript = Transcript(transcript)
+        return Transcript.from_columns(
+            transcript.starts,
+            transcript.durations,
+            (translations.get(i, text) for i, text in enumerate(transcript.texts())),
+            language_code=target_language
+        )
+
+    def _translate_batch(
+        self,
+        entries: List[Dict],
+        target_language: str,
+        source_language: Optional[str] = None,
+        use_cache: bool = True
+    ) -> Dict[int, str]:
+        """
+        자막 항목 배치를 번역합니다.
+
+        Args:
+            entries: id와 text를 포함한 자막 항목 리스트
+            target_language: 대상 언어 코드
+            source_language: 소스 언어 코드
+            use_cache: False면 캐시된 응답을 사용하지 않음
+
+        Returns:
+            {항목 ID: 번역 텍스트} 딕셔너리 (응답에 없는 항목은 제외)
+        """
+        target_lang_name = self.LANGUAGE_NAMES.get(target_language, target_language)
+        if source_language:
+            source_lang_name = self.LANGUAGE_NAMES.get(source_language, source_language)
+            instruction = f"다음 {source_lang_name} 자막 항목들을 {target_lang_name}로 번역해주세요."
+        else:
+            instruction = f"다음 자막 항목들을 {target_lang_name}로 번역해주세요."
+
+        lines = "\n".join(
+            f"[{entry['id']}] {' '.join(entry['text'].split())}" for entry in entries
+        )
+        prompt = f"""{instruction}
+각 줄은 [번호] 원문 형식입니다. 줄을 합치거나 나누지 말고, 같은 번호를 유지하여
+한 줄에 하나씩 [번호] 번역 형식으로만 출력하세요. 다른 설명은 포함하지 마세요.
+
+원문:
+{lines}
+
+번역:"""
+
+        try:
+            result = self._make_api_call(prompt, temperature=0.3, use_cache=use_cache)
+        except Exception as e:
+            logger.error(f"번역 오류: {e}")
+            return {}
+        if not result:
+            return {}
+
+        ids = {entry['id'] for entry in entries}
+        translations = {}
+        for match in re.finditer(r'^\s*\[(\d+)\]\s*(.*?)\s*$', result, re.MULTILINE):
+            entry_id = int(match.group(1))
+            if entry_id in ids and match.group(2):
+                translations[entry_id] = match.group(2)
+
+        # 항목이 하나뿐이면 번호 없이 응답해도 번역으로 사용
+        if not translations and len(entries) == 1:
+            translations[entries[0]['id']] = result.strip()
+
+        return translations
 
     def extract_key_topics(
         self,
         transcript: List[Dict],
         num_topics: int = 5,
-        language: str = 'ko'
+        language: str = 'ko',
+        use_cache: bool = True
     ) -> Optional[List[str]]:
         """
         자막에서 핵심 주제를 추출합니다.
@@ -332,6 +871,7 @@ Summary:"""
             transcript: 자막 데이터 리스트
             num_topics: 추출할 주제 수
             language: 출력 언어
+            use_cache: False면 캐시된 응답을 사용하지 않음
 
         Returns:
             핵심 주제 리스트 또는 None (실패 시)
@@ -382,7 +922,7 @@ Output format (one topic per line, use bullet points):
 Topics:"""
 
             logger.info(f"주제 추출 중... (언어: {language}, 개수: {num_topics})")
-            topics_text = self._make_api_call(prompt, temperature=0.5)
+            topics_text = self._make_api_call(prompt, temperature=0.5, use_cache=use_cache)
 
             if not topics_text:
                 logger.error("주제 추출 실패")
@@ -399,7 +939,6 @@ Topics:"""
                         topics.append(topic)
                 elif line and not line.isspace():
                     # 숫자 제거 (1., 2. 등)
-                    import re
                     topic = re.sub(r'^\d+\.\s*', '', line).strip()
                     if topic:
                         topics.append(topic)
@@ -419,6 +958,39 @@ Topics:"""
             return None
 
 
+# 상태 코드가 없는 예외의 메시지에서 한도 초과를 찾는 패턴
+_RATE_LIMIT_MESSAGE = re.compile(r'\b429\b|RESOURCE_EXHAUSTED')
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    예외가 API 한도 초과(HTTP 429, RESOURCE_EXHAUSTED)인지 확인합니다.
+
+    예외의 상태 코드(code, status_code, response.status_code)나 상태(status)가 있으면
+    그것으로 판단하고, 없을 때만 메시지에서 독립된 '429' 또는 'RESOURCE_EXHAUSTED'를
+    찾습니다 (ID나 토큰 수에 포함된 429는 한도 초과로 보지 않음).
+
+    Args:
+        error: API 호출 중 발생한 예외
+
+    Returns:
+        한도 초과 오류이면 True
+    """
+    if getattr(error, 'status', None) == 'RESOURCE_EXHAUSTED':
+        return True
+
+    response = getattr(error, 'response', None)
+    for code in (
+        getattr(error, 'code', None),
+        getattr(error, 'status_code', None),
+        getattr(response, 'status_code', None),
+    ):
+        if isinstance(code, int) and not isinstance(code, bool):
+            return code == 429
+
+    return _RATE_LIMIT_MESSAGE.search(str(error)) is not None
+
+
 def is_gemini_available(api_key: Optional[str] = None) -> bool:
     """
     Gemini API가 사용 가능한지 확인합니다.
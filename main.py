@@ -8,12 +8,22 @@ Phase 2: 재생목록 지원, AI 요약, 다국어 지원
 
 import sys
 import re
+import io
+import hashlib
 import argparse
-from typing import Optional, List
-from youtube_api import extract_video_id, get_video_metadata, get_transcript_with_timestamps
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Tuple, TextIO, TYPE_CHECKING
+from youtube_api import extract_video_id
 from formatters import get_formatter, get_available_formatters
 from playlist_handler import process_playlist_or_video
-from gemini_api import GeminiClient, is_gemini_available
+from utils.run_manifest import RunManifest, default_manifest_path
+from utils.playlist_index import PlaylistIndex, PlaylistDiff, default_index_path
+
+if TYPE_CHECKING:
+    # 설정(pydantic-settings)과 HTTP 클라이언트를 불러오는 모듈은 실제로 필요할 때 import
+    # (--help 같은 호출의 시작 시간 단축, gemini_api는 AI 옵션을 사용할 때만)
+    from core.youtube_service import YouTubeService
+    from gemini_api import GeminiClient
 
 
 def display_banner():
@@ -53,6 +63,15 @@ def parse_arguments():
 
   # 모든 기능 사용
   python main.py VIDEO_URL --summary --translate en --topics 5 --format 2
+
+  # 재생목록을 4개의 워커로 동시 처리
+  python main.py PLAYLIST_URL --workers 4
+
+  # 중단된 재생목록 처리를 이어서 실행 (완료된 비디오는 건너뜀)
+  python main.py PLAYLIST_URL --resume
+
+  # 재생목록 동기화 (새로 추가되었거나 바뀐 비디오만 처리)
+  python main.py PLAYLIST_URL --sync
         """
     )
 
@@ -110,7 +129,43 @@ def parse_arguments():
         help='재생목록에서 처리할 최대 비디오 수 (기본값: 전체)'
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help='재생목록 비디오를 동시에 처리할 워커 수 (기본값: 1, 순차 처리)'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='실행 매니페스트를 읽어 완료된 비디오는 건너뛰고 실패하거나 남은 비디오만 처리'
+    )
+
+    parser.add_argument(
+        '--sync',
+        action='store_true',
+        help='재생목록 동기화 인덱스와 비교하여 새로 추가되었거나 바뀐 비디오만 처리하고 '
+             '추가/삭제/순서 변경된 비디오를 보고'
+    )
+
+    parser.add_argument(
+        '--manifest',
+        metavar='PATH',
+        default=None,
+        help='재생목록 실행 매니페스트(체크포인트) 또는 --sync 인덱스 파일 경로 '
+             '(기본값: .scraper_manifest_<재생목록 ID>.json, '
+             '--sync는 .scraper_index_<재생목록 ID>.json)'
+    )
+
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers는 1 이상이어야 합니다.')
+    if args.sync and args.resume:
+        parser.error('--sync와 --resume은 함께 사용할 수 없습니다. (--sync는 미완료 비디오도 다시 처리합니다)')
+
+    return args
 
 
 def get_youtube_url(args) -> str:
@@ -201,14 +256,91 @@ def generate_safe_filename(title: str, video_id: str, extension: str) -> str:
     return f"{safe_title[:50]}_{video_id}.{extension}"
 
 
+def create_run_manifest(args, youtube_url: str, playlist_info: Dict, format_choice: str) -> RunManifest:
+    """
+    재생목록 실행 매니페스트를 생성합니다.
+
+    --sync이면 재생목록 동기화 인덱스를, --resume이면 기존 매니페스트를 불러오고,
+    아니면 빈 매니페스트로 새로 시작합니다.
+    출력 형식, 언어, AI 옵션이 다르면 이전 출력을 재사용하지 않습니다.
+
+    Args:
+        args: 명령줄 인자
+        youtube_url: 재생목록 URL
+        playlist_info: 재생목록 정보
+        format_choice: 출력 형식 번호
+
+    Returns:
+        RunManifest 인스턴스 (--sync이면 PlaylistIndex)
+    """
+    playlist_id = playlist_info.get('playlist_id')
+    if not playlist_id or playlist_id == 'Unknown':
+        playlist_id = hashlib.sha256(youtube_url.encode('utf-8')).hexdigest()[:16]
+    default_path = default_index_path if args.sync else default_manifest_path
+    path = args.manifest or default_path(playlist_id)
+
+    options = {
+        'format': format_choice,
+        'lang': args.lang,
+        'summary': bool(args.summary),
+        'translate': args.translate,
+        'topics': args.topics,
+    }
+    if args.sync:
+        return PlaylistIndex.load(path, options, source=youtube_url)
+    if args.resume:
+        return RunManifest.load(path, options, source=youtube_url)
+    return RunManifest(path, options, source=youtube_url)
+
+
+# 동기화 보고에서 항목별로 나열할 최대 비디오 수
+SYNC_REPORT_LIMIT = 20
+
+
+def print_sync_report(sync_diff: PlaylistDiff, index_path: str) -> None:
+    """
+    재생목록 동기화 결과(추가/삭제/순서 변경/내용 변경)를 출력합니다.
+
+    Args:
+        sync_diff: 재생목록 목록과 인덱스의 차이
+        index_path: 동기화 인덱스 파일 경로
+    """
+    counts = sync_diff.counts()
+    print(f"🔄 동기화 인덱스와 비교했습니다. (인덱스: {index_path})")
+    print(
+        f"   추가: {counts['added']}, 삭제: {counts['removed']}, "
+        f"순서 변경: {counts['reordered']}, 내용 변경: {counts['changed']}, "
+        f"미완료: {counts['stale']}"
+    )
+
+    sections = [
+        ('+', [(video['position'], video['title'], video['id']) for video in sync_diff.added]),
+        ('-', [(entry['position'], entry['title'], entry['video_id']) for entry in sync_diff.removed]),
+        ('↕', [
+            (f"{previous}→{video['position']}", video['title'], video['id'])
+            for video, previous in sync_diff.reordered
+        ]),
+        ('~', [(video['position'], video['title'], video['id']) for video in sync_diff.changed]),
+    ]
+    for marker, lines in sections:
+        for position, title, video_id in lines[:SYNC_REPORT_LIMIT]:
+            print(f"   {marker} [{position}] {title} ({video_id})")
+        if len(lines) > SYNC_REPORT_LIMIT:
+            print(f"   {marker} ... 외 {len(lines) - SYNC_REPORT_LIMIT}개")
+    print()
+
+
 def process_single_video(
     video_url: str,
     video_id: str,
     formatter,
     args,
-    gemini_client: Optional[GeminiClient] = None,
+    gemini_client: Optional['GeminiClient'] = None,
     video_index: Optional[int] = None,
-    total_videos: Optional[int] = None
+    total_videos: Optional[int] = None,
+    youtube_service: Optional['YouTubeService'] = None,
+    manifest: Optional[RunManifest] = None,
+    output: Optional[TextIO] = None
 ) -> bool:
     """
     단일 비디오를 처리합니다.
@@ -221,79 +353,89 @@ def process_single_video(
         gemini_client: Gemini API 클라이언트 (선택사항)
         video_index: 재생목록 내 비디오 인덱스 (선택사항)
         total_videos: 전체 비디오 수 (선택사항)
+        youtube_service: 캐시를 공유할 YouTube 서비스 (선택사항)
+        manifest: 처리 결과를 기록할 실행 매니페스트 (선택사항)
+        output: 진행 상황을 출력할 스트림 (None이면 sys.stdout)
 
     Returns:
         성공 여부
     """
+    out = output if output is not None else sys.stdout
+
+    if youtube_service is None:
+        from core.youtube_service import YouTubeService
+        youtube_service = YouTubeService()
+
     try:
         # 진행 상황 표시 (재생목록인 경우)
         if video_index is not None and total_videos is not None:
-            print(f"\n{'='*80}")
-            print(f"비디오 {video_index}/{total_videos} 처리 중...")
-            print(f"{'='*80}")
+            print(f"\n{'='*80}", file=out)
+            print(f"비디오 {video_index}/{total_videos} 처리 중...", file=out)
+            print(f"{'='*80}", file=out)
 
         # 메타데이터 가져오기
-        print(f"📥 비디오 정보를 가져오는 중... (ID: {video_id})")
-        metadata = get_video_metadata(video_url)
-        print(f"✓ 제목: {metadata['title']}")
-        print()
+        print(f"📥 비디오 정보를 가져오는 중... (ID: {video_id})", file=out)
+        metadata = youtube_service.get_video_metadata(video_id)
+        print(f"✓ 제목: {metadata['title']}", file=out)
+        print(file=out)
 
         # 자막 가져오기
-        print("📥 자막을 가져오는 중...")
-        transcript = get_transcript_with_timestamps(video_id, languages=args.lang)
+        print("📥 자막을 가져오는 중...", file=out)
+        transcript = youtube_service.get_transcript(video_id, languages=args.lang)
 
         if transcript:
-            print(f"✓ {len(transcript)}개의 자막 항목을 찾았습니다.")
+            print(f"✓ {len(transcript)}개의 자막 항목을 찾았습니다.", file=out)
         else:
-            print("⚠️  자막을 찾을 수 없습니다. 메타데이터만 저장됩니다.")
-        print()
+            print("⚠️  자막을 찾을 수 없습니다. 메타데이터만 저장됩니다.", file=out)
+        print(file=out)
 
         # AI 기능 처리
         summary = None
         translation = None
+        translated_transcript = None
         key_topics = None
 
         if gemini_client and transcript:
             # 요약 생성
             if args.summary:
-                print("🤖 AI 요약을 생성하는 중...")
+                print("🤖 AI 요약을 생성하는 중...", file=out)
                 summary = gemini_client.generate_summary(
                     transcript,
                     max_points=5,
                     language=args.lang[0] if args.lang else 'ko'
                 )
                 if summary:
-                    print("✓ 요약이 생성되었습니다.")
+                    print("✓ 요약이 생성되었습니다.", file=out)
                 else:
-                    print("⚠️  요약 생성에 실패했습니다.")
-                print()
+                    print("⚠️  요약 생성에 실패했습니다.", file=out)
+                print(file=out)
 
             # 번역
             if args.translate:
-                print(f"🌐 {args.translate}로 번역하는 중...")
-                translation = gemini_client.translate_transcript(
+                print(f"🌐 {args.translate}로 번역하는 중...", file=out)
+                translated_transcript = gemini_client.translate_transcript_entries(
                     transcript,
                     target_language=args.translate
                 )
-                if translation:
-                    print("✓ 번역이 완료되었습니다.")
+                if translated_transcript:
+                    print("✓ 번역이 완료되었습니다.", file=out)
                 else:
-                    print("⚠️  번역에 실패했습니다.")
-                print()
+                    print("⚠️  번역에 실패했습니다.", file=out)
+                print(file=out)
 
             # 핵심 주제 추출
             if args.topics:
-                print(f"🔑 핵심 주제 {args.topics}개를 추출하는 중...")
+                print(f"🔑 핵심 주제 {args.topics}개를 추출하는 중...", file=out)
                 key_topics = gemini_client.extract_key_topics(
                     transcript,
                     num_topics=args.topics,
                     language=args.lang[0] if args.lang else 'ko'
                 )
                 if key_topics:
-                    print(f"✓ {len(key_topics)}개의 주제가 추출되었습니다.")
+                    print(f"✓ {len(key_topics)}개의 주제가 추출되었습니다.", file=out)
                 else:
-                    print("⚠️  주제 추출에 실패했습니다.")
-                print()
+                    print("⚠️  주제 추출에 실패했습니다.", file=out)
+                print(file=out)
 
         # 출력 파일명 생성
         output_file = generate_safe_filename(
@@ -303,23 +445,109 @@ def process_single_video(
         )
 
         # 파일 생성
-        print(f"💾 {formatter.get_name()} 파일을 생성하는 중...")
+        print(f"💾 {formatter.get_name()} 파일을 생성하는 중...", file=out)
         formatter.save(
             metadata,
             transcript,
             output_file,
             summary=summary,
             translation=translation,
-            key_topics=key_topics
+            key_topics=key_topics,
+            translated_transcript=translated_transcript
         )
 
+        if manifest is not None:
+            manifest.mark_done(video_id, output_file)
         return True
 
     except Exception as e:
-        print(f"\n❌ 비디오 처리 오류 (ID: {video_id}): {e}")
+        print(f"\n❌ 비디오 처리 오류 (ID: {video_id}): {e}", file=out)
+        if manifest is not None:
+            manifest.mark_failed(video_id, str(e))
         return False
 
 
+def process_videos_concurrently(
+    videos: List[Dict],
+    formatter,
+    args,
+    gemini_client: Optional['GeminiClient'] = None,
+    workers: int = 1,
+    youtube_service: Optional['YouTubeService'] = None,
+    manifest: Optional[RunManifest] = None,
+    output: Optional[TextIO] = None
+) -> int:
+    """
+    재생목록 비디오들을 워커 풀에서 동시에 처리합니다.
+
+    각 워커는 메타데이터 조회, 자막 조회, AI 처리, 파일 저장을 수행하며,
+    서로 다른 비디오의 단계들이 겹쳐서 실행됩니다.
+    각 워커의 진행 상황은 비디오별 버퍼에 기록되고, 끝난 비디오의 출력은 재생목록
+    순서대로 한 덩어리씩 출력되므로 서로 다른 비디오의 출력이 섞이지 않고 로그 순서가
+    실행마다 같습니다. 앞 비디오가 끝나지 않으면 뒤에 끝난 비디오의 출력은 그때까지 보류됩니다.
+
+    Args:
+        videos: 비디오 정보 리스트 ('id', 'url' 포함)
+        formatter: 포맷터 객체
+        args: 명령줄 인자
+        gemini_client: Gemini API 클라이언트 (선택사항)
+        workers: 동시 처리 워커 수
+        youtube_service: 워커 간에 공유할 YouTube 서비스 (선택사항)
+        manifest: 처리 결과를 기록할 실행 매니페스트 (선택사항)
+        output: 진행 상황을 출력할 스트림 (None이면 sys.stdout)
+
+    Returns:
+        성공한 비디오 수
+    """
+    out = output if output is not None else sys.stdout
+    total_videos = len(videos)
+
+    def run(index: int, video: Dict) -> Tuple[bool, str]:
+        buffer = io.StringIO()
+        success = process_single_video(
+            video['url'],
+            video['id'],
+            formatter,
+            args,
+            gemini_client,
+            video_index=index,
+            total_videos=total_videos,
+            youtube_service=youtube_service,
+            manifest=manifest,
+            output=buffer
+        )
+        return success, buffer.getvalue()
+
+    success_count = 0
+    finished: Dict[int, str] = {}  # 출력 순서를 기다리는 끝난 비디오의 출력
+    next_index = 1
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='video-worker')
+    try:
+        futures = {
+            executor.submit(run, index, video): index
+            for index, video in enumerate(videos, 1)
+        }
+        # 끝나는 대로 결과를 모으고 (예외는 바로 전파), 출력은 재생목록 순서대로
+        for future in as_completed(futures):
+            success, captured = future.result()
+            finished[futures[future]] = captured
+            if success:
+                success_count += 1
+
+            while next_index in finished:
+                out.write(finished.pop(next_index))
+                print(f"⏱  진행: {next_index}/{total_videos} 완료", file=out)
+                next_index += 1
+            out.flush()
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown(wait=True)
+
+    return success_count
+
+
 def main():
     """메인 함수 - 전체 워크플로우를 오케스트레이션합니다."""
 
@@ -342,6 +570,8 @@ def main():
         # 5. Gemini API 클라이언트 초기화 (필요한 경우)
         gemini_client = None
         if args.summary or args.translate or args.topics:
+            from gemini_api import GeminiClient, is_gemini_available
+
             if is_gemini_available():
                 try:
                     gemini_client = GeminiClient()
@@ -356,7 +586,11 @@ def main():
                 print("   AI 기능을 사용하려면 API 키를 설정하세요.")
                 print()
 
-        # 6. 재생목록 또는 단일 비디오 확인
+        # 6. YouTube 서비스 초기화 (메타데이터/자막 캐시를 모든 비디오가 공유)
+        from core.youtube_service import YouTubeService
+        youtube_service = YouTubeService()
+
+        # 7. 재생목록 또는 단일 비디오 확인
         print("🔍 URL 분석 중...")
         result = process_playlist_or_video(youtube_url)
 
@@ -371,31 +605,78 @@ def main():
             print(f"   비디오 수: {playlist_info['video_count']}")
             print()
 
+            # 실행 매니페스트 (비디오마다 처리 결과를 기록하는 체크포인트)
+            manifest = create_run_manifest(args, youtube_url, playlist_info, format_choice)
+
+            if args.sync:
+                # 전체 목록을 인덱스와 비교한 뒤 새로 추가되었거나 바뀐 비디오만 처리
+                sync_diff = manifest.diff(videos)
+                print_sync_report(sync_diff, manifest.path)
+                manifest.apply_listing(videos)
+                videos = sync_diff.to_fetch()
+                if not videos:
+                    print("✓ 새로 추가되었거나 바뀐 비디오가 없습니다.")
+                    print()
+
             # 최대 비디오 수 제한
             if args.max_videos and args.max_videos < len(videos):
                 videos = videos[:args.max_videos]
                 print(f"⚠️  처리할 비디오를 {args.max_videos}개로 제한합니다.")
                 print()
 
+            total_count = len(videos)
+            if args.resume:
+                skipped = [video for video in videos if manifest.is_complete(video['id'])]
+                if skipped:
+                    skipped_ids = {video['id'] for video in skipped}
+                    videos = [video for video in videos if video['id'] not in skipped_ids]
+                    print(f"⏩ 이미 완료된 비디오 {len(skipped)}개를 건너뜁니다. (매니페스트: {manifest.path})")
+                    print()
+            elif not args.sync:
+                manifest.save()
+            skipped_count = total_count - len(videos)
+
             # 각 비디오 처리
             success_count = 0
-            for i, video in enumerate(videos, 1):
-                success = process_single_video(
-                    video['url'],
-                    video['id'],
+            if args.workers > 1 and len(videos) > 1:
+                print(f"⚡ {args.workers}개의 워커로 동시 처리합니다.")
+                print()
+                success_count = process_videos_concurrently(
+                    videos,
                     formatter,
                     args,
                     gemini_client,
-                    video_index=i,
-                    total_videos=len(videos)
+                    workers=args.workers,
+                    youtube_service=youtube_service,
+                    manifest=manifest
                 )
-                if success:
-                    success_count += 1
+            else:
+                for i, video in enumerate(videos, 1):
+                    success = process_single_video(
+                        video['url'],
+                        video['id'],
+                        formatter,
+                        args,
+                        gemini_client,
+                        video_index=i,
+                        total_videos=len(videos),
+                        youtube_service=youtube_service,
+                        manifest=manifest
+                    )
+                    if success:
+                        success_count += 1
 
             # 재생목록 처리 결과
             print("\n" + "=" * 80)
             print("✅ 재생목록 처리 완료!")
-            print(f"   성공: {success_count}/{len(videos)}")
+            result_line = f"   성공: {success_count + skipped_count}/{total_count}"
+            if skipped_count:
+                result_line += f" (건너뜀: {skipped_count})"
+            print(result_line)
+            failed_count = len(videos) - success_count
+            if failed_count:
+                retry_hint = '--sync로' if args.sync else '--resume으로'
+                print(f"   실패한 {failed_count}개는 {retry_hint} 다시 시도할 수 있습니다.")
             print("=" * 80)
 
         elif result['type'] == 'video':
@@ -410,7 +691,8 @@ def main():
                 video['id'],
                 formatter,
                 args,
-                gemini_client
+                gemini_client,
+                youtube_service=youtube_service
             )
 
             if success:
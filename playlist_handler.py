@@ -3,9 +3,25 @@
 YouTube 재생목록 감지 및 처리 기능을 제공합니다.
 """
 
+import logging
 import re
-from typing import Optional, List, Dict
-import yt_dlp
+from itertools import islice
+from typing import Optional, List, Dict, Iterable, Iterator
+
+from utils.lazy_import import lazy_module
+
+# yt-dlp는 첫 추출 시 로드 (시작 시간 단축)
+yt_dlp = lazy_module('yt_dlp')
+
+logger = logging.getLogger(__name__)
+
+
+# 재생목록 추출용 YoutubeDL 옵션
+PLAYLIST_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': True,  # 메타데이터만 추출 (비디오 다운로드 X)
+}
 
 
 class PlaylistHandler:
@@ -50,58 +66,187 @@ class PlaylistHandler:
         return None
 
     @staticmethod
-    def get_playlist_info(url: str) -> Optional[Dict]:
+    def get_playlist_info(url: str, ydl=None) -> Optional[Dict]:
         """
         재생목록의 정보를 가져옵니다.
 
         Args:
             url: YouTube 재생목록 URL
+            ydl: 재사용할 YoutubeDL 인스턴스 (None이면 호출마다 새로 생성)
 
         Returns:
             재생목록 정보 딕셔너리 (PlaylistInfo 스키마와 일치)
         """
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,  # 메타데이터만 추출 (비디오 다운로드 X)
-        }
-
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            if ydl is None:
+                with yt_dlp.YoutubeDL(PLAYLIST_YDL_OPTS) as ydl:
+                    info = ydl.extract_info(url, download=False)
+            else:
                 info = ydl.extract_info(url, download=False)
 
-                if info.get('_type') != 'playlist':
-                    return None
-
-                # entries 안전 처리
-                entries = info.get('entries', [])
-                if entries is None:
-                    entries = []
-                elif not isinstance(entries, list):
-                    # entries가 리스트가 아닌 경우 (드물지만 가능)
-                    print(f"Unexpected entries type: {type(entries)}")
-                    entries = []
-                
-                # video_count 계산 개선
-                video_count = info.get('playlist_count')
-                if video_count is None:
-                    # entries에서 유효한 항목 수 계산
-                    valid_entries = [e for e in entries if e is not None]
-                    video_count = len(valid_entries)
-                
-                return {
-                    'playlist_id': info.get('id', 'Unknown'),  # 필드명 변경
-                    'title': info.get('title', 'Unknown Playlist'),
-                    'uploader': info.get('uploader', 'Unknown Channel'),
-                    'video_count': video_count,  # 개선된 계산
-                    'description': info.get('description'),  # description 추가
-                    'entries': entries  # 내부 사용용 (필요시)
-                }
+            if info.get('_type') != 'playlist':
+                return None
+
+            # entries 안전 처리
+            entries = info.get('entries', [])
+            if entries is None:
+                entries = []
+            elif not isinstance(entries, list):
+                # entries가 리스트가 아닌 경우 (드물지만 가능)
+                print(f"Unexpected entries type: {type(entries)}")
+                entries = []
+            
+            # video_count 계산 개선
+            video_count = info.get('playlist_count')
+            if video_count is None:
+                # entries에서 유효한 항목 수 계산
+                valid_entries = [e for e in entries if e is not None]
+                video_count = len(valid_entries)
+            
+            return {
+                'playlist_id': info.get('id', 'Unknown'),  # 필드명 변경
+                'title': info.get('title', 'Unknown Playlist'),
+                'uploader': info.get('uploader', 'Unknown Channel'),
+                'video_count': video_count,  # 개선된 계산
+                'description': info.get('description'),  # description 추가
+                'entries': entries  # 내부 사용용 (필요시)
+            }
 
         except Exception as e:
             print(f"⚠️  재생목록 정보 추출 오류: {e}")
             return None
 
+    @staticmethod
+    def _video_from_entry(entry, position: int) -> Optional[Dict[str, str]]:
+        """
+        재생목록 항목 하나를 비디오 정보 딕셔너리로 변환합니다.
+
+        Args:
+            entry: yt-dlp 재생목록 항목 (딕셔너리, URL/비디오 ID 문자열 또는 None)
+            position: 재생목록 내 위치 (0-based)
+
+        Returns:
+            비디오 정보 딕셔너리 또는 None (변환할 수 없는 항목)
+        """
+        if not entry:  # None 체크
+            return None
+
+        video_id = None
+        video_title = 'Unknown Title'
+        video_url = None
+
+        # entry 타입에 따라 처리
+        if isinstance(entry, dict):
+            # 딕셔너리인 경우 (일반적인 경우)
+            video_id = entry.get('id')
+            video_title = entry.get('title', 'Unknown Title')
+            # URL이 있으면 사용, 없으면 생성
+            video_url = entry.get('url') or (
+                f"https://www.youtube.com/watch?v={video_id}" if video_id else None
+            )
+        elif isinstance(entry, str):
+            # 문자열인 경우 (URL 또는 video_id)
+            # URL에서 video_id 추출 시도
+            from youtube_api import extract_video_id
+            video_id = extract_video_id(entry) or entry
+            video_url = entry if entry.startswith('http') else f"https://www.youtube.com/watch?v={entry}"
+            video_title = 'Unknown Title'  # URL만 있으면 제목을 알 수 없음
+        else:
+            # 예상치 못한 타입
+            print(f"Unexpected entry type: {type(entry)}, value: {entry}")
+            return None
+
+        if not video_id:
+            return None
+
+        return {
+            'id': video_id,
+            'url': video_url or f"https://www.youtube.com/watch?v={video_id}",
+            'title': video_title,
+            'position': position  # 0-based position 추가 (API 문서와 일치)
+        }
+
+    @staticmethod
+    def iter_entry_videos(
+        entries: Iterable,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        재생목록 항목을 순서대로 읽으며 비디오 정보를 하나씩 반환합니다.
+
+        entries가 제너레이터이면 필요한 만큼만 소비하므로, offset + limit개의
+        비디오를 반환한 뒤에는 남은 항목(다음 페이지)을 읽지 않습니다.
+
+        Args:
+            entries: 재생목록 항목 iterable (리스트 또는 yt-dlp의 지연 entries)
+            offset: 건너뛸 비디오 수 (유효한 비디오 기준)
+            limit: 반환할 최대 비디오 수 (None이면 끝까지)
+
+        Yields:
+            비디오 정보 딕셔너리 ('id', 'url', 'title', 'position')
+        """
+        videos = (
+            video for video in (
+                PlaylistHandler._video_from_entry(entry, position)
+                for position, entry in enumerate(entries)
+            )
+            if video is not None
+        )
+        stop = None if limit is None else offset + limit
+        return islice(videos, offset, stop)
+
+    @staticmethod
+    def iter_playlist_videos(
+        url: str,
+        ydl=None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        재생목록의 비디오를 페이지 단위로 지연 조회하며 하나씩 반환합니다.
+
+        yt-dlp의 처리 단계를 거치지 않고(process=False) 추출기의 지연 entries를 직접
+        순회하므로, 필요한 비디오 수에 도달하면 다음 페이지를 요청하지 않습니다.
+        수천 개의 업로드가 있는 채널에서 앞의 몇 개만 필요할 때 사용합니다.
+
+        Args:
+            url: YouTube 재생목록 URL
+            ydl: 재사용할 YoutubeDL 인스턴스 (None이면 새로 생성)
+            offset: 건너뛸 비디오 수
+            limit: 반환할 최대 비디오 수 (None이면 끝까지)
+
+        Yields:
+            비디오 정보 딕셔너리 ('id', 'url', 'title', 'position')
+
+        Raises:
+            Exception: 재생목록 추출 또는 항목 조회 실패 시 (이미 반환한 비디오 이후에 발생하며,
+                잘린 목록이 전체 목록처럼 보이지 않도록 그대로 전파)
+        """
+        if ydl is None:
+            with yt_dlp.YoutubeDL(PLAYLIST_YDL_OPTS) as ydl:
+                yield from PlaylistHandler.iter_playlist_videos(url, ydl, offset, limit)
+            return
+
+        if limit is not None and limit <= 0:
+            return
+
+        try:
+            info = ydl.extract_info(url, download=False, process=False)
+            # watch?v=...&list=... 처럼 재생목록 URL로 위임된 결과는 한 번 더 해석
+            if info and info.get('_type') in ('url', 'url_transparent') and info.get('url'):
+                info = ydl.extract_info(info['url'], download=False, process=False)
+
+            if not info or info.get('_type') != 'playlist':
+                return
+
+            yield from PlaylistHandler.iter_entry_videos(
+                info.get('entries') or [], offset=offset, limit=limit
+            )
+        except Exception as e:
+            logger.error(f"Failed to iterate playlist entries for {url}: {e}")
+            raise
+
     @staticmethod
     def get_video_urls_from_playlist(url: str, playlist_info: Optional[Dict] = None) -> List[Dict[str, str]]:
         """
@@ -113,47 +258,8 @@ class PlaylistHandler:
         if not playlist_info:
             return []
 
-        videos = []
         entries = playlist_info.get('entries', []) or []
-        
-        for position, entry in enumerate(entries):
-            if not entry:  # None 체크
-                continue
-            
-            video_id = None
-            video_title = 'Unknown Title'
-            video_url = None
-            
-            # entry 타입에 따라 처리
-            if isinstance(entry, dict):
-                # 딕셔너리인 경우 (일반적인 경우)
-                video_id = entry.get('id')
-                video_title = entry.get('title', 'Unknown Title')
-                # URL이 있으면 사용, 없으면 생성
-                video_url = entry.get('url') or (
-                    f"https://www.youtube.com/watch?v={video_id}" if video_id else None
-                )
-            elif isinstance(entry, str):
-                # 문자열인 경우 (URL 또는 video_id)
-                # URL에서 video_id 추출 시도
-                from youtube_api import extract_video_id
-                video_id = extract_video_id(entry) or entry
-                video_url = entry if entry.startswith('http') else f"https://www.youtube.com/watch?v={entry}"
-                video_title = 'Unknown Title'  # URL만 있으면 제목을 알 수 없음
-            else:
-                # 예상치 못한 타입
-                print(f"Unexpected entry type: {type(entry)}, value: {entry}")
-                continue
-
-            if video_id:
-                videos.append({
-                    'id': video_id,
-                    'url': video_url or f"https://www.youtube.com/watch?v={video_id}",
-                    'title': video_title,
-                    'position': position  # 0-based position 추가 (API 문서와 일치)
-                })
-
-        return videos
+        return list(PlaylistHandler.iter_entry_videos(entries))
 
     @staticmethod
     def get_playlist_metadata(url: str) -> Dict:
@@ -186,12 +292,13 @@ class PlaylistHandler:
         }
 
 
-def process_playlist_or_video(url: str) -> Dict:
+def process_playlist_or_video(url: str, playlist_info: Optional[Dict] = None) -> Dict:
     """
     URL이 재생목록인지 단일 비디오인지 확인하고 처리합니다.
 
     Args:
         url: YouTube URL
+        playlist_info: 이미 추출한 재생목록 정보 (None이면 새로 추출)
 
     Returns:
         처리 결과 딕셔너리 {
@@ -204,7 +311,8 @@ def process_playlist_or_video(url: str) -> Dict:
 
     if handler.is_playlist_url(url):
         # 한 번만 호출하여 재사용
-        playlist_info = handler.get_playlist_info(url)
+        if playlist_info is None:
+            playlist_info = handler.get_playlist_info(url)
         
         if not playlist_info:
             return {
@@ -2,11 +2,14 @@
 AI 라우터 테스트
 """
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock
 
 from api_main import app
+from core.ai_service import AIService
 from utils.dependencies import get_ai_service, get_settings
 
 client = TestClient(app)
@@ -23,6 +26,29 @@ class TestAIRouter:
         data = response.json()
         assert "available" in data
         assert "model" in data
+        assert "response_cache" in data
+
+    def test_ai_health_reports_cache_and_limit_stats(self):
+        """헬스 체크가 응답 캐시, 호출 제한기, 요청 병합 통계를 포함하는지 테스트"""
+        mock_service = Mock(spec=AIService)
+        mock_service.is_available.return_value = True
+        mock_service.get_cache_stats.return_value = {'hits': 3, 'misses': 1, 'hit_rate': 0.75}
+        mock_service.get_rate_limit_stats.return_value = {
+            'rate_limiter': {'requests_per_minute': 60.0, 'waiting': 2},
+            'concurrency': {'limit': 4, 'in_flight': 4, 'waiting': 1}
+        }
+        mock_service.get_coalescing_stats.return_value = {'executions': 2, 'coalesced': 5, 'max_waiters': 3}
+
+        app.dependency_overrides[get_ai_service] = lambda: mock_service
+        response = client.get("/ai/health")
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["response_cache"]["hit_rate"] == 0.75
+        assert data["rate_limits"]["rate_limiter"]["waiting"] == 2
+        assert data["rate_limits"]["concurrency"]["limit"] == 4
+        assert data["coalescing"]["coalesced"] == 5
 
     def test_generate_summary_success(self):
         """요약 생성 성공 테스트"""
@@ -48,6 +74,22 @@ class TestAIRouter:
         assert "summary" in data
         assert data["summary"] == "This is a summary."
 
+    def test_summary_bypass_cache(self):
+        """bypass_cache 플래그가 서비스에 전달되는지 테스트"""
+        mock_service = Mock(spec=AIService)
+        mock_service.is_available.return_value = True
+        mock_service.generate_summary_from_text.return_value = "Fresh summary"
+
+        app.dependency_overrides[get_ai_service] = lambda: mock_service
+        response = client.post(
+            "/ai/summary",
+            json={"text": "Long text", "bypass_cache": True}
+        )
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        assert mock_service.generate_summary_from_text.call_args.kwargs['use_cache'] is False
+
     def test_translate_text_success(self):
         """번역 성공 테스트"""
         mock_service = Mock()
@@ -95,6 +137,34 @@ class TestAIRouter:
         assert "topics" in data
         assert len(data["topics"]) == 2
 
+    @pytest.mark.parametrize("path, method, payload, result", [
+        ("/ai/summary", "generate_summary_from_text", {"text": "text"}, "summary"),
+        ("/ai/translate", "translate_text", {"text": "text", "target_language": "ko"}, "번역"),
+        ("/ai/topics", "extract_topics_from_text", {"text": "text"}, ["topic"]),
+    ])
+    def test_blocking_calls_run_off_event_loop(self, path, method, payload, result):
+        """요약, 번역, 주제 추출의 블로킹 호출이 이벤트 루프 밖(실행기)에서 실행되는지 테스트"""
+        on_event_loop = []
+
+        def blocking_call(**kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(True)
+            except RuntimeError:
+                on_event_loop.append(False)
+            return result
+
+        mock_service = Mock(spec=AIService)
+        mock_service.is_available.return_value = True
+        getattr(mock_service, method).side_effect = blocking_call
+
+        app.dependency_overrides[get_ai_service] = lambda: mock_service
+        response = client.post(path, json=payload)
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        assert on_event_loop == [False]
+
     def test_generate_summary_service_unavailable(self):
         """AI 서비스 사용 불가능 시 요약 실패 테스트"""
         mock_service = Mock()
@@ -154,11 +224,11 @@ class TestAIRouter:
 
     def test_enhance_text_all_features(self):
         """모든 AI 기능 적용 테스트"""
-        mock_service = Mock()
+        mock_service = Mock(spec=AIService)
         mock_service.is_available.return_value = True
 
-        # enhance_transcript 메서드의 반환값 설정
-        mock_service.enhance_transcript.return_value = {
+        # enhance_transcript_async 메서드의 반환값 설정
+        mock_service.enhance_transcript_async.return_value = {
             'summary': "Test summary",
             'translation': "Translated text",
             'topics': ["Topic 1", "Topic 2"],
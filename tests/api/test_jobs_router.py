@@ -0,0 +1,132 @@
+"""
+작업 큐 라우터 테스트
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import Mock
+
+from api_main import app
+from core.job_queue import JobQueue, JobNotFoundError
+from core.youtube_service import YouTubeService
+from utils.dependencies import get_job_queue, get_youtube_service
+
+client = TestClient(app)
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLtest"
+
+
+@pytest.fixture
+def job_queue():
+    """작업 큐와 YouTube 서비스 mock"""
+    mock_jobs = Mock(spec=JobQueue)
+    mock_yt = Mock(spec=YouTubeService)
+    mock_yt.is_playlist_url.side_effect = lambda url: 'list=' in url
+
+    app.dependency_overrides[get_job_queue] = lambda: mock_jobs
+    app.dependency_overrides[get_youtube_service] = lambda: mock_yt
+    yield mock_jobs
+    app.dependency_overrides = {}
+
+
+class TestJobsRouter:
+    """작업 큐 라우터 테스트"""
+
+    def test_submit_playlist_job(self, job_queue):
+        """작업 제출 시 202와 작업 ID를 반환하는지 테스트"""
+        job_queue.submit.return_value = "job123"
+
+        response = client.post(
+            "/jobs/playlist",
+            json={"playlist_url": PLAYLIST_URL, "max_videos": 10, "enable_summary": True}
+        )
+
+        assert response.status_code == 202
+        assert response.json() == {"job_id": "job123", "status": "queued"}
+        params = job_queue.submit.call_args.args[0]
+        assert params['playlist_url'] == PLAYLIST_URL
+        assert params['max_videos'] == 10
+        assert params['enable_summary'] is True
+        assert params['output_format'] is None
+
+    def test_submit_rejects_non_playlist(self, job_queue):
+        """플레이리스트가 아닌 URL은 400을 반환하는지 테스트"""
+        response = client.post(
+            "/jobs/playlist",
+            json={"playlist_url": "https://www.youtube.com/watch?v=test123"}
+        )
+
+        assert response.status_code == 400
+        job_queue.submit.assert_not_called()
+
+    def test_get_job_status(self, job_queue):
+        """작업 상태와 비디오별 진행 상황 조회 테스트"""
+        job_queue.status.return_value = {
+            'job_id': 'job123',
+            'params': {'playlist_url': PLAYLIST_URL},
+            'status': 'running',
+            'error': None,
+            'videos_listed': True,
+            'created_at': 1.0,
+            'updated_at': 2.0,
+            'progress': {'total': 2, 'pending': 1, 'running': 0, 'done': 1, 'failed': 0},
+            'videos': [
+                {'position': 0, 'video_id': 'a', 'url': 'url-a', 'title': 'A',
+                 'status': 'done', 'error': None},
+                {'position': 1, 'video_id': 'b', 'url': 'url-b', 'title': 'B',
+                 'status': 'pending', 'error': None},
+            ]
+        }
+
+        response = client.get("/jobs/job123")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['status'] == 'running'
+        assert data['progress']['done'] == 1
+        assert [video['status'] for video in data['videos']] == ['done', 'pending']
+
+    def test_get_job_result(self, job_queue):
+        """완료된 비디오의 결과 조회 테스트"""
+        job_queue.results.return_value = {
+            'job_id': 'job123',
+            'params': {'playlist_url': PLAYLIST_URL},
+            'status': 'completed',
+            'videos': [
+                {'position': 0, 'video_id': 'a', 'url': 'url-a', 'title': 'A',
+                 'status': 'done', 'error': None,
+                 'result': {
+                     'video_id': 'a',
+                     'metadata': {'video_id': 'a', 'title': 'A'},
+                     'transcript': [{'start': 0, 'duration': 1, 'text': 'Hello'}],
+                     'summary': 'Summary',
+                     'errors': {'metadata': 'Timed out after 30s'}
+                 }},
+                {'position': 1, 'video_id': 'b', 'url': 'url-b', 'title': 'B',
+                 'status': 'failed', 'error': 'boom', 'result': None},
+            ]
+        }
+
+        response = client.get("/jobs/job123/result")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['finished'] is True
+        assert data['videos'][0]['result']['summary'] == 'Summary'
+        assert data['videos'][0]['result']['partial'] is True
+        assert data['videos'][0]['result']['errors'] == {'metadata': 'Timed out after 30s'}
+        assert data['videos'][1]['result'] is None
+
+    def test_cancel_job(self, job_queue):
+        """작업 취소 테스트"""
+        job_queue.cancel.return_value = True
+        assert client.post("/jobs/job123/cancel").status_code == 200
+
+        job_queue.cancel.return_value = False
+        assert client.post("/jobs/job123/cancel").status_code == 409
+
+    def test_unknown_job(self, job_queue):
+        """존재하지 않는 작업은 404를 반환하는지 테스트"""
+        job_queue.status.side_effect = JobNotFoundError("missing")
+
+        assert client.get("/jobs/missing").status_code == 404
@@ -4,6 +4,7 @@ FastAPI 메인 애플리케이션 테스트
 
 import pytest
 from fastapi.testclient import TestClient
+from unittest.mock import patch
 
 from api_main import app
 
@@ -57,3 +58,16 @@ class TestMainAPI:
         """API 문서 엔드포인트 테스트"""
         response = client.get("/docs")
         assert response.status_code == 200
+
+    def test_lifespan_manages_shared_services(self):
+        """시작 시 공유 서비스를 준비하고 종료 시 정리하는지 테스트"""
+        with patch('api_main.init_services') as mock_init, \
+             patch('api_main.close_services') as mock_close, \
+             patch('api_main.shutdown_extractor_pool') as mock_pool_shutdown:
+            with TestClient(app) as lifespan_client:
+                assert lifespan_client.get("/health").status_code == 200
+                mock_init.assert_called_once()
+                mock_close.assert_not_called()
+
+        mock_close.assert_called_once()
+        mock_pool_shutdown.assert_called_once()
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from unittest.mock import Mock
 
 from api_main import app
+from core.youtube_service import YouTubeService
 from utils.dependencies import get_youtube_service
 
 client = TestClient(app)
@@ -17,7 +18,7 @@ class TestPlaylistRouter:
 
     def test_check_playlist_url_is_playlist(self):
         """플레이리스트 URL 확인 테스트 - 플레이리스트인 경우"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.is_playlist_url.return_value = True
 
         app.dependency_overrides[get_youtube_service] = lambda: mock_service
@@ -36,7 +37,7 @@ class TestPlaylistRouter:
 
     def test_check_playlist_url_is_video(self):
         """플레이리스트 URL 확인 테스트 - 비디오인 경우"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.is_playlist_url.return_value = False
         mock_service.extract_video_id.return_value = "test123"
 
@@ -56,9 +57,9 @@ class TestPlaylistRouter:
 
     def test_get_playlist_videos_success(self):
         """플레이리스트 비디오 목록 가져오기 성공 테스트"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.is_playlist_url.return_value = True
-        mock_service.get_playlist_videos.return_value = [
+        mock_service.get_playlist_videos_async.return_value = [
             {'id': 'video1', 'url': 'url1', 'title': 'Video 1'},
             {'id': 'video2', 'url': 'url2', 'title': 'Video 2'}
         ]
@@ -80,7 +81,7 @@ class TestPlaylistRouter:
 
     def test_get_playlist_videos_not_playlist(self):
         """플레이리스트가 아닌 URL로 비디오 목록 가져오기 실패 테스트"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.is_playlist_url.return_value = False
 
         app.dependency_overrides[get_youtube_service] = lambda: mock_service
@@ -96,9 +97,9 @@ class TestPlaylistRouter:
 
     def test_get_playlist_videos_with_limit(self):
         """최대 비디오 수 제한하여 가져오기 테스트"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.is_playlist_url.return_value = True
-        mock_service.get_playlist_videos.return_value = [
+        mock_service.get_playlist_videos_async.return_value = [
             {'id': f'video{i}', 'url': f'url{i}', 'title': f'Video {i}'}
             for i in range(5)
         ]
@@ -118,3 +119,117 @@ class TestPlaylistRouter:
         assert response.status_code == 200
         data = response.json()
         assert len(data['videos']) == 5
+
+    def test_get_playlist_videos_pagination(self):
+        """offset과 next_offset으로 페이지를 나누어 가져오는지 테스트"""
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.is_playlist_url.return_value = True
+        # 다음 페이지 확인을 위해 max_videos + 1개를 요청
+        mock_service.get_playlist_videos_async.return_value = [
+            {'id': f'video{i}', 'url': f'url{i}', 'title': f'Video {i}', 'position': i}
+            for i in range(10, 13)
+        ]
+
+        app.dependency_overrides[get_youtube_service] = lambda: mock_service
+
+        response = client.get(
+            "/playlist/videos",
+            params={
+                "playlist_url": "https://www.youtube.com/playlist?list=PLtest",
+                "max_videos": 2,
+                "offset": 10
+            }
+        )
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [v['id'] for v in data['videos']] == ['video10', 'video11']
+        assert data['count'] == 2
+        assert data['offset'] == 10
+        assert data['next_offset'] == 12
+        mock_service.get_playlist_videos_async.assert_called_once_with(
+            playlist_url="https://www.youtube.com/playlist?list=PLtest",
+            max_videos=3,
+            offset=10
+        )
+
+    def test_get_playlist_videos_last_page(self):
+        """마지막 페이지에서는 next_offset이 None인지 테스트"""
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.is_playlist_url.return_value = True
+        mock_service.get_playlist_videos_async.return_value = [
+            {'id': 'video20', 'url': 'url20', 'title': 'Video 20', 'position': 20}
+        ]
+
+        app.dependency_overrides[get_youtube_service] = lambda: mock_service
+
+        response = client.get(
+            "/playlist/videos",
+            params={
+                "playlist_url": "https://www.youtube.com/playlist?list=PLtest",
+                "max_videos": 2,
+                "offset": 20
+            }
+        )
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['count'] == 1
+        assert data['next_offset'] is None
+
+    def test_get_playlist_videos_listing_error(self):
+        """목록 조회가 중간에 실패하면 잘린 목록 대신 500을 반환하는지 테스트"""
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.is_playlist_url.return_value = True
+        mock_service.get_playlist_videos_async.side_effect = RuntimeError("page 2 request failed")
+
+        app.dependency_overrides[get_youtube_service] = lambda: mock_service
+
+        response = client.get(
+            "/playlist/videos",
+            params={"playlist_url": "https://www.youtube.com/playlist?list=PLtest"}
+        )
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 500
+        assert "page 2 request failed" in response.json()['detail']
+
+    def test_get_playlist_info_single_extraction(self):
+        """플레이리스트 정보 요청이 한 번의 추출 결과로 비디오 목록을 만드는지 테스트"""
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.is_playlist_url.return_value = True
+        playlist = {
+            'playlist_id': 'PLtest',
+            'title': 'Test Playlist',
+            'uploader': 'Test Channel',
+            'video_count': 3,
+            'entries': [{'id': f'video{i}'} for i in range(3)]
+        }
+        mock_service.get_playlist_info_async.return_value = playlist
+        mock_service.playlist_videos.return_value = [
+            {'id': 'video0', 'url': 'url0', 'title': 'Video 0', 'position': 0},
+            {'id': 'video1', 'url': 'url1', 'title': 'Video 1', 'position': 1}
+        ]
+
+        app.dependency_overrides[get_youtube_service] = lambda: mock_service
+
+        response = client.post(
+            "/playlist/info",
+            json={"playlist_url": "https://www.youtube.com/playlist?list=PLtest", "max_videos": 2}
+        )
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['playlist_info']['title'] == 'Test Playlist'
+        assert data['total_videos'] == 3
+        assert data['returned_videos'] == 2
+        mock_service.get_playlist_info_async.assert_called_once()
+        mock_service.playlist_videos.assert_called_once_with(playlist, max_videos=2)
+        mock_service.get_playlist_videos_async.assert_not_called()
@@ -0,0 +1,77 @@
+"""
+빠른 JSON 응답 테스트
+"""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from api.responses import FastJSONResponse, json_dumps, transcript_entries
+from utils.transcript import Transcript
+
+
+class TestJsonDumps:
+    """json_dumps 함수 테스트"""
+
+    CONTENT = {'text': '안녕 "세상"', 'values': [1, 2.5, None, True]}
+
+    def test_round_trip(self):
+        """UTF-8 JSON 바이트로 직렬화하는지 테스트"""
+        encoded = json_dumps(self.CONTENT)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == self.CONTENT
+        assert '안녕'.encode('utf-8') in encoded
+
+    def test_fallback_without_orjson(self):
+        """orjson이 없으면 표준 json 모듈로 같은 결과를 만드는지 테스트"""
+        with patch('api.responses.orjson', None):
+            encoded = json_dumps(self.CONTENT)
+
+        assert json.loads(encoded) == self.CONTENT
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_finite_floats_become_null(self, use_orjson):
+        """NaN과 무한대가 orjson 설치 여부와 관계없이 null로 직렬화되는지 테스트"""
+        content = {
+            'duration': float('nan'),
+            'entries': [{'start': float('inf'), 'text': 'Hello'}, (1.5, float('-inf'))],
+        }
+        expected = {'duration': None, 'entries': [{'start': None, 'text': 'Hello'}, [1.5, None]]}
+
+        if use_orjson:
+            pytest.importorskip('orjson')
+            encoded = json_dumps(content)
+        else:
+            with patch('api.responses.orjson', None):
+                encoded = json_dumps(content)
+
+        assert json.loads(encoded) == expected
+        assert content['duration'] != content['duration']  # 원본 값은 바꾸지 않음
+
+    def test_response_body(self):
+        """FastJSONResponse가 json_dumps 결과를 본문으로 사용하는지 테스트"""
+        response = FastJSONResponse(content=self.CONTENT)
+
+        assert response.body == json_dumps(self.CONTENT)
+        assert response.media_type == 'application/json'
+
+
+class TestTranscriptEntries:
+    """transcript_entries 함수 테스트"""
+
+    def test_plain_list_is_normalized(self):
+        """숫자를 float로 바꾸고 스키마에 없는 키를 제외하는지 테스트"""
+        entries = transcript_entries([{'start': 1, 'duration': 2, 'text': 'a', 'id': 7}])
+
+        assert entries == [{'start': 1.0, 'duration': 2.0, 'text': 'a', 'timestamp': None}]
+        assert isinstance(entries[0]['start'], float)
+
+    def test_transcript_uses_columns(self):
+        """Transcript는 열 데이터에서 바로 변환하는지 테스트"""
+        transcript = Transcript([{'start': 5.0, 'duration': 1.0, 'text': 'b'}])
+
+        assert transcript_entries(transcript) == [
+            {'start': 5.0, 'duration': 1.0, 'text': 'b', 'timestamp': '00:05'}
+        ]
@@ -2,12 +2,22 @@
 비디오 라우터 테스트
 """
 
+import asyncio
+import json
+import threading
+
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from api_main import app
+from core.youtube_service import YouTubeService
+from core.ai_service import AIService
+from core.formatter_service import FormatterService
+from api.schemas.video import VideoResponse, TranscriptEntry
 from utils.dependencies import get_youtube_service, get_ai_service, get_formatter_service
+from utils.metadata import normalize_metadata, validate_metadata
+from utils.transcript import Transcript
 
 client = TestClient(app)
 
@@ -17,9 +27,9 @@ class TestVideoRouter:
 
     def test_get_video_metadata_success(self):
         """비디오 메타데이터 가져오기 성공 테스트"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.extract_video_id.return_value = "test123"
-        mock_service.get_video_metadata.return_value = {
+        mock_service.get_video_metadata_async.return_value = {
             'video_id': 'test123',
             'title': 'Test Video',
             'channel': 'Test Channel'
@@ -41,7 +51,7 @@ class TestVideoRouter:
 
     def test_get_video_metadata_invalid_url(self):
         """유효하지 않은 URL로 메타데이터 가져오기 실패 테스트"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.extract_video_id.return_value = None
 
         app.dependency_overrides[get_youtube_service] = lambda: mock_service
@@ -57,9 +67,9 @@ class TestVideoRouter:
 
     def test_get_video_transcript_success(self):
         """비디오 자막 가져오기 성공 테스트"""
-        mock_service = Mock()
+        mock_service = Mock(spec=YouTubeService)
         mock_service.extract_video_id.return_value = "test123"
-        mock_service.get_transcript.return_value = [
+        mock_service.get_transcript_async.return_value = [
             {'start': 0.0, 'duration': 3.0, 'text': 'Hello', 'timestamp': '00:00:00'}
         ]
 
@@ -82,8 +92,8 @@ class TestVideoRouter:
 
     def test_post_video_info_success(self):
         """비디오 정보 POST 엔드포인트 성공 테스트"""
-        mock_service = Mock()
-        mock_service.get_video_info.return_value = {
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.get_video_info_async.return_value = {
             'metadata': {
                 'video_id': 'test123',
                 'title': 'Test Video',
@@ -118,8 +128,8 @@ class TestVideoRouter:
 
     def test_post_video_info_invalid_url(self):
         """유효하지 않은 URL로 비디오 정보 POST 실패 테스트"""
-        mock_service = Mock()
-        mock_service.get_video_info.side_effect = ValueError("Invalid YouTube URL")
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.get_video_info_async.side_effect = ValueError("Invalid YouTube URL")
 
         app.dependency_overrides[get_youtube_service] = lambda: mock_service
 
@@ -137,8 +147,8 @@ class TestVideoRouter:
 
     def test_scrape_video_with_summary(self):
         """요약 포함 비디오 스크래핑 테스트"""
-        mock_yt = Mock()
-        mock_yt.get_video_info.return_value = {
+        mock_yt = Mock(spec=YouTubeService)
+        mock_yt.get_video_info_async.return_value = {
             'metadata': {
                 'video_id': 'test123',
                 'title': 'Test',
@@ -150,8 +160,13 @@ class TestVideoRouter:
             'video_id': 'test123'
         }
 
-        mock_ai = Mock()
-        mock_ai.generate_summary.return_value = "Test summary"
+        mock_ai = Mock(spec=AIService)
+        mock_ai.enhance_transcript_async.return_value = {
+            'summary': "Test summary",
+            'translation': None,
+            'topics': None,
+            'processing_time': 0.1
+        }
 
         mock_formatter = Mock()
 
@@ -178,8 +193,8 @@ class TestVideoRouter:
 
     def test_scrape_video_with_translation(self):
         """번역 포함 비디오 스크래핑 테스트"""
-        mock_yt = Mock()
-        mock_yt.get_video_info.return_value = {
+        mock_yt = Mock(spec=YouTubeService)
+        mock_yt.get_video_info_async.return_value = {
             'metadata': {
                 'video_id': 'test123',
                 'title': 'Test',
@@ -191,8 +206,13 @@ class TestVideoRouter:
             'video_id': 'test123'
         }
 
-        mock_ai = Mock()
-        mock_ai.translate_transcript.return_value = "Translated text"
+        mock_ai = Mock(spec=AIService)
+        mock_ai.enhance_transcript_async.return_value = {
+            'summary': None,
+            'translation': "Translated text",
+            'topics': None,
+            'processing_time': 0.1
+        }
 
         mock_formatter = Mock()
 
@@ -219,8 +239,8 @@ class TestVideoRouter:
 
     def test_scrape_video_with_topics(self):
         """주제 추출 포함 비디오 스크래핑 테스트"""
-        mock_yt = Mock()
-        mock_yt.get_video_info.return_value = {
+        mock_yt = Mock(spec=YouTubeService)
+        mock_yt.get_video_info_async.return_value = {
             'metadata': {
                 'video_id': 'test123',
                 'title': 'Test',
@@ -232,8 +252,13 @@ class TestVideoRouter:
             'video_id': 'test123'
         }
 
-        mock_ai = Mock()
-        mock_ai.extract_topics.return_value = ["Topic 1", "Topic 2"]
+        mock_ai = Mock(spec=AIService)
+        mock_ai.enhance_transcript_async.return_value = {
+            'summary': None,
+            'translation': None,
+            'topics': ["Topic 1", "Topic 2"],
+            'processing_time': 0.1
+        }
 
         mock_formatter = Mock()
 
@@ -257,3 +282,414 @@ class TestVideoRouter:
         data = response.json()
         assert 'key_topics' in data
         assert len(data['key_topics']) == 2
+
+
+def make_video_info(video_id):
+    """테스트용 비디오 정보"""
+    return {
+        'metadata': {'video_id': video_id, 'title': f'Video {video_id}', 'channel': 'Test Channel'},
+        'transcript': [{'start': 0, 'duration': 1, 'text': 'Hello'}],
+        'video_id': video_id
+    }
+
+
+class TestVideoBatch:
+    """비디오 일괄 스크래핑 테스트"""
+
+    @pytest.fixture
+    def services(self):
+        """YouTube/AI/Formatter 서비스 mock"""
+        mock_yt = Mock(spec=YouTubeService)
+        mock_ai = Mock(spec=AIService)
+        mock_ai.is_available.return_value = False
+
+        app.dependency_overrides[get_youtube_service] = lambda: mock_yt
+        app.dependency_overrides[get_ai_service] = lambda: mock_ai
+        app.dependency_overrides[get_formatter_service] = lambda: Mock()
+        yield mock_yt, mock_ai
+        app.dependency_overrides = {}
+
+    def test_batch_streams_results_as_they_finish(self, services):
+        """먼저 끝난 비디오의 결과가 먼저 전송되고 실패가 격리되는지 테스트"""
+        mock_yt, _ = services
+        delays = {'slow': 0.2, 'fast': 0.0}
+
+        async def get_video_info(video_url, languages, prefer_manual):
+            if video_url == 'bad':
+                raise ValueError("Invalid YouTube URL: bad")
+            await asyncio.sleep(delays[video_url])
+            return make_video_info(video_url)
+
+        mock_yt.get_video_info_async.side_effect = get_video_info
+
+        response = client.post(
+            "/video/batch",
+            json={"video_urls": ["slow", "bad", "fast"]}
+        )
+
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        events = [json.loads(line) for line in response.text.splitlines()]
+        results = [event for event in events if event['event'] == 'result']
+
+        assert [item['index'] for item in results] == [1, 2, 0]
+        assert results[0]['status'] == 'error'
+        assert results[0]['status_code'] == 400
+        assert results[1]['result']['metadata']['video_id'] == 'fast'
+        assert events[-1] == {'event': 'done', 'total': 3, 'succeeded': 2, 'failed': 1}
+
+    def test_batch_sse_format(self, services):
+        """SSE 형식으로 이벤트를 전송하는지 테스트"""
+        mock_yt, _ = services
+        mock_yt.get_video_info_async.return_value = make_video_info('test123')
+
+        response = client.post(
+            "/video/batch",
+            json={"video_urls": ["test123"], "stream_format": "sse"}
+        )
+
+        assert response.headers['content-type'].startswith('text/event-stream')
+        messages = response.text.strip().split("\n\n")
+        assert messages[0].startswith("event: result\ndata: ")
+        assert json.loads(messages[0].split("data: ", 1)[1])['status'] == 'ok'
+        assert messages[-1].startswith("event: done\n")
+
+    def test_batch_respects_concurrency_cap(self, services):
+        """서버 상한을 넘는 동시 처리를 하지 않는지 테스트"""
+        mock_yt, _ = services
+        running = 0
+        peak = 0
+
+        async def get_video_info(video_url, languages, prefer_manual):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return make_video_info(video_url)
+
+        mock_yt.get_video_info_async.side_effect = get_video_info
+
+        with patch('api.routers.video.settings.batch_max_concurrency', 2):
+            response = client.post(
+                "/video/batch",
+                json={"video_urls": [f"video{i}" for i in range(6)], "max_concurrency": 10}
+            )
+
+        assert response.status_code == 200
+        assert peak == 2
+
+    def test_batch_too_many_videos(self, services):
+        """비디오 수가 상한을 넘으면 400을 반환하는지 테스트"""
+        with patch('api.routers.video.settings.batch_max_videos', 2):
+            response = client.post(
+                "/video/batch",
+                json={"video_urls": ["a", "b", "c"]}
+            )
+
+        assert response.status_code == 400
+
+
+class TestVideoExport:
+    """자막 파일 스트리밍 다운로드 테스트"""
+
+    @pytest.fixture
+    def mock_yt(self):
+        """YouTube 서비스 mock (실제 Formatter 서비스 사용)"""
+        mock_yt = Mock(spec=YouTubeService)
+        mock_yt.get_video_info_async.return_value = {
+            'video_id': 'test123',
+            'metadata': {
+                'video_id': 'test123',
+                'title': 'Test Video',
+                'channel': 'Test Channel',
+                'upload_date': '20240101',
+                'duration': 120,
+                'view_count': 10,
+                'description': 'Description'
+            },
+            'transcript': [
+                {'start': 0.0, 'duration': 1.0, 'text': 'Hello'},
+                {'start': 1.0, 'duration': 1.0, 'text': 'World'}
+            ]
+        }
+
+        app.dependency_overrides[get_youtube_service] = lambda: mock_yt
+        app.dependency_overrides[get_formatter_service] = FormatterService
+        yield mock_yt
+        app.dependency_overrides = {}
+
+    def test_export_json(self, mock_yt):
+        """JSON 문서를 첨부 파일로 스트리밍하는지 테스트"""
+        response = client.get(
+            "/video/export",
+            params={"video_url": "https://www.youtube.com/watch?v=test123", "output_format": "json"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/json')
+        assert "Test%20Video_test123.json" in response.headers['content-disposition']
+        data = response.json()
+        assert [entry['text'] for entry in data['transcript']] == ['Hello', 'World']
+        assert data['metadata']['total_entries'] == 2
+
+    def test_export_invalid_format(self, mock_yt):
+        """지원하지 않는 형식이면 400을 반환하는지 테스트"""
+        response = client.get(
+            "/video/export",
+            params={"video_url": "https://www.youtube.com/watch?v=test123", "output_format": "pdf"}
+        )
+
+        assert response.status_code == 400
+        mock_yt.get_video_info_async.assert_not_called()
+
+    def test_export_incomplete_metadata(self, mock_yt):
+        """헤더를 만들 수 없으면 스트리밍 전에 500을 반환하는지 테스트"""
+        del mock_yt.get_video_info_async.return_value['metadata']['view_count']
+
+        response = client.get(
+            "/video/export",
+            params={"video_url": "https://www.youtube.com/watch?v=test123"}
+        )
+
+        assert response.status_code == 500
+
+
+class TestFastSerialization:
+    """/video/info, /video/transcript 빠른 직렬화 경로 테스트"""
+
+    METADATA = {
+        'video_id': 'test123',
+        'title': '테스트 비디오',
+        'channel': 'Test Channel',
+        'upload_date': '20240101',
+        'duration': 120,
+        'view_count': 10
+    }
+
+    def schema_response(self, transcript):
+        """기존 방식(항목별 TranscriptEntry 모델)으로 만든 응답"""
+        return VideoResponse(
+            metadata=validate_metadata(normalize_metadata(dict(self.METADATA), video_id='test123')),
+            transcript=[TranscriptEntry(**entry) for entry in transcript],
+            transcript_language='ko'
+        ).model_dump(mode='json')
+
+    @pytest.mark.parametrize('transcript', [
+        Transcript([
+            {'start': 0.0, 'duration': 1.5, 'text': '안녕 "세상"'},
+            {'start': 3725.25, 'duration': 2.0, 'text': 'line\nbreak'},
+        ]),
+        [
+            {'start': 0, 'duration': 1, 'text': 'int times', 'extra': 'ignored'},
+            {'start': 1.5, 'duration': 2.0, 'text': 'no timestamp'},
+        ],
+    ])
+    def test_video_info_matches_schema(self, transcript):
+        """빠른 경로 응답이 VideoResponse 스키마 직렬화 결과와 같은지 테스트"""
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.get_video_info_async.return_value = {
+            'metadata': dict(self.METADATA),
+            'transcript': transcript,
+            'video_id': 'test123'
+        }
+        app.dependency_overrides[get_youtube_service] = lambda: mock_service
+
+        response = client.post(
+            "/video/info",
+            json={"video_url": "https://www.youtube.com/watch?v=test123", "languages": ["ko"]}
+        )
+
+        app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        assert response.headers['content-type'] == 'application/json'
+        assert response.json() == self.schema_response(transcript)
+
+    def test_video_transcript_serializes_transcript(self):
+        """Transcript를 타임스탬프가 포함된 JSON 배열로 반환하는지 테스트"""
+        mock_service = Mock(spec=YouTubeService)
+        mock_service.extract_video_id.return_value = "test123"
+        mock_service.get_transcript_async.return_value = Transcript([
+            {'start': 61.0, 'duration': 2.0, 'text': 'Hello'}
+        ])
+        app.dependency_overrides[get_youtube_service] = lambda: mock_service
+
+        response = client.get("/video/transcript", params={"video_url": "test123"})
+
+        app.dependency_overrides = {}
+
+        assert response.json() == [
+            {'start': 61.0, 'duration': 2.0, 'text': 'Hello', 'timestamp': '01:01'}
+        ]
+
+
+class TestPartialVideoInfo:
+    """메타데이터나 자막 중 하나만 가져온 부분 결과 응답 테스트"""
+
+    VIDEO_URL = "https://www.youtube.com/watch?v=test123"
+    METADATA = {'video_id': 'test123', 'title': 'Test Video', 'channel': 'Test Channel'}
+    TRANSCRIPT = [{'start': 0.0, 'duration': 1.0, 'text': 'Hello'}]
+
+    @pytest.fixture
+    def youtube_service(self, tmp_path, monkeypatch):
+        """
+        캐시 없이 실제 get_video_info 흐름을 사용하는 YouTube 서비스
+
+        실제 FormatterService가 저장하는 출력 파일(output/)은 임시 디렉토리에 만듭니다.
+        """
+        monkeypatch.chdir(tmp_path)
+        from core.extractor_pool import ExtractorPool
+        from core.metadata_cache import MetadataCache
+        from core.transcript_cache import TranscriptCache
+        from utils.cache import MemoryCache, TieredCache
+
+        service = YouTubeService(
+            transcript_cache=TranscriptCache(MemoryCache()),
+            metadata_cache=MetadataCache(TieredCache(MemoryCache()), static_ttl=100, volatile_ttl=10),
+            extractor_pool=ExtractorPool(size=2, factory=lambda options: Mock())
+        )
+        mock_ai = Mock(spec=AIService)
+        mock_ai.is_available.return_value = False
+
+        app.dependency_overrides[get_youtube_service] = lambda: service
+        app.dependency_overrides[get_ai_service] = lambda: mock_ai
+        app.dependency_overrides[get_formatter_service] = FormatterService
+        yield service
+        app.dependency_overrides = {}
+
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_info_complete_result(self, mock_transcript, mock_metadata, youtube_service):
+        """두 조회가 모두 성공하면 partial이 False인지 테스트"""
+        mock_metadata.return_value = dict(self.METADATA)
+        mock_transcript.return_value = self.TRANSCRIPT
+
+        response = client.post("/video/info", json={"video_url": self.VIDEO_URL})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['partial'] is False
+        assert data['errors'] == {}
+
+    @patch('core.youtube_service.settings.video_info_timeout', 0.2)
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_info_metadata_timeout(self, mock_transcript, mock_metadata, youtube_service):
+        """메타데이터 조회가 제한 시간을 넘기면 기본값과 함께 partial/errors로 알리는지 테스트"""
+        release = threading.Event()
+
+        def slow_metadata(*args, **kwargs):
+            release.wait(5)
+            return dict(self.METADATA)
+
+        mock_metadata.side_effect = slow_metadata
+        mock_transcript.return_value = self.TRANSCRIPT
+
+        try:
+            response = client.post("/video/info", json={"video_url": self.VIDEO_URL})
+        finally:
+            release.set()
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['partial'] is True
+        assert 'Timed out' in data['errors']['metadata']
+        assert data['metadata']['title'] == 'Unknown Title'
+        assert data['transcript'][0]['text'] == 'Hello'
+
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_scrape_transcript_failure(self, mock_transcript, mock_metadata, youtube_service):
+        """자막 조회 실패가 /video/scrape 응답의 errors에 포함되는지 테스트"""
+        mock_metadata.return_value = dict(self.METADATA)
+        mock_transcript.side_effect = Exception("Transcript service unavailable")
+
+        response = client.post("/video/scrape", json={"video_url": self.VIDEO_URL})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['partial'] is True
+        assert 'Transcript service unavailable' in data['errors']['transcript']
+        assert data['metadata']['title'] == 'Test Video'
+        assert data['transcript'] == []
+
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_batch_item_reports_partial(self, mock_transcript, mock_metadata, youtube_service):
+        """일괄 스크래핑 결과 항목에 부분 결과 여부가 포함되는지 테스트"""
+        mock_metadata.return_value = dict(self.METADATA)
+        mock_transcript.side_effect = Exception("Transcript service unavailable")
+
+        response = client.post("/video/batch", json={"video_urls": [self.VIDEO_URL]})
+
+        events = [json.loads(line) for line in response.text.splitlines()]
+        result = events[0]['result']
+        assert events[0]['status'] == 'ok'
+        assert result['partial'] is True
+        assert 'transcript' in result['errors']
+
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_export_partial_header(self, mock_transcript, mock_metadata, youtube_service):
+        """내보내기 응답이 부분 결과를 X-Partial-Errors 헤더로 알리는지 테스트"""
+        mock_metadata.side_effect = Exception("Metadata service unavailable")
+        mock_transcript.return_value = self.TRANSCRIPT
+
+        response = client.get(
+            "/video/export",
+            params={"video_url": self.VIDEO_URL, "output_format": "json"}
+        )
+
+        assert response.status_code == 200
+        errors = json.loads(response.headers['x-partial-errors'])
+        assert 'Metadata service unavailable' in errors['metadata']
+
+
+class TestVideoHealth:
+    """YouTube 서비스 캐시와 요청 병합 통계 테스트"""
+
+    @patch('core.youtube_service.get_video_metadata')
+    def test_reports_coalescing_and_cache_stats(self, mock_metadata):
+        """동시 요청 병합 카운터와 캐시 통계를 반환하는지 테스트"""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from core.extractor_pool import ExtractorPool
+        from core.metadata_cache import MetadataCache
+        from core.transcript_cache import TranscriptCache
+        from utils.cache import MemoryCache, TieredCache
+
+        release = threading.Event()
+
+        def slow_extract(url, ydl=None):
+            release.wait(timeout=5)
+            return {'video_id': 'test123', 'title': 'Test Video', 'channel': 'Test Channel'}
+
+        mock_metadata.side_effect = slow_extract
+        service = YouTubeService(
+            transcript_cache=TranscriptCache(MemoryCache()),
+            metadata_cache=MetadataCache(TieredCache(MemoryCache()), static_ttl=100, volatile_ttl=10),
+            extractor_pool=ExtractorPool(size=2, factory=lambda options: Mock())
+        )
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(service.get_video_metadata, 'test123') for _ in range(3)]
+            while service.coalescing_stats()['metadata']['in_flight'] == 0:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+            [future.result(timeout=5) for future in futures]
+
+        app.dependency_overrides[get_youtube_service] = lambda: service
+        try:
+            response = client.get("/video/health")
+        finally:
+            app.dependency_overrides = {}
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data['coalescing']['metadata']['executions'] == 1
+        assert data['coalescing']['metadata']['coalesced'] == 2
+        assert data['coalescing']['metadata']['max_waiters'] == 2
+        assert set(data['coalescing']) == {'metadata', 'transcript', 'playlist'}
+        assert set(data['cache']) == {'transcript', 'metadata', 'playlist', 'extractor_pool'}
+        assert data['cache']['metadata'] is not None
@@ -0,0 +1,9 @@
+"""
+pytest 공통 설정
+"""
+
+import os
+
+# 테스트 간에 캐시된 결과가 공유되지 않도록 디스크 캐시를 비활성화합니다.
+# (utils.config.settings가 생성되기 전에 설정되어야 합니다)
+os.environ.setdefault("CACHE_ENABLED", "false")
@@ -2,6 +2,8 @@
 AI 서비스 테스트
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -173,7 +175,9 @@ class TestAIService:
         mock_available.return_value = True
         mock_client = Mock()
         mock_client.generate_summary.return_value = "Summary"
-        mock_client.translate_transcript.return_value = "Translation"
+        mock_client.translate_transcript_entries.return_value = [
+            {'text': 'Translation', 'start': 0}
+        ]
         mock_client.extract_key_topics.return_value = ["Topic 1"]
         mock_client_class.return_value = mock_client
 
@@ -189,6 +193,7 @@ class TestAIService:
 
         assert result['summary'] == "Summary"
         assert result['translation'] == "Translation"
+        assert result['translated_transcript'] == [{'text': 'Translation', 'start': 0}]
         assert len(result['topics']) == 1
         assert 'processing_time' in result
 
@@ -213,3 +218,91 @@ class TestAIService:
         assert result['summary'] == "Summary only"
         assert result['translation'] is None
         assert result['topics'] is None
+
+    @patch('core.ai_service.GeminiClient')
+    def test_enhance_transcript_runs_concurrently(self, mock_client_class):
+        """요약, 번역, 주제 추출을 동시에 실행하는지 테스트"""
+        all_started = threading.Barrier(3, timeout=5)
+
+        def call(value):
+            def run(*args, **kwargs):
+                # 세 작업이 동시에 실행 중이어야만 통과
+                all_started.wait()
+                return value
+            return run
+
+        mock_client = Mock()
+        mock_client.generate_summary.side_effect = call("Summary")
+        mock_client.translate_transcript_entries.side_effect = call(
+            [{'text': 'Translation', 'start': 0}]
+        )
+        mock_client.extract_key_topics.side_effect = call(["Topic 1"])
+        mock_client_class.return_value = mock_client
+
+        service = AIService(api_key="test_key")
+        result = service.enhance_transcript(
+            transcript=[{'text': 'Hello', 'start': 0}],
+            enable_summary=True,
+            enable_translation=True,
+            target_language="en",
+            enable_topics=True,
+            max_concurrency=3
+        )
+
+        assert result['summary'] == "Summary"
+        assert result['translation'] == "Translation"
+        assert result['topics'] == ["Topic 1"]
+
+    @patch('core.ai_service.GeminiClient')
+    def test_enhance_transcript_concurrency_cap(self, mock_client_class):
+        """max_concurrency를 넘는 작업이 동시에 실행되지 않는지 테스트"""
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def tracked(*args, **kwargs):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            threading.Event().wait(0.05)
+            with lock:
+                running.pop()
+            return [{'text': 'ok', 'start': 0}]
+
+        mock_client = Mock()
+        mock_client.generate_summary.side_effect = tracked
+        mock_client.translate_transcript_entries.side_effect = tracked
+        mock_client.extract_key_topics.side_effect = tracked
+        mock_client_class.return_value = mock_client
+
+        service = AIService(api_key="test_key")
+        service.enhance_transcript(
+            transcript=[{'text': 'Hello', 'start': 0}],
+            enable_summary=True,
+            enable_translation=True,
+            target_language="en",
+            enable_topics=True,
+            max_concurrency=1
+        )
+
+        assert max(peak) == 1
+        assert len(peak) == 3
+
+    @patch('core.ai_service.GeminiClient')
+    def test_enhance_transcript_isolates_failures(self, mock_client_class):
+        """한 작업이 실패해도 나머지 결과를 반환하는지 테스트"""
+        mock_client = Mock()
+        mock_client.generate_summary.side_effect = RuntimeError("Unexpected error")
+        mock_client.extract_key_topics.return_value = ["Topic 1"]
+        mock_client_class.return_value = mock_client
+
+        service = AIService(api_key="test_key")
+        result = service.enhance_transcript(
+            transcript=[{'text': 'Hello', 'start': 0}],
+            enable_summary=True,
+            enable_topics=True
+        )
+
+        assert result['summary'] is None
+        assert result['topics'] == ["Topic 1"]
+
@@ -0,0 +1,141 @@
+"""
+yt-dlp 추출기 풀 테스트
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from core.extractor_pool import ExtractorPool
+
+
+OPTS = {'quiet': True, 'extract_flat': False}
+
+
+def make_factory():
+    """호출마다 새 Mock 인스턴스를 생성하는 팩토리"""
+    return Mock(side_effect=lambda options: Mock(options=options))
+
+
+class TestExtractorPool:
+    """ExtractorPool 테스트"""
+
+    def test_invalid_size(self):
+        """잘못된 크기로 생성 시 에러 테스트"""
+        with pytest.raises(ValueError):
+            ExtractorPool(size=0)
+
+    def test_instance_reused(self):
+        """반환된 인스턴스가 재사용되는지 테스트"""
+        factory = make_factory()
+        pool = ExtractorPool(size=2, factory=factory)
+
+        with pool.acquire(OPTS) as first:
+            pass
+        with pool.acquire(OPTS) as second:
+            pass
+
+        assert first is second
+        assert factory.call_count == 1
+        assert pool.stats()['reused'] == 1
+
+    def test_separate_instances_per_options(self):
+        """옵션 조합별로 별도 인스턴스를 사용하는지 테스트"""
+        factory = make_factory()
+        pool = ExtractorPool(size=2, factory=factory)
+
+        with pool.acquire(OPTS) as first:
+            pass
+        with pool.acquire({'quiet': True, 'extract_flat': True}) as second:
+            pass
+
+        assert first is not second
+        assert second.options['extract_flat'] is True
+
+    def test_concurrent_checkout_uses_distinct_instances(self):
+        """동시에 빌려간 인스턴스가 서로 다른지 테스트"""
+        pool = ExtractorPool(size=2, factory=make_factory())
+
+        with pool.acquire(OPTS) as first:
+            with pool.acquire(OPTS) as second:
+                assert first is not second
+
+    def test_blocks_when_exhausted(self):
+        """인스턴스가 모두 사용 중이면 반환될 때까지 대기하는지 테스트"""
+        factory = make_factory()
+        pool = ExtractorPool(size=1, factory=factory)
+        acquired = []
+
+        def worker():
+            with pool.acquire(OPTS) as ydl:
+                acquired.append(ydl)
+
+        with pool.acquire(OPTS) as held:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            time.sleep(0.05)
+            assert acquired == []
+
+        thread.join(timeout=1)
+
+        assert acquired == [held]
+        assert factory.call_count == 1
+
+    def test_close(self):
+        """종료 시 유휴 인스턴스를 닫는지 테스트"""
+        pool = ExtractorPool(size=1, factory=make_factory())
+        with pool.acquire(OPTS) as ydl:
+            pass
+
+        pool.close()
+
+        ydl.close.assert_called_once()
+        with pytest.raises(RuntimeError):
+            with pool.acquire(OPTS):
+                pass
+
+    def test_close_wakes_waiters_and_closes_returned_instance(self):
+        """종료 시 대기 중인 스레드가 깨어나고, 이후 반환된 인스턴스는 닫히는지 테스트"""
+        pool = ExtractorPool(size=1, factory=make_factory())
+        errors = []
+
+        def waiter():
+            try:
+                with pool.acquire(OPTS):
+                    pass
+            except RuntimeError as e:
+                errors.append(e)
+
+        with pool.acquire(OPTS) as held:
+            threads = [threading.Thread(target=waiter) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.05)
+
+            pool.close()
+            for thread in threads:
+                thread.join(timeout=1)
+
+            assert not any(thread.is_alive() for thread in threads)
+            assert len(errors) == 2
+            held.close.assert_not_called()
+
+        # 종료 후 반환된 인스턴스는 풀에 넣지 않고 닫음
+        held.close.assert_called_once()
+        assert pool.stats()['idle'] == 0
+
+    def test_warm_up(self):
+        """미리 생성한 인스턴스를 첫 요청에서 재사용하는지 테스트"""
+        factory = make_factory()
+        pool = ExtractorPool(size=2, factory=factory)
+
+        assert pool.warm_up(OPTS, count=1) == 1
+        assert pool.warm_up(OPTS, count=1) == 0
+
+        with pool.acquire(OPTS):
+            pass
+
+        assert factory.call_count == 1
+        assert pool.stats()['reused'] == 1
@@ -135,3 +135,39 @@ class TestFormatterService:
         except Exception:
             # 실제 파일 작업이 필요하므로 예외 발생 가능
             pass
+
+    def test_iter_format_streams_chunks(self):
+        """실제 포맷터로 문자열 조각을 차례로 생성하는지 테스트"""
+        service = FormatterService()
+        metadata = {
+            'title': 'Test', 'channel': 'Channel', 'upload_date': '20240101',
+            'duration': 10, 'view_count': 1, 'description': ''
+        }
+        transcript = [{'start': 0.0, 'duration': 1.0, 'text': 'Hello'}]
+
+        chunks = list(service.iter_format(
+            metadata, transcript, format_choice='markdown',
+            translated_transcript=[{'text': '안녕'}]
+        ))
+
+        assert len(chunks) == 4  # 헤더, 자막 시작, 항목, 푸터
+        assert chunks[2] == "| `00:00` | Hello | 안녕 |\n"
+
+    def test_format_data_renders_in_memory(self, tmp_path):
+        """임시 파일 없이 save_to_file과 같은 내용을 반환하는지 테스트"""
+        service = FormatterService()
+        metadata = {
+            'title': 'Test', 'channel': 'Channel', 'upload_date': '20240101',
+            'duration': 10, 'view_count': 1, 'description': ''
+        }
+        transcript = [{'start': 0.0, 'duration': 1.0, 'text': 'Hello'}]
+
+        with patch('formatters._generated_at', return_value='2024-01-01 00:00:00'):
+            output_file = service.save_to_file(
+                metadata, transcript, str(tmp_path / 'out'), format_choice='xml'
+            )
+            with patch('builtins.open', side_effect=AssertionError('file access')):
+                content = service.format_data(metadata, transcript, format_choice='xml')
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            assert content == f.read()
@@ -0,0 +1,306 @@
+"""
+플레이리스트 작업 큐 테스트
+"""
+
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from core.job_queue import (
+    JobStore,
+    JobQueue,
+    JobNotFoundError,
+    QUEUED,
+    RUNNING,
+    COMPLETED,
+    CANCELLED,
+    DONE,
+    FAILED,
+    PENDING,
+)
+from core.youtube_service import YouTubeService
+from core.ai_service import AIService
+from core.formatter_service import FormatterService
+
+
+VIDEOS = [
+    {'id': f'vid{i}', 'url': f'https://www.youtube.com/watch?v=vid{i}', 'title': f'Video {i}'}
+    for i in range(3)
+]
+
+
+def make_video_info(video_url, languages=None, prefer_manual=True):
+    """테스트용 비디오 정보"""
+    video_id = video_url.rsplit('=', 1)[-1]
+    if video_id == 'vid1':
+        raise RuntimeError("extraction failed")
+    return {
+        'video_id': video_id,
+        'metadata': {'video_id': video_id, 'title': f'Title {video_id}'},
+        'transcript': [{'start': 0, 'duration': 1, 'text': 'Hello'}],
+    }
+
+
+def wait_for_status(jobs, job_id, statuses, timeout=5.0):
+    """작업이 지정된 상태가 될 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = jobs.status(job_id)
+        if status['status'] in statuses:
+            return status
+        time.sleep(0.01)
+    raise AssertionError(f"job did not reach {statuses}: {jobs.status(job_id)['status']}")
+
+
+@pytest.fixture
+def youtube():
+    """플레이리스트와 비디오 정보를 반환하는 YouTube 서비스 mock"""
+    service = Mock(spec=YouTubeService)
+    service.get_playlist_videos.return_value = VIDEOS
+    service.get_video_info.side_effect = make_video_info
+    return service
+
+
+@pytest.fixture
+def store(tmp_path):
+    """임시 파일 작업 저장소"""
+    return JobStore(str(tmp_path / "jobs.db"))
+
+
+def make_queue(store, youtube):
+    ai = Mock(spec=AIService)
+    ai.is_available.return_value = False
+    return JobQueue(store, youtube, ai, Mock(spec=FormatterService), workers=1, video_concurrency=2)
+
+
+class TestJobStore:
+    """JobStore 테스트"""
+
+    def test_job_lifecycle(self, store):
+        """작업 생성, 비디오 저장, 상태 변경 테스트"""
+        store.create_job("job1", {"playlist_url": "url"})
+        store.add_videos("job1", VIDEOS)
+        store.update_video("job1", 0, DONE, result={"summary": "요약"})
+
+        job = store.get_job("job1")
+        assert job['status'] == QUEUED
+        assert job['params'] == {"playlist_url": "url"}
+        assert job['videos_listed'] is True
+        assert store.count_videos("job1") == {'done': 1, 'pending': 2}
+        assert store.get_videos("job1", include_results=True)[0]['result'] == {"summary": "요약"}
+
+    def test_cancel_only_unfinished(self, store):
+        """끝난 작업은 취소되지 않는지 테스트"""
+        store.create_job("job1", {})
+        store.create_job("job2", {})
+        store.set_status("job2", COMPLETED)
+
+        assert store.cancel("job1") is True
+        assert store.cancel("job2") is False
+        assert store.get_job("job1")['status'] == CANCELLED
+
+    def test_set_status_keeps_finished_jobs(self, store):
+        """취소되거나 끝난 작업의 상태는 변경하지 않는지 테스트"""
+        store.create_job("job1", {})
+        store.cancel("job1")
+
+        assert store.set_status("job1", RUNNING) is False
+        assert store.set_status("job1", COMPLETED) is False
+        assert store.get_job("job1")['status'] == CANCELLED
+
+    def test_unfinished_jobs_resets_running_videos(self, store):
+        """재시작 시 실행 중이던 비디오를 대기 상태로 되돌리는지 테스트"""
+        store.create_job("job1", {})
+        store.set_status("job1", RUNNING)
+        store.add_videos("job1", VIDEOS)
+        store.update_video("job1", 1, RUNNING)
+        store.create_job("job2", {})
+        store.set_status("job2", COMPLETED)
+
+        assert store.unfinished_jobs() == ["job1"]
+        assert store.count_videos("job1") == {'pending': 3}
+
+
+class TestJobQueue:
+    """JobQueue 테스트"""
+
+    def test_runs_job_and_reports_progress(self, store, youtube):
+        """작업을 실행하고 비디오별 결과와 실패를 기록하는지 테스트"""
+        jobs = make_queue(store, youtube)
+        try:
+            job_id = jobs.submit({"playlist_url": "playlist", "languages": ["en"]})
+            status = wait_for_status(jobs, job_id, (COMPLETED,))
+            results = jobs.results(job_id)['videos']
+        finally:
+            jobs.close()
+
+        assert status['progress'] == {'total': 3, 'pending': 0, 'running': 0, 'done': 2, 'failed': 1}
+        assert status['videos'][1]['error'] == "extraction failed"
+        assert results[0]['result']['metadata']['title'] == 'Title vid0'
+        assert results[0]['result']['transcript_language'] == 'en'
+
+    def test_partial_video_info_recorded(self, store, youtube):
+        """메타데이터나 자막 중 하나를 가져오지 못한 비디오의 실패 내용이 결과에 저장되는지 테스트"""
+        def partial_video_info(video_url, languages=None, prefer_manual=True):
+            info = make_video_info(video_url.replace('vid1', 'vid9'))
+            if video_url.endswith('vid2'):
+                info['transcript'] = []
+                info['errors'] = {'transcript': 'Timed out after 30s'}
+            return info
+
+        youtube.get_video_info.side_effect = partial_video_info
+        jobs = make_queue(store, youtube)
+        try:
+            job_id = jobs.submit({"playlist_url": "playlist"})
+            wait_for_status(jobs, job_id, (COMPLETED,))
+            results = jobs.results(job_id)['videos']
+        finally:
+            jobs.close()
+
+        assert results[0]['result']['errors'] == {}
+        assert results[2]['result']['errors'] == {'transcript': 'Timed out after 30s'}
+
+    def test_resume_skips_completed_videos(self, tmp_path, youtube):
+        """재시작 후 완료된 비디오를 다시 처리하지 않는지 테스트"""
+        path = str(tmp_path / "jobs.db")
+        store = JobStore(path)
+        store.create_job("job1", {"playlist_url": "playlist"})
+        store.set_status("job1", RUNNING)
+        store.add_videos("job1", VIDEOS)
+        store.update_video("job1", 0, DONE, result={"video_id": "vid0"})
+        store.update_video("job1", 2, RUNNING)
+        store.close()
+
+        jobs = make_queue(JobStore(path), youtube)
+        try:
+            assert jobs.start() == 1
+            wait_for_status(jobs, "job1", (COMPLETED,))
+        finally:
+            jobs.close()
+
+        youtube.get_playlist_videos.assert_not_called()
+        processed = [call.args[0] for call in youtube.get_video_info.call_args_list]
+        assert sorted(processed) == [VIDEOS[1]['url'], VIDEOS[2]['url']]
+
+    def test_resume_retries_failed_videos(self, tmp_path, youtube):
+        """재시작 후 이어서 실행하는 작업은 실패한 비디오도 다시 처리하는지 테스트"""
+        path = str(tmp_path / "jobs.db")
+        store = JobStore(path)
+        store.create_job("job1", {"playlist_url": "playlist"})
+        store.set_status("job1", RUNNING)
+        store.add_videos("job1", VIDEOS)
+        store.update_video("job1", 0, DONE, result={"video_id": "vid0"})
+        store.update_video("job1", 2, FAILED, error="network error")
+        store.close()
+
+        jobs = make_queue(JobStore(path), youtube)
+        try:
+            jobs.start()
+            status = wait_for_status(jobs, "job1", (COMPLETED,))
+        finally:
+            jobs.close()
+
+        processed = [call.args[0] for call in youtube.get_video_info.call_args_list]
+        assert sorted(processed) == [VIDEOS[1]['url'], VIDEOS[2]['url']]
+        assert status['videos'][2]['status'] == DONE
+        assert status['videos'][2]['error'] is None
+
+    def test_failed_videos_not_retried_in_same_run(self, store, youtube):
+        """한 번의 실행에서 실패한 비디오는 다시 시도하지 않고 failed로 남는지 테스트"""
+        jobs = make_queue(store, youtube)
+        try:
+            job_id = jobs.submit({"playlist_url": "playlist"})
+            status = wait_for_status(jobs, job_id, (COMPLETED,))
+        finally:
+            jobs.close()
+
+        assert youtube.get_video_info.call_count == 3
+        assert status['videos'][1]['status'] == FAILED
+
+    def test_empty_listing_fails_job(self, store, youtube):
+        """비디오 목록이 비어 있으면 0개로 완료하지 않고 작업을 실패로 기록하는지 테스트"""
+        youtube.get_playlist_videos.return_value = []
+        jobs = make_queue(store, youtube)
+        try:
+            job_id = jobs.submit({"playlist_url": "playlist"})
+            status = wait_for_status(jobs, job_id, (FAILED,))
+        finally:
+            jobs.close()
+
+        assert "no videos" in status['error']
+        assert status['videos_listed'] is False
+
+    def test_listing_error_fails_job(self, store, youtube):
+        """비디오 목록 조회 중 예외가 나면 작업을 실패로 기록하는지 테스트"""
+        youtube.get_playlist_videos.side_effect = ConnectionError("connection reset")
+        jobs = make_queue(store, youtube)
+        try:
+            job_id = jobs.submit({"playlist_url": "playlist"})
+            status = wait_for_status(jobs, job_id, (FAILED,))
+        finally:
+            jobs.close()
+
+        assert status['error'] == "connection reset"
+        youtube.get_video_info.assert_not_called()
+
+    def test_all_videos_failed_fails_job(self, store, youtube):
+        """모든 비디오가 실패하면 작업을 완료가 아닌 실패로 기록하는지 테스트"""
+        youtube.get_video_info.side_effect = RuntimeError("extraction failed")
+        jobs = make_queue(store, youtube)
+        try:
+            job_id = jobs.submit({"playlist_url": "playlist"})
+            status = wait_for_status(jobs, job_id, (FAILED, COMPLETED))
+        finally:
+            jobs.close()
+
+        assert status['status'] == FAILED
+        assert status['error'] == "All 3 videos failed"
+        assert status['progress']['failed'] == 3
+
+    def test_cancel_after_read_is_not_overwritten(self, store, youtube):
+        """워커가 작업을 읽은 직후 들어온 취소를 실행 중 상태로 덮어쓰지 않는지 테스트"""
+        jobs = make_queue(store, youtube)
+        store.create_job("job1", {"playlist_url": "playlist"})
+        get_job = store.get_job
+
+        def get_job_then_cancel(job_id):
+            job = get_job(job_id)
+            store.cancel(job_id)  # 읽기와 상태 변경 사이에 취소 요청이 도착
+            return job
+
+        store.get_job = get_job_then_cancel
+        try:
+            jobs._run_job("job1")
+        finally:
+            store.get_job = get_job
+
+        try:
+            assert jobs.status("job1")['status'] == CANCELLED
+        finally:
+            jobs.close()
+        youtube.get_playlist_videos.assert_not_called()
+
+    def test_cancelled_job_is_not_run(self, store, youtube):
+        """시작 전에 취소된 작업은 실행되지 않는지 테스트"""
+        jobs = make_queue(store, youtube)
+        store.create_job("job1", {"playlist_url": "playlist"})
+
+        assert jobs.cancel("job1") is True
+        try:
+            jobs.start()
+            time.sleep(0.05)
+            assert jobs.status("job1")['status'] == CANCELLED
+        finally:
+            jobs.close()
+
+        youtube.get_playlist_videos.assert_not_called()
+
+    def test_unknown_job(self, store, youtube):
+        """존재하지 않는 작업 조회 시 JobNotFoundError 테스트"""
+        jobs = make_queue(store, youtube)
+
+        with pytest.raises(JobNotFoundError):
+            jobs.status("missing")
+        with pytest.raises(JobNotFoundError):
+            jobs.cancel("missing")
@@ -0,0 +1,81 @@
+"""
+메타데이터 캐시 테스트
+"""
+
+import pytest
+from unittest.mock import patch
+
+from core.metadata_cache import MetadataCache
+from utils.cache import MemoryCache, SQLiteCache, TieredCache
+
+
+@pytest.fixture
+def metadata_cache(tmp_path):
+    """임시 디렉토리의 메타데이터 캐시"""
+    store = TieredCache(MemoryCache(), SQLiteCache(str(tmp_path / "metadata.db")))
+    return MetadataCache(store, static_ttl=1000, volatile_ttl=10)
+
+
+@pytest.fixture
+def sample_metadata():
+    """테스트용 샘플 메타데이터"""
+    return {
+        'video_id': 'test123',
+        'title': 'Test Video',
+        'channel': 'Test Channel',
+        'upload_date': '20240101',
+        'duration': 120,
+        'view_count': 1000,
+        'like_count': 50,
+    }
+
+
+class TestMetadataCache:
+    """MetadataCache 테스트"""
+
+    def test_put_and_get(self, metadata_cache, sample_metadata):
+        """저장 후 조회 테스트"""
+        metadata_cache.put('test123', sample_metadata)
+
+        assert metadata_cache.get('test123') == sample_metadata
+        assert metadata_cache.hits == 1
+
+    def test_miss(self, metadata_cache):
+        """캐시 미스 테스트"""
+        assert metadata_cache.get('unknown') is None
+        assert metadata_cache.misses == 1
+
+    def test_volatile_fields_expire_first(self, metadata_cache, sample_metadata):
+        """변동 필드가 먼저 만료되는지 테스트"""
+        with patch('utils.cache.time.time', return_value=1000.0):
+            metadata_cache.put('test123', sample_metadata)
+
+        with patch('utils.cache.time.time', return_value=1100.0):
+            assert metadata_cache.get('test123') is None
+
+            static = metadata_cache.get_static('test123')
+            assert static['title'] == 'Test Video'
+            assert 'view_count' not in static
+
+    def test_shared_disk_store(self, tmp_path, sample_metadata):
+        """다른 프로세스(새 메모리 캐시)에서도 디스크를 통해 적중하는지 테스트"""
+        disk = SQLiteCache(str(tmp_path / "shared.db"))
+        writer = MetadataCache(TieredCache(MemoryCache(), disk), 1000, 100)
+        writer.put('test123', sample_metadata)
+
+        reader = MetadataCache(TieredCache(MemoryCache(), disk), 1000, 100)
+
+        assert reader.get('test123') == sample_metadata
+
+    def test_stats(self, metadata_cache, sample_metadata):
+        """통계 테스트"""
+        metadata_cache.put('test123', sample_metadata)
+        metadata_cache.get('test123')
+        metadata_cache.get('unknown')
+
+        stats = metadata_cache.stats()
+
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert 'memory' in stats['tiers']
@@ -0,0 +1,108 @@
+"""
+자막 캐시 테스트
+"""
+
+import pytest
+
+from core.transcript_cache import TranscriptCache
+from utils.cache import SQLiteCache
+from utils.transcript import Transcript
+
+
+@pytest.fixture
+def transcript_cache(tmp_path):
+    """임시 디렉토리의 자막 캐시"""
+    return TranscriptCache(SQLiteCache(str(tmp_path / "transcripts.db")))
+
+
+@pytest.fixture
+def sample_transcript():
+    """테스트용 샘플 자막"""
+    return [
+        {'start': 0.0, 'duration': 2.0, 'text': 'Hello', 'timestamp': '00:00'},
+        {'start': 2.0, 'duration': 3.0, 'text': 'World', 'timestamp': '00:02'},
+    ]
+
+
+class TestTranscriptCache:
+    """TranscriptCache 테스트"""
+
+    def test_get_miss(self, transcript_cache):
+        """캐시 미스 테스트"""
+        assert transcript_cache.get('test123', ['ko', 'en']) is None
+
+    def test_put_and_get(self, transcript_cache, sample_transcript):
+        """저장 후 동일 요청 조회 테스트"""
+        transcript_cache.put(
+            'test123', ['ko', 'en'], True, sample_transcript,
+            language='en', is_generated=False
+        )
+
+        assert transcript_cache.get('test123', ['ko', 'en'], True) == sample_transcript
+
+    def test_request_key_includes_preferences(self, transcript_cache, sample_transcript):
+        """언어 우선순위와 수동 자막 선호 여부가 키에 포함되는지 테스트"""
+        transcript_cache.put('test123', ['ko', 'en'], True, sample_transcript)
+
+        assert transcript_cache.get('test123', ['en'], True) is None
+        assert transcript_cache.get('test123', ['ko', 'en'], False) is None
+
+    def test_get_track(self, transcript_cache, sample_transcript):
+        """해석된 트랙 키로 조회 테스트"""
+        transcript_cache.put(
+            'test123', ['ko', 'en'], True, sample_transcript,
+            language='en', is_generated=True
+        )
+
+        assert transcript_cache.get_track('test123', 'en', True) == sample_transcript
+        assert transcript_cache.get_track('test123', 'en', False) is None
+
+    def test_same_content_is_stored_once(self, transcript_cache, sample_transcript):
+        """같은 트랙으로 해석된 요청들이 본문을 공유하는지 테스트"""
+        transcript_cache.put(
+            'test123', ['ko', 'en'], True, sample_transcript,
+            language='en', is_generated=False
+        )
+        transcript_cache.put(
+            'test123', ['en'], True, sample_transcript,
+            language='en', is_generated=False
+        )
+
+        blob_count = transcript_cache.backend._conn.execute(
+            "SELECT COUNT(*) FROM cache WHERE key LIKE 'blob:%'"
+        ).fetchone()[0]
+        assert blob_count == 1
+
+    def test_put_missing(self, tmp_path):
+        """자막 없음 결과를 짧은 TTL로 캐시하는지 테스트"""
+        cache = TranscriptCache(SQLiteCache(str(tmp_path / "transcripts.db")), negative_ttl=60)
+        cache.put_missing('test123', ['ko', 'en'], True)
+
+        assert cache.get('test123', ['ko', 'en'], True) == []
+        expires_at = cache.backend.get_with_expiry('request:test123|ko,en|1')[1]
+        assert expires_at is not None
+
+
+    def test_stores_columns_and_restores_track_info(self, transcript_cache, sample_transcript):
+        """본문을 열 단위로 저장하고 트랙 정보와 함께 Transcript로 복원하는지 테스트"""
+        transcript_cache.put(
+            'test123', ['ko', 'en'], True, sample_transcript,
+            language='en', is_generated=True
+        )
+
+        blob = transcript_cache.backend._conn.execute(
+            "SELECT value FROM cache WHERE key LIKE 'blob:%'"
+        ).fetchone()[0]
+        assert 'timestamp' not in str(blob)
+
+        cached = transcript_cache.get('test123', ['ko', 'en'], True)
+        assert isinstance(cached, Transcript)
+        assert cached.language_code == 'en'
+        assert cached.is_generated is True
+
+    def test_reads_legacy_entry_list_blob(self, transcript_cache, sample_transcript):
+        """이전 형식(항목 딕셔너리 리스트)으로 저장된 본문도 읽는지 테스트"""
+        transcript_cache.backend.set('blob:legacy', sample_transcript)
+        transcript_cache.backend.set('track:test123|en|manual', 'legacy')
+
+        assert transcript_cache.get_track('test123', 'en', False) == sample_transcript
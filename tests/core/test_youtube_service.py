@@ -2,10 +2,20 @@
 YouTube 서비스 테스트
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
 from core.youtube_service import YouTubeService
+from core.transcript_cache import TranscriptCache
+from core.metadata_cache import MetadataCache
+from core.extractor_pool import ExtractorPool
+from utils.cache import MemoryCache, SQLiteCache, TieredCache
+from youtube_api import TranscriptList
 
 
 class TestYouTubeService:
@@ -45,13 +55,11 @@ class TestYouTubeService:
         mock_metadata.assert_called_once_with('test123')
 
     @patch('core.youtube_service.get_transcript_with_timestamps')
-    @patch('core.youtube_service.format_timestamp')
-    def test_get_transcript_success(self, mock_format, mock_transcript):
+    def test_get_transcript_success(self, mock_transcript):
         """자막 가져오기 성공 테스트"""
         mock_transcript.return_value = [
             {'start': 0.0, 'duration': 3.0, 'text': 'Hello'}
         ]
-        mock_format.return_value = "00:00:00"
         service = YouTubeService()
 
         transcript = service.get_transcript('test123', languages=['en'])
@@ -123,11 +131,10 @@ class TestYouTubeService:
     def test_get_playlist_videos_success(self, mock_handler_class):
         """플레이리스트 비디오 목록 가져오기 성공 테스트"""
         mock_handler = Mock()
-        mock_handler.get_video_urls_from_playlist.return_value = [
+        mock_handler.iter_playlist_videos.return_value = iter([
             {'id': 'video1', 'url': 'url1', 'title': 'Video 1'},
             {'id': 'video2', 'url': 'url2', 'title': 'Video 2'},
-            {'id': 'video3', 'url': 'url3', 'title': 'Video 3'},
-        ]
+        ])
         mock_handler_class.return_value = mock_handler
 
         service = YouTubeService()
@@ -138,3 +145,468 @@ class TestYouTubeService:
 
         assert len(videos) == 2
         assert videos[0]['id'] == 'video1'
+        # 필요한 개수만 지연 조회하도록 limit을 전달
+        kwargs = mock_handler.iter_playlist_videos.call_args.kwargs
+        assert kwargs['offset'] == 0
+        assert kwargs['limit'] == 2
+
+    @patch('core.youtube_service.PlaylistHandler')
+    def test_get_playlist_videos_partial_listing_raises(self, mock_handler_class):
+        """목록 조회가 중간에 실패하면 잘린 목록 대신 예외를 전파하는지 테스트"""
+        def videos():
+            yield {'id': 'video1', 'url': 'url1', 'title': 'Video 1'}
+            raise RuntimeError("page 2 request failed")
+
+        mock_handler = Mock()
+        mock_handler.iter_playlist_videos.return_value = videos()
+        mock_handler_class.return_value = mock_handler
+
+        service = YouTubeService()
+        with pytest.raises(RuntimeError, match="page 2 request failed"):
+            service.get_playlist_videos("https://www.youtube.com/playlist?list=PLtest")
+
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_transcript_uses_cache(self, mock_transcript, tmp_path):
+        """자막 캐시 적중 시 네트워크 요청을 생략하는지 테스트"""
+        mock_transcript.return_value = [
+            {'start': 0.0, 'duration': 3.0, 'text': 'Hello'}
+        ]
+        cache = TranscriptCache(SQLiteCache(str(tmp_path / "transcripts.db")))
+        service = YouTubeService(transcript_cache=cache)
+
+        first = service.get_transcript('test123', languages=['en'])
+        second = service.get_transcript('test123', languages=['en'])
+
+        assert first == second
+        assert second[0]['timestamp'] == '00:00'
+        mock_transcript.assert_called_once()
+
+    @patch('core.youtube_service.get_video_metadata')
+    def test_get_video_metadata_uses_cache(self, mock_metadata):
+        """메타데이터 캐시 적중 시 재추출하지 않는지 테스트"""
+        mock_metadata.return_value = {
+            'video_id': 'test123',
+            'title': 'Test Video',
+            'channel': 'Test Channel',
+            'upload_date': '20240101',
+            'view_count': 10
+        }
+        cache = MetadataCache(TieredCache(MemoryCache()), static_ttl=100, volatile_ttl=10)
+        service = YouTubeService(metadata_cache=cache)
+
+        service.get_video_metadata('test123')
+        metadata = service.get_video_metadata('test123')
+
+        assert metadata['title'] == 'Test Video'
+        assert metadata['view_count'] == 10
+        mock_metadata.assert_called_once()
+
+    @patch('core.youtube_service.get_video_metadata')
+    def test_get_video_metadata_placeholder_not_cached(self, mock_metadata):
+        """추출 실패 기본값은 캐시하지 않고 캐시된 불변 필드로 대체하는지 테스트"""
+        cache = MetadataCache(TieredCache(MemoryCache()), static_ttl=100, volatile_ttl=10)
+        cache.put('test123', {'video_id': 'test123', 'title': 'Cached Title', 'view_count': 5})
+        cache.store.memory.delete('metadata:volatile:test123')
+        mock_metadata.return_value = {
+            'video_id': 'test123',
+            'title': 'Unknown Title',
+            'channel': 'Unknown Channel',
+            'upload_date': 'Unknown Date',
+            'view_count': 0
+        }
+        service = YouTubeService(metadata_cache=cache)
+
+        metadata = service.get_video_metadata('test123')
+
+        assert metadata['title'] == 'Cached Title'
+        assert cache.get('test123') is None
+
+    @patch('core.youtube_service.get_video_metadata')
+    def test_get_video_metadata_uses_pooled_extractor(self, mock_metadata):
+        """풀의 YoutubeDL 인스턴스를 사용하는지 테스트"""
+        mock_metadata.return_value = {'video_id': 'test123', 'title': 'Test'}
+        pool = ExtractorPool(size=1, factory=lambda options: Mock())
+        service = YouTubeService(extractor_pool=pool)
+
+        service.get_video_metadata('test123')
+        service.get_video_metadata('test123')
+
+        first_ydl = mock_metadata.call_args_list[0].kwargs['ydl']
+        second_ydl = mock_metadata.call_args_list[1].kwargs['ydl']
+        assert first_ydl is second_ydl
+        assert pool.stats()['created'] == 1
+
+    def test_warm_up_prepares_extractor(self):
+        """워밍업 시 메타데이터 추출기를 미리 생성하는지 테스트"""
+        factory = Mock(return_value=Mock())
+        pool = ExtractorPool(size=2, factory=factory)
+        service = YouTubeService(extractor_pool=pool)
+
+        service.warm_up()
+
+        factory.assert_called_once()
+        assert pool.stats()['idle'] == 1
+
+    def test_close_closes_caches(self):
+        """종료 시 자막/메타데이터 캐시를 닫는지 테스트"""
+        transcript_cache = Mock(spec=TranscriptCache)
+        metadata_cache = Mock(spec=MetadataCache)
+        service = YouTubeService(
+            transcript_cache=transcript_cache,
+            metadata_cache=metadata_cache
+        )
+
+        service.close()
+
+        transcript_cache.close.assert_called_once()
+        metadata_cache.close.assert_called_once()
+
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_transcript_caches_missing(self, mock_transcript, tmp_path):
+        """자막 없음 결과를 캐시하여 반복 조회를 생략하는지 테스트"""
+        mock_transcript.return_value = TranscriptList(missing=True)
+        cache = TranscriptCache(SQLiteCache(str(tmp_path / "transcripts.db")))
+        service = YouTubeService(transcript_cache=cache)
+
+        assert service.get_transcript('test123', languages=['en']) == []
+        assert service.get_transcript('test123', languages=['en']) == []
+        mock_transcript.assert_called_once()
+
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_transcript_does_not_cache_transient_failure(self, mock_transcript, tmp_path):
+        """일시적 오류로 인한 빈 결과는 캐시하지 않는지 테스트"""
+        mock_transcript.return_value = TranscriptList()
+        cache = TranscriptCache(SQLiteCache(str(tmp_path / "transcripts.db")))
+        service = YouTubeService(transcript_cache=cache)
+
+        service.get_transcript('test123', languages=['en'])
+        service.get_transcript('test123', languages=['en'])
+
+        assert mock_transcript.call_count == 2
+
+    @patch('core.youtube_service.extract_video_id')
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_video_info_async(self, mock_transcript, mock_metadata, mock_extract):
+        """비동기 비디오 정보 조회가 실행기 스레드에서 수행되는지 테스트"""
+        caller_threads = []
+        mock_extract.side_effect = lambda *args, **kwargs: (
+            caller_threads.append(threading.current_thread().name) or "test123"
+        )
+        mock_metadata.return_value = {'video_id': 'test123', 'title': 'Test'}
+        mock_transcript.return_value = [{'start': 0.0, 'duration': 3.0, 'text': 'Hello'}]
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test-executor")
+        service = YouTubeService(executor=executor)
+
+        result = asyncio.run(
+            service.get_video_info_async("https://www.youtube.com/watch?v=test123")
+        )
+        executor.shutdown()
+
+        assert result['video_id'] == 'test123'
+        assert result['metadata']['title'] == 'Test'
+        assert caller_threads[0].startswith("test-executor")
+
+    @patch('core.youtube_service.get_video_metadata')
+    def test_async_calls_do_not_block_event_loop(self, mock_metadata):
+        """블로킹 추출 작업이 동시에 진행되는지 테스트"""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def blocking_metadata(*args, **kwargs):
+            # 두 호출이 동시에 실행 중이어야만 통과
+            both_started.wait()
+            return {'video_id': args[0][-6:], 'title': 'Test'}
+
+        mock_metadata.side_effect = blocking_metadata
+        executor = ThreadPoolExecutor(max_workers=2)
+        service = YouTubeService(executor=executor)
+
+        async def fetch_both():
+            return await asyncio.gather(
+                service.get_video_metadata_async('video1'),
+                service.get_video_metadata_async('video2')
+            )
+
+        results = asyncio.run(fetch_both())
+        executor.shutdown()
+
+        assert [r['video_id'] for r in results] == ['video1', 'video2']
+
+    @patch('core.youtube_service.extract_video_id')
+    def test_get_video_info_async_invalid_url(self, mock_extract):
+        """비동기 조회에서도 ValueError가 그대로 전달되는지 테스트"""
+        mock_extract.return_value = None
+        service = YouTubeService()
+
+        with pytest.raises(ValueError, match="Invalid YouTube URL"):
+            asyncio.run(service.get_video_info_async("invalid_url"))
+
+    @patch('core.youtube_service.extract_video_id')
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_video_info_fetches_concurrently(self, mock_transcript, mock_metadata, mock_extract):
+        """메타데이터와 자막을 동시에 조회하는지 테스트"""
+        both_started = threading.Barrier(2, timeout=5)
+
+        def blocking_metadata(*args, **kwargs):
+            both_started.wait()
+            return {'video_id': 'test123', 'title': 'Test'}
+
+        def blocking_transcript(*args, **kwargs):
+            both_started.wait()
+            return [{'start': 0.0, 'duration': 3.0, 'text': 'Hello'}]
+
+        mock_extract.return_value = "test123"
+        mock_metadata.side_effect = blocking_metadata
+        mock_transcript.side_effect = blocking_transcript
+        service = YouTubeService()
+
+        result = service.get_video_info("https://www.youtube.com/watch?v=test123")
+
+        assert result['metadata']['title'] == 'Test'
+        assert result['transcript'][0]['text'] == 'Hello'
+        assert result['errors'] == {}
+
+    @patch('core.youtube_service.extract_video_id')
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_video_info_partial_on_transcript_failure(self, mock_transcript, mock_metadata, mock_extract):
+        """자막 조회 실패 시 메타데이터만으로 응답하는지 테스트"""
+        mock_extract.return_value = "test123"
+        mock_metadata.return_value = {'video_id': 'test123', 'title': 'Test'}
+        mock_transcript.side_effect = Exception("Transcript service unavailable")
+        service = YouTubeService()
+
+        result = service.get_video_info("https://www.youtube.com/watch?v=test123")
+
+        assert result['metadata']['title'] == 'Test'
+        assert result['transcript'] == []
+        assert 'Transcript service unavailable' in result['errors']['transcript']
+
+    @patch('core.youtube_service.extract_video_id')
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_video_info_partial_on_deadline(self, mock_transcript, mock_metadata, mock_extract):
+        """공통 제한 시간을 넘긴 조회는 기본값으로 대체하는지 테스트"""
+        release = threading.Event()
+
+        def slow_metadata(*args, **kwargs):
+            release.wait(5)
+            return {'video_id': 'test123', 'title': 'Late'}
+
+        mock_extract.return_value = "test123"
+        mock_metadata.side_effect = slow_metadata
+        mock_transcript.return_value = [{'start': 0.0, 'duration': 3.0, 'text': 'Hello'}]
+        service = YouTubeService()
+
+        try:
+            result = service.get_video_info(
+                "https://www.youtube.com/watch?v=test123",
+                timeout=0.2
+            )
+        finally:
+            release.set()
+
+        assert result['metadata']['title'] == 'Unknown Title'
+        assert result['metadata']['video_id'] == 'test123'
+        assert result['transcript'][0]['text'] == 'Hello'
+        assert 'Timed out' in result['errors']['metadata']
+
+    @patch('core.youtube_service.extract_video_id')
+    @patch('core.youtube_service.get_video_metadata')
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_get_video_info_both_failed(self, mock_transcript, mock_metadata, mock_extract):
+        """메타데이터와 자막 모두 실패하면 예외를 발생시키는지 테스트"""
+        mock_extract.return_value = "test123"
+        mock_metadata.side_effect = Exception("Metadata error")
+        mock_transcript.side_effect = Exception("Transcript error")
+        service = YouTubeService()
+
+        with pytest.raises(RuntimeError, match="Failed to get video info"):
+            service.get_video_info("https://www.youtube.com/watch?v=test123")
+
+
+
+class TestPlaylistSingleExtraction:
+    """재생목록 단일 추출 (캐시 + 요청 병합) 테스트"""
+
+    PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLtest"
+
+    @staticmethod
+    def playlist_info():
+        return {
+            'playlist_id': 'PLtest',
+            'title': 'Test Playlist',
+            'uploader': 'Test Channel',
+            'video_count': 3,
+            'description': None,
+            'entries': [
+                {'id': 'video0', 'title': 'Video 0'},
+                {'id': 'video1', 'title': 'Video 1'},
+                {'id': 'video2', 'title': 'Video 2'},
+            ]
+        }
+
+    @staticmethod
+    def make_service(playlist_cache=None):
+        pool = ExtractorPool(size=4, factory=lambda options: Mock())
+        return YouTubeService(
+            extractor_pool=pool,
+            playlist_cache=playlist_cache if playlist_cache is not None else MemoryCache(default_ttl=60)
+        )
+
+    @patch('playlist_handler.PlaylistHandler.get_playlist_info')
+    def test_info_and_videos_share_one_extraction(self, mock_info):
+        """정보 조회 후 비디오 목록 조회가 캐시된 추출 결과를 재사용하는지 테스트"""
+        mock_info.return_value = self.playlist_info()
+        service = self.make_service()
+
+        with patch.object(service.playlist_handler, 'iter_playlist_videos') as mock_iter:
+            info = service.get_playlist_info(self.PLAYLIST_URL)
+            videos = service.get_playlist_videos(self.PLAYLIST_URL, max_videos=2, offset=1)
+
+        assert info['title'] == 'Test Playlist'
+        assert [v['id'] for v in videos] == ['video1', 'video2']
+        mock_info.assert_called_once()
+        mock_iter.assert_not_called()
+
+    @patch('playlist_handler.PlaylistHandler.get_playlist_info')
+    def test_cache_key_uses_playlist_id(self, mock_info):
+        """같은 재생목록의 다른 URL 형식이 캐시를 공유하는지 테스트"""
+        mock_info.return_value = self.playlist_info()
+        service = self.make_service()
+
+        service.get_playlist(self.PLAYLIST_URL)
+        service.get_playlist("https://www.youtube.com/watch?v=video0&list=PLtest")
+
+        mock_info.assert_called_once()
+
+    @patch('playlist_handler.PlaylistHandler.get_playlist_info')
+    def test_failure_not_cached(self, mock_info):
+        """추출 실패(None)는 캐시하지 않는지 테스트"""
+        mock_info.side_effect = [None, self.playlist_info()]
+        service = self.make_service()
+
+        assert service.get_playlist(self.PLAYLIST_URL) is None
+        assert service.get_playlist(self.PLAYLIST_URL)['title'] == 'Test Playlist'
+        assert mock_info.call_count == 2
+
+    @patch('playlist_handler.PlaylistHandler.get_playlist_info')
+    def test_concurrent_requests_coalesced(self, mock_info):
+        """동시에 들어온 같은 재생목록 요청이 추출 하나를 공유하는지 테스트"""
+        release = threading.Event()
+        playlist = self.playlist_info()
+
+        def slow_extract(url, ydl=None):
+            release.wait(timeout=5)
+            return playlist
+
+        mock_info.side_effect = slow_extract
+        # 캐시 없이도 동시 요청은 병합됨
+        service = self.make_service()
+        service.playlist_cache = None
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(service.get_playlist, self.PLAYLIST_URL) for _ in range(4)]
+            while service._playlist_flight.in_flight() == 0:
+                time.sleep(0.01)
+            time.sleep(0.1)  # 나머지 요청이 진행 중인 추출에 합류할 시간
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert all(result is playlist for result in results)
+        mock_info.assert_called_once()
+
+    @patch('playlist_handler.PlaylistHandler.get_playlist_info')
+    def test_process_url_reuses_playlist(self, mock_info):
+        """process_url이 캐시된 재생목록 추출 결과를 재사용하는지 테스트"""
+        mock_info.return_value = self.playlist_info()
+        service = self.make_service()
+
+        service.get_playlist(self.PLAYLIST_URL)
+        result = service.process_url(self.PLAYLIST_URL)
+
+        assert result['type'] == 'playlist'
+        assert len(result['videos']) == 3
+        assert result['playlist_info']['title'] == 'Test Playlist'
+        mock_info.assert_called_once()
+
+
+class TestVideoRequestCoalescing:
+    """같은 비디오 동시 요청 병합 테스트"""
+
+    @staticmethod
+    def make_service():
+        pool = ExtractorPool(size=4, factory=lambda options: Mock())
+        return YouTubeService(
+            transcript_cache=TranscriptCache(MemoryCache()),
+            metadata_cache=MetadataCache(TieredCache(MemoryCache()), static_ttl=100, volatile_ttl=10),
+            extractor_pool=pool
+        )
+
+    @patch('core.youtube_service.get_video_metadata')
+    def test_concurrent_metadata_coalesced(self, mock_get_metadata):
+        """동시에 들어온 같은 비디오의 메타데이터 요청이 추출 하나를 공유하는지 테스트"""
+        release = threading.Event()
+
+        def slow_extract(url, ydl=None):
+            release.wait(timeout=5)
+            return {'video_id': 'test123', 'title': 'Test Video', 'channel': 'Test Channel'}
+
+        mock_get_metadata.side_effect = slow_extract
+        service = self.make_service()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(service.get_video_metadata, 'test123') for _ in range(4)]
+            while service._metadata_flight.in_flight() == 0:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert all(r['title'] == 'Test Video' for r in results)
+        # 호출자마다 별도의 딕셔너리를 받음
+        assert len({id(r) for r in results}) == 4
+        mock_get_metadata.assert_called_once()
+
+        stats = service.coalescing_stats()['metadata']
+        assert stats['executions'] == 1
+        assert stats['coalesced'] == 3
+        assert stats['max_waiters'] == 3
+
+    @patch('core.youtube_service.get_transcript_with_timestamps')
+    def test_concurrent_transcript_coalesced(self, mock_get_transcript):
+        """같은 비디오와 언어 설정의 동시 자막 요청만 조회 하나를 공유하는지 테스트"""
+        release = threading.Event()
+
+        def slow_fetch(video_id, languages=None, prefer_manual=True):
+            release.wait(timeout=5)
+            return [{'start': 0.0, 'duration': 1.0, 'text': languages[0]}]
+
+        mock_get_transcript.side_effect = slow_fetch
+        service = self.make_service()
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(service.get_transcript, 'test123', ['ko']) for _ in range(4)]
+            futures.append(pool.submit(service.get_transcript, 'test123', ['en']))
+            while service._transcript_flight.in_flight() < 2:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert [r[0]['text'] for r in results] == ['ko', 'ko', 'ko', 'ko', 'en']
+        assert mock_get_transcript.call_count == 2
+        assert service.coalescing_stats()['transcript']['coalesced'] == 3
+
+    @patch('core.youtube_service.get_video_metadata')
+    def test_cache_hit_not_counted(self, mock_get_metadata):
+        """캐시 적중은 병합 통계에 포함되지 않는지 테스트"""
+        mock_get_metadata.return_value = {'video_id': 'test123', 'title': 'Test Video'}
+        service = self.make_service()
+
+        service.get_video_metadata('test123')
+        service.get_video_metadata('test123')
+
+        mock_get_metadata.assert_called_once()
+        assert service.coalescing_stats()['metadata']['executions'] == 1
@@ -3,16 +3,19 @@ Formatters 모듈 단위 테스트
 """
 
 import pytest
+import io
 import json
 import xml.etree.ElementTree as ET
 import os
+from unittest.mock import patch
 from formatters import (
     TxtFormatter,
     JsonFormatter,
     XmlFormatter,
     MarkdownFormatter,
     get_formatter,
-    get_available_formatters
+    get_available_formatters,
+    align_translation
 )
 
 
@@ -39,6 +42,16 @@ def sample_transcript():
     ]
 
 
+@pytest.fixture
+def sample_translated_transcript():
+    """테스트용 항목별 번역 자막"""
+    return [
+        {'start': 0.0, 'duration': 2.5, 'text': '첫 번째 자막'},
+        {'start': 2.5, 'duration': 3.0, 'text': '두 번째 자막'},
+        {'start': 5.5, 'duration': 2.0, 'text': '세 번째 자막'}
+    ]
+
+
 @pytest.fixture
 def temp_output_file(tmp_path):
     """임시 출력 파일 경로"""
@@ -279,3 +292,174 @@ class TestFormatterFactory:
         assert isinstance(formatters['2'], JsonFormatter)
         assert isinstance(formatters['3'], XmlFormatter)
         assert isinstance(formatters['4'], MarkdownFormatter)
+
+
+class TestBilingualOutput:
+    """항목별 번역 자막 출력 테스트"""
+
+    def test_align_translation(self, sample_transcript):
+        """번역을 원본 순서에 맞추고 누락된 항목은 None으로 채우는지 테스트"""
+        translated = [{'text': ' 하나 '}, {'text': ''}]
+
+        assert align_translation(sample_transcript, translated) == ['하나', None, None]
+        assert align_translation(sample_transcript, None) == [None, None, None]
+
+    def test_txt_bilingual(self, sample_metadata, sample_transcript,
+                           sample_translated_transcript, temp_output_file):
+        """텍스트 파일에 원문 아래 번역이 출력되는지 테스트"""
+        output_file = temp_output_file('txt')
+        TxtFormatter().save(
+            sample_metadata, sample_transcript, output_file,
+            translated_transcript=sample_translated_transcript
+        )
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+        index = lines.index('[00:02] Second subtitle')
+        assert lines[index + 1].strip() == '두 번째 자막'
+
+    def test_json_bilingual(self, sample_metadata, sample_transcript,
+                            sample_translated_transcript, temp_output_file):
+        """JSON 항목마다 translation 필드가 포함되는지 테스트"""
+        output_file = temp_output_file('json')
+        JsonFormatter().save(
+            sample_metadata, sample_transcript, output_file,
+            translated_transcript=sample_translated_transcript
+        )
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        assert [entry['translation'] for entry in data['transcript']] == [
+            '첫 번째 자막', '두 번째 자막', '세 번째 자막'
+        ]
+        assert data['transcript'][1]['start_seconds'] == 2.5
+
+    def test_json_without_translation(self, sample_metadata, sample_transcript, temp_output_file):
+        """번역이 없으면 translation 필드를 추가하지 않는지 테스트"""
+        output_file = temp_output_file('json')
+        JsonFormatter().save(sample_metadata, sample_transcript, output_file)
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        assert all('translation' not in entry for entry in data['transcript'])
+
+    def test_xml_bilingual(self, sample_metadata, sample_transcript,
+                           sample_translated_transcript, temp_output_file):
+        """XML 항목마다 translation 요소가 포함되는지 테스트"""
+        output_file = temp_output_file('xml')
+        XmlFormatter().save(
+            sample_metadata, sample_transcript, output_file,
+            translated_transcript=sample_translated_transcript
+        )
+
+        entries = ET.parse(output_file).getroot().find('transcript').findall('entry')
+        assert entries[2].find('translation').text == '세 번째 자막'
+
+    def test_markdown_bilingual(self, sample_metadata, sample_transcript,
+                                sample_translated_transcript, temp_output_file):
+        """Markdown 표에 번역 열이 추가되는지 테스트"""
+        output_file = temp_output_file('md')
+        MarkdownFormatter().save(
+            sample_metadata, sample_transcript, output_file,
+            translated_transcript=sample_translated_transcript
+        )
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        assert '| Timestamp | Text | Translation |' in content
+        assert '| `00:00` | First subtitle | 첫 번째 자막 |' in content
+
+
+class TestStreamingRender:
+    """헤더 / 항목 / 푸터 스트리밍 출력 테스트"""
+
+    ALL_FORMATTERS = [TxtFormatter, JsonFormatter, XmlFormatter, MarkdownFormatter]
+
+    @pytest.mark.parametrize('formatter_class', ALL_FORMATTERS)
+    def test_iter_render_matches_save(self, formatter_class, sample_metadata,
+                                      sample_transcript, temp_output_file):
+        """제너레이터 자막으로 만든 스트리밍 출력이 save() 파일과 같은지 테스트"""
+        formatter = formatter_class()
+        output_file = temp_output_file(formatter.file_extension)
+        options = {'summary': 'Summary', 'translation': 'Translated', 'key_topics': ['A', 'B']}
+
+        with patch('formatters._generated_at', return_value='2024-01-01 00:00:00'):
+            formatter.save(sample_metadata, sample_transcript, output_file, **options)
+            streamed = ''.join(formatter.iter_render(
+                sample_metadata, (entry for entry in sample_transcript), **options
+            ))
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            assert streamed == f.read()
+
+    @pytest.mark.parametrize('formatter_class', ALL_FORMATTERS)
+    def test_iter_render_is_lazy(self, formatter_class, sample_metadata, sample_transcript):
+        """자막 항목을 출력할 때마다 하나씩만 소비하는지 테스트"""
+        consumed = []
+
+        def entries():
+            for entry in sample_transcript:
+                consumed.append(entry)
+                yield entry
+
+        chunks = formatter_class().iter_render(sample_metadata, entries())
+
+        next(chunks)  # 헤더
+        assert consumed == []
+        next(chunks)  # 자막 섹션 시작
+        next(chunks)  # 첫 항목
+        assert len(consumed) == 1
+
+    def test_json_stream_empty_transcript(self, sample_metadata):
+        """자막이 비어 있어도 올바른 JSON을 출력하는지 테스트"""
+        data = json.loads(''.join(JsonFormatter().iter_render(sample_metadata, iter([]))))
+
+        assert data['transcript'] == []
+        assert data['metadata']['total_entries'] == 0
+
+    def test_xml_stream_with_translations(self, sample_metadata, sample_transcript):
+        """항목별 번역 iterable이 짧으면 나머지 항목은 번역 없이 출력하는지 테스트"""
+        content = ''.join(XmlFormatter().iter_render(
+            sample_metadata, iter(sample_transcript), translations=iter(['하나'])
+        ))
+
+        entries = ET.fromstring(content.split('\n', 1)[1]).find('transcript').findall('entry')
+        assert entries[0].find('translation').text == '하나'
+        assert entries[1].find('translation') is None
+        assert len(entries) == 3
+
+    @pytest.mark.parametrize('formatter_class', ALL_FORMATTERS)
+    def test_render_matches_save(self, formatter_class, sample_metadata, sample_transcript,
+                                 sample_translated_transcript, temp_output_file):
+        """메모리 버퍼 출력이 save() 파일과 같은지 테스트"""
+        formatter = formatter_class()
+        output_file = temp_output_file(formatter.file_extension)
+
+        with patch('formatters._generated_at', return_value='2024-01-01 00:00:00'):
+            formatter.save(
+                sample_metadata, sample_transcript, output_file,
+                summary='Summary', translated_transcript=sample_translated_transcript
+            )
+            rendered = formatter.render(
+                sample_metadata, sample_transcript,
+                summary='Summary', translated_transcript=sample_translated_transcript
+            )
+
+        with open(output_file, 'r', encoding='utf-8') as f:
+            assert rendered == f.read()
+
+    def test_write_to_stream(self, sample_metadata, sample_transcript):
+        """텍스트 스트림에 항목 단위로 쓰는지 테스트"""
+        stream = io.StringIO()
+
+        MarkdownFormatter().write(
+            stream, sample_metadata, iter(sample_transcript),
+            translations=iter(['하나', '둘', '셋']), bilingual=True
+        )
+
+        assert '| `00:05` | Third subtitle | 셋 |' in stream.getvalue()
+        assert '**Total transcript entries**: 3' in stream.getvalue()
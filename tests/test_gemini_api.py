@@ -6,7 +6,9 @@ Coverage 80% 이상을 목표로 한 포괄적인 테스트
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import os
+import re
 import sys
+import threading
 
 # google.genai 모듈을 mock으로 대체 (새 API 스타일)
 mock_genai_module = MagicMock()
@@ -182,8 +184,9 @@ class TestGeminiClient:
         # side_effect 리셋
         mock_client.models.generate_content.side_effect = None
 
+    @patch('gemini_api.time.sleep')
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'})
-    def test_make_api_call_empty_response(self):
+    def test_make_api_call_empty_response(self, mock_sleep):
         """빈 응답 처리 테스트"""
         mock_response = Mock()
         mock_response.text = ""
@@ -327,7 +330,7 @@ class TestGeminiClient:
     def test_translate_transcript_success(self):
         """자막 번역 성공 테스트"""
         mock_response = Mock()
-        mock_response.text = "Translated transcript"
+        mock_response.text = "[0] 안녕\n[1] 세계"
         mock_client = Mock()
         mock_client.models.generate_content.return_value = mock_response
         mock_genai_module.Client.return_value = mock_client
@@ -337,7 +340,7 @@ class TestGeminiClient:
 
         result = client.translate_transcript(transcript, target_language='ko')
 
-        assert result == "Translated transcript"
+        assert result == "안녕 세계"
 
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'test-key'})
     def test_translate_transcript_empty(self):
@@ -499,3 +502,448 @@ class TestGetGeminiClient:
         client = get_gemini_client()
 
         assert client is None
+
+
+class TestMapReduceSummary:
+    """긴 자막 map-reduce 요약 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """API 호출을 가로챈 Gemini 클라이언트"""
+        from utils.cache import MemoryCache
+        from utils.response_cache import ResponseCache
+
+        with patch('gemini_api.genai'):
+            client = GeminiClient(
+                api_key='test-key',
+                response_cache=ResponseCache(MemoryCache())
+            )
+        client.prompts = []
+
+        def fake_call(prompt, temperature=0.7, max_output_tokens=None):
+            client.prompts.append(prompt)
+            return f"summary {len(client.prompts)}"
+
+        client._generate_content = fake_call
+        return client
+
+    @staticmethod
+    def make_transcript(count):
+        return [
+            {'start': i * 60.0, 'duration': 60.0, 'text': f"sentence number {i} " * 5}
+            for i in range(count)
+        ]
+
+    def test_short_transcript_single_call(self, client):
+        """예산 안의 자막은 잘라내지 않고 한 번에 요약하는지 테스트"""
+        long_text = "A" * 31000
+        summary = client.generate_summary([{'text': long_text, 'start': 0}])
+
+        assert summary == "summary 1"
+        assert len(client.prompts) == 1
+        assert long_text in client.prompts[0]
+
+    def test_long_transcript_map_reduce(self, client):
+        """긴 자막을 구간별로 요약한 뒤 통합하는지 테스트"""
+        transcript = self.make_transcript(40)
+
+        with patch.object(gemini_api.settings, 'summary_chunk_tokens', 200):
+            summary = client.generate_summary(transcript, max_points=3)
+
+        section_prompts = client.prompts[:-1]
+        reduce_prompt = client.prompts[-1]
+        assert len(section_prompts) > 1
+        assert summary == f"summary {len(client.prompts)}"
+        # 마지막 구간의 내용까지 모두 요약에 포함
+        assert any("sentence number 39" in prompt for prompt in section_prompts)
+        # 통합 프롬프트는 구간 시간 범위를 순서대로 포함
+        assert reduce_prompt.index("[00:00:00 - ") < reduce_prompt.index(" - 00:40:00]")
+
+    def test_section_summaries_are_cached(self, client):
+        """같은 자막을 다시 요약하면 구간 요약을 재사용하는지 테스트"""
+        transcript = self.make_transcript(40)
+
+        with patch.object(gemini_api.settings, 'summary_chunk_tokens', 200):
+            client.generate_summary(transcript)
+            first_calls = len(client.prompts)
+            client.generate_summary(transcript)
+
+        # 구간 요약과 통합 단계 모두 응답 캐시를 사용하므로 API를 다시 호출하지 않음
+        assert len(client.prompts) == first_calls
+
+    def test_hierarchical_reduce(self, client):
+        """구간 요약이 예산을 넘으면 여러 단계로 통합하는지 테스트"""
+        transcript = self.make_transcript(200)
+        client._make_api_call = lambda prompt, **kwargs: (
+            client.prompts.append(prompt) or "bullet point text " * 8
+        )
+
+        with patch.object(gemini_api.settings, 'summary_chunk_tokens', 200):
+            client.generate_summary(transcript)
+
+        # 자막 구간 요약 이후, 구간 요약을 묶은 중간 요약 단계가 존재
+        section_prompts = [p for p in client.prompts if "sentence number" in p]
+        regroup_prompts = [
+            p for p in client.prompts
+            if "sentence number" not in p and "핵심 내용:" in p
+        ]
+        assert len(section_prompts) > 1
+        assert len(regroup_prompts) >= 1
+        assert len(regroup_prompts) < len(section_prompts)
+
+    def test_failed_sections_are_skipped(self, client):
+        """일부 구간 요약이 실패해도 나머지로 통합하는지 테스트"""
+        transcript = self.make_transcript(40)
+        calls = []
+
+        def flaky(prompt, **kwargs):
+            calls.append(prompt)
+            return None if len(calls) == 1 else "ok"
+
+        client._make_api_call = flaky
+
+        with patch.object(gemini_api.settings, 'summary_chunk_tokens', 200):
+            summary = client.generate_summary(transcript)
+
+        assert summary == "ok"
+
+
+class TestSegmentTranslation:
+    """항목별 병렬 번역 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """[번호] 형식으로 응답하는 가짜 API를 가진 Gemini 클라이언트"""
+        with patch('gemini_api.genai'):
+            client = GeminiClient(api_key='test-key')
+        client.prompts = []
+        client.skip_ids = set()
+        lock = threading.Lock()
+
+        def fake_call(prompt, temperature=0.7, max_output_tokens=None):
+            with lock:
+                client.prompts.append(prompt)
+            lines = []
+            for match in re.finditer(r'^\[(\d+)\] (.*)$', prompt, re.MULTILINE):
+                entry_id = int(match.group(1))
+                if entry_id in client.skip_ids:
+                    client.skip_ids.discard(entry_id)
+                    continue
+                lines.append(f"[{entry_id}] T({match.group(2)})")
+            return "\n".join(lines)
+
+        client._generate_content = fake_call
+        return client
+
+    @staticmethod
+    def make_transcript(count):
+        return [
+            {'start': i * 2.0, 'duration': 2.0, 'text': f"line {i} " * 5}
+            for i in range(count)
+        ]
+
+    def test_preserves_order_and_timestamps(self, client):
+        """배치로 나누어 번역해도 순서와 타임스탬프를 유지하는지 테스트"""
+        transcript = self.make_transcript(30)
+
+        with patch.object(gemini_api.settings, 'translation_batch_tokens', 50):
+            translated = client.translate_transcript_entries(transcript, 'ko')
+
+        assert len(client.prompts) > 1
+        assert len(translated) == 30
+        for original, entry in zip(transcript, translated):
+            assert entry['start'] == original['start']
+            assert entry['duration'] == original['duration']
+            assert entry['text'] == f"T({' '.join(original['text'].split())})"
+            assert 'id' not in entry
+
+    def test_retries_missing_entries(self, client):
+        """응답에서 누락된 항목만 다시 요청하는지 테스트"""
+        transcript = self.make_transcript(5)
+        client.skip_ids = {3}
+
+        translated = client.translate_transcript_entries(transcript, 'ko')
+
+        assert len(client.prompts) == 2
+        assert '[3] ' in client.prompts[1]
+        assert '[0] ' not in client.prompts[1]
+        assert translated[3]['text'].startswith('T(line 3')
+
+    def test_keeps_original_when_translation_missing(self, client):
+        """끝내 번역되지 않은 항목은 원문을 유지하는지 테스트"""
+        transcript = self.make_transcript(3)
+        client._make_api_call = lambda prompt, **kwargs: "[0] 번역"
+
+        translated = client.translate_transcript_entries(transcript, 'ko')
+
+        assert translated[0]['text'] == '번역'
+        assert translated[2]['text'] == transcript[2]['text']
+
+    def test_translate_transcript_covers_whole_transcript(self, client):
+        """결합 번역 텍스트가 자막 전체를 포함하는지 테스트"""
+        transcript = self.make_transcript(200)
+
+        with patch.object(gemini_api.settings, 'translation_batch_tokens', 100):
+            text = client.translate_transcript(transcript, 'en')
+
+        assert 'T(line 0' in text
+        assert 'T(line 199' in text
+
+
+class TestResponseCache:
+    """LLM 응답 캐시 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """메모리 응답 캐시를 사용하는 Gemini 클라이언트"""
+        from utils.cache import MemoryCache
+        from utils.response_cache import ResponseCache
+
+        with patch('gemini_api.genai'):
+            client = GeminiClient(
+                api_key='test-key',
+                response_cache=ResponseCache(MemoryCache())
+            )
+        client._generate_content = Mock(side_effect=lambda prompt, *args: f"response {prompt}")
+        return client
+
+    def test_repeated_call_uses_cache(self, client):
+        """같은 프롬프트와 설정의 호출은 API를 다시 호출하지 않는지 테스트"""
+        first = client._make_api_call("prompt", temperature=0.3)
+        second = client._make_api_call("prompt", temperature=0.3)
+
+        assert first == second == "response prompt"
+        assert client._generate_content.call_count == 1
+        assert client.response_cache.stats()['hits'] == 1
+
+    def test_key_includes_generation_settings(self, client):
+        """온도나 최대 출력 토큰 수가 다르면 캐시를 공유하지 않는지 테스트"""
+        client._make_api_call("prompt", temperature=0.3)
+        client._make_api_call("prompt", temperature=0.7)
+        client._make_api_call("prompt", temperature=0.3, max_output_tokens=100)
+
+        assert client._generate_content.call_count == 3
+
+    def test_bypass_refreshes_cache(self, client):
+        """use_cache=False면 API를 호출하고 캐시를 새 응답으로 갱신하는지 테스트"""
+        client._make_api_call("prompt")
+        client._generate_content.side_effect = lambda prompt, *args: "fresh"
+
+        assert client._make_api_call("prompt", use_cache=False) == "fresh"
+        assert client._make_api_call("prompt") == "fresh"
+        assert client._generate_content.call_count == 2
+        assert client.response_cache.stats()['bypassed'] == 1
+
+    def test_failed_response_not_cached(self, client):
+        """실패한 호출 결과는 캐시하지 않는지 테스트"""
+        client._generate_content.side_effect = [None, "ok"]
+
+        assert client._make_api_call("prompt") is None
+        assert client._make_api_call("prompt") == "ok"
+
+    def test_concurrent_identical_calls_coalesced(self, client):
+        """캐시에 없는 같은 요청이 동시에 들어오면 API를 한 번만 호출하는지 테스트"""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+
+        def slow_generate(prompt, *args):
+            release.wait(timeout=5)
+            return f"response {prompt}"
+
+        client._generate_content.side_effect = slow_generate
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(client._make_api_call, "prompt") for _ in range(4)]
+            while client.request_flight.in_flight() == 0:
+                time.sleep(0.01)
+            time.sleep(0.1)
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert results == ["response prompt"] * 4
+        assert client._generate_content.call_count == 1
+        assert client.request_flight.stats()['coalesced'] == 3
+
+    def test_bypass_flag_reaches_api_call(self, client):
+        """공개 메서드의 use_cache 플래그가 API 호출까지 전달되는지 테스트"""
+        client.translate_text("hello", 'ko')
+        client.translate_text("hello", 'ko', use_cache=False)
+        client.extract_key_topics([{'text': 'hello', 'start': 0}], use_cache=False)
+        client.extract_key_topics([{'text': 'hello', 'start': 0}])
+
+        assert client._generate_content.call_count == 3
+
+
+class TestRateLimitHandling:
+    """한도 초과 처리 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        """전용 제한기를 사용하는 Gemini 클라이언트"""
+        from utils.rate_limiter import AdaptiveConcurrencyLimiter, RateLimiter
+
+        with patch('gemini_api.genai'):
+            client = GeminiClient(
+                api_key='test-key',
+                retry_count=3,
+                rate_limiter=RateLimiter(
+                    6000, burst=100, tokens_per_minute=10 ** 6, clock=lambda: 0.0
+                ),
+                concurrency_limiter=AdaptiveConcurrencyLimiter(max_limit=8, cooldown=0)
+            )
+        return client
+
+    def test_rate_limit_error_detection(self):
+        """429 오류 판별 테스트"""
+        error = Exception("Too many requests")
+        error.code = 429
+
+        assert gemini_api.is_rate_limit_error(error)
+        assert gemini_api.is_rate_limit_error(Exception("429 RESOURCE_EXHAUSTED"))
+        assert not gemini_api.is_rate_limit_error(Exception("500 Internal error"))
+
+    def test_rate_limit_error_prefers_status_code(self):
+        """상태 코드가 있으면 메시지 대신 상태 코드로 판별하는지 테스트"""
+        server_error = Exception("request req-4291 failed after 429 tokens")
+        server_error.code = 500
+        response_error = Exception("Too many requests")
+        response_error.response = Mock(status_code=429)
+        status_error = Exception("quota")
+        status_error.status = 'RESOURCE_EXHAUSTED'
+
+        assert not gemini_api.is_rate_limit_error(server_error)
+        assert gemini_api.is_rate_limit_error(response_error)
+        assert gemini_api.is_rate_limit_error(status_error)
+
+    def test_rate_limit_message_match_is_whole_word(self):
+        """상태 코드가 없을 때 메시지에 포함된 숫자 429를 한도 초과로 보지 않는지 테스트"""
+        assert not gemini_api.is_rate_limit_error(Exception("video id abc4290 not found"))
+        assert not gemini_api.is_rate_limit_error(Exception("prompt has 14291 tokens"))
+        assert gemini_api.is_rate_limit_error(Exception("HTTP 429: Too Many Requests"))
+
+    def test_rate_limit_wait_does_not_hold_concurrency_slot(self, client):
+        """토큰 한도를 기다리는 동안에는 동시 실행 슬롯을 점유하지 않는지 테스트"""
+        response = Mock()
+        response.text = "ok"
+        client.client.models.generate_content.return_value = response
+        in_flight_during_wait = []
+
+        def acquire(tokens=0, timeout=None):
+            in_flight_during_wait.append(client.concurrency_limiter.in_flight)
+            return True
+
+        client.rate_limiter.acquire = acquire
+        with patch('gemini_api.types'):
+            assert client._generate_content("prompt") == "ok"
+
+        assert in_flight_during_wait == [0]
+
+    def test_empty_response_backs_off(self, client):
+        """빈 응답은 바로 재시도하지 않고 백오프 후 재시도하는지 테스트"""
+        empty = Mock()
+        empty.text = ""
+        response = Mock()
+        response.text = "ok"
+        client.client.models.generate_content.side_effect = [empty, response]
+
+        with patch('gemini_api.types'), \
+             patch('gemini_api.time.sleep') as mock_sleep, \
+             patch('gemini_api.backoff_delay', return_value=0.25) as mock_backoff:
+            result = client._generate_content("prompt")
+
+        assert result == "ok"
+        mock_backoff.assert_called_once_with(0, client.retry_delay, gemini_api.settings.gemini_backoff_max)
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_throttled_call_backs_off_and_shrinks_concurrency(self, client):
+        """429 응답 시 지터 백오프 후 재시도하고 동시 실행 한도를 줄이는지 테스트"""
+        response = Mock()
+        response.text = "ok"
+        client.client.models.generate_content.side_effect = [
+            Exception("429 RESOURCE_EXHAUSTED"),
+            response
+        ]
+
+        with patch('gemini_api.types'), \
+             patch('gemini_api.time.sleep') as mock_sleep, \
+             patch('gemini_api.backoff_delay', return_value=0.25) as mock_backoff:
+            result = client._generate_content("prompt", temperature=0.3)
+
+        assert result == "ok"
+        mock_backoff.assert_called_once_with(0, client.retry_delay, gemini_api.settings.gemini_backoff_max)
+        mock_sleep.assert_called_once_with(0.25)
+        stats = client.limiter_stats()['concurrency']
+        assert stats['decreases'] == 1
+        assert stats['in_flight'] == 0
+
+    def test_server_errors_keep_concurrency_limit(self, client):
+        """429가 아닌 실패와 빈 응답은 동시 실행 한도를 늘리지 않고, 성공만 늘리는지 테스트"""
+        from utils.rate_limiter import AdaptiveConcurrencyLimiter
+
+        client.concurrency_limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=2)
+        empty = Mock()
+        empty.text = ""
+        response = Mock()
+        response.text = "ok"
+        client.client.models.generate_content.side_effect = [
+            Exception("503 Service Unavailable"),
+            empty,
+            response
+        ]
+
+        with patch('gemini_api.types'), patch('gemini_api.time.sleep'):
+            result = client._generate_content("prompt")
+
+        assert result == "ok"
+        stats = client.limiter_stats()['concurrency']
+        assert stats['increases'] == 1
+        assert stats['decreases'] == 0
+        assert client.concurrency_limiter.limit == pytest.approx(2.5)
+
+    def test_charges_estimated_tokens(self, client):
+        """프롬프트와 최대 출력 토큰 수만큼 토큰 한도를 소비하는지 테스트"""
+        response = Mock()
+        response.text = "ok"
+        client.client.models.generate_content.return_value = response
+
+        with patch('gemini_api.types'):
+            client._generate_content("a" * 400, max_output_tokens=100)
+
+        stats = client.limiter_stats()['rate_limiter']
+        assert stats['tokens_per_minute'] - stats['available_tokens'] == 200
+
+
+class TestClientLifecycle:
+    """연결 풀, 워밍업, 종료 테스트"""
+
+    def test_client_uses_connection_pool(self):
+        """연결 풀 크기를 지정한 HTTP 옵션으로 클라이언트를 생성하는지 테스트"""
+        with patch('gemini_api.genai') as mock_genai, \
+             patch('gemini_api.types') as mock_types:
+            GeminiClient(api_key='test-key')
+
+        limits = mock_types.HttpOptions.call_args.kwargs['client_args']['limits']
+        assert limits.max_connections == gemini_api.settings.gemini_max_connections
+        assert mock_genai.Client.call_args.kwargs['http_options'] is mock_types.HttpOptions.return_value
+
+    def test_warm_up_failure_is_ignored(self):
+        """워밍업 실패가 예외로 전파되지 않는지 테스트"""
+        with patch('gemini_api.genai'):
+            client = GeminiClient(api_key='test-key')
+        client.client.models.get.side_effect = Exception("network down")
+
+        client.warm_up()
+
+        client.client.models.get.assert_called_once_with(model=client.model_name)
+
+    def test_close_closes_http_client(self):
+        """종료 시 SDK 클라이언트의 연결을 닫는지 테스트"""
+        with patch('gemini_api.genai'):
+            client = GeminiClient(api_key='test-key')
+
+        client.close()
+
+        client.client.close.assert_called_once()
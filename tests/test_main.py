@@ -0,0 +1,228 @@
+"""
+CLI(main) 테스트
+"""
+
+import io
+import json
+import sys
+import time
+from argparse import Namespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+import main
+from utils.playlist_index import PlaylistIndex, PENDING
+from utils.run_manifest import DONE
+
+
+def make_args(**overrides):
+    """main.parse_arguments 결과와 같은 형태의 인자 객체"""
+    values = {
+        'lang': ['ko', 'en'], 'summary': False, 'translate': None, 'topics': None,
+        'max_videos': None, 'workers': 1, 'resume': False, 'sync': False, 'manifest': None,
+    }
+    values.update(overrides)
+    return Namespace(**values)
+
+
+def playlist(*video_ids):
+    return [
+        {'id': video_id, 'url': f'url-{video_id}', 'title': video_id.upper(), 'position': position}
+        for position, video_id in enumerate(video_ids)
+    ]
+
+
+class TestProcessVideosConcurrently:
+    """--workers 동시 처리 테스트"""
+
+    @staticmethod
+    def fake_process(delays=None, failures=(), errors=()):
+        """진행 상황을 여러 줄로 출력하는 process_single_video 대체 함수"""
+        delays = delays or {}
+
+        def process(url, video_id, formatter, args, gemini_client=None, video_index=None,
+                    total_videos=None, youtube_service=None, manifest=None, output=None):
+            print(f"start {video_id}", file=output)
+            time.sleep(delays.get(video_id, 0))
+            if video_id in errors:
+                raise RuntimeError(f"unexpected {video_id}")
+            print(f"end {video_id}", file=output)
+            return video_id not in failures
+
+        return process
+
+    def test_output_grouped_per_video_in_playlist_order(self):
+        """비디오별 출력이 섞이지 않고 끝난 순서와 관계없이 재생목록 순서대로 출력되는지 테스트"""
+        output = io.StringIO()
+        with patch('main.process_single_video', side_effect=self.fake_process({'a': 0.3, 'b': 0.1})):
+            success = main.process_videos_concurrently(
+                playlist('a', 'b', 'c'), Mock(), make_args(), workers=3, output=output
+            )
+
+        assert success == 3
+        assert output.getvalue().splitlines() == [
+            'start a', 'end a', "⏱  진행: 1/3 완료",
+            'start b', 'end b', "⏱  진행: 2/3 완료",
+            'start c', 'end c', "⏱  진행: 3/3 완료",
+        ]
+
+    def test_videos_run_concurrently(self):
+        """출력은 순서대로 보류되어도 비디오 처리는 동시에 진행되는지 테스트"""
+        started = time.monotonic()
+        with patch('main.process_single_video',
+                   side_effect=self.fake_process({'a': 0.3, 'b': 0.3, 'c': 0.3})):
+            main.process_videos_concurrently(
+                playlist('a', 'b', 'c'), Mock(), make_args(), workers=3, output=io.StringIO()
+            )
+
+        assert time.monotonic() - started < 0.8
+
+    def test_failures_counted(self):
+        """실패한 비디오는 성공 수에서 빠지는지 테스트"""
+        with patch('main.process_single_video', side_effect=self.fake_process(failures={'b'})):
+            success = main.process_videos_concurrently(
+                playlist('a', 'b', 'c'), Mock(), make_args(), workers=2, output=io.StringIO()
+            )
+
+        assert success == 2
+
+    def test_does_not_replace_stdout(self, capsys):
+        """워커 실행 중 sys.stdout을 바꾸지 않아 다른 스레드의 출력이 그대로 나가는지 테스트"""
+        original_stdout = sys.stdout
+        seen = []
+
+        def process(*args, output=None, **kwargs):
+            seen.append(sys.stdout)
+            print("other thread output")  # 출력 스트림을 거치지 않는 출력
+            print("video output", file=output)
+            return True
+
+        output = io.StringIO()
+        with patch('main.process_single_video', side_effect=process):
+            main.process_videos_concurrently(playlist('a', 'b'), Mock(), make_args(), workers=2, output=output)
+
+        assert all(stream is original_stdout for stream in seen)
+        assert capsys.readouterr().out.count("other thread output") == 2
+        assert output.getvalue().count("video output") == 2
+
+    def test_exception_propagates_and_stdout_restored(self):
+        """워커에서 예외가 나면 전파되고 sys.stdout이 원래대로인지 테스트"""
+        original_stdout = sys.stdout
+        with patch('main.process_single_video', side_effect=self.fake_process(errors={'b'})):
+            with pytest.raises(RuntimeError):
+                main.process_videos_concurrently(
+                    playlist('a', 'b', 'c'), Mock(), make_args(), workers=2, output=io.StringIO()
+                )
+
+        assert sys.stdout is original_stdout
+
+
+class TestSyncCli:
+    """main.py --sync 실행 테스트 (재생목록 목록과 YouTube 서비스는 모의 객체)"""
+
+    PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLsync"
+
+    @pytest.fixture
+    def workdir(self, tmp_path, monkeypatch):
+        """출력 파일을 임시 디렉토리에 만들도록 작업 디렉토리를 바꿉니다."""
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    @staticmethod
+    def listing(*items):
+        """(비디오 ID, 제목) 목록으로 재생목록 목록을 만듭니다."""
+        return [
+            {'id': video_id, 'url': f'url-{video_id}', 'title': title, 'position': position}
+            for position, (video_id, title) in enumerate(items)
+        ]
+
+    def run_sync(self, index_path, videos, failures=(), on_fetch=None):
+        """
+        --sync로 main()을 실행합니다.
+
+        Returns:
+            메타데이터를 가져온(다시 처리한) 비디오 ID 목록
+        """
+        titles = {video['id']: video['title'] for video in videos}
+        fetched = []
+
+        def get_video_metadata(video_id):
+            if on_fetch is not None:
+                on_fetch(video_id)
+            fetched.append(video_id)
+            if video_id in failures:
+                raise RuntimeError("network error")
+            return {'video_id': video_id, 'title': titles[video_id], 'channel': 'Channel'}
+
+        service = Mock()
+        service.get_video_metadata.side_effect = get_video_metadata
+        service.get_transcript.return_value = [{'start': 0.0, 'duration': 1.0, 'text': 'Hello'}]
+        result = {
+            'type': 'playlist',
+            'playlist_info': {
+                'playlist_id': 'PLsync', 'title': 'Sync', 'uploader': 'Channel',
+                'video_count': len(videos)
+            },
+            'videos': videos,
+        }
+        argv = ['main.py', self.PLAYLIST_URL, '2', '--sync', '--manifest', index_path]
+
+        with patch.object(sys, 'argv', argv), \
+                patch('main.process_playlist_or_video', return_value=result), \
+                patch('core.youtube_service.YouTubeService', return_value=service):
+            main.main()
+        return fetched
+
+    @staticmethod
+    def load_index(index_path):
+        return PlaylistIndex.load(index_path, {
+            'format': '2', 'lang': ['ko', 'en'], 'summary': False, 'translate': None, 'topics': None
+        })
+
+    def test_refetches_only_added_changed_failed_and_missing(self, workdir):
+        """두 번째 실행에서 추가, 제목 변경, 실패, 출력 파일이 사라진 비디오만 다시 처리하는지 테스트"""
+        index_path = str(workdir / "index.json")
+        first = self.listing(('a', 'A'), ('b', 'B'), ('c', 'C'), ('d', 'D'))
+
+        fetched = self.run_sync(index_path, first, failures={'c'})
+
+        assert fetched == ['a', 'b', 'c', 'd']
+        index = self.load_index(index_path)
+        assert [video_id for video_id in 'abcd' if index.is_complete(video_id)] == ['a', 'b', 'd']
+
+        (workdir / index.videos['d']['output_file']).unlink()
+        second = self.listing(('e', 'E'), ('a', 'A'), ('b', 'B (updated)'), ('c', 'C'), ('d', 'D'))
+
+        fetched = self.run_sync(index_path, second)
+
+        assert fetched == ['e', 'b', 'c', 'd']
+        index = self.load_index(index_path)
+        assert all(index.is_complete(video_id) for video_id in 'abcde')
+        assert {video_id: entry['position'] for video_id, entry in index.videos.items()} == {
+            'e': 0, 'a': 1, 'b': 2, 'c': 3, 'd': 4
+        }
+
+        # 변경이 없으면 아무것도 다시 처리하지 않음
+        assert self.run_sync(index_path, second) == []
+
+    def test_index_saved_after_apply_listing(self, workdir):
+        """비디오를 처리하기 전에 새 목록(위치, 삭제)이 인덱스 파일에 저장되는지 테스트"""
+        index_path = str(workdir / "index.json")
+        self.run_sync(index_path, self.listing(('a', 'A'), ('b', 'B'), ('c', 'C')))
+        snapshots = []
+
+        def read_index(video_id):
+            with open(index_path, encoding='utf-8') as f:
+                snapshots.append(json.load(f)['videos'])
+
+        fetched = self.run_sync(
+            index_path, self.listing(('new', 'New'), ('c', 'C'), ('a', 'A')), on_fetch=read_index
+        )
+
+        assert fetched == ['new']
+        saved = snapshots[0]
+        assert set(saved) == {'new', 'c', 'a'}
+        assert [saved[video_id]['position'] for video_id in ('new', 'c', 'a')] == [0, 1, 2]
+        assert saved['new']['status'] == PENDING
+        assert saved['a']['status'] == DONE
@@ -146,6 +146,113 @@ class TestPlaylistHandler:
         assert metadata['video_count'] == 2
 
 
+class TestIterPlaylistVideos:
+    """재생목록 지연 조회 테스트"""
+
+    @staticmethod
+    def make_ydl(info):
+        mock_ydl = Mock()
+        mock_ydl.extract_info.return_value = info
+        return mock_ydl
+
+    def test_stops_consuming_entries_at_limit(self):
+        """limit개를 반환하면 남은 항목(다음 페이지)을 읽지 않는지 테스트"""
+        consumed = []
+
+        def entries():
+            for i in range(5000):
+                consumed.append(i)
+                yield {'id': f'video{i}', 'title': f'Video {i}'}
+
+        mock_ydl = self.make_ydl({'_type': 'playlist', 'entries': entries()})
+
+        videos = list(PlaylistHandler.iter_playlist_videos(
+            "https://www.youtube.com/playlist?list=PLtest", ydl=mock_ydl, limit=10
+        ))
+
+        assert [v['id'] for v in videos] == [f'video{i}' for i in range(10)]
+        assert len(consumed) == 10
+        mock_ydl.extract_info.assert_called_once_with(
+            "https://www.youtube.com/playlist?list=PLtest", download=False, process=False
+        )
+
+    def test_offset_skips_invalid_entries(self):
+        """offset이 유효한 비디오 기준으로 적용되고 position은 재생목록 위치인지 테스트"""
+        mock_ydl = self.make_ydl({
+            '_type': 'playlist',
+            'entries': [
+                {'id': 'video0'},
+                None,
+                {'id': 'video2'},
+                {'id': 'video3'},
+                {'id': 'video4'},
+            ]
+        })
+
+        videos = list(PlaylistHandler.iter_playlist_videos(
+            "https://www.youtube.com/playlist?list=PLtest", ydl=mock_ydl, offset=1, limit=2
+        ))
+
+        assert [(v['id'], v['position']) for v in videos] == [('video2', 2), ('video3', 3)]
+
+    def test_follows_url_result(self):
+        """재생목록 URL로 위임된 결과를 한 번 더 해석하는지 테스트"""
+        mock_ydl = Mock()
+        mock_ydl.extract_info.side_effect = [
+            {'_type': 'url', 'url': 'https://www.youtube.com/playlist?list=PLtest'},
+            {'_type': 'playlist', 'entries': [{'id': 'video1'}]},
+        ]
+
+        videos = list(PlaylistHandler.iter_playlist_videos(
+            "https://www.youtube.com/watch?v=video1&list=PLtest", ydl=mock_ydl
+        ))
+
+        assert [v['id'] for v in videos] == ['video1']
+        assert mock_ydl.extract_info.call_count == 2
+
+    def test_not_playlist(self):
+        """재생목록이 아니면 아무것도 반환하지 않는지 테스트"""
+        mock_ydl = self.make_ydl({'_type': 'video', 'id': 'video1'})
+
+        videos = list(PlaylistHandler.iter_playlist_videos(
+            "https://www.youtube.com/watch?v=video1", ydl=mock_ydl
+        ))
+
+        assert videos == []
+
+    def test_entries_error_propagates(self):
+        """항목 조회 중 오류가 나면 이미 반환한 비디오 이후에 예외가 전파되는지 테스트"""
+        def entries():
+            yield {'id': 'video0'}
+            yield {'id': 'video1'}
+            raise RuntimeError("page 2 request failed")
+
+        mock_ydl = self.make_ydl({'_type': 'playlist', 'entries': entries()})
+        received = []
+
+        with pytest.raises(RuntimeError, match="page 2 request failed"):
+            for video in PlaylistHandler.iter_playlist_videos(
+                "https://www.youtube.com/playlist?list=PLtest", ydl=mock_ydl
+            ):
+                received.append(video['id'])
+
+        assert received == ['video0', 'video1']
+
+    @patch('playlist_handler.yt_dlp.YoutubeDL')
+    def test_creates_ydl_when_not_given(self, mock_ydl_class):
+        """ydl이 없으면 새 YoutubeDL을 만들어 사용하는지 테스트"""
+        mock_ydl_class.return_value.__enter__.return_value = self.make_ydl({
+            '_type': 'playlist',
+            'entries': [{'id': 'video1'}, {'id': 'video2'}]
+        })
+
+        videos = list(PlaylistHandler.iter_playlist_videos(
+            "https://www.youtube.com/playlist?list=PLtest", limit=1
+        ))
+
+        assert [v['id'] for v in videos] == ['video1']
+
+
 class TestProcessPlaylistOrVideo:
     """process_playlist_or_video 함수 테스트"""
 
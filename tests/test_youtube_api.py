@@ -3,15 +3,26 @@ YouTube API 모듈 단위 테스트
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from youtube_api import (
     extract_video_id,
     format_timestamp,
     get_video_metadata,
-    get_transcript_with_timestamps
+    get_transcript_with_timestamps,
+    select_transcript_track
 )
 
 
+def make_track(language_code, is_generated, entries=None):
+    """테스트용 자막 트랙 생성"""
+    return SimpleNamespace(
+        language_code=language_code,
+        is_generated=is_generated,
+        fetch=Mock(return_value=entries or [])
+    )
+
+
 class TestExtractVideoId:
     """extract_video_id 함수 테스트"""
 
@@ -147,13 +158,14 @@ class TestGetTranscriptWithTimestamps:
     """get_transcript_with_timestamps 함수 테스트"""
 
     @patch('youtube_api.YouTubeTranscriptApi')
-    def test_get_transcript_success_old_api(self, mock_api):
-        """구버전 API로 자막 추출 성공 테스트"""
+    def test_get_transcript_success(self, mock_api):
+        """자막 트랙 목록 조회 후 자막 추출 성공 테스트"""
         # Mock 설정
-        mock_api.get_transcript.return_value = [
+        track = make_track('en', False, [
             {'start': 0.0, 'duration': 2.5, 'text': 'Hello'},
             {'start': 2.5, 'duration': 3.0, 'text': 'World'}
-        ]
+        ])
+        mock_api.return_value.list.return_value = [track]
 
         # 테스트 실행
         transcript = get_transcript_with_timestamps('test_video_id')
@@ -162,30 +174,81 @@ class TestGetTranscriptWithTimestamps:
         assert len(transcript) == 2
         assert transcript[0]['text'] == 'Hello'
         assert transcript[1]['text'] == 'World'
+        assert transcript.language_code == 'en'
+        assert transcript.is_generated is False
 
     @patch('youtube_api.YouTubeTranscriptApi')
     def test_get_transcript_no_available(self, mock_api):
         """자막이 없는 경우 테스트"""
-        # Mock 설정 - 모든 메서드가 실패하도록
-        mock_api.get_transcript.side_effect = Exception("No transcript")
+        # Mock 설정 - 사용 가능한 트랙 없음
+        mock_api.return_value.list.return_value = []
 
         # 테스트 실행
         transcript = get_transcript_with_timestamps('test_video_id')
 
-        # 검증 - 빈 리스트가 반환되어야 함
+        # 검증 - 자막 없음으로 표시된 빈 리스트가 반환되어야 함
+        assert transcript == []
+        assert transcript.missing is True
+
+    @patch('youtube_api.YouTubeTranscriptApi')
+    def test_get_transcript_list_error_is_not_missing(self, mock_api):
+        """일시적 오류는 자막 없음으로 표시하지 않는지 테스트"""
+        mock_api.return_value.list.side_effect = Exception("Network error")
+
+        transcript = get_transcript_with_timestamps('test_video_id')
+
         assert transcript == []
+        assert transcript.missing is False
 
     @patch('youtube_api.YouTubeTranscriptApi')
     def test_get_transcript_with_language_preference(self, mock_api):
         """언어 선호도를 사용한 자막 추출 테스트"""
         # Mock 설정
-        mock_api.get_transcript.return_value = [
+        ko_track = make_track('ko', False, [
             {'start': 0.0, 'duration': 2.5, 'text': '안녕하세요'}
-        ]
+        ])
+        en_track = make_track('en', False)
+        mock_api.return_value.list.return_value = [en_track, ko_track]
 
         # 테스트 실행
         transcript = get_transcript_with_timestamps('test_video_id', languages=['ko', 'en'])
 
-        # 검증
+        # 검증 - 선택된 트랙 하나만 가져와야 함
         assert len(transcript) == 1
         assert transcript[0]['text'] == '안녕하세요'
+        ko_track.fetch.assert_called_once()
+        en_track.fetch.assert_not_called()
+
+
+class TestSelectTranscriptTrack:
+    """select_transcript_track 함수 테스트"""
+
+    def test_language_priority(self):
+        """언어 우선순위 순서대로 선택하는지 테스트"""
+        tracks = [make_track('en', False), make_track('ko', False)]
+
+        assert select_transcript_track(tracks, ['ko', 'en']).language_code == 'ko'
+        assert select_transcript_track(tracks, ['en', 'ko']).language_code == 'en'
+
+    def test_prefer_manual(self):
+        """같은 언어에서 수동/자동 자막 선호 여부를 반영하는지 테스트"""
+        tracks = [make_track('en', True), make_track('en', False)]
+
+        assert select_transcript_track(tracks, ['en'], prefer_manual=True).is_generated is False
+        assert select_transcript_track(tracks, ['en'], prefer_manual=False).is_generated is True
+
+    def test_base_language_match(self):
+        """지역 코드가 붙은 트랙을 기본 언어로 일치시키는지 테스트"""
+        tracks = [make_track('ja', False), make_track('en-US', False)]
+
+        assert select_transcript_track(tracks, ['en']).language_code == 'en-US'
+
+    def test_fallback_to_first_available(self):
+        """요청한 언어가 없으면 사용 가능한 트랙으로 대체하는지 테스트"""
+        tracks = [make_track('ja', True), make_track('fr', False)]
+
+        assert select_transcript_track(tracks, ['ko']).language_code == 'fr'
+
+    def test_no_tracks(self):
+        """트랙이 없으면 None을 반환하는지 테스트"""
+        assert select_transcript_track([], ['ko']) is None
@@ -2,10 +2,13 @@
 비디오 스크래퍼 도구 테스트
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
 from tools.video_scraper import VideoScraperTool
+from utils.transcript import Transcript
 
 
 class TestVideoScraperTool:
@@ -36,6 +39,42 @@ class TestVideoScraperTool:
         assert 'transcript' in result
         assert result['video_id'] == 'test123'
 
+    @patch('tools.video_scraper.YouTubeService')
+    def test_run_result_is_json_serializable(self, mock_service_class):
+        """열 기반 Transcript가 딕셔너리 리스트로 변환되어 결과를 JSON으로 직렬화할 수 있는지 테스트"""
+        mock_service = Mock()
+        mock_service.get_video_info.return_value = {
+            'metadata': {'video_id': 'test123', 'title': 'Test Video'},
+            'transcript': Transcript([{'start': 0.0, 'duration': 1.5, 'text': 'Hello'}]),
+            'translated_transcript': Transcript([{'start': 0.0, 'duration': 1.5, 'text': '안녕'}]),
+            'video_id': 'test123'
+        }
+        mock_service_class.return_value = mock_service
+
+        tool = VideoScraperTool()
+        result = tool.run(video_url="https://www.youtube.com/watch?v=test123")
+
+        data = json.loads(json.dumps(result))
+        assert isinstance(result['transcript'], list)
+        assert data['transcript'][0]['text'] == 'Hello'
+        assert data['transcript'][0]['duration'] == 1.5
+        assert data['translated_transcript'][0]['text'] == '안녕'
+
+    @patch('tools.video_scraper.YouTubeService')
+    def test_get_transcript_only_returns_list(self, mock_service_class):
+        """자막만 가져올 때 Transcript를 딕셔너리 리스트로 반환하는지 테스트"""
+        mock_service = Mock()
+        mock_service.extract_video_id.return_value = "test123"
+        mock_service.get_transcript.return_value = Transcript([{'start': 0.0, 'duration': 1.5, 'text': 'Hello'}])
+        mock_service_class.return_value = mock_service
+
+        tool = VideoScraperTool()
+        transcript = tool.get_transcript_only("https://www.youtube.com/watch?v=test123")
+
+        assert isinstance(transcript, list)
+        assert transcript[0]['text'] == 'Hello'
+        assert json.dumps(transcript)
+
     def test_run_no_url(self):
         """URL 없이 실행 시 오류 테스트"""
         tool = VideoScraperTool()
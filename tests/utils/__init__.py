@@ -0,0 +1,3 @@
+"""
+Utils 테스트 패키지
+"""
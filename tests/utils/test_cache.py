@@ -0,0 +1,216 @@
+"""
+캐시 백엔드 테스트
+"""
+
+import pytest
+from unittest.mock import patch
+
+from utils.cache import MemoryCache, SQLiteCache, FileCache, TieredCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """임시 디렉토리의 SQLite 캐시"""
+    cache = SQLiteCache(str(tmp_path / "cache.db"))
+    yield cache
+    cache.close()
+
+
+class TestSQLiteCache:
+    """SQLiteCache 테스트"""
+
+    def test_set_and_get(self, cache):
+        """저장 및 조회 테스트"""
+        cache.set("key", {"text": "안녕하세요", "items": [1, 2, 3]})
+
+        assert cache.get("key") == {"text": "안녕하세요", "items": [1, 2, 3]}
+        assert cache.hits == 1
+
+    def test_get_missing_key(self, cache):
+        """존재하지 않는 키 조회 테스트"""
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_ttl_expiration(self, cache):
+        """TTL 만료 테스트"""
+        with patch('utils.cache.time.time', return_value=1000.0):
+            cache.set("key", "value", ttl=10)
+
+        with patch('utils.cache.time.time', return_value=1005.0):
+            assert cache.get("key") == "value"
+
+        with patch('utils.cache.time.time', return_value=1011.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_size_based_lru_eviction(self, tmp_path):
+        """크기 제한 초과 시 LRU 제거 테스트"""
+        probe = SQLiteCache(":memory:")
+        probe.set("probe", "x" * 10)
+        entry_size = probe.total_size()
+        probe.close()
+
+        cache = SQLiteCache(str(tmp_path / "lru.db"), max_bytes=entry_size * 2)
+
+        with patch('utils.cache.time.time', return_value=1.0):
+            cache.set("a", "x" * 10)
+        with patch('utils.cache.time.time', return_value=2.0):
+            cache.set("b", "y" * 10)
+        with patch('utils.cache.time.time', return_value=3.0):
+            cache.get("a")  # a를 최근 사용 항목으로 갱신
+        with patch('utils.cache.time.time', return_value=4.0):
+            cache.set("c", "z" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "x" * 10
+        assert cache.get("c") == "z" * 10
+        assert cache.evictions == 1
+        cache.close()
+
+    def test_persistence(self, tmp_path):
+        """재시작 후에도 값이 유지되는지 테스트"""
+        path = str(tmp_path / "persist.db")
+        first = SQLiteCache(path)
+        first.set("key", [1, 2])
+        first.close()
+
+        second = SQLiteCache(path)
+        assert second.get("key") == [1, 2]
+        second.close()
+
+    def test_stats(self, cache):
+        """통계 테스트"""
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("missing")
+
+        stats = cache.stats()
+
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert stats['entries'] == 1
+        assert stats['size_bytes'] > 0
+
+
+class TestFileCache:
+    """FileCache 테스트"""
+
+    def test_set_and_get(self, tmp_path):
+        """저장 및 조회 테스트"""
+        cache = FileCache(str(tmp_path / "files"))
+        cache.set("key", {"text": "안녕하세요"})
+
+        assert cache.get("key") == {"text": "안녕하세요"}
+        assert cache.get("missing") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_ttl_expiration(self, tmp_path):
+        """TTL 만료 시 파일을 삭제하는지 테스트"""
+        cache = FileCache(str(tmp_path / "files"))
+        with patch('utils.cache.time.time', return_value=1000.0):
+            cache.set("key", "value", ttl=10)
+
+        with patch('utils.cache.time.time', return_value=1011.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_size_based_lru_eviction(self, tmp_path):
+        """크기 제한 초과 시 가장 오래 사용되지 않은 파일을 제거하는지 테스트"""
+        probe = FileCache(str(tmp_path / "probe"))
+        probe.set("probe", "x" * 10)
+        entry_size = probe.total_size()
+
+        cache = FileCache(str(tmp_path / "files"), max_bytes=entry_size * 2)
+        with patch('utils.cache.time.time', return_value=1.0):
+            cache.set("a", "x" * 10)
+        with patch('utils.cache.time.time', return_value=2.0):
+            cache.set("b", "y" * 10)
+        with patch('utils.cache.time.time', return_value=3.0):
+            cache.get("a")  # a를 최근 사용 항목으로 갱신
+        with patch('utils.cache.time.time', return_value=4.0):
+            cache.set("c", "z" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "x" * 10
+        assert cache.get("c") == "z" * 10
+        assert cache.evictions == 1
+
+    def test_corrupt_file_is_miss(self, tmp_path):
+        """손상된 파일은 미스로 처리하고 삭제하는지 테스트"""
+        cache = FileCache(str(tmp_path / "files"))
+        cache.set("key", "value")
+        with open(cache._path("key"), 'wb') as f:
+            f.write(b"not compressed")
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+
+class TestMemoryCache:
+    """MemoryCache 테스트"""
+
+    def test_set_and_get(self):
+        """저장 및 조회 테스트"""
+        cache = MemoryCache()
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+        assert cache.stats()['hit_rate'] == 0.5
+
+    def test_lru_eviction(self):
+        """최대 항목 수 초과 시 LRU 제거 테스트"""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_ttl_expiration(self):
+        """TTL 만료 테스트"""
+        cache = MemoryCache()
+        with patch('utils.cache.time.time', return_value=1000.0):
+            cache.set("key", "value", ttl=10)
+        with patch('utils.cache.time.time', return_value=1011.0):
+            assert cache.get("key") is None
+
+
+class TestTieredCache:
+    """TieredCache 테스트"""
+
+    def test_disk_hit_promotes_to_memory(self, cache):
+        """디스크 적중 시 메모리로 승격되는지 테스트"""
+        cache.set("key", {"title": "Test"}, ttl=100)
+        tiered = TieredCache(MemoryCache(), cache)
+
+        assert tiered.get("key") == {"title": "Test"}
+        assert tiered.memory.get("key") == {"title": "Test"}
+
+    def test_promotion_keeps_remaining_ttl(self, cache):
+        """승격된 항목이 디스크의 남은 만료 시간을 유지하는지 테스트"""
+        with patch('utils.cache.time.time', return_value=1000.0):
+            cache.set("key", "value", ttl=100)
+        tiered = TieredCache(MemoryCache(), cache)
+
+        with patch('utils.cache.time.time', return_value=1050.0):
+            assert tiered.get("key") == "value"
+
+        with patch('utils.cache.time.time', return_value=1101.0):
+            assert tiered.memory.get("key") is None
+
+    def test_set_writes_both_tiers(self, cache):
+        """저장 시 두 단계에 모두 기록되는지 테스트"""
+        tiered = TieredCache(MemoryCache(), cache)
+        tiered.set("key", [1, 2, 3])
+
+        assert tiered.memory.get("key") == [1, 2, 3]
+        assert cache.get("key") == [1, 2, 3]
@@ -0,0 +1,92 @@
+"""
+자막 분할 유틸리티 테스트
+"""
+
+import pytest
+
+from utils.chunking import chunk_transcript, estimate_tokens, format_time_range
+
+
+def make_transcript(count, text='hello world', duration=5.0):
+    """테스트용 자막 생성"""
+    return [
+        {'start': i * duration, 'duration': duration, 'text': f"{text} {i}"}
+        for i in range(count)
+    ]
+
+
+class TestEstimateTokens:
+    """estimate_tokens 함수 테스트"""
+
+    def test_empty(self):
+        """빈 텍스트 테스트"""
+        assert estimate_tokens('') == 0
+
+    def test_ascii(self):
+        """ASCII 텍스트는 약 4자당 1토큰으로 추정하는지 테스트"""
+        assert estimate_tokens('a' * 400) == 100
+
+    def test_non_ascii_counts_more(self):
+        """한글은 같은 글자 수의 영문보다 많은 토큰으로 추정하는지 테스트"""
+        assert estimate_tokens('가' * 100) > estimate_tokens('a' * 100)
+
+
+class TestChunkTranscript:
+    """chunk_transcript 함수 테스트"""
+
+    def test_single_chunk(self):
+        """예산 안에 들어가면 하나의 구간으로 반환하는지 테스트"""
+        chunks = chunk_transcript(make_transcript(3), max_tokens=1000)
+
+        assert len(chunks) == 1
+        assert chunks[0].start == 0.0
+        assert chunks[0].end == 15.0
+
+    def test_chunks_respect_budget_and_order(self):
+        """구간이 예산을 넘지 않고 자막 순서와 항목을 보존하는지 테스트"""
+        transcript = make_transcript(50)
+        chunks = chunk_transcript(transcript, max_tokens=20)
+
+        assert len(chunks) > 1
+        assert all(chunk.tokens <= 20 for chunk in chunks)
+        assert [entry for chunk in chunks for entry in chunk.entries] == transcript
+
+    def test_boundaries_are_timestamp_aligned(self):
+        """구간 경계가 자막 항목의 시작/종료 시간과 일치하는지 테스트"""
+        chunks = chunk_transcript(make_transcript(50), max_tokens=20)
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert previous.end == current.start
+            assert current.start == current.entries[0]['start']
+
+    def test_oversized_entry_gets_own_chunk(self):
+        """예산보다 큰 항목은 단독 구간이 되는지 테스트"""
+        transcript = [
+            {'start': 0.0, 'duration': 1.0, 'text': 'short'},
+            {'start': 1.0, 'duration': 1.0, 'text': 'x' * 400},
+            {'start': 2.0, 'duration': 1.0, 'text': 'short'},
+        ]
+
+        chunks = chunk_transcript(transcript, max_tokens=10)
+
+        assert [len(chunk.entries) for chunk in chunks] == [1, 1, 1]
+
+    def test_skips_empty_entries(self):
+        """텍스트가 없는 항목은 건너뛰는지 테스트"""
+        transcript = [{'start': 0.0, 'duration': 1.0, 'text': ''}] + make_transcript(2)
+
+        chunks = chunk_transcript(transcript, max_tokens=1000)
+
+        assert len(chunks[0].entries) == 2
+
+    def test_invalid_budget(self):
+        """예산이 1보다 작으면 예외를 발생시키는지 테스트"""
+        with pytest.raises(ValueError):
+            chunk_transcript(make_transcript(1), max_tokens=0)
+
+    def test_label(self):
+        """구간 시간 범위 표시 테스트"""
+        chunks = chunk_transcript(make_transcript(2, duration=1800.0), max_tokens=1000)
+
+        assert chunks[0].label == "00:00:00 - 01:00:00"
+        assert format_time_range(61, 3725) == "00:01:01 - 01:02:05"
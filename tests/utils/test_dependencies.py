@@ -0,0 +1,55 @@
+"""
+FastAPI 의존성 테스트
+"""
+
+import pytest
+from unittest.mock import patch
+
+from utils import dependencies
+
+
+@pytest.fixture
+def services():
+    """서비스 클래스를 mock으로 대체하고 공유 서비스를 초기화"""
+    dependencies.close_services()
+    with patch('utils.dependencies.YouTubeService') as youtube_class, \
+         patch('utils.dependencies.AIService') as ai_class, \
+         patch('utils.dependencies.FormatterService') as formatter_class:
+        yield youtube_class, ai_class, formatter_class
+        dependencies.close_services()
+
+
+class TestSharedServices:
+    """공유 서비스 테스트"""
+
+    def test_services_are_shared_across_calls(self, services):
+        """요청마다 같은 서비스 인스턴스를 반환하는지 테스트"""
+        youtube_class, ai_class, formatter_class = services
+
+        assert dependencies.get_youtube_service() is dependencies.get_youtube_service()
+        assert dependencies.get_ai_service() is dependencies.get_ai_service()
+        assert dependencies.get_formatter_service() is dependencies.get_formatter_service()
+        youtube_class.assert_called_once()
+        ai_class.assert_called_once()
+        formatter_class.assert_called_once()
+
+    def test_init_services_warm_up(self, services):
+        """init_services가 서비스를 워밍업하는지 테스트"""
+        youtube_class, ai_class, _ = services
+
+        dependencies.init_services(warm_up=True)
+
+        youtube_class.return_value.warm_up.assert_called_once()
+        ai_class.return_value.warm_up.assert_called_once()
+
+    def test_close_services_resets_singletons(self, services):
+        """종료 시 연결을 닫고 다음 호출에서 새로 생성하는지 테스트"""
+        youtube_class, ai_class, _ = services
+        first = dependencies.get_youtube_service()
+
+        dependencies.close_services()
+
+        first.close.assert_called_once()
+        ai_class.return_value.close.assert_called_once()
+        dependencies.get_youtube_service()
+        assert youtube_class.call_count == 2
@@ -0,0 +1,65 @@
+"""
+지연 import 테스트
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from utils.lazy_import import lazy_module
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run_python(code: str) -> str:
+    """새 인터프리터에서 코드를 실행하고 표준 출력을 반환합니다."""
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+
+class TestLazyModule:
+    """lazy_module 함수 테스트"""
+
+    def test_returns_loaded_module(self):
+        """이미 import된 모듈은 그대로 반환하는지 테스트"""
+        assert lazy_module('json') is sys.modules['json']
+
+    def test_missing_module(self):
+        """설치되지 않은 모듈은 None을 반환하는지 테스트"""
+        assert lazy_module('no_such_module_for_lazy_import') is None
+        assert lazy_module('no_such_package_for_lazy_import.sub') is None
+
+    def test_defers_execution_until_attribute_access(self):
+        """속성에 처음 접근할 때 모듈이 실행되는지 테스트"""
+        output = run_python(
+            "import sys\n"
+            "from utils.lazy_import import lazy_module\n"
+            "m = lazy_module('xml.dom.minidom')\n"
+            "print('xml.dom.minicompat' in sys.modules)\n"
+            "m.parseString\n"
+            "print('xml.dom.minicompat' in sys.modules)\n"
+        )
+        assert output.split() == ['False', 'True']
+
+
+class TestStartupImports:
+    """CLI/API 시작 시 무거운 의존성이 로드되지 않는지 테스트"""
+
+    @pytest.mark.parametrize('module', ['main', 'api_main'])
+    def test_heavy_dependencies_deferred(self, module):
+        """main/api_main import 시 yt-dlp, youtube-transcript-api, google-genai가 실행되지 않는지 테스트"""
+        output = run_python(
+            "import sys\n"
+            f"import {module}\n"
+            "for name in ('yt_dlp.YoutubeDL', 'youtube_transcript_api._api', 'google.genai.client'):\n"
+            "    print(name in sys.modules)\n"
+        )
+        assert output.split() == ['False', 'False', 'False']
@@ -0,0 +1,130 @@
+"""
+재생목록 동기화 인덱스 테스트
+"""
+
+import pytest
+
+from utils.playlist_index import PlaylistIndex, PENDING, default_index_path
+
+
+OPTIONS = {'format': '2', 'lang': ['ko', 'en'], 'summary': False, 'translate': None, 'topics': None}
+
+
+def listing(*items):
+    """(비디오 ID, 제목) 목록으로 재생목록 목록을 만듭니다."""
+    return [
+        {'id': video_id, 'url': f'url-{video_id}', 'title': title, 'position': position}
+        for position, (video_id, title) in enumerate(items)
+    ]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    """임시 인덱스 파일 경로"""
+    return str(tmp_path / "index.json")
+
+
+def synced_index(tmp_path, index_path, videos):
+    """목록의 모든 비디오를 처리 완료한 인덱스를 만들고 다시 불러옵니다."""
+    index = PlaylistIndex(index_path, OPTIONS, source="playlist")
+    index.apply_listing(videos)
+    for video in videos:
+        output = tmp_path / f"{video['id']}.json"
+        output.write_text(video['title'], encoding='utf-8')
+        index.mark_done(video['id'], str(output))
+    return PlaylistIndex.load(index_path, OPTIONS, source="playlist")
+
+
+class TestPlaylistIndex:
+    """PlaylistIndex 테스트"""
+
+    def test_first_sync_fetches_everything(self, index_path):
+        """인덱스가 없으면 모든 비디오를 추가로 보고하는지 테스트"""
+        videos = listing(('a', 'A'), ('b', 'B'))
+        index = PlaylistIndex.load(index_path, OPTIONS)
+
+        diff = index.diff(videos)
+
+        assert [video['id'] for video in diff.added] == ['a', 'b']
+        assert [video['id'] for video in diff.to_fetch()] == ['a', 'b']
+        assert diff.counts()['removed'] == 0
+
+    def test_unchanged_playlist_fetches_nothing(self, tmp_path, index_path):
+        """처리가 끝난 재생목록이 그대로면 다시 처리할 비디오가 없는지 테스트"""
+        videos = listing(('a', 'A'), ('b', 'B'))
+        index = synced_index(tmp_path, index_path, videos)
+
+        diff = index.diff(videos)
+
+        assert diff.to_fetch() == []
+        assert diff.counts() == {'added': 0, 'removed': 0, 'reordered': 0, 'changed': 0, 'stale': 0}
+
+    def test_reports_added_removed_and_changed(self, tmp_path, index_path):
+        """추가, 삭제, 제목 변경을 찾고 추가/변경된 비디오만 처리하는지 테스트"""
+        index = synced_index(tmp_path, index_path, listing(('a', 'A'), ('b', 'B'), ('c', 'C')))
+
+        diff = index.diff(listing(('new', 'New'), ('a', 'A'), ('c', 'C (updated)')))
+
+        assert [video['id'] for video in diff.added] == ['new']
+        assert [entry['video_id'] for entry in diff.removed] == ['b']
+        assert [video['id'] for video in diff.changed] == ['c']
+        # 앞에 추가된 비디오 때문에 위치만 밀린 것은 순서 변경이 아님
+        assert diff.reordered == []
+        assert [video['id'] for video in diff.to_fetch()] == ['new', 'c']
+
+    def test_reports_moved_video(self, tmp_path, index_path):
+        """상대 순서가 바뀐 비디오만 순서 변경으로 보고하는지 테스트"""
+        index = synced_index(tmp_path, index_path, listing(('a', 'A'), ('b', 'B'), ('c', 'C'), ('d', 'D')))
+
+        diff = index.diff(listing(('b', 'B'), ('c', 'C'), ('d', 'D'), ('a', 'A')))
+
+        assert [(video['id'], previous) for video, previous in diff.reordered] == [('a', 0)]
+        assert diff.to_fetch() == []
+
+    def test_incomplete_videos_are_stale(self, tmp_path, index_path):
+        """실패했거나 출력 파일이 사라진 비디오를 다시 처리하는지 테스트"""
+        videos = listing(('a', 'A'), ('b', 'B'), ('c', 'C'))
+        index = synced_index(tmp_path, index_path, videos)
+        index.mark_failed('b', "network error")
+        (tmp_path / "c.json").unlink()
+
+        diff = index.diff(videos)
+
+        assert [video['id'] for video in diff.stale] == ['b', 'c']
+        assert [video['id'] for video in diff.to_fetch()] == ['b', 'c']
+
+    def test_apply_listing_updates_index(self, tmp_path, index_path):
+        """목록 반영 시 위치를 갱신하고 삭제된 비디오를 지우며 바뀐 비디오를 대기 상태로 두는지 테스트"""
+        index = synced_index(tmp_path, index_path, listing(('a', 'A'), ('b', 'B'), ('c', 'C')))
+        last_scraped = index.videos['a']['last_scraped']
+
+        index.apply_listing(listing(('c', 'C'), ('a', 'A (updated)')))
+        loaded = PlaylistIndex.load(index_path, OPTIONS)
+
+        assert set(loaded.videos) == {'a', 'c'}
+        assert loaded.videos['c']['position'] == 0
+        assert loaded.is_complete('c')
+        assert loaded.videos['a']['status'] == PENDING
+        assert loaded.videos['a']['last_scraped'] == last_scraped
+        # 다음 실행에서도 처리되지 않은 변경 비디오는 다시 처리
+        assert [video['id'] for video in loaded.diff(listing(('c', 'C'), ('a', 'A (updated)'))).stale] == ['a']
+
+    def test_mark_done_keeps_listing_fields(self, tmp_path, index_path):
+        """처리 결과 기록이 위치와 내용 해시를 유지하고 마지막 스크래핑 시각을 기록하는지 테스트"""
+        index = PlaylistIndex(index_path, OPTIONS)
+        index.apply_listing(listing(('a', 'A')))
+        output = tmp_path / "a.json"
+        output.write_text("data", encoding='utf-8')
+
+        index.mark_done('a', str(output))
+
+        entry = index.videos['a']
+        assert entry['position'] == 0
+        assert entry['content_hash']
+        assert entry['last_scraped'] == entry['updated_at']
+        assert index.is_complete('a')
+
+
+def test_default_index_path():
+    """재생목록 ID로 안전한 기본 인덱스 경로를 만드는지 테스트"""
+    assert default_index_path("PL/abc") == ".scraper_index_PL_abc.json"
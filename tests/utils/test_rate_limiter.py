@@ -0,0 +1,210 @@
+"""
+요청 속도 제한기 테스트
+"""
+
+import threading
+
+import pytest
+
+from utils.rate_limiter import (
+    RateLimiter,
+    AdaptiveConcurrencyLimiter,
+    backoff_delay,
+    get_rate_limiter,
+    get_concurrency_limiter,
+)
+
+
+class FakeClock:
+    """sleep 호출 시 시간이 흐르는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_burst_without_waiting(self):
+        """burst 이내의 요청은 대기하지 않는지 테스트"""
+        clock = FakeClock()
+        limiter = RateLimiter(60, burst=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(3):
+            assert limiter.acquire() is True
+
+        assert clock.sleeps == []
+        assert limiter.stats()['throttled'] == 0
+
+    def test_waits_for_refill(self):
+        """토큰이 없으면 채워질 때까지 대기하는지 테스트"""
+        clock = FakeClock()
+        limiter = RateLimiter(60, burst=1, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+        limiter.acquire()
+
+        assert clock.now == pytest.approx(1.0)
+        stats = limiter.stats()
+        assert stats['throttled'] == 1
+        assert stats['waiting'] == 0
+        assert stats['total_wait'] == pytest.approx(1.0)
+
+    def test_acquire_timeout(self):
+        """제한 시간 안에 토큰을 얻지 못하면 False를 반환하는지 테스트"""
+        clock = FakeClock()
+        limiter = RateLimiter(6, burst=1, clock=clock, sleep=clock.sleep)
+
+        limiter.acquire()
+
+        assert limiter.acquire(timeout=1.0) is False
+        assert limiter.stats()['waiting'] == 0
+
+    def test_tokens_per_minute(self):
+        """요청 한도와 별개로 토큰 한도를 넘으면 대기하는지 테스트"""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            600, burst=10, tokens_per_minute=600, clock=clock, sleep=clock.sleep
+        )
+
+        limiter.acquire(tokens=500)
+        limiter.acquire(tokens=200)
+
+        # 부족한 100 토큰이 채워지는 데 10초 (초당 10 토큰)
+        assert clock.now == pytest.approx(10.0)
+        assert limiter.stats()['tokens_per_minute'] == 600
+
+    def test_oversized_request_is_capped(self):
+        """1분 한도보다 큰 요청도 영원히 대기하지 않는지 테스트"""
+        clock = FakeClock()
+        limiter = RateLimiter(60, tokens_per_minute=100, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire(tokens=1000, timeout=0) is True
+        assert limiter.stats()['available_tokens'] == pytest.approx(0.0)
+
+    def test_invalid_rate(self):
+        """0 이하의 속도는 허용하지 않는지 테스트"""
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+
+    def test_get_rate_limiter_shared_by_name(self):
+        """같은 이름의 제한기를 공유하는지 테스트"""
+        first = get_rate_limiter("test:shared", 60)
+
+        assert get_rate_limiter("test:shared", 60) is first
+        assert get_rate_limiter("test:other", 60) is not first
+        assert get_rate_limiter("test:disabled", 0) is None
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """AdaptiveConcurrencyLimiter 테스트"""
+
+    def test_additive_increase(self):
+        """성공할 때마다 limit이 1/limit씩 늘어나는지 테스트"""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=2)
+
+        for _ in range(2):
+            limiter.acquire()
+        for _ in range(2):
+            limiter.release()
+
+        assert limiter.limit == pytest.approx(2.0 + 1 / 2 + 1 / 2.5)
+        assert limiter.stats()['limit'] == 2
+
+    def test_failures_do_not_increase(self):
+        """한도 초과가 아닌 실패(5xx, 시간 초과 등)는 limit을 바꾸지 않는지 테스트"""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=2)
+
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(success=False)
+
+        assert limiter.limit == 2.0
+        assert limiter.stats()['increases'] == 0
+        assert limiter.stats()['decreases'] == 0
+        assert limiter.stats()['in_flight'] == 0
+
+    def test_multiplicative_decrease_with_cooldown(self):
+        """한도 초과 시 limit을 줄이되 cooldown 안의 연속 감소는 무시하는지 테스트"""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, cooldown=1.0, clock=clock)
+
+        for _ in range(3):
+            limiter.acquire()
+        limiter.release(throttled=True)
+        limiter.release(throttled=True)
+        clock.now = 2.0
+        limiter.release(throttled=True)
+
+        assert limiter.limit == 2.0
+        assert limiter.stats()['decreases'] == 2
+
+    def test_respects_min_and_max(self):
+        """limit이 최소/최대 범위를 벗어나지 않는지 테스트"""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2, min_limit=1, cooldown=0, clock=clock)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release()
+        assert limiter.limit == 2.0
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(throttled=True)
+        assert limiter.limit == 1.0
+
+    def test_blocks_at_limit(self):
+        """limit만큼 실행 중이면 슬롯이 반환될 때까지 대기하는지 테스트"""
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+        limiter.acquire()
+
+        assert limiter.acquire(timeout=0.01) is False
+
+        acquired = threading.Event()
+
+        def waiter():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        while limiter.stats()['waiting'] == 0:
+            threading.Event().wait(0.001)
+        limiter.release()
+        thread.join(timeout=5)
+
+        assert acquired.is_set()
+        assert limiter.stats()['in_flight'] == 1
+
+    def test_get_concurrency_limiter(self):
+        """이름별 공유 및 비활성화 테스트"""
+        first = get_concurrency_limiter("test:concurrency", 4)
+
+        assert get_concurrency_limiter("test:concurrency", 4) is first
+        assert get_concurrency_limiter("test:concurrency-off", 0) is None
+
+
+class TestBackoffDelay:
+    """backoff_delay 테스트"""
+
+    def test_exponential_with_cap(self):
+        """지수적으로 늘어나고 최대값을 넘지 않는지 테스트"""
+        assert backoff_delay(0, 1.0, 30.0, rng=lambda: 0.999) < 1.0
+        assert backoff_delay(3, 1.0, 30.0, rng=lambda: 0.5) == 4.0
+        assert backoff_delay(10, 1.0, 30.0, rng=lambda: 0.5) == 15.0
+
+    def test_full_jitter(self):
+        """대기 시간이 0과 상한 사이에서 무작위로 선택되는지 테스트"""
+        delays = {backoff_delay(2, 1.0, 30.0) for _ in range(20)}
+
+        assert len(delays) > 1
+        assert all(0 <= delay < 4.0 for delay in delays)
@@ -0,0 +1,89 @@
+"""
+LLM 응답 캐시 테스트
+"""
+
+import sqlite3
+
+import pytest
+from unittest.mock import Mock, patch
+
+from utils.cache import MemoryCache, SQLiteCache, FileCache
+from utils.response_cache import ResponseCache, create_cache_backend, get_response_cache
+
+
+class TestResponseCache:
+    """ResponseCache 테스트"""
+
+    def test_make_key_depends_on_all_inputs(self):
+        """모델, 프롬프트, 온도, 최대 출력 토큰 수가 모두 키에 반영되는지 테스트"""
+        base = ResponseCache.make_key("model", "prompt", 0.3, 100)
+
+        assert base == ResponseCache.make_key("model", "prompt", 0.3, 100)
+        assert base != ResponseCache.make_key("other", "prompt", 0.3, 100)
+        assert base != ResponseCache.make_key("model", "prompt!", 0.3, 100)
+        assert base != ResponseCache.make_key("model", "prompt", 0.5, 100)
+        assert base != ResponseCache.make_key("model", "prompt", 0.3, None)
+
+    def test_hit_rate_metrics(self):
+        """적중, 미스, 우회 통계 테스트"""
+        cache = ResponseCache(MemoryCache())
+        key = cache.make_key("model", "prompt", 0.3)
+
+        assert cache.get(key) is None
+        cache.set(key, "response")
+        assert cache.get(key) == "response"
+        cache.record_bypass()
+
+        stats = cache.stats()
+        assert stats['backend'] == 'MemoryCache'
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['bypassed'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert stats['storage']['entries'] == 1
+
+    def test_ttl_applies_to_backend(self):
+        """설정한 TTL로 저장하는지 테스트"""
+        backend = Mock()
+        cache = ResponseCache(backend, ttl=60)
+
+        cache.set("key", "response")
+
+        backend.set.assert_called_once_with("key", "response", ttl=60)
+
+    def test_backend_errors_are_misses(self):
+        """저장소 오류는 미스로 처리하고 예외를 전파하지 않는지 테스트"""
+        backend = Mock()
+        backend.get.side_effect = sqlite3.OperationalError("locked")
+        backend.set.side_effect = OSError("disk full")
+        cache = ResponseCache(backend)
+
+        assert cache.get("key") is None
+        cache.set("key", "response")
+        assert cache.errors == 2
+
+
+class TestCreateCacheBackend:
+    """저장소 생성 테스트"""
+
+    def test_backends(self, tmp_path):
+        """이름별 저장소 생성 테스트"""
+        assert isinstance(create_cache_backend('memory', str(tmp_path)), MemoryCache)
+        sqlite_cache = create_cache_backend('sqlite', str(tmp_path), max_bytes=1024)
+        assert isinstance(sqlite_cache, SQLiteCache)
+        assert sqlite_cache.max_bytes == 1024
+        sqlite_cache.close()
+        assert isinstance(create_cache_backend('disk', str(tmp_path)), FileCache)
+
+    def test_unknown_backend(self, tmp_path):
+        """지원하지 않는 저장소 이름 테스트"""
+        with pytest.raises(ValueError):
+            create_cache_backend('redis', str(tmp_path))
+
+    def test_disabled(self):
+        """캐시가 비활성화되면 None을 반환하는지 테스트"""
+        with patch('utils.response_cache.settings.cache_enabled', True), \
+             patch('utils.response_cache.settings.llm_cache_backend', 'none'):
+            assert get_response_cache() is None
+        with patch('utils.response_cache.settings.cache_enabled', False):
+            assert get_response_cache() is None
@@ -0,0 +1,99 @@
+"""
+실행 매니페스트 테스트
+"""
+
+import json
+
+import pytest
+
+from utils.run_manifest import RunManifest, file_sha256, default_manifest_path
+
+
+OPTIONS = {'format': '2', 'lang': ['ko', 'en'], 'summary': False, 'translate': None, 'topics': None}
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    """임시 매니페스트 파일 경로"""
+    return str(tmp_path / "manifest.json")
+
+
+class TestRunManifest:
+    """RunManifest 테스트"""
+
+    def test_done_video_is_complete_after_reload(self, tmp_path, manifest_path):
+        """완료 기록이 저장되고 다시 불러와도 유지되는지 테스트"""
+        output = tmp_path / "video1.json"
+        output.write_text('{"title": "Video"}', encoding='utf-8')
+
+        manifest = RunManifest(manifest_path, OPTIONS, source="playlist")
+        manifest.mark_done("video1", str(output))
+        manifest.mark_failed("video2", "network error")
+
+        loaded = RunManifest.load(manifest_path, OPTIONS, source="playlist")
+        assert loaded.is_complete("video1")
+        assert not loaded.is_complete("video2")
+        assert not loaded.is_complete("video3")
+        assert loaded.counts() == {'done': 1, 'failed': 1}
+
+    def test_changed_output_is_not_complete(self, tmp_path, manifest_path):
+        """출력 파일이 지워지거나 내용이 바뀌면 완료로 인정하지 않는지 테스트"""
+        changed = tmp_path / "changed.json"
+        changed.write_text("original", encoding='utf-8')
+        removed = tmp_path / "removed.json"
+        removed.write_text("original", encoding='utf-8')
+
+        manifest = RunManifest(manifest_path, OPTIONS)
+        manifest.mark_done("changed", str(changed))
+        manifest.mark_done("removed", str(removed))
+
+        changed.write_text("truncat", encoding='utf-8')
+        removed.unlink()
+
+        assert not manifest.is_complete("changed")
+        assert not manifest.is_complete("removed")
+
+    def test_different_options_start_over(self, tmp_path, manifest_path):
+        """실행 옵션이 다르면 기존 기록을 사용하지 않는지 테스트"""
+        output = tmp_path / "video1.json"
+        output.write_text("data", encoding='utf-8')
+        RunManifest(manifest_path, OPTIONS).mark_done("video1", str(output))
+
+        loaded = RunManifest.load(manifest_path, {**OPTIONS, 'format': '1'})
+
+        assert loaded.videos == {}
+
+    def test_corrupt_manifest_is_ignored(self, manifest_path):
+        """손상된 매니페스트는 빈 매니페스트로 대체되는지 테스트"""
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write("{not json")
+
+        assert RunManifest.load(manifest_path, OPTIONS).videos == {}
+
+    def test_saved_file_format(self, manifest_path):
+        """저장된 매니페스트 내용 테스트"""
+        manifest = RunManifest(manifest_path, OPTIONS, source="playlist")
+        manifest.mark_failed("video1", "boom")
+
+        with open(manifest_path, encoding='utf-8') as f:
+            data = json.load(f)
+
+        assert data['version'] == RunManifest.VERSION
+        assert data['source'] == "playlist"
+        assert data['options'] == OPTIONS
+        assert data['videos']['video1']['status'] == 'failed'
+        assert data['videos']['video1']['error'] == "boom"
+
+
+def test_file_sha256(tmp_path):
+    """파일 해시 계산 테스트"""
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"abc")
+
+    assert file_sha256(str(path)) == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    assert file_sha256(str(tmp_path / "missing")) is None
+
+
+def test_default_manifest_path():
+    """기본 매니페스트 경로 테스트"""
+    assert default_manifest_path("PL/abc") == ".scraper_manifest_PL_abc.json"
@@ -0,0 +1,96 @@
+"""
+요청 병합 (single-flight) 테스트
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.single_flight import SingleFlight
+
+
+def run_concurrently(flight, key, func, callers=4):
+    """같은 키로 동시에 호출하고, 첫 실행이 진행 중인 동안 나머지가 합류하도록 합니다."""
+    release = threading.Event()
+
+    def blocking():
+        release.wait(timeout=5)
+        return func()
+
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        futures = [pool.submit(flight.do, key, blocking) for _ in range(callers)]
+        while flight.in_flight() == 0:
+            time.sleep(0.01)
+        time.sleep(0.1)
+        release.set()
+        return [f.exception(timeout=5) or f.result() for f in futures]
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    def test_sequential_calls_execute_each_time(self):
+        """실행이 끝난 뒤의 호출은 다시 실행하는지 테스트 (결과를 캐시하지 않음)"""
+        flight = SingleFlight()
+        calls = []
+
+        assert flight.do('key', lambda: calls.append(1) or len(calls)) == 1
+        assert flight.do('key', lambda: calls.append(1) or len(calls)) == 2
+        assert flight.in_flight() == 0
+
+    def test_concurrent_calls_share_result(self):
+        """동시에 들어온 같은 키의 호출이 한 번의 실행 결과를 공유하는지 테스트"""
+        flight = SingleFlight()
+        calls = []
+        result = object()
+
+        results = run_concurrently(flight, 'key', lambda: calls.append(1) or result)
+
+        assert all(r is result for r in results)
+        assert len(calls) == 1
+        assert flight.in_flight() == 0
+
+    def test_exception_shared_with_waiters(self):
+        """실행 중 발생한 예외가 대기 중인 호출자에게도 전달되는지 테스트"""
+        flight = SingleFlight()
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ValueError("boom")
+
+        results = run_concurrently(flight, 'key', fail)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(calls) == 1
+        with pytest.raises(ValueError):
+            flight.do('key', fail)
+
+    def test_different_keys_not_coalesced(self):
+        """다른 키의 호출은 각각 실행되는지 테스트"""
+        flight = SingleFlight()
+
+        assert flight.do('a', lambda: 'A') == 'A'
+        assert flight.do('b', lambda: 'B') == 'B'
+
+    def test_stats_count_coalesced_waiters(self):
+        """실행 수, 합류한 대기자 수, 실패 수 통계를 테스트"""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        run_concurrently(flight, 'key', lambda: 'value', callers=4)
+        with pytest.raises(ValueError):
+            flight.do('other', fail)
+
+        stats = flight.stats()
+        assert stats['executions'] == 2
+        assert stats['coalesced'] == 3
+        assert stats['coalesce_rate'] == pytest.approx(3 / 5)
+        assert stats['failures'] == 1
+        assert stats['max_waiters'] == 3
+        assert stats['in_flight'] == 0
+        assert stats['waiting'] == 0
@@ -0,0 +1,103 @@
+"""
+열 기반 자막 표현 테스트
+"""
+
+import json
+import pickle
+
+import pytest
+
+from utils.transcript import Transcript, format_timestamp, transcript_to_list
+
+
+@pytest.fixture
+def entries():
+    """테스트용 자막 항목"""
+    return [
+        {'start': 0.0, 'duration': 2.0, 'text': 'Hello'},
+        {'start': 2.0, 'duration': 1.5, 'text': ''},
+        {'start': 3725.0, 'duration': 3.0, 'text': '안녕하세요'},
+    ]
+
+
+class TestFormatTimestamp:
+    """format_timestamp 함수 테스트"""
+
+    def test_minutes(self):
+        """1시간 미만은 MM:SS 형식으로 변환하는지 테스트"""
+        assert format_timestamp(65) == '01:05'
+
+    def test_hours(self):
+        """1시간 이상은 HH:MM:SS 형식으로 변환하는지 테스트"""
+        assert format_timestamp(3725) == '01:02:05'
+
+
+class TestTranscript:
+    """Transcript 클래스 테스트"""
+
+    def test_columns(self, entries):
+        """시작 시간, 길이, 텍스트를 열 단위로 보관하는지 테스트"""
+        transcript = Transcript(entries)
+
+        assert transcript.starts.typecode == 'd'
+        assert list(transcript.starts) == [0.0, 2.0, 3725.0]
+        assert list(transcript.durations) == [2.0, 1.5, 3.0]
+        assert list(transcript.texts()) == ['Hello', '', '안녕하세요']
+
+    def test_entry_views_behave_like_dicts(self, entries):
+        """항목 뷰가 기존 자막 딕셔너리처럼 동작하는지 테스트"""
+        transcript = Transcript(entries)
+        entry = transcript[-1]
+
+        assert entry['text'] == '안녕하세요'
+        assert entry['timestamp'] == '01:02:05'
+        assert entry.get('missing', 'default') == 'default'
+        assert {**entry, 'id': 2}['id'] == 2
+        assert dict(entry) == {
+            'start': 3725.0, 'duration': 3.0, 'text': '안녕하세요', 'timestamp': '01:02:05'
+        }
+
+    def test_equality_with_lists(self, entries):
+        """타임스탬프가 포함된 딕셔너리 리스트와 비교할 수 있는지 테스트"""
+        transcript = Transcript(entries)
+        expected = [{**entry, 'timestamp': format_timestamp(entry['start'])} for entry in entries]
+
+        assert transcript == expected
+        assert transcript == Transcript(expected)
+        assert Transcript(missing=True) == []
+
+    def test_from_columns(self):
+        """열 데이터로 생성하고 길이가 다르면 거부하는지 테스트"""
+        transcript = Transcript.from_columns([0, 1], [1, 1], ['a', 'b'], language_code='en')
+
+        assert len(transcript) == 2
+        assert transcript[1]['text'] == 'b'
+        assert transcript.language_code == 'en'
+        with pytest.raises(ValueError):
+            Transcript.from_columns([0], [1, 2], ['a'])
+
+    def test_slice_and_index_errors(self, entries):
+        """슬라이스는 Transcript를 반환하고 범위를 벗어난 인덱스는 IndexError인지 테스트"""
+        transcript = Transcript(entries, language_code='ko')
+
+        part = transcript[1:]
+        assert isinstance(part, Transcript)
+        assert [entry['text'] for entry in part] == ['', '안녕하세요']
+        assert part.language_code == 'ko'
+        with pytest.raises(IndexError):
+            transcript[3]
+
+    def test_serialization(self, entries):
+        """JSON용 리스트 변환, 열 변환, pickle 왕복 테스트"""
+        transcript = Transcript(entries, language_code='ko', is_generated=False)
+
+        assert json.loads(json.dumps(transcript_to_list(transcript)))[0]['timestamp'] == '00:00'
+        assert Transcript.from_columns(**transcript.to_columns()) == transcript
+        restored = pickle.loads(pickle.dumps(transcript))
+        assert restored == transcript
+        assert restored.language_code == 'ko'
+
+    def test_transcript_to_list_accepts_plain_lists(self, entries):
+        """일반 리스트와 None도 처리하는지 테스트"""
+        assert transcript_to_list(entries) == entries
+        assert transcript_to_list(None) is None
@@ -7,6 +7,7 @@ from typing import Dict, List, Optional
 import logging
 
 from core import YouTubeService
+from utils.transcript import transcript_to_list
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +53,7 @@ class VideoScraperTool:
         Returns:
             다음 키를 포함한 딕셔너리:
             - metadata: 비디오 메타데이터 (제목, 채널, 조회수 등)
-            - transcript: 타임스탬프가 포함된 자막 리스트
+            - transcript: 타임스탬프가 포함된 자막 딕셔너리 리스트 (JSON 직렬화 가능)
             - video_id: YouTube 비디오 ID
 
         Raises:
@@ -84,6 +85,11 @@ class VideoScraperTool:
                 f"Successfully scraped video: {result['metadata']['title']}"
             )
 
+            # 에이전트 프레임워크가 결과를 JSON으로 직렬화하므로 열 기반 Transcript를 리스트로 변환
+            result = dict(result)
+            result['transcript'] = transcript_to_list(result.get('transcript'))
+            if 'translated_transcript' in result:
+                result['translated_transcript'] = transcript_to_list(result['translated_transcript'])
             return result
 
         except Exception as e:
@@ -124,7 +130,7 @@ class VideoScraperTool:
             prefer_manual: 수동 생성 자막 선호 여부
 
         Returns:
-            자막 리스트
+            자막 딕셔너리 리스트 (JSON 직렬화 가능)
 
         Raises:
             ValueError: 유효하지 않은 URL
@@ -136,11 +142,12 @@ class VideoScraperTool:
         if not video_id:
             raise ValueError(f"Invalid YouTube URL: {video_url}")
 
-        return self.youtube_service.get_transcript(
+        transcript = self.youtube_service.get_transcript(
             video_id=video_id,
             languages=languages,
             prefer_manual=prefer_manual
         )
+        return transcript_to_list(transcript)
 
     @staticmethod
     def get_tool_schema() -> Dict:
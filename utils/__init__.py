@@ -3,17 +3,35 @@ Utils 패키지
 설정 관리 및 유틸리티 함수를 제공합니다.
 """
 
-from .config import settings, Settings
-from .dependencies import (
-    get_settings,
-    get_youtube_service,
-    get_ai_service,
-    get_formatter_service,
-    YouTubeServiceDep,
-    AIServiceDep,
-    FormatterServiceDep,
-    SettingsDep,
-)
+# config 모듈은 pydantic-settings를 불러오므로, 설정이 필요 없는 가벼운 유틸리티
+# (예: utils.transcript)만 사용할 때 시작 비용이 들지 않도록 처음 접근할 때 로드합니다.
+_CONFIG_EXPORTS = {"settings", "Settings"}
+
+# dependencies 모듈은 core 패키지를 import하므로, core에서 utils를 사용할 때
+# 순환 import가 생기지 않도록 처음 접근할 때 로드합니다.
+_DEPENDENCY_EXPORTS = {
+    "get_settings",
+    "get_youtube_service",
+    "get_ai_service",
+    "get_formatter_service",
+    "get_job_queue",
+    "YouTubeServiceDep",
+    "AIServiceDep",
+    "FormatterServiceDep",
+    "JobQueueDep",
+    "SettingsDep",
+}
+
+
+def __getattr__(name):
+    if name in _CONFIG_EXPORTS:
+        from . import config
+        return getattr(config, name)
+    if name in _DEPENDENCY_EXPORTS:
+        from . import dependencies
+        return getattr(dependencies, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "settings",
@@ -22,8 +40,10 @@ __all__ = [
     "get_youtube_service",
     "get_ai_service",
     "get_formatter_service",
+    "get_job_queue",
     "YouTubeServiceDep",
     "AIServiceDep",
     "FormatterServiceDep",
+    "JobQueueDep",
     "SettingsDep",
 ]
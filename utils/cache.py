@@ -0,0 +1,664 @@
+"""
+캐시 백엔드
+서비스 레이어에서 공통으로 사용하는 메모리 캐시와 영속 캐시를 제공합니다.
+"""
+
+from collections import OrderedDict
+from typing import Optional, Any, Dict, Tuple
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCache:
+    """
+    프로세스 내 LRU 캐시
+
+    최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거하며,
+    항목별 TTL을 지원합니다. 여러 스레드에서 공유해도 안전합니다.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: Optional[float] = None):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 최대 항목 수
+            default_ttl: 기본 만료 시간 (초, None이면 만료 없음)
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+
+    def get_with_expiry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        캐시된 값과 만료 시각을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (값, 만료 시각) 튜플 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value, expires_at
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None (없거나 만료된 경우)
+        """
+        item = self.get_with_expiry(key)
+        return item[0] if item is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 만료 시간 (초, None이면 default_ttl 사용)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """
+        캐시 항목을 삭제합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제합니다."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            hits, misses, evictions, hit_rate, entries를 포함한 딕셔너리
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self),
+        }
+
+
+class SQLiteCache:
+    """
+    SQLite 기반 키-값 캐시
+
+    값은 JSON으로 직렬화한 뒤 압축하여 저장합니다.
+    항목별 TTL과 전체 크기 제한을 지원하며, 크기 제한을 넘으면
+    가장 오래 사용되지 않은 항목부터 제거합니다 (LRU).
+    여러 스레드에서 하나의 인스턴스를 공유해도 안전합니다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        default_ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (':memory:' 가능)
+            default_ttl: 기본 만료 시간 (초, None이면 만료 없음)
+            max_bytes: 저장 값의 최대 총 크기 (바이트, None이면 제한 없음)
+        """
+        self.path = path
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._conn:
+            if path != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_accessed_at ON cache (accessed_at)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None (없거나 만료된 경우)
+        """
+        item = self.get_with_expiry(key)
+        return item[0] if item is not None else None
+
+    def get_with_expiry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        캐시된 값과 만료 시각을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (값, 만료 시각) 튜플 또는 None (없거나 만료된 경우)
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            self.hits += 1
+
+        return json.loads(zlib.decompress(value).decode('utf-8')), expires_at
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+            ttl: 만료 시간 (초, None이면 default_ttl 사용)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        data = zlib.compress(
+            json.dumps(value, ensure_ascii=False).encode('utf-8')
+        )
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO cache (key, value, size, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, data, len(data), expires_at, now)
+            )
+            self._evict(now)
+
+    def delete(self, key: str) -> None:
+        """
+        캐시 항목을 삭제합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제합니다."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def _evict(self, now: float) -> None:
+        """만료된 항목과 크기 제한을 넘는 항목을 제거합니다 (잠금 보유 상태에서 호출)."""
+        cursor = self._conn.execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,)
+        )
+        self.evictions += max(cursor.rowcount, 0)
+
+        if self.max_bytes is None:
+            return
+
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM cache ORDER BY accessed_at ASC"
+        ).fetchall()
+        expired_keys = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            expired_keys.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", expired_keys)
+        self.evictions += len(expired_keys)
+        logger.debug(f"Evicted {len(expired_keys)} cache entries from {self.path}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def total_size(self) -> int:
+        """
+        저장된 값의 총 크기를 반환합니다.
+
+        Returns:
+            바이트 단위 크기
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()[0]
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            hits, misses, evictions, hit_rate, entries, size_bytes를 포함한 딕셔너리
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self),
+            'size_bytes': self.total_size(),
+        }
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+class FileCache:
+    """
+    파일 기반 키-값 캐시
+
+    항목마다 하나의 파일(키 해시를 파일명으로 사용)에 만료 시각과 값을
+    JSON으로 직렬화하고 압축하여 저장합니다. 항목별 TTL과 전체 크기 제한을
+    지원하며, 크기 제한을 넘으면 가장 오래 사용되지 않은 파일부터 제거합니다 (LRU).
+    여러 프로세스가 같은 디렉토리를 공유할 수 있습니다.
+    """
+
+    SUFFIX = ".cache"
+
+    def __init__(
+        self,
+        directory: str,
+        default_ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            directory: 캐시 파일을 저장할 디렉토리
+            default_ttl: 기본 만료 시간 (초, None이면 만료 없음)
+            max_bytes: 저장 파일의 최대 총 크기 (바이트, None이면 제한 없음)
+        """
+        self.directory = directory
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + self.SUFFIX)
+
+    def _files(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(self.SUFFIX):
+                    yield os.path.join(root, name)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None (없거나 만료된 경우)
+        """
+        item = self.get_with_expiry(key)
+        return item[0] if item is not None else None
+
+    def get_with_expiry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """
+        캐시된 값과 만료 시각을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            (값, 만료 시각) 튜플 또는 None (없거나 만료되었거나 손상된 경우)
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                record = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Corrupt cache file {path}: {e}")
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        expires_at = record.get('expires_at')
+        expired = expires_at is not None and expires_at <= now
+        if expired:
+            self._remove(path)
+        if expired or record.get('key') != key:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # 접근 시각을 갱신하여 LRU 순서 유지
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return record['value'], expires_at
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+            ttl: 만료 시간 (초, None이면 default_ttl 사용)
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        data = zlib.compress(json.dumps(
+            {'key': key, 'expires_at': expires_at, 'value': value},
+            ensure_ascii=False
+        ).encode('utf-8'))
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체하여 다른 프로세스가 쓰다 만 파일을 읽지 않도록 함
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        os.utime(path, (now, now))
+
+        if self.max_bytes is not None:
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        """
+        캐시 항목을 삭제합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        self._remove(self._path(key))
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제합니다."""
+        for path in list(self._files()):
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+    def _evict(self) -> None:
+        """만료된 항목과 크기 제한을 넘는 항목을 제거합니다."""
+        files = []
+        total = 0
+        for path in self._files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                evicted += 1
+            total -= size
+
+        with self._lock:
+            self.evictions += evicted
+        logger.debug(f"Evicted {evicted} cache files from {self.directory}")
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._files())
+
+    def total_size(self) -> int:
+        """
+        저장된 파일의 총 크기를 반환합니다.
+
+        Returns:
+            바이트 단위 크기
+        """
+        total = 0
+        for path in self._files():
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                continue
+        return total
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            hits, misses, evictions, hit_rate, entries, size_bytes를 포함한 딕셔너리
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self),
+            'size_bytes': self.total_size(),
+        }
+
+
+class TieredCache:
+    """
+    2단계 캐시 (프로세스 내 LRU + 공유 디스크 저장소)
+
+    조회 시 메모리를 먼저 확인하고, 없으면 디스크를 확인한 뒤
+    남은 만료 시간을 유지한 채 메모리로 승격합니다.
+    저장 시에는 두 단계에 모두 기록합니다.
+    """
+
+    def __init__(self, memory: MemoryCache, disk: Optional[SQLiteCache] = None):
+        """
+        캐시 초기화
+
+        Args:
+            memory: 1단계 메모리 캐시
+            disk: 2단계 디스크 캐시 (None이면 메모리만 사용)
+        """
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시된 값을 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None (두 단계 모두 미스)
+        """
+        value = self.memory.get(key)
+        if value is not None or self.disk is None:
+            return value
+
+        try:
+            item = self.disk.get_with_expiry(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Disk cache lookup failed for {key}: {e}")
+            return None
+
+        if item is None:
+            return None
+
+        value, expires_at = item
+        ttl = expires_at - time.time() if expires_at is not None else None
+        if ttl is None or ttl > 0:
+            self.memory.set(key, value, ttl=ttl)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 두 단계 캐시에 모두 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 만료 시간 (초)
+        """
+        self.memory.set(key, value, ttl=ttl)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value, ttl=ttl)
+            except sqlite3.Error as e:
+                logger.warning(f"Disk cache write failed for {key}: {e}")
+
+    def delete(self, key: str) -> None:
+        """
+        두 단계 캐시에서 항목을 삭제합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def stats(self) -> Dict:
+        """
+        단계별 캐시 통계를 반환합니다.
+
+        Returns:
+            memory, disk 통계를 포함한 딕셔너리
+        """
+        return {
+            'memory': self.memory.stats(),
+            'disk': self.disk.stats() if self.disk is not None else None,
+        }
+
+    def close(self) -> None:
+        """디스크 저장소 연결을 닫습니다."""
+        if self.disk is not None:
+            self.disk.close()
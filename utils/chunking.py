@@ -0,0 +1,130 @@
+"""
+자막 분할 유틸리티
+긴 자막을 LLM 컨텍스트 예산에 맞는 구간으로 나눕니다.
+"""
+
+from typing import List, Dict, Sequence
+import math
+
+
+# 토큰 수 추정 비율 (정확한 토크나이저 없이 보수적으로 추정)
+# 영문 등 ASCII 문자는 약 4자당 1토큰, 한글/한자 등은 약 1.5자당 1토큰
+ASCII_CHARS_PER_TOKEN = 4.0
+NON_ASCII_CHARS_PER_TOKEN = 1.5
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 추정합니다.
+
+    Args:
+        text: 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    non_ascii_chars = len(text) - ascii_chars
+    return math.ceil(
+        ascii_chars / ASCII_CHARS_PER_TOKEN
+        + non_ascii_chars / NON_ASCII_CHARS_PER_TOKEN
+    )
+
+
+def _format_time(seconds: float) -> str:
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+
+def format_time_range(start: float, end: float) -> str:
+    """
+    시간 범위를 'HH:MM:SS - HH:MM:SS' 형식으로 변환합니다.
+
+    Args:
+        start: 시작 시간 (초)
+        end: 종료 시간 (초)
+
+    Returns:
+        시간 범위 문자열
+    """
+    return f"{_format_time(start)} - {_format_time(end)}"
+
+
+class TranscriptChunk:
+    """
+    연속된 자막 항목으로 이루어진 구간
+
+    Attributes:
+        entries: 구간에 포함된 자막 항목
+        start: 구간 시작 시간 (초)
+        end: 구간 종료 시간 (초)
+        tokens: 구간 텍스트의 추정 토큰 수
+    """
+
+    def __init__(self):
+        self.entries: List[Dict] = []
+        self.start = 0.0
+        self.end = 0.0
+        self.tokens = 0
+
+    @property
+    def text(self) -> str:
+        """구간 자막 텍스트를 공백으로 결합하여 반환합니다."""
+        return " ".join(
+            entry.get('text', '').strip() for entry in self.entries if entry.get('text')
+        )
+
+    @property
+    def label(self) -> str:
+        """구간의 시간 범위를 'HH:MM:SS - HH:MM:SS' 형식으로 반환합니다."""
+        return format_time_range(self.start, self.end)
+
+
+def chunk_transcript(transcript: Sequence[Dict], max_tokens: int) -> List[TranscriptChunk]:
+    """
+    자막을 토큰 예산을 넘지 않는 구간들로 나눕니다.
+
+    구간 경계는 항상 자막 항목 사이에 위치하므로 각 구간은 정확한 시작/종료
+    시간을 가집니다. 하나의 항목이 예산보다 크면 그 항목만으로 구간을 만듭니다.
+
+    Args:
+        transcript: 자막 데이터 리스트 (start, duration, text)
+        max_tokens: 구간당 최대 추정 토큰 수
+
+    Returns:
+        TranscriptChunk 리스트 (자막 순서 유지)
+    """
+    if max_tokens < 1:
+        raise ValueError("max_tokens must be at least 1")
+
+    chunks: List[TranscriptChunk] = []
+    current = TranscriptChunk()
+
+    for entry in transcript:
+        text = (entry.get('text') or '').strip()
+        if not text:
+            continue
+
+        # 공백 구분자까지 포함하여 추정
+        tokens = estimate_tokens(text) + 1
+        start = float(entry.get('start') or 0.0)
+        end = start + float(entry.get('duration') or 0.0)
+
+        if current.entries and current.tokens + tokens > max_tokens:
+            chunks.append(current)
+            current = TranscriptChunk()
+
+        if not current.entries:
+            current.start = start
+        current.entries.append(entry)
+        current.end = max(current.end, end)
+        current.tokens += tokens
+
+    if current.entries:
+        chunks.append(current)
+
+    return chunks
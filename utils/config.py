@@ -29,6 +29,7 @@ class Settings(BaseSettings):
     api_version: str = "3.0.0"
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    service_warm_up: bool = True  # 서버 시작 시 추출기와 Gemini 연결을 미리 준비
 
     # Gemini API 설정
     # .env 파일에서 GEMINI_API_KEY 또는 gemini_api_key로 설정 가능
@@ -37,12 +38,60 @@ class Settings(BaseSettings):
     gemini_model_name: str = "gemini-2.5-flash"
     gemini_retry_count: int = 3
     gemini_retry_delay: float = 1.0
+    gemini_requests_per_minute: int = 60  # 모델별 분당 요청 한도 (0이면 비활성화)
+    gemini_burst: int = 10  # 한 번에 보낼 수 있는 최대 요청 수
+    gemini_tokens_per_minute: int = 1_000_000  # 모델별 분당 토큰 한도 (0이면 비활성화)
+    gemini_max_concurrency: int = 8  # 모델별 최대 동시 호출 수 (AIMD로 조정, 0이면 비활성화)
+    gemini_min_concurrency: int = 1
+    gemini_backoff_max: float = 30.0  # 재시도 백오프 최대 대기 시간 (초)
+    gemini_max_connections: int = 16  # Gemini HTTP 연결 풀 크기 (keep-alive 연결 재사용)
+    ai_max_concurrency: int = 3  # 요청당 동시에 실행할 AI 작업 수 (요약, 번역, 주제 추출)
+
+    # 긴 자막 요약 설정 (map-reduce)
+    summary_chunk_tokens: int = 8000  # 한 번에 요약할 최대 추정 토큰 수 (초과 시 구간 분할)
+    summary_chunk_points: int = 5  # 구간 요약당 최대 글머리표 수
+    summary_max_parallel_chunks: int = 4  # 동시에 요약할 구간 수
+    summary_section_max_output_tokens: int = 512
+    summary_max_output_tokens: int = 1024
+
+    # 자막 번역 설정
+    translation_batch_tokens: int = 1500  # 번역 요청당 최대 추정 토큰 수
+    translation_max_parallel_batches: int = 4  # 동시에 번역할 배치 수
+
+    # LLM 응답 캐시 설정 (cache_enabled가 False면 비활성화)
+    llm_cache_backend: str = "sqlite"  # memory, sqlite, disk, none
+    llm_cache_ttl: int = 30 * 24 * 3600  # 초
+    llm_cache_memory_size: int = 1024  # memory 저장소 최대 항목 수
+    llm_cache_max_mb: int = 128  # sqlite/disk 저장소 최대 크기
 
     # 기본 설정
     default_languages: list = ["ko", "en"]
     default_max_summary_points: int = 5
     default_num_topics: int = 5
 
+    # yt-dlp 설정
+    extractor_pool_size: int = 4  # 옵션 조합별 재사용 YoutubeDL 인스턴스 수 (0이면 비활성화)
+    blocking_executor_workers: int = 16  # API 서버에서 동시에 실행할 추출 작업 수
+    fetch_executor_workers: int = 32  # 메타데이터/자막 병렬 조회에 사용할 스레드 수
+    video_info_timeout: float = 60.0  # 메타데이터와 자막 조회의 공통 제한 시간 (초)
+    batch_max_videos: int = 100  # /video/batch 요청당 최대 비디오 수
+    batch_max_concurrency: int = 4  # /video/batch 요청당 동시에 처리할 최대 비디오 수
+    job_workers: int = 2  # 동시에 실행할 플레이리스트 작업 수
+    job_video_concurrency: int = 4  # 작업당 동시에 처리할 비디오 수
+
+    # 캐시 설정
+    cache_enabled: bool = True
+    cache_dir: str = ".cache"
+    transcript_cache_ttl: int = 7 * 24 * 3600  # 초
+    transcript_cache_max_mb: int = 256
+    transcript_negative_cache_ttl: int = 3600  # 자막 없음 결과
+    metadata_cache_static_ttl: int = 30 * 24 * 3600  # 제목, 길이, 업로드 날짜 등
+    metadata_cache_volatile_ttl: int = 10 * 60  # 조회수, 좋아요 수
+    metadata_cache_memory_size: int = 1024
+    metadata_cache_max_mb: int = 64
+    playlist_cache_ttl: int = 60  # 재생목록 추출 결과 (짧게 유지, 0이면 병합만 사용)
+    playlist_cache_size: int = 16  # 메모리에 보관할 최대 재생목록 수
+
     # CORS 설정
     cors_origins: list = ["*"]
     cors_allow_credentials: bool = True
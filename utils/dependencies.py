@@ -4,13 +4,18 @@ Dependencies for FastAPI
 """
 
 from functools import lru_cache
-from typing import Annotated
+from typing import Annotated, Optional
+import logging
+import threading
 
 from fastapi import Depends
 
 from core import YouTubeService, AIService, FormatterService
+from core.job_queue import JobQueue
 from utils.config import Settings
 
+logger = logging.getLogger(__name__)
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -22,46 +27,146 @@ def get_settings() -> Settings:
     return Settings()
 
 
-def get_youtube_service() -> YouTubeService:
+class ServiceContainer:
+    """
+    애플리케이션 수명 동안 공유하는 서비스 모음
+
+    서비스는 캐시 연결, 추출기 풀, Gemini HTTP 연결 풀을 보유하므로
+    요청마다 새로 만들지 않고 하나의 인스턴스를 모든 요청이 공유합니다.
     """
-    YouTube 서비스 인스턴스를 생성하여 반환합니다.
+
+    def __init__(self, settings: Settings):
+        """
+        서비스 생성
+
+        Args:
+            settings: 애플리케이션 설정
+        """
+        self.youtube = YouTubeService()
+        self.ai = AIService(
+            api_key=settings.gemini_api_key,
+            model_name=settings.gemini_model_name
+        )
+        self.formatter = FormatterService()
+        self._jobs: Optional[JobQueue] = None
+        self._jobs_lock = threading.Lock()
+
+    @property
+    def jobs(self) -> JobQueue:
+        """플레이리스트 스크래핑 작업 큐 (처음 사용할 때 저장소를 엽니다)"""
+        with self._jobs_lock:
+            if self._jobs is None:
+                self._jobs = JobQueue.from_settings(self.youtube, self.ai, self.formatter)
+            return self._jobs
+
+    def warm_up(self) -> None:
+        """추출기 인스턴스와 Gemini 연결을 미리 준비합니다."""
+        self.youtube.warm_up()
+        self.ai.warm_up()
+
+    def close(self) -> None:
+        """서비스가 보유한 연결을 모두 닫습니다."""
+        with self._jobs_lock:
+            jobs, self._jobs = self._jobs, None
+        if jobs is not None:
+            jobs.close()
+        self.ai.close()
+        self.youtube.close()
+
+
+_services: Optional[ServiceContainer] = None
+_services_lock = threading.Lock()
+
+
+def get_services() -> ServiceContainer:
+    """
+    공유 서비스 모음을 반환합니다.
+
+    lifespan에서 init_services로 미리 생성하지 않았다면 처음 호출할 때 생성합니다.
 
     Returns:
-        YouTubeService 인스턴스
+        ServiceContainer 인스턴스
     """
-    return YouTubeService()
+    global _services
+    with _services_lock:
+        if _services is None:
+            _services = ServiceContainer(get_settings())
+        return _services
 
 
-def get_ai_service(
-    settings: Annotated[Settings, Depends(get_settings)]
-) -> AIService:
+def init_services(warm_up: bool = False, start_jobs: bool = False) -> ServiceContainer:
     """
-    AI 서비스 인스턴스를 생성하여 반환합니다.
+    공유 서비스를 생성하고 필요하면 워밍업합니다 (애플리케이션 시작 시 호출).
 
     Args:
-        settings: 애플리케이션 설정 (의존성 주입)
+        warm_up: 추출기와 Gemini 연결을 미리 준비할지 여부
+        start_jobs: 작업 큐 워커를 시작하고 끝나지 않은 작업을 이어서 실행할지 여부
+
+    Returns:
+        ServiceContainer 인스턴스
+    """
+    services = get_services()
+    if warm_up:
+        services.warm_up()
+    if start_jobs:
+        services.jobs.start()
+    return services
+
+
+def close_services() -> None:
+    """공유 서비스의 연결을 닫고 초기화합니다 (애플리케이션 종료 시 호출)."""
+    global _services
+    with _services_lock:
+        services, _services = _services, None
+
+    if services is not None:
+        services.close()
+        logger.info("Shared services closed")
+
+
+def get_youtube_service() -> YouTubeService:
+    """
+    공유 YouTube 서비스 인스턴스를 반환합니다.
+
+    Returns:
+        YouTubeService 인스턴스
+    """
+    return get_services().youtube
+
+
+def get_ai_service() -> AIService:
+    """
+    공유 AI 서비스 인스턴스를 반환합니다.
 
     Returns:
         AIService 인스턴스
     """
-    return AIService(
-        api_key=settings.gemini_api_key,
-        model_name=settings.gemini_model_name
-    )
+    return get_services().ai
 
 
 def get_formatter_service() -> FormatterService:
     """
-    Formatter 서비스 인스턴스를 생성하여 반환합니다.
+    공유 Formatter 서비스 인스턴스를 반환합니다.
 
     Returns:
         FormatterService 인스턴스
     """
-    return FormatterService()
+    return get_services().formatter
+
+
+def get_job_queue() -> JobQueue:
+    """
+    공유 작업 큐 인스턴스를 반환합니다.
+
+    Returns:
+        JobQueue 인스턴스
+    """
+    return get_services().jobs
 
 
 # Type aliases for cleaner code
 YouTubeServiceDep = Annotated[YouTubeService, Depends(get_youtube_service)]
 AIServiceDep = Annotated[AIService, Depends(get_ai_service)]
 FormatterServiceDep = Annotated[FormatterService, Depends(get_formatter_service)]
+JobQueueDep = Annotated[JobQueue, Depends(get_job_queue)]
 SettingsDep = Annotated[Settings, Depends(get_settings)]
@@ -0,0 +1,67 @@
+"""
+지연 import
+무거운 외부 패키지를 처음 사용할 때 불러와 CLI와 API의 시작 시간을 줄입니다.
+"""
+
+from types import ModuleType
+from typing import Optional
+import importlib
+import importlib.util
+import sys
+
+
+class LazyModule(ModuleType):
+    """
+    처음 속성에 접근할 때 실제 모듈을 import하여 위임하는 모듈 프록시
+
+    sys.modules에는 등록하지 않으므로 다른 코드의 일반 import에는 영향을 주지 않으며,
+    실제 로드는 importlib.import_module을 통해 일반 import와 같은 방식으로 이루어집니다.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._module = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_module(name: str) -> Optional[ModuleType]:
+    """
+    모듈을 처음 사용할 때 로드하는 지연 모듈을 반환합니다.
+
+    설치 여부는 모듈을 실행하지 않고 확인하므로, 기존의
+    `try: import x / except ImportError: x = None` 패턴을 그대로 대체할 수 있습니다.
+    이미 import된 모듈이면 그대로 반환합니다.
+
+    Args:
+        name: 모듈 이름 (예: 'yt_dlp', 'google.genai')
+
+    Returns:
+        모듈 객체 또는 None (설치되지 않은 경우)
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    try:
+        spec = importlib.util.find_spec(name)
+    except ImportError:
+        # 상위 패키지가 설치되지 않은 경우 (예: 'google' 없이 'google.genai')
+        return None
+    if spec is None:
+        return None
+
+    return LazyModule(name)
@@ -0,0 +1,234 @@
+"""
+재생목록 동기화 인덱스
+재생목록별로 비디오 ID, 위치, 마지막 스크래핑 시각, 목록 내용 해시를 기록하여
+다음 실행에서 새로 추가되었거나 바뀐 비디오만 다시 처리할 수 있게 합니다.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Tuple
+import hashlib
+import json
+import re
+import time
+
+from utils.run_manifest import RunManifest, DONE
+
+
+# 목록에는 있지만 아직 (다시) 처리하지 않은 비디오
+PENDING = 'pending'
+
+# 내용 해시에 사용하는 목록(flat) 필드
+LISTING_FIELDS = ('title',)
+
+
+def listing_hash(video: Dict[str, Any]) -> str:
+    """
+    재생목록 목록에서 얻은 비디오 정보의 내용 해시를 계산합니다.
+
+    Args:
+        video: 비디오 정보 딕셔너리 (id, url, title, position)
+
+    Returns:
+        16진수 SHA-256 해시 문자열
+    """
+    values = [video.get(field) for field in LISTING_FIELDS]
+    return hashlib.sha256(
+        json.dumps(values, ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+
+
+def default_index_path(source_id: str) -> str:
+    """
+    재생목록 ID로 기본 동기화 인덱스 파일 경로를 만듭니다.
+
+    Args:
+        source_id: 재생목록 ID
+
+    Returns:
+        현재 디렉토리의 '.scraper_index_<ID>.json' 경로
+    """
+    safe_id = re.sub(r'[^\w-]', '_', source_id or 'run')
+    return f".scraper_index_{safe_id}.json"
+
+
+def _moved_ids(previous_positions: List[Tuple[str, int]]) -> List[str]:
+    """
+    현재 순서로 나열한 (비디오 ID, 이전 위치) 중 다른 비디오에 대한 상대 순서가 바뀐 ID를 찾습니다.
+
+    이전 위치의 최장 증가 부분 수열에 속한 비디오는 제자리에 있다고 보므로,
+    앞에 비디오가 추가되거나 삭제되어 위치만 밀린 경우는 포함되지 않습니다.
+    """
+    tails: List[int] = []        # 길이별 증가 부분 수열의 마지막 이전 위치
+    tail_index: List[int] = []   # tails 항목의 인덱스
+    parents: List[int] = []
+    for i, (_, position) in enumerate(previous_positions):
+        length = bisect_left(tails, position)
+        if length == len(tails):
+            tails.append(position)
+            tail_index.append(i)
+        else:
+            tails[length] = position
+            tail_index[length] = i
+        parents.append(tail_index[length - 1] if length else -1)
+
+    in_place = set()
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        in_place.add(i)
+        i = parents[i]
+    return [video_id for i, (video_id, _) in enumerate(previous_positions) if i not in in_place]
+
+
+class PlaylistDiff:
+    """
+    재생목록 목록과 동기화 인덱스의 차이
+
+    Attributes:
+        added: 인덱스에 없는 새 비디오 목록
+        removed: 목록에서 사라진 비디오의 인덱스 기록 목록 (video_id, title, position 포함)
+        reordered: 다른 비디오에 대한 상대 순서가 바뀐 (비디오, 이전 위치) 목록
+        changed: 목록 내용(제목)이 바뀐 비디오 목록
+        stale: 목록은 그대로지만 이전 처리가 실패했거나 출력 파일이 없거나 바뀐 비디오 목록
+    """
+
+    def __init__(
+        self,
+        added: List[Dict[str, Any]],
+        removed: List[Dict[str, Any]],
+        reordered: List[Tuple[Dict[str, Any], int]],
+        changed: List[Dict[str, Any]],
+        stale: List[Dict[str, Any]]
+    ):
+        self.added = added
+        self.removed = removed
+        self.reordered = reordered
+        self.changed = changed
+        self.stale = stale
+
+    def to_fetch(self) -> List[Dict[str, Any]]:
+        """
+        다시 처리해야 하는 비디오를 재생목록 순서대로 반환합니다.
+
+        Returns:
+            추가, 내용 변경, 미완료 비디오 목록
+        """
+        videos = self.added + self.changed + self.stale
+        return sorted(videos, key=lambda video: video['position'])
+
+    def counts(self) -> Dict[str, int]:
+        """
+        항목별 비디오 수를 반환합니다.
+
+        Returns:
+            added, removed, reordered, changed, stale 수를 담은 딕셔너리
+        """
+        return {
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'reordered': len(self.reordered),
+            'changed': len(self.changed),
+            'stale': len(self.stale),
+        }
+
+
+class PlaylistIndex(RunManifest):
+    """
+    재생목록 동기화 인덱스
+
+    실행 매니페스트의 비디오별 처리 기록(상태, 출력 파일, 출력 파일 해시)에
+    재생목록 내 위치, 목록 내용 해시, 마지막 스크래핑 시각을 더해 실행이 끝나도 유지합니다.
+    매 실행에서 재생목록 목록(flat)과 비교하여 추가/삭제/순서 변경/내용 변경을 찾고,
+    새로 추가되었거나 바뀐 비디오와 이전 처리가 온전하지 않은 비디오만 다시 처리합니다.
+    """
+
+    def diff(self, videos: Iterable[Dict[str, Any]]) -> PlaylistDiff:
+        """
+        현재 재생목록 목록을 인덱스와 비교합니다.
+
+        Args:
+            videos: 재생목록 순서의 비디오 정보 목록 (id, title, position 포함)
+
+        Returns:
+            PlaylistDiff 인스턴스
+        """
+        with self._lock:
+            entries = {video_id: dict(entry) for video_id, entry in self.videos.items()}
+
+        added, changed, stale = [], [], []
+        kept: List[Tuple[Dict[str, Any], int]] = []
+        seen = set()
+        for video in videos:
+            video_id = video['id']
+            if video_id in seen:
+                continue  # 재생목록에 같은 비디오가 여러 번 있으면 처음 위치만 사용
+            seen.add(video_id)
+
+            entry = entries.get(video_id)
+            if entry is None or entry.get('position') is None:
+                added.append(video)
+                continue
+
+            kept.append((video, entry['position']))
+            if entry.get('content_hash') != listing_hash(video):
+                changed.append(video)
+            elif not self.is_complete(video_id):
+                stale.append(video)
+
+        moved = set(_moved_ids([(video['id'], position) for video, position in kept]))
+        reordered = [(video, position) for video, position in kept if video['id'] in moved]
+
+        removed = [
+            {'video_id': video_id, 'title': entry.get('title'), 'position': entry.get('position')}
+            for video_id, entry in entries.items()
+            if video_id not in seen and entry.get('position') is not None
+        ]
+        removed.sort(key=lambda entry: entry['position'])
+
+        return PlaylistDiff(added, removed, reordered, changed, stale)
+
+    def apply_listing(self, videos: Iterable[Dict[str, Any]]) -> None:
+        """
+        현재 재생목록 목록을 인덱스에 반영하고 저장합니다.
+
+        위치와 목록 내용 해시를 갱신하고, 목록에서 사라진 비디오는 삭제하며,
+        새 비디오와 내용이 바뀐 비디오는 처리 대기 상태로 기록합니다.
+
+        Args:
+            videos: 재생목록 순서의 비디오 정보 목록 (id, title, position 포함)
+        """
+        with self._lock:
+            listed: Dict[str, Dict[str, Any]] = {}
+            for video in videos:
+                video_id = video['id']
+                if video_id in listed:
+                    continue
+
+                content_hash = listing_hash(video)
+                entry = self.videos.get(video_id)
+                if entry is None or entry.get('content_hash') != content_hash:
+                    entry = {
+                        'status': PENDING,
+                        'output_file': None,
+                        'sha256': None,
+                        'error': None,
+                        'last_scraped': entry.get('last_scraped') if entry else None,
+                    }
+                entry.update({
+                    'title': video.get('title'),
+                    'position': video['position'],
+                    'content_hash': content_hash,
+                })
+                listed[video_id] = entry
+
+            self.videos = listed
+            self._save()
+
+    def _record(self, video_id: str, entry: Dict[str, Any]) -> None:
+        """처리 결과를 기존 목록 정보(위치, 내용 해시)와 합쳐 기록합니다."""
+        now = time.time()
+        entry['updated_at'] = now
+        if entry['status'] == DONE:
+            entry['last_scraped'] = now
+        with self._lock:
+            self.videos[video_id] = {**self.videos.get(video_id, {}), **entry}
+            self._save()
@@ -0,0 +1,359 @@
+"""
+요청 속도 제한기
+외부 API 호출이 분당 요청/토큰 한도를 넘지 않도록 호출 속도와 동시 실행 수를 조절합니다.
+"""
+
+from typing import Optional, Dict, Callable
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    토큰 버킷 기반 요청 속도 제한기
+
+    요청 버킷은 초당 requests_per_minute / 60개의 속도로 채워지며, 최대 burst개까지
+    모아둘 수 있습니다. tokens_per_minute가 주어지면 LLM 토큰 버킷(최대 1분 분량)을
+    함께 사용하여, 호출마다 요청 하나와 예상 토큰 수를 모두 확보할 때까지 대기합니다.
+    여러 스레드에서 하나의 인스턴스를 공유해도 안전합니다.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: Optional[int] = None,
+        tokens_per_minute: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        속도 제한기 초기화
+
+        Args:
+            requests_per_minute: 분당 허용 요청 수
+            burst: 한 번에 허용할 최대 요청 수 (None이면 1)
+            tokens_per_minute: 분당 허용 토큰 수 (None 또는 0 이하면 토큰 제한 없음)
+            clock: 현재 시각 함수 (테스트용)
+            sleep: 대기 함수 (테스트용)
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst or 1)
+        if tokens_per_minute and tokens_per_minute > 0:
+            self.token_rate: Optional[float] = tokens_per_minute / 60.0
+            self.token_capacity: Optional[float] = float(tokens_per_minute)
+        else:
+            self.token_rate = None
+            self.token_capacity = None
+        self._clock = clock
+        self._sleep = sleep
+
+        self._tokens = float(self.capacity)
+        self._llm_tokens = self.token_capacity or 0.0
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.waiting = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        """경과 시간만큼 토큰을 채웁니다 (잠금 보유 상태에서 호출)."""
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        if self.token_rate is not None:
+            self._llm_tokens = min(
+                self.token_capacity, self._llm_tokens + elapsed * self.token_rate
+            )
+        self._updated_at = now
+
+    def acquire(self, tokens: int = 0, timeout: Optional[float] = None) -> bool:
+        """
+        요청 하나를 보낼 수 있을 때까지 대기합니다.
+
+        Args:
+            tokens: 요청이 사용할 예상 LLM 토큰 수 (토큰 제한이 없으면 무시,
+                1분 한도보다 크면 1분 한도만큼만 소비)
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            요청과 토큰을 확보하면 True, 제한 시간 안에 확보하지 못하면 False
+        """
+        cost = min(float(tokens), self.token_capacity) if self.token_rate is not None else 0.0
+        start = self._clock()
+        deadline = start + timeout if timeout is not None else None
+        throttled = False
+
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if self._tokens >= 1 and self._llm_tokens >= cost:
+                    self._tokens -= 1
+                    self._llm_tokens -= cost
+                    self.acquired += 1
+                    if throttled:
+                        self.waiting -= 1
+                        self.total_wait += now - start
+                    return True
+
+                if not throttled:
+                    throttled = True
+                    self.throttled += 1
+                    self.waiting += 1
+
+                wait = max(0.0, (1 - self._tokens) / self.rate)
+                if cost > self._llm_tokens:
+                    wait = max(wait, (cost - self._llm_tokens) / self.token_rate)
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self.waiting -= 1
+                        return False
+                    wait = min(wait, remaining)
+
+            self._sleep(wait)
+
+    def stats(self) -> Dict:
+        """
+        속도 제한기 통계를 반환합니다.
+
+        Returns:
+            requests_per_minute, burst, tokens_per_minute, available_requests,
+            available_tokens, acquired, throttled, waiting(대기 중인 호출 수),
+            total_wait를 포함한 딕셔너리
+        """
+        with self._lock:
+            self._refill(self._clock())
+            return {
+                'requests_per_minute': self.rate * 60.0,
+                'burst': self.capacity,
+                'tokens_per_minute': self.token_capacity,
+                'available_requests': self._tokens,
+                'available_tokens': self._llm_tokens if self.token_rate is not None else None,
+                'acquired': self.acquired,
+                'throttled': self.throttled,
+                'waiting': self.waiting,
+                'total_wait': self.total_wait,
+            }
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 방식 적응형 동시 실행 제한기
+
+    동시에 실행 중인 호출 수를 limit 이하로 유지합니다. 호출이 성공하면 limit을
+    1/limit씩 늘리고(한 라운드에 약 1씩 증가), 한도 초과(429) 응답을 받으면
+    decrease_factor를 곱해 줄입니다. 그 밖의 실패(5xx, 시간 초과, 연결 오류,
+    빈 응답)는 limit을 바꾸지 않습니다. 동시에 실패한 여러 호출 때문에 limit이
+    연쇄적으로 줄지 않도록 감소 후 cooldown 동안은 다시 줄이지 않습니다.
+    여러 스레드에서 하나의 인스턴스를 공유해도 안전합니다.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: Optional[int] = None,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        동시 실행 제한기 초기화
+
+        Args:
+            max_limit: 최대 동시 실행 수
+            min_limit: 최소 동시 실행 수
+            initial_limit: 초기 동시 실행 수 (None이면 max_limit)
+            decrease_factor: 한도 초과 시 limit에 곱할 값 (0-1)
+            cooldown: 감소 후 다음 감소까지의 최소 간격 (초)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        if max_limit < 1:
+            raise ValueError("max_limit must be at least 1")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.max_limit = max_limit
+        self.min_limit = max(1, min(min_limit, max_limit))
+        self.limit = float(min(max_limit, max(self.min_limit, initial_limit or max_limit)))
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._clock = clock
+
+        self._condition = threading.Condition()
+        self._last_decrease: Optional[float] = None
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.increases = 0
+        self.decreases = 0
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        실행 슬롯을 얻을 때까지 대기합니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            슬롯을 얻으면 True, 제한 시간 안에 얻지 못하면 False
+        """
+        with self._condition:
+            if self.in_flight >= int(self.limit):
+                self.waiting += 1
+                try:
+                    acquired = self._condition.wait_for(
+                        lambda: self.in_flight < int(self.limit), timeout
+                    )
+                finally:
+                    self.waiting -= 1
+                if not acquired:
+                    return False
+            self.in_flight += 1
+            return True
+
+    def release(self, throttled: bool = False, success: bool = True) -> None:
+        """
+        실행 슬롯을 반환하고 결과에 따라 limit을 조정합니다.
+
+        Args:
+            throttled: 호출이 한도 초과(429)로 실패했는지 여부 (limit 감소)
+            success: 호출이 성공했는지 여부 (성공한 호출만 limit 증가,
+                한도 초과가 아닌 실패는 limit 유지)
+        """
+        with self._condition:
+            self.in_flight = max(0, self.in_flight - 1)
+            if throttled:
+                now = self._clock()
+                if self._last_decrease is None or now - self._last_decrease >= self.cooldown:
+                    previous = self.limit
+                    self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    self.decreases += 1
+                    logger.info(
+                        f"Concurrency limit decreased: {previous:.1f} -> {self.limit:.1f}"
+                    )
+            elif success and self.limit < self.max_limit:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+                self.increases += 1
+            self._condition.notify_all()
+
+    def stats(self) -> Dict:
+        """
+        동시 실행 제한기 통계를 반환합니다.
+
+        Returns:
+            limit, min_limit, max_limit, in_flight, waiting(대기 중인 호출 수),
+            increases, decreases를 포함한 딕셔너리
+        """
+        with self._condition:
+            return {
+                'limit': int(self.limit),
+                'min_limit': self.min_limit,
+                'max_limit': self.max_limit,
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                'increases': self.increases,
+                'decreases': self.decreases,
+            }
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    cap: float,
+    rng: Callable[[], float] = random.random
+) -> float:
+    """
+    지터가 적용된 지수 백오프 대기 시간을 계산합니다 (full jitter).
+
+    0과 min(cap, base * 2^attempt) 사이에서 무작위로 선택하므로, 동시에 실패한
+    여러 호출이 같은 시각에 다시 몰리지 않습니다.
+
+    Args:
+        attempt: 실패한 시도 번호 (0부터 시작)
+        base: 기본 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+        rng: [0, 1) 난수 함수 (테스트용)
+
+    Returns:
+        대기 시간 (초)
+    """
+    return rng() * min(cap, base * (2 ** attempt))
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+_concurrency_limiters: Dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_rate_limiter(
+    name: str,
+    requests_per_minute: float,
+    burst: Optional[int] = None,
+    tokens_per_minute: Optional[float] = None
+) -> Optional[RateLimiter]:
+    """
+    이름별 프로세스 전역 속도 제한기를 반환합니다.
+
+    같은 이름(예: 모델 이름)으로 생성된 모든 클라이언트가 하나의 한도를 공유합니다.
+
+    Args:
+        name: 속도 제한기 이름
+        requests_per_minute: 분당 허용 요청 수 (0 이하면 비활성화)
+        burst: 한 번에 허용할 최대 요청 수
+        tokens_per_minute: 분당 허용 토큰 수 (None 또는 0 이하면 토큰 제한 없음)
+
+    Returns:
+        RateLimiter 인스턴스 또는 None (비활성화 시)
+    """
+    if requests_per_minute <= 0:
+        return None
+
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(
+                requests_per_minute,
+                burst=burst,
+                tokens_per_minute=tokens_per_minute
+            )
+            _limiters[name] = limiter
+        return limiter
+
+
+def get_concurrency_limiter(
+    name: str,
+    max_limit: int,
+    min_limit: int = 1
+) -> Optional[AdaptiveConcurrencyLimiter]:
+    """
+    이름별 프로세스 전역 적응형 동시 실행 제한기를 반환합니다.
+
+    Args:
+        name: 제한기 이름
+        max_limit: 최대 동시 실행 수 (0 이하면 비활성화)
+        min_limit: 최소 동시 실행 수
+
+    Returns:
+        AdaptiveConcurrencyLimiter 인스턴스 또는 None (비활성화 시)
+    """
+    if max_limit <= 0:
+        return None
+
+    with _limiters_lock:
+        limiter = _concurrency_limiters.get(name)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(max_limit, min_limit=min_limit)
+            _concurrency_limiters[name] = limiter
+        return limiter
@@ -0,0 +1,217 @@
+"""
+LLM 응답 캐시
+같은 모델, 프롬프트, 생성 설정의 호출 결과를 재사용하여 API 지연과 비용을 줄입니다.
+"""
+
+from typing import Optional, Dict, Union
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+
+from .cache import MemoryCache, SQLiteCache, FileCache
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+CacheBackend = Union[MemoryCache, SQLiteCache, FileCache]
+
+BACKENDS = ('memory', 'sqlite', 'disk')
+
+
+class ResponseCache:
+    """
+    내용 해시 기반 LLM 응답 캐시
+
+    캐시 키는 (모델 이름, 온도, 최대 출력 토큰 수, 프롬프트)의 SHA-256 해시이므로
+    프롬프트가 한 글자라도 다르면 다른 항목이 됩니다. 저장소는 메모리 LRU,
+    SQLite, 파일 중 하나를 사용할 수 있습니다. 여러 스레드에서 공유해도 안전합니다.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = None):
+        """
+        캐시 초기화
+
+        Args:
+            backend: 응답을 저장할 캐시 저장소
+            ttl: 응답 만료 시간 (초, None이면 저장소 기본값 사용)
+        """
+        self.backend = backend
+        self.ttl = ttl
+
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        prompt: str,
+        temperature: float,
+        max_output_tokens: Optional[int] = None
+    ) -> str:
+        """
+        호출 설정과 프롬프트로 캐시 키를 생성합니다.
+
+        Args:
+            model_name: 모델 이름
+            prompt: 프롬프트
+            temperature: 생성 온도
+            max_output_tokens: 최대 출력 토큰 수
+
+        Returns:
+            'llm:<sha256>' 형식의 캐시 키
+        """
+        digest = hashlib.sha256(json.dumps(
+            [model_name, float(temperature), max_output_tokens, prompt],
+            ensure_ascii=False
+        ).encode('utf-8')).hexdigest()
+        return f"llm:{digest}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답을 반환합니다.
+
+        Args:
+            key: make_key로 생성한 캐시 키
+
+        Returns:
+            캐시된 응답 또는 None (미스 또는 저장소 오류)
+        """
+        try:
+            value = self.backend.get(key)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            with self._lock:
+                self.errors += 1
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, response: str) -> None:
+        """
+        응답을 캐시에 저장합니다. 저장소 오류는 기록만 하고 무시합니다.
+
+        Args:
+            key: make_key로 생성한 캐시 키
+            response: 저장할 응답
+        """
+        try:
+            self.backend.set(key, response, ttl=self.ttl)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Response cache write failed: {e}")
+            with self._lock:
+                self.errors += 1
+
+    def record_bypass(self) -> None:
+        """캐시를 우회한 호출 수를 기록합니다."""
+        with self._lock:
+            self.bypassed += 1
+
+    def clear(self) -> None:
+        """모든 캐시 항목을 삭제합니다."""
+        self.backend.clear()
+
+    def stats(self) -> Dict:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            backend, hits, misses, bypassed, errors, hit_rate, ttl과
+            저장소 통계(storage)를 포함한 딕셔너리
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'backend': type(self.backend).__name__,
+                'hits': self.hits,
+                'misses': self.misses,
+                'bypassed': self.bypassed,
+                'errors': self.errors,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'ttl': self.ttl,
+            }
+        try:
+            stats['storage'] = self.backend.stats()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Response cache stats failed: {e}")
+            stats['storage'] = None
+        return stats
+
+
+def create_cache_backend(
+    backend: str,
+    cache_dir: str,
+    max_entries: int = 1024,
+    max_bytes: Optional[int] = None
+) -> CacheBackend:
+    """
+    이름으로 캐시 저장소를 생성합니다.
+
+    Args:
+        backend: 저장소 종류 ('memory', 'sqlite', 'disk')
+        cache_dir: sqlite/disk 저장소를 만들 디렉토리
+        max_entries: memory 저장소의 최대 항목 수
+        max_bytes: sqlite/disk 저장소의 최대 크기 (바이트)
+
+    Returns:
+        캐시 저장소 인스턴스
+
+    Raises:
+        ValueError: 지원하지 않는 저장소 종류인 경우
+    """
+    if backend == 'memory':
+        return MemoryCache(max_entries=max_entries)
+    if backend == 'sqlite':
+        return SQLiteCache(os.path.join(cache_dir, 'llm_responses.db'), max_bytes=max_bytes)
+    if backend == 'disk':
+        return FileCache(os.path.join(cache_dir, 'llm_responses'), max_bytes=max_bytes)
+    raise ValueError(
+        f"Unknown cache backend: {backend!r} (expected one of {', '.join(BACKENDS)})"
+    )
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    프로세스 전역 LLM 응답 캐시를 반환합니다.
+
+    저장소 종류, TTL, 크기 제한은 llm_cache_* 설정을 따릅니다. 디스크 저장소를
+    열 수 없으면 메모리 저장소로 대체합니다.
+
+    Returns:
+        ResponseCache 인스턴스 또는 None (캐시 비활성화 시)
+    """
+    global _response_cache
+    backend_name = settings.llm_cache_backend.lower()
+    if not settings.cache_enabled or backend_name == 'none':
+        return None
+
+    with _response_cache_lock:
+        if _response_cache is None:
+            try:
+                backend = create_cache_backend(
+                    backend_name,
+                    settings.cache_dir,
+                    max_entries=settings.llm_cache_memory_size,
+                    max_bytes=settings.llm_cache_max_mb * 1024 * 1024
+                )
+            except (OSError, sqlite3.Error, ValueError) as e:
+                logger.warning(f"Failed to open {backend_name} response cache, using memory: {e}")
+                backend = MemoryCache(max_entries=settings.llm_cache_memory_size)
+            _response_cache = ResponseCache(backend, ttl=settings.llm_cache_ttl)
+        return _response_cache
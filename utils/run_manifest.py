@@ -0,0 +1,202 @@
+"""
+실행 매니페스트 (체크포인트)
+재생목록 처리 중 비디오별 상태와 출력 파일을 기록하여, 중단된 실행을 이어서 할 수 있게 합니다.
+"""
+
+from typing import Optional, Dict, Any
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# 비디오 상태
+DONE = 'done'
+FAILED = 'failed'
+
+
+def file_sha256(path: str) -> Optional[str]:
+    """
+    파일 내용의 SHA-256 해시를 계산합니다.
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        16진수 해시 문자열 또는 None (파일이 없거나 읽을 수 없는 경우)
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def default_manifest_path(source_id: str) -> str:
+    """
+    재생목록 ID로 기본 매니페스트 파일 경로를 만듭니다.
+
+    Args:
+        source_id: 재생목록 ID
+
+    Returns:
+        현재 디렉토리의 '.scraper_manifest_<ID>.json' 경로
+    """
+    safe_id = re.sub(r'[^\w-]', '_', source_id or 'run')
+    return f".scraper_manifest_{safe_id}.json"
+
+
+class RunManifest:
+    """
+    비디오별 처리 상태를 JSON 파일에 기록하는 실행 매니페스트
+
+    비디오 처리가 끝날 때마다 상태, 출력 파일 경로, 출력 파일의 내용 해시를
+    원자적으로 기록합니다. 완료된 비디오는 출력 파일이 남아 있고 내용 해시가
+    기록과 같을 때만 완료로 인정하므로, 지워지거나 중간에 잘린 파일은 다시 생성합니다.
+    여러 스레드에서 하나의 인스턴스를 공유해도 안전합니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, options: Dict[str, Any], source: str = ''):
+        """
+        빈 매니페스트 생성
+
+        Args:
+            path: 매니페스트 파일 경로
+            options: 출력 결과에 영향을 주는 실행 옵션 (형식, 언어, AI 기능)
+            source: 처리 대상 URL
+        """
+        self.path = path
+        self.options = options
+        self.source = source
+        self.videos: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, options: Dict[str, Any], source: str = '') -> "RunManifest":
+        """
+        기존 매니페스트를 불러옵니다.
+
+        파일이 없거나 손상되었거나 실행 옵션이 다르면 (이전 출력을 재사용할 수 없으므로)
+        빈 매니페스트를 반환합니다.
+
+        Args:
+            path: 매니페스트 파일 경로
+            options: 현재 실행 옵션
+            source: 처리 대상 URL
+
+        Returns:
+            RunManifest 인스턴스
+        """
+        manifest = cls(path, options, source)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+            return manifest
+
+        if data.get('version') != cls.VERSION or data.get('options') != options:
+            logger.warning(f"Manifest {path} was written with different options; starting over")
+            return manifest
+
+        manifest.videos = data.get('videos') or {}
+        return manifest
+
+    def is_complete(self, video_id: str) -> bool:
+        """
+        비디오가 이미 처리되었고 출력 파일이 온전한지 확인합니다.
+
+        Args:
+            video_id: 비디오 ID
+
+        Returns:
+            완료 기록이 있고 출력 파일의 내용 해시가 기록과 같으면 True
+        """
+        with self._lock:
+            entry = self.videos.get(video_id)
+        if not entry or entry.get('status') != DONE:
+            return False
+        output_file = entry.get('output_file')
+        return bool(output_file) and file_sha256(output_file) == entry.get('sha256')
+
+    def mark_done(self, video_id: str, output_file: str) -> None:
+        """
+        비디오 처리 완료와 출력 파일의 내용 해시를 기록합니다.
+
+        Args:
+            video_id: 비디오 ID
+            output_file: 출력 파일 경로
+        """
+        self._record(video_id, {
+            'status': DONE,
+            'output_file': output_file,
+            'sha256': file_sha256(output_file),
+            'error': None,
+        })
+
+    def mark_failed(self, video_id: str, error: str) -> None:
+        """
+        비디오 처리 실패를 기록합니다.
+
+        Args:
+            video_id: 비디오 ID
+            error: 실패 사유
+        """
+        self._record(video_id, {
+            'status': FAILED,
+            'output_file': None,
+            'sha256': None,
+            'error': error,
+        })
+
+    def counts(self) -> Dict[str, int]:
+        """
+        상태별 비디오 수를 반환합니다.
+
+        Returns:
+            {상태: 비디오 수} 딕셔너리
+        """
+        with self._lock:
+            result: Dict[str, int] = {}
+            for entry in self.videos.values():
+                result[entry['status']] = result.get(entry['status'], 0) + 1
+            return result
+
+    def _record(self, video_id: str, entry: Dict[str, Any]) -> None:
+        entry['updated_at'] = time.time()
+        with self._lock:
+            self.videos[video_id] = entry
+            self._save()
+
+    def save(self) -> None:
+        """매니페스트를 파일에 저장합니다."""
+        with self._lock:
+            self._save()
+
+    def _save(self) -> None:
+        """매니페스트를 임시 파일에 쓴 뒤 교체합니다 (잠금 보유 상태에서 호출)."""
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': self.VERSION,
+                'source': self.source,
+                'options': self.options,
+                'videos': self.videos,
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
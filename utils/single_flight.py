@@ -0,0 +1,107 @@
+"""
+요청 병합 (single-flight)
+같은 키로 동시에 들어온 호출이 하나의 실행 결과를 공유하도록 합니다.
+"""
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+import threading
+
+
+class _Call:
+    """실행 중인 호출 하나 (결과 Future와 합류한 대기자 수)"""
+
+    __slots__ = ('future', 'waiters')
+
+    def __init__(self):
+        self.future = Future()
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    키별 중복 호출 억제기
+
+    같은 키의 호출이 이미 실행 중이면 새로 실행하지 않고 그 결과(또는 예외)를
+    기다려 함께 반환합니다. 실행이 끝나면 키를 비우므로 결과를 캐시하지는 않습니다.
+    여러 스레드에서 공유해도 안전합니다.
+    """
+
+    def __init__(self):
+        self.executions = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.max_waiters = 0
+
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        키에 대해 함수를 한 번만 실행하고 결과를 공유합니다.
+
+        Args:
+            key: 중복 판단 키
+            func: 실행할 함수
+            *args, **kwargs: 함수 인자
+
+        Returns:
+            함수 반환값 (동시에 호출한 모든 호출자가 같은 객체를 받음)
+
+        Raises:
+            Exception: 함수가 발생시킨 예외 (대기 중인 호출자에게도 전달)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                self.max_waiters = max(self.max_waiters, call.waiters)
+
+        if not leader:
+            return call.future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self.failures += 1
+            call.future.set_exception(e)
+            raise
+        else:
+            call.future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        """실행 중인 키의 수를 반환합니다."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict:
+        """
+        요청 병합 통계를 반환합니다.
+
+        Returns:
+            executions (실제 실행 수), coalesced (진행 중인 실행에 합류한 호출 수),
+            coalesce_rate, failures, max_waiters (한 실행에 합류한 최대 대기자 수),
+            in_flight (실행 중인 키 수), waiting (현재 대기 중인 호출 수)을 포함한 딕셔너리
+        """
+        with self._lock:
+            calls = self.executions + self.coalesced
+            return {
+                'executions': self.executions,
+                'coalesced': self.coalesced,
+                'coalesce_rate': self.coalesced / calls if calls else 0.0,
+                'failures': self.failures,
+                'max_waiters': self.max_waiters,
+                'in_flight': len(self._calls),
+                'waiting': sum(call.waiters for call in self._calls.values()),
+            }
@@ -0,0 +1,279 @@
+"""
+열 기반(columnar) 자막 표현
+자막 항목마다 딕셔너리를 만들지 않고 시작 시간, 길이, 텍스트를 열 단위로 보관합니다.
+"""
+
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Optional, List, Dict, Iterable, Iterator, Any
+
+
+def format_timestamp(seconds: float) -> str:
+    """
+    초를 HH:MM:SS 형식으로 변환합니다.
+
+    Args:
+        seconds: 초 단위 시간
+
+    Returns:
+        HH:MM:SS 형식의 문자열
+    """
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    else:
+        return f"{minutes:02d}:{secs:02d}"
+
+
+class TranscriptEntryView(Mapping):
+    """
+    Transcript 항목 하나의 읽기 전용 딕셔너리 뷰
+
+    기존 자막 딕셔너리와 같은 키(start, duration, text, timestamp)를 제공하며,
+    값은 Transcript의 열에서 필요할 때 읽습니다. timestamp는 start로 계산합니다.
+    """
+
+    __slots__ = ('_transcript', '_index')
+
+    KEYS = ('start', 'duration', 'text', 'timestamp')
+
+    def __init__(self, transcript: "Transcript", index: int):
+        self._transcript = transcript
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        transcript, index = self._transcript, self._index
+        if key == 'start':
+            return transcript.starts[index]
+        if key == 'duration':
+            return transcript.durations[index]
+        if key == 'text':
+            return transcript.text_at(index)
+        if key == 'timestamp':
+            return format_timestamp(transcript.starts[index])
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class Transcript(Sequence):
+    """
+    열 기반 자막 컨테이너
+
+    시작 시간과 길이는 array('d')에, 텍스트는 하나의 문자열 버퍼와 항목별 끝 위치
+    (array('q'))에 저장하므로 항목당 딕셔너리와 float/str 객체를 만들지 않습니다.
+    순회하거나 인덱싱하면 TranscriptEntryView를 반환하여 기존 List[Dict] 자막을
+    받던 코드가 그대로 동작합니다. 생성 후에는 변경할 수 없습니다.
+
+    Attributes:
+        starts: 항목별 시작 시간 (초)
+        durations: 항목별 길이 (초)
+        language_code: 실제로 선택된 자막 트랙의 언어 코드 (알 수 없으면 None)
+        is_generated: 자동 생성 자막 여부 (알 수 없으면 None)
+        missing: 비디오에 자막이 없음이 확인된 경우에만 True
+            (네트워크 오류 같은 일시적 실패로 비어 있는 경우에는 False)
+    """
+
+    __slots__ = ('starts', 'durations', '_text', '_ends', 'language_code', 'is_generated', 'missing')
+
+    def __init__(
+        self,
+        entries: Iterable[Mapping] = (),
+        language_code: Optional[str] = None,
+        is_generated: Optional[bool] = None,
+        missing: bool = False
+    ):
+        """
+        자막 항목으로 Transcript 생성
+
+        Args:
+            entries: start, duration, text 키를 가진 자막 항목 iterable
+            language_code: 자막 언어 코드 (선택사항)
+            is_generated: 자동 생성 자막 여부 (선택사항)
+            missing: 자막 없음이 확인되었는지 여부
+        """
+        self.language_code = language_code
+        self.is_generated = is_generated
+        self.missing = missing
+
+        if isinstance(entries, Transcript):
+            self.starts = array('d', entries.starts)
+            self.durations = array('d', entries.durations)
+            self._text = entries._text
+            self._ends = array('q', entries._ends)
+            return
+
+        starts = array('d')
+        durations = array('d')
+        texts = []
+        for entry in entries:
+            starts.append(float(entry.get('start') or 0.0))
+            durations.append(float(entry.get('duration') or 0.0))
+            texts.append(entry.get('text') or '')
+        self._set_columns(starts, durations, texts)
+
+    @classmethod
+    def from_columns(
+        cls,
+        starts: Iterable[float],
+        durations: Iterable[float],
+        texts: Iterable[str],
+        language_code: Optional[str] = None,
+        is_generated: Optional[bool] = None,
+        missing: bool = False
+    ) -> "Transcript":
+        """
+        열 데이터로 Transcript를 생성합니다.
+
+        Args:
+            starts: 항목별 시작 시간
+            durations: 항목별 길이
+            texts: 항목별 텍스트
+            language_code: 자막 언어 코드 (선택사항)
+            is_generated: 자동 생성 자막 여부 (선택사항)
+            missing: 자막 없음이 확인되었는지 여부
+
+        Returns:
+            Transcript 인스턴스
+
+        Raises:
+            ValueError: 열 길이가 서로 다른 경우
+        """
+        transcript = cls(language_code=language_code, is_generated=is_generated, missing=missing)
+        starts = array('d', starts)
+        durations = array('d', durations)
+        texts = [text or '' for text in texts]
+        if not len(starts) == len(durations) == len(texts):
+            raise ValueError("starts, durations and texts must have the same length")
+        transcript._set_columns(starts, durations, texts)
+        return transcript
+
+    def _set_columns(self, starts: array, durations: array, texts: List[str]) -> None:
+        self.starts = starts
+        self.durations = durations
+        self._text = ''.join(texts)
+        self._ends = array('q')
+        end = 0
+        for text in texts:
+            end += len(text)
+            self._ends.append(end)
+
+    def text_at(self, index: int) -> str:
+        """
+        항목의 텍스트를 반환합니다.
+
+        Args:
+            index: 항목 순서 (음수면 끝에서부터)
+
+        Returns:
+            자막 텍스트
+        """
+        index = range(len(self._ends))[index]
+        begin = self._ends[index - 1] if index else 0
+        return self._text[begin:self._ends[index]]
+
+    def texts(self) -> Iterator[str]:
+        """항목별 텍스트를 순서대로 반환합니다."""
+        begin = 0
+        for end in self._ends:
+            yield self._text[begin:end]
+            begin = end
+
+    def to_list(self) -> List[Dict]:
+        """
+        기존 형식의 자막 딕셔너리 리스트로 변환합니다 (JSON 직렬화용).
+
+        Returns:
+            start, duration, text, timestamp를 포함한 딕셔너리 리스트
+        """
+        return [
+            {
+                'start': start,
+                'duration': duration,
+                'text': text,
+                'timestamp': format_timestamp(start),
+            }
+            for start, duration, text in zip(self.starts, self.durations, self.texts())
+        ]
+
+    def to_columns(self) -> Dict[str, List]:
+        """
+        열 단위 딕셔너리로 변환합니다 (저장용, from_columns의 역변환).
+
+        Returns:
+            {'starts': [...], 'durations': [...], 'texts': [...]}
+        """
+        return {
+            'starts': self.starts.tolist(),
+            'durations': self.durations.tolist(),
+            'texts': list(self.texts()),
+        }
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Transcript.from_columns(
+                self.starts[index],
+                self.durations[index],
+                list(self.texts())[index],
+                language_code=self.language_code,
+                is_generated=self.is_generated
+            )
+        return TranscriptEntryView(self, range(len(self.starts))[index])
+
+    def __iter__(self) -> Iterator[TranscriptEntryView]:
+        for index in range(len(self.starts)):
+            yield TranscriptEntryView(self, index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Transcript):
+            return (
+                self.starts == other.starts
+                and self.durations == other.durations
+                and self._ends == other._ends
+                and self._text == other._text
+            )
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                entry == other_entry for entry, other_entry in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Transcript({len(self)} entries, language_code={self.language_code!r}, "
+            f"is_generated={self.is_generated!r}, missing={self.missing!r})"
+        )
+
+
+def transcript_to_list(transcript: Optional[Iterable[Mapping]]) -> Optional[List[Dict]]:
+    """
+    Transcript 또는 자막 딕셔너리 iterable을 딕셔너리 리스트로 변환합니다.
+
+    JSON 응답이나 저장소처럼 일반 리스트가 필요한 경계에서 사용합니다.
+
+    Args:
+        transcript: Transcript, 자막 딕셔너리 리스트 또는 None
+
+    Returns:
+        자막 딕셔너리 리스트 (None이면 None)
+    """
+    if transcript is None:
+        return None
+    if isinstance(transcript, Transcript):
+        return transcript.to_list()
+    return [dict(entry) for entry in transcript]
@@ -5,8 +5,86 @@ YouTube 비디오 메타데이터 및 자막 추출 기능을 제공합니다.
 
 import re
 from typing import Optional, Dict, List
-import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi
+
+from utils.lazy_import import lazy_module
+from utils.transcript import Transcript, format_timestamp
+
+# yt-dlp와 youtube-transcript-api는 처음 사용할 때 로드 (시작 시간 단축)
+yt_dlp = lazy_module('yt_dlp')
+YouTubeTranscriptApi = None
+TranscriptsDisabled = None
+NoTranscriptFound = None
+
+
+# 메타데이터 추출용 YoutubeDL 옵션
+METADATA_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+}
+
+
+def _load_transcript_api() -> None:
+    """
+    youtube-transcript-api를 로드하여 모듈 전역 이름을 채웁니다.
+
+    이미 값이 있는 이름(이전 로드 또는 테스트 patch)은 덮어쓰지 않습니다.
+    """
+    global YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+    if None not in (YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound):
+        return
+
+    import youtube_transcript_api
+
+    if YouTubeTranscriptApi is None:
+        YouTubeTranscriptApi = youtube_transcript_api.YouTubeTranscriptApi
+    if TranscriptsDisabled is None:
+        TranscriptsDisabled = youtube_transcript_api.TranscriptsDisabled
+    if NoTranscriptFound is None:
+        NoTranscriptFound = youtube_transcript_api.NoTranscriptFound
+
+
+# 기존 이름 호환용 별칭 (자막은 열 기반 Transcript로 표현)
+TranscriptList = Transcript
+
+
+def _to_transcript_list(result, track=None) -> Transcript:
+    """
+    youtube-transcript-api의 fetch 결과를 Transcript로 변환합니다.
+
+    Args:
+        result: FetchedTranscript 객체 또는 dict 리스트
+        track: 결과를 가져온 자막 트랙 (언어 정보 보완용, 선택사항)
+
+    Returns:
+        Transcript 인스턴스
+    """
+    if hasattr(result, 'snippets'):
+        snippets = result.snippets
+        starts = [s.start for s in snippets]
+        durations = [s.duration for s in snippets]
+        texts = [s.text for s in snippets]
+    elif isinstance(result, list):
+        starts = [entry.get('start') or 0.0 for entry in result]
+        durations = [entry.get('duration') or 0.0 for entry in result]
+        texts = [entry.get('text') or '' for entry in result]
+    else:
+        starts, durations, texts = [], [], []
+
+    language_code = getattr(result, 'language_code', None)
+    is_generated = getattr(result, 'is_generated', None)
+    if track is not None:
+        if not isinstance(language_code, str):
+            language_code = getattr(track, 'language_code', None)
+        if not isinstance(is_generated, bool):
+            is_generated = getattr(track, 'is_generated', None)
+    return Transcript.from_columns(
+        starts,
+        durations,
+        texts,
+        language_code=language_code if isinstance(language_code, str) else None,
+        is_generated=is_generated if isinstance(is_generated, bool) else None
+    )
 
 
 def extract_video_id(url: str) -> Optional[str]:
@@ -33,87 +111,157 @@ def extract_video_id(url: str) -> Optional[str]:
     return None
 
 
-def format_timestamp(seconds: float) -> str:
+def get_video_metadata(url: str, ydl=None) -> Dict[str, str]:
     """
-    초를 HH:MM:SS 형식으로 변환합니다.
+    YouTube 비디오의 메타데이터를 가져옵니다.
 
     Args:
-        seconds: 초 단위 시간
+        url: YouTube 비디오 URL
+        ydl: 재사용할 YoutubeDL 인스턴스 (None이면 호출마다 새로 생성)
 
     Returns:
-        HH:MM:SS 형식의 문자열
+        title, description, channel 등의 정보를 담은 딕셔너리
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    try:
+        if ydl is None:
+            with yt_dlp.YoutubeDL(METADATA_YDL_OPTS) as ydl:
+                info = ydl.extract_info(url, download=False)
+        else:
+            info = ydl.extract_info(url, download=False)
 
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    else:
-        return f"{minutes:02d}:{secs:02d}"
+        # video_id 추출
+        video_id = info.get('id', '')
+        if not video_id:
+            # URL에서 추출 시도
+            video_id = extract_video_id(url) or ''
+
+        return {
+            'video_id': video_id,
+            'title': info.get('title', 'Unknown Title'),
+            'description': info.get('description', 'No description available'),
+            'channel': info.get('channel', 'Unknown Channel'),
+            'upload_date': info.get('upload_date', 'Unknown Date'),
+            'duration': info.get('duration', 0),
+            'view_count': info.get('view_count', 0),
+            'like_count': info.get('like_count'),  # 추가
+            'thumbnail_url': info.get('thumbnail') or info.get('thumbnails', [{}])[0].get('url') if info.get('thumbnails') else None,  # 추가
+        }
+    except Exception as e:
+        print(f"메타데이터 추출 오류: {e}")
+        return placeholder_metadata(extract_video_id(url) or '')
 
 
-def get_video_metadata(url: str) -> Dict[str, str]:
+def placeholder_metadata(video_id: str = '') -> Dict:
     """
-    YouTube 비디오의 메타데이터를 가져옵니다.
+    메타데이터 추출 실패 시 사용하는 기본값을 반환합니다.
 
     Args:
-        url: YouTube 비디오 URL
+        video_id: YouTube 비디오 ID
 
     Returns:
-        title, description, channel 등의 정보를 담은 딕셔너리
+        기본값으로 채워진 메타데이터 딕셔너리
     """
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': False,
+    return {
+        'video_id': video_id,
+        'title': 'Unknown Title',
+        'description': 'No description available',
+        'channel': 'Unknown Channel',
+        'upload_date': 'Unknown Date',
+        'duration': 0,
+        'view_count': 0,
+        'like_count': None,
+        'thumbnail_url': None,
     }
 
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            # video_id 추출
-            video_id = info.get('id', '')
-            if not video_id:
-                # URL에서 추출 시도
-                video_id = extract_video_id(url) or ''
-
-            return {
-                'video_id': video_id,
-                'title': info.get('title', 'Unknown Title'),
-                'description': info.get('description', 'No description available'),
-                'channel': info.get('channel', 'Unknown Channel'),
-                'upload_date': info.get('upload_date', 'Unknown Date'),
-                'duration': info.get('duration', 0),
-                'view_count': info.get('view_count', 0),
-                'like_count': info.get('like_count'),  # 추가
-                'thumbnail_url': info.get('thumbnail') or info.get('thumbnails', [{}])[0].get('url') if info.get('thumbnails') else None,  # 추가
-            }
-    except Exception as e:
-        print(f"메타데이터 추출 오류: {e}")
-        video_id = extract_video_id(url) or ''
-        return {
-            'video_id': video_id,
-            'title': 'Unknown Title',
-            'description': 'No description available',
-            'channel': 'Unknown Channel',
-            'upload_date': 'Unknown Date',
-            'duration': 0,
-            'view_count': 0,
-            'like_count': None,
-            'thumbnail_url': None,
-        }
+
+def is_placeholder_metadata(metadata: Dict) -> bool:
+    """
+    메타데이터가 추출 실패 시 반환되는 기본값인지 확인합니다.
+
+    Args:
+        metadata: get_video_metadata()가 반환한 딕셔너리
+
+    Returns:
+        추출 실패로 채워진 기본값이면 True
+    """
+    return (
+        metadata.get('title') == 'Unknown Title'
+        and metadata.get('channel') == 'Unknown Channel'
+        and metadata.get('upload_date') == 'Unknown Date'
+    )
+
+
+def _list_transcript_tracks(video_id: str):
+    """
+    비디오의 사용 가능한 자막 트랙 목록을 한 번의 요청으로 가져옵니다.
+    youtube-transcript-api 0.x와 1.x 버전 모두 지원합니다.
+
+    Args:
+        video_id: YouTube 비디오 ID
+
+    Returns:
+        자막 트랙 목록 (TranscriptList)
+    """
+    _load_transcript_api()
+    api = YouTubeTranscriptApi()
+    if hasattr(api, 'list'):
+        # 신버전 (1.x) - list() 인스턴스 메서드
+        return api.list(video_id)
+    # 구버전 (0.x) - list_transcripts() 정적 메서드
+    return YouTubeTranscriptApi.list_transcripts(video_id)
+
+
+def select_transcript_track(
+    tracks,
+    languages: List[str],
+    prefer_manual: bool = True
+):
+    """
+    자막 트랙 목록에서 가장 적합한 트랙을 로컬에서 선택합니다 (네트워크 요청 없음).
+
+    언어 우선순위 순서대로 일치하는 트랙을 찾으며, 정확한 언어 코드가 없으면
+    지역 코드를 제외한 기본 언어(예: 'en-US' → 'en')로 일치 여부를 확인합니다.
+    같은 언어에 수동/자동 자막이 모두 있으면 prefer_manual에 따라 선택합니다.
+    요청한 언어가 하나도 없으면 사용 가능한 첫 번째 트랙을 반환합니다.
+
+    Args:
+        tracks: 자막 트랙 목록 (language_code, is_generated 속성 필요)
+        languages: 자막 언어 우선순위 목록
+        prefer_manual: 수동 생성 자막 선호 여부
+
+    Returns:
+        선택된 자막 트랙 또는 None (트랙이 없는 경우)
+    """
+    # 선호하는 종류(수동/자동)가 앞에 오도록 정렬 (sorted는 안정 정렬)
+    ordered = sorted(
+        tracks,
+        key=lambda t: bool(t.is_generated) if prefer_manual else not t.is_generated
+    )
+    if not ordered:
+        return None
+
+    for lang in languages:
+        for track in ordered:
+            if track.language_code == lang:
+                return track
+        for track in ordered:
+            if track.language_code.split('-')[0] == lang.split('-')[0]:
+                return track
+
+    return ordered[0]
 
 
 def get_transcript_with_timestamps(
     video_id: str,
     languages: Optional[List[str]] = None,
     prefer_manual: bool = True
-) -> List[Dict]:
+) -> Transcript:
     """
     YouTube 비디오의 자막을 타임스탬프와 함께 가져옵니다.
-    youtube-transcript-api 0.x와 1.x 버전 모두 지원합니다.
+
+    사용 가능한 자막 트랙 목록을 한 번 조회한 뒤, languages와 prefer_manual에 따라
+    가장 적합한 트랙을 로컬에서 선택하여 해당 트랙 하나만 가져옵니다
+    (최대 2번의 네트워크 요청). youtube-transcript-api 0.x와 1.x 버전 모두 지원합니다.
 
     Args:
         video_id: YouTube 비디오 ID
@@ -121,127 +269,28 @@ def get_transcript_with_timestamps(
         prefer_manual: 수동 생성 자막을 우선적으로 사용할지 여부 (기본값: True)
 
     Returns:
-        타임스탬프와 텍스트를 담은 딕셔너리 리스트
+        열 기반 자막 (Transcript, 항목은 start, duration, text, timestamp 키를 가진 딕셔너리 뷰)
     """
     # 기본 언어 설정
     if languages is None:
         languages = ['ko', 'en']
 
-    # 신버전 (1.x) API 사용 시도 - fetch() 인스턴스 메서드
+    _load_transcript_api()
     try:
-        api = YouTubeTranscriptApi()
-        transcript = api.fetch(video_id, languages=languages)
-        # FetchedTranscript 객체를 dict 리스트로 변환
-        if hasattr(transcript, 'snippets'):
-            return [{'start': s.start, 'duration': s.duration, 'text': s.text}
-                   for s in transcript.snippets]
-        # 이미 리스트 형태인 경우
-        return transcript if isinstance(transcript, list) else []
-    except AttributeError:
-        # fetch 메서드가 없음 - 구버전 (0.x)일 가능성
-        pass
+        tracks = _list_transcript_tracks(video_id)
+        track = select_transcript_track(tracks, languages, prefer_manual)
+    except (TranscriptsDisabled, NoTranscriptFound):
+        track = None
     except Exception as e:
-        # 다른 이유로 실패 (자막 없음, 네트워크 오류 등) - 계속 시도
-        pass
+        print(f"자막 목록 조회 오류: {e}")
+        return Transcript()
+
+    if track is None:
+        print("이 비디오에 사용 가능한 자막이 없습니다.")
+        return Transcript(missing=True)
 
-    # 구버전 (0.x) API 사용 시도 - get_transcript() 정적 메서드
-    # 방법 1: 선호하는 언어들을 한 번에 시도
-    try:
-        transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
-        return transcript
-    except AttributeError:
-        # get_transcript 메서드가 없음 - 신버전인데 위에서 실패한 경우
-        pass
-    except Exception:
-        # 자막을 찾을 수 없거나 다른 오류
-        pass
-
-    # 방법 2: 각 언어를 개별적으로 시도 (구버전)
-    if hasattr(YouTubeTranscriptApi, 'get_transcript'):
-        for lang in languages:
-            try:
-                transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=[lang])
-                return transcript
-            except Exception:
-                continue
-
-    # 방법 3: 언어 지정 없이 기본 자막 가져오기 시도 (구버전)
-    if hasattr(YouTubeTranscriptApi, 'get_transcript'):
-        try:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-            return transcript
-        except Exception:
-            pass
-
-    # 방법 4: list() 메서드로 사용 가능한 자막 목록 확인 (신버전 1.x)
     try:
-        api = YouTubeTranscriptApi()
-        transcript_list = api.list(video_id)
-
-        # 수동 생성 자막 우선 시도
-        try:
-            transcript = transcript_list.find_transcript(languages)
-            result = transcript.fetch()
-            if hasattr(result, 'snippets'):
-                return [{'start': s.start, 'duration': s.duration, 'text': s.text}
-                       for s in result.snippets]
-            return result if isinstance(result, list) else []
-        except:
-            pass
-
-        # 사용 가능한 첫 번째 자막 사용
-        try:
-            available = list(transcript_list)
-            if available:
-                result = available[0].fetch()
-                if hasattr(result, 'snippets'):
-                    return [{'start': s.start, 'duration': s.duration, 'text': s.text}
-                           for s in result.snippets]
-                return result if isinstance(result, list) else []
-        except:
-            pass
-    except AttributeError:
-        # list 메서드가 없음
-        pass
+        return _to_transcript_list(track.fetch(), track)
     except Exception as e:
-        print(f"자막 목록 조회 오류: {e}")
-
-    # 방법 5: list_transcripts() 메서드 시도 (구버전 0.x)
-    if hasattr(YouTubeTranscriptApi, 'list_transcripts'):
-        try:
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-
-            # 수동 생성 자막 우선 시도
-            try:
-                for lang in languages:
-                    try:
-                        transcript = transcript_list.find_manually_created_transcript([lang])
-                        return transcript.fetch()
-                    except:
-                        continue
-            except:
-                pass
-
-            # 자동 생성 자막 시도
-            try:
-                for lang in languages:
-                    try:
-                        transcript = transcript_list.find_generated_transcript([lang])
-                        return transcript.fetch()
-                    except:
-                        continue
-            except:
-                pass
-
-            # 사용 가능한 첫 번째 자막 사용
-            try:
-                available_transcripts = list(transcript_list)
-                if available_transcripts:
-                    return available_transcripts[0].fetch()
-            except:
-                pass
-        except Exception as e:
-            print(f"자막 추출 오류: {e}")
-
-    print("이 비디오에 사용 가능한 자막이 없습니다.")
-    return []
+        print(f"자막 추출 오류: {e}")
+        return Transcript()